@@ -1 +1,2 @@
 from .actor_controller import ActorController
+from .async_actor_controller import AsyncActorController
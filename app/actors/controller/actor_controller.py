@@ -1,4 +1,6 @@
 """Actor controller module"""
+from typing import Optional
+
 from fastapi import HTTPException
 from starlette.responses import JSONResponse
 
@@ -30,17 +32,19 @@ class ActorController:
             raise HTTPException(status_code=500, detail=str(exc)) from exc
 
     @staticmethod
-    def get_all_actors(page: int):
+    def get_all_actors(page: int, cursor: Optional[str] = None, schema=None):
         """
         Function returns all actors in the database.
         It takes one argument, page, which is an integer representing the page number of results to return.
         The function will return a list of actors, and a count of total number of actors.
 
         Param page:int: Specify the page number of the results to be returned
+        Param cursor:str: Cursor returned with the previous page, used instead of the page number.
+        Param schema: Response schema whose columns are selected, rows are returned instead of actors if given.
         Return: A list of actors.
         """
         try:
-            actors = ActorServices.get_all_actors(page)
+            actors = ActorServices.get_all_actors(page, cursor, schema)
             if not actors:
                 return JSONResponse(content="End of query.", status_code=200)
             return actors
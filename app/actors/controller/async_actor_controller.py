@@ -0,0 +1,33 @@
+"""Async Actor Controller module"""
+from typing import Optional
+
+from fastapi import HTTPException
+from starlette.responses import JSONResponse
+
+from app.actors.controller.actor_controller import ActorController
+from app.actors.service import AsyncActorServices
+from app.base import AppException, sync_fallback
+
+
+class AsyncActorController:
+    """Async controller for Actor catalogue routes. Falls back to ActorController when DB_ASYNC is disabled."""
+    @staticmethod
+    @sync_fallback(ActorController.get_all_actors)
+    async def get_all_actors(page: int, cursor: Optional[str] = None, schema=None):
+        """
+        Function returns one page of actors in the database.
+
+        Param page:int: Specify the page number of the results to be returned
+        Param cursor:str: Cursor returned with the previous page, used instead of the page number.
+        Param schema: Response schema whose columns are selected, rows are returned instead of actors if given.
+        Return: A list of actors.
+        """
+        try:
+            actors = await AsyncActorServices.get_all_actors(page, cursor, schema)
+            if not actors:
+                return JSONResponse(content="End of query.", status_code=200)
+            return actors
+        except AppException as exc:
+            raise HTTPException(status_code=exc.code, detail=exc.message) from exc
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
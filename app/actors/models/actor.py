@@ -1,23 +1,21 @@
 """Actor Model module"""
-from uuid import uuid4
-
 from sqlalchemy import String, Column, Date
 from sqlalchemy.orm import relationship
 
-from app.db import Base
+from app.db import Base, UUIDKey, new_id
 
 
 class Actor(Base):
     """Base Model for Actor"""
     __tablename__ = "actors"
-    id = Column(String(50), primary_key=True, default=uuid4)
-    first_name = Column(String(50), nullable=False)
-    last_name = Column(String(50), nullable=False)
-    date_of_birth = Column(Date())
+    id = Column(UUIDKey(), primary_key=True, default=new_id)
+    first_name = Column(String(50), nullable=False, index=True)
+    last_name = Column(String(50), nullable=False, index=True)
+    date_of_birth = Column(Date(), index=True)
     country = Column(String(50))
 
-    movies = relationship('Movie', secondary="movie_actors", back_populates='actors', lazy="subquery")
-    series = relationship('Series', secondary="series_actors", back_populates='actors', lazy="subquery")
+    movies = relationship('Movie', secondary="movie_actors", back_populates='actors')
+    series = relationship('Series', secondary="series_actors", back_populates='actors')
 
     def __init__(self, first_name: str, last_name: str, date_of_birth: str, country: str):
         self.first_name = first_name
@@ -1,6 +1,7 @@
 """Actor Repository module"""
 from app.actors.models import Actor
 from app.base import BaseCRUDRepository
+from app.search import search_ids
 
 
 class ActorRepository(BaseCRUDRepository):
@@ -14,13 +15,13 @@ class ActorRepository(BaseCRUDRepository):
 
         Param first_name:str: Store the first name of the actor
         Param search:bool=True: Determine whether the search should be case-sensitive or not
-        Return: All actors whose first name contains the first_name argument.
+        Return: Actors whose first name matches the first_name argument, best matches first.
         """
         try:
             if search:
-                actors = self.db.query(Actor).filter(Actor.first_name.ilike(f"%{first_name}%")).all()
+                actors = self.read_by_ids(search_ids(self.db, Actor, ("first_name",), first_name))
             else:
-                actors = self.db.query(Actor).filter(Actor.first_name == first_name).first()
+                actors = self.base_query().filter(Actor.first_name == first_name).first()
             return actors
         except Exception as exc:
             self.db.rollback()
@@ -34,13 +35,13 @@ class ActorRepository(BaseCRUDRepository):
 
         Param last_name:str: Filter the actors by last name
         Param literal=False: Indicate whether the last_name parameter is a literal or not.
-        Return: The list of actors whose last name contains the string passed as an argument.
+        Return: Actors whose last name matches the string passed as an argument, best matches first.
         """
         try:
             if search:
-                actors = self.db.query(Actor).filter(Actor.last_name.ilike(f"%{last_name}%")).all()
+                actors = self.read_by_ids(search_ids(self.db, Actor, ("last_name",), last_name))
             else:
-                actors = self.db.query(Actor).filter(Actor.last_name == last_name).first()
+                actors = self.base_query().filter(Actor.last_name == last_name).first()
             return actors
         except Exception as exc:
             self.db.rollback()
@@ -55,9 +56,9 @@ class ActorRepository(BaseCRUDRepository):
         """
         try:
             if search:
-                return self.db.query(Actor).filter(Actor.country.ilike(f"%{country}%")).all()
+                return self.base_query().filter(Actor.country.ilike(f"%{country}%")).all()
             else:
-                return self.db.query(Actor).filter(Actor.country == country).first()
+                return self.base_query().filter(Actor.country == country).first()
         except Exception as exc:
             self.db.rollback()
             raise exc
@@ -72,7 +73,7 @@ class ActorRepository(BaseCRUDRepository):
         try:
             start_date = f"{year}-01-01"
             end_date = f"{year}-12-31"
-            return self.db.query(Actor).filter(Actor.date_of_birth.between(start_date, end_date)).all()
+            return self.base_query().filter(Actor.date_of_birth.between(start_date, end_date)).all()
         except Exception as exc:
             self.db.rollback()
             raise exc
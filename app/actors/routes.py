@@ -1,7 +1,11 @@
 """Actor routes"""
+from typing import Optional
+
 from fastapi import APIRouter, Depends, status, Query
 
-from app.actors.controller import ActorController
+from app.actors.controller import ActorController, AsyncActorController
+from app.base import fast_json_response
+from app.db import QueryBudget
 from app.actors.schemas import ActorSchema, ActorSchemaIn
 from app.users.controller import JWTBearer
 
@@ -24,17 +28,20 @@ def create_new_actor(actor: ActorSchemaIn):
     return ActorController.create_actor(**vars(actor))
 
 
-@actor_router.get("/", response_model=list[ActorSchema])
-def get_all_actors(page: int = 1):
+@actor_router.get("/", response_model=list[ActorSchema], dependencies=[Depends(QueryBudget(2))])
+async def get_all_actors(page: int = 1, cursor: Optional[str] = None):
     """
     Function returns a list of all actors in the database. The get_all_actors function
     takes an optional parameter, page, which specifies which subset of the entire
     actor list should be returned. The default value for a page is 1.
+    Actors are selected as rows of the columns of the schema and serialized with orjson.
 
     Param page:int=1: Specify the page number to be returned.
+    Param cursor:str: Cursor from the X-Next-Cursor header of the previous response, used instead of the page.
     Return: A list of actors.
     """
-    return ActorController.get_all_actors(page)
+    actors = await AsyncActorController.get_all_actors(page, cursor, schema=ActorSchema)
+    return fast_json_response(actors)
 
 
 @actor_router.get("/get-actor/id",
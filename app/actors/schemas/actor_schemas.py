@@ -1,11 +1,13 @@
 """Actor Schemas module"""
 from datetime import date
-from pydantic import BaseModel, UUID4
+from uuid import UUID
+
+from pydantic import BaseModel
 
 
 class ActorSchema(BaseModel):
     """Base actor schema"""
-    id: UUID4
+    id: UUID
     first_name: str
     last_name: str
     date_of_birth: date
@@ -1 +1,2 @@
 from .actor_services import ActorServices
+from .async_actor_services import AsyncActorServices
@@ -1,5 +1,8 @@
 """Actor Service module"""
+from typing import Optional
+
 from app.actors.exceptions.actor_exceptions import ActorDataException
+from app.base import LoadingProfile, projection
 from app.config import settings
 from app.db import SessionLocal
 from app.actors.repositories import ActorRepository
@@ -7,6 +10,7 @@ from app.actors.models import Actor
 
 
 PER_PAGE = settings.PER_PAGE
+ACTOR_WITH_MOVIES = LoadingProfile("movies")
 
 
 class ActorServices:
@@ -39,19 +43,23 @@ class ActorServices:
             raise exc
 
     @staticmethod
-    def get_all_actors(page: int):
+    def get_all_actors(page: int, cursor: Optional[str] = None, schema=None):
         """
         Function retrieves all actors from the database.
         It takes a page number as an argument, and returns a list of actors on that page.
 
         Param page:int: Skip the first n results and return the next n
-        Return: A list of actors.
+        Param cursor:str: Cursor returned with the previous page, used instead of the page number.
+        Param schema: Response schema whose columns are selected, rows are returned instead of actors if given.
+        Return: A page of actors.
         """
         try:
             with SessionLocal() as db:
                 repository = ActorRepository(db, Actor)
-                skip = (page - 1) * PER_PAGE
-                actors = repository.read_many(skip=skip, limit=PER_PAGE)
+                if schema is not None:
+                    return repository.read_page_rows(projection(Actor, schema), page=page, cursor=cursor,
+                                                     limit=PER_PAGE)
+                actors = repository.read_page(page=page, cursor=cursor, limit=PER_PAGE)
                 return actors
         except Exception as exc:
             raise exc
@@ -152,7 +160,7 @@ class ActorServices:
         """
         try:
             with SessionLocal() as db:
-                repository = ActorRepository(db, Actor)
+                repository = ActorRepository(db, Actor, ACTOR_WITH_MOVIES)
                 actor = repository.read_actors_by_last_name(last_name, literal=True)
                 return actor
         except Exception as exc:
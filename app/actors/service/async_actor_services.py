@@ -0,0 +1,32 @@
+"""Async Actor Service module"""
+from typing import Optional
+
+from app.base import AsyncBaseCRUDRepository, projection
+from app.config import settings
+from app.db import AsyncSessionLocal
+from app.actors.models import Actor
+
+PER_PAGE = settings.PER_PAGE
+
+
+class AsyncActorServices:
+    """Async service for Actor catalogue routes"""
+    @staticmethod
+    async def get_all_actors(page: int, cursor: Optional[str] = None, schema=None):
+        """
+        Function retrieves one page of actors from the database.
+
+        Param page:int: Skip the first n results and return the next n
+        Param cursor:str: Cursor returned with the previous page, used instead of the page number.
+        Param schema: Response schema whose columns are selected, rows are returned instead of actors if given.
+        Return: A page of actors.
+        """
+        try:
+            async with AsyncSessionLocal() as db:
+                repository = AsyncBaseCRUDRepository(db, Actor)
+                if schema is not None:
+                    return await repository.read_page_rows(projection(Actor, schema), page=page, cursor=cursor,
+                                                           limit=PER_PAGE)
+                return await repository.read_page(page=page, cursor=cursor, limit=PER_PAGE)
+        except Exception as exc:
+            raise exc
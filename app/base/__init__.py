@@ -1,2 +1,7 @@
 from .base_exception import AppException
 from .base_repository import BaseCRUDRepository
+from .loading_profile import LoadingProfile, NO_RELATIONSHIPS
+from .async_base_repository import AsyncBaseCRUDRepository
+from .sync_fallback import sync_fallback
+from .pagination import Page, paginate, build_page, set_next_cursor, NEXT_CURSOR_HEADER
+from .fast_json import FastJSONResponse, projection, fast_json_response
@@ -0,0 +1,214 @@
+"""Async Base Repository class with CRUD operations, used by the repositories of the async read path."""
+from typing import Union, Type, Generic, Iterable, Optional, Sequence
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.base.base_exception import AppException
+from app.base.base_repository import Model, IN_CLAUSE_CHUNK_SIZE
+from app.base.loading_profile import LoadingProfile, NO_RELATIONSHIPS
+from app.base.pagination import Page, paginate, build_page
+
+
+class AsyncBaseCRUDRepository(Generic[Model]):
+    """Base Class for CRUD operations over an AsyncSession. Mirrors BaseCRUDRepository method by method."""
+
+    def __init__(self, db: AsyncSession, model: Type[Model], profile: LoadingProfile = NO_RELATIONSHIPS):
+        self.db = db
+        self.model = model
+        self.profile = profile
+
+    def base_select(self):
+        """
+        Function returns a select statement over the repository model with the loading profile applied.
+        Every read method that returns model objects should start from this statement.
+
+        Return: Select object for the model.
+        """
+        return self.profile.apply(select(self.model), self.model)
+
+    async def scalars(self, statement) -> list:
+        """
+        Function executes the given select statement and returns the model objects it selected.
+
+        Param statement: Select statement to execute.
+        Return: A list of model objects.
+        """
+        result = await self.db.execute(statement)
+        return result.scalars().all()
+
+    async def create(self, attributes: dict):
+        """
+        Function creates a new instance of the model class and adds it to the database.
+
+        Param attributes:dict: Pass in the attributes that will be used to create a new instance of the model
+        Return: The newly created object.
+        """
+        try:
+            db_obj = self.model(**attributes)
+            self.db.add(db_obj)
+            await self.db.commit()
+            await self.db.refresh(db_obj)
+        except Exception as exc:
+            await self.db.rollback()
+            raise exc
+        return db_obj
+
+    async def read_all(self):
+        """
+        Function is used to retrieve all the objects from a table.
+
+        Return: All the models of a specific model.
+        """
+        try:
+            return await self.scalars(self.base_select())
+        except Exception as exc:
+            await self.db.rollback()
+            raise AppException(message=str(exc), code=500) from exc
+
+    async def read_many(self, *, skip: int = 0, limit: int = 100):
+        """
+        Function is used to retrieve a list of records from the database.
+
+        Param skip:int=0: Skip the first n rows
+        Param limit:int=100: Limit the number of returned results
+        Return: A list of instances of the model class.
+        """
+        try:
+            return await self.scalars(self.base_select().offset(skip).limit(limit))
+        except Exception as exc:
+            await self.db.rollback()
+            raise AppException(message=str(exc), code=500) from exc
+
+    async def read_page(self, *, page: int = 1, cursor: Optional[str] = None, limit: int = 100,
+                        statement=None) -> Page:
+        """
+        Function returns one page of objects, ordered by the stable sort key of the model.
+        With a cursor, the page is read with a keyset condition instead of an offset.
+
+        Param page:int: Page number, used when no cursor is given.
+        Param cursor:str: Cursor returned with the previous page.
+        Param limit:int: Number of objects on a page.
+        Param statement: Select to paginate, defaults to the base select of the repository.
+        Return: A Page of model objects.
+        """
+        statement = paginate(self.base_select() if statement is None else statement, self.model,
+                             page=page, cursor=cursor, limit=limit)
+        try:
+            return build_page(await self.scalars(statement), self.model, limit)
+        except Exception as exc:
+            await self.db.rollback()
+            raise AppException(message=str(exc), code=500) from exc
+
+    async def read_page_rows(self, columns: Sequence, *, page: int = 1, cursor: Optional[str] = None,
+                             limit: int = 100) -> Page:
+        """
+        Function returns the given columns of one page of objects as rows, without loading model objects.
+        The columns must include the sort key of the model, labelled with the names of its columns.
+
+        Param columns:Sequence: Columns to select, like a projection of a response schema.
+        Param page:int: Page number, used when no cursor is given.
+        Param cursor:str: Cursor returned with the previous page.
+        Param limit:int: Number of rows on a page.
+        Return: A Page of rows.
+        """
+        statement = paginate(select(*columns), self.model, page=page, cursor=cursor, limit=limit)
+        try:
+            result = await self.db.execute(statement)
+            return build_page(result.all(), self.model, limit)
+        except Exception as exc:
+            await self.db.rollback()
+            raise AppException(message=str(exc), code=500) from exc
+
+    async def read_by_id(self, model_id: Union[str, int]):
+        """
+        Function accepts a model_id as an argument and returns the object with that ID.
+        If no such object exists, it raises an AppException with code 400.
+
+        Param model_id:Union[str, int]: ID of the object.
+        Return: An object of the model class that matches the given ID.
+        """
+        try:
+            result = await self.db.execute(self.base_select().filter(self.model.id == model_id))
+            obj = result.scalars().first()
+            if not obj:
+                raise AppException(message=f"{self.model.__name__} ID: {model_id} does not exist in DB.", code=400)
+            return obj
+        except Exception as exc:
+            await self.db.rollback()
+            raise exc
+
+    async def read_by_ids(self, model_ids: Iterable[Union[str, int]], chunk_size: int = IN_CLAUSE_CHUNK_SIZE):
+        """
+        Function accepts a list of IDs and returns the objects with those IDs, fetched with one IN query
+        per chunk of IDs. Objects are returned in the order of the given IDs, IDs that do not exist are skipped.
+
+        Param model_ids:Iterable: IDs of the objects to retrieve.
+        Param chunk_size:int: Maximum number of IDs sent in a single IN clause.
+        Return: A list of objects of the model class.
+        """
+        try:
+            model_ids = list(dict.fromkeys(model_ids))
+            objects = {}
+            for start in range(0, len(model_ids), chunk_size):
+                chunk = model_ids[start:start + chunk_size]
+                for obj in await self.scalars(self.base_select().filter(self.model.id.in_(chunk))):
+                    objects[obj.id] = obj
+            return [objects[model_id] for model_id in model_ids if model_id in objects]
+        except Exception as exc:
+            await self.db.rollback()
+            raise exc
+
+    async def exists(self, *criteria) -> bool:
+        """
+        Function checks whether at least one object of the model matches the given criteria.
+
+        Param criteria: Filter expressions over the model columns.
+        Return: True if a matching object exists.
+        """
+        try:
+            result = await self.db.execute(select(self.model.id).filter(*criteria).limit(1))
+            return result.first() is not None
+        except Exception as exc:
+            await self.db.rollback()
+            raise exc
+
+    async def update(self, db_obj, updates: dict):
+        """
+        Function updates an existing object in the database.
+
+        Param db_obj: Pass the database object to be updated
+        Param updates:dict: Update the object in the database
+        Return: The updated object.
+        """
+        try:
+            obj_data = jsonable_encoder(db_obj)
+            for data in obj_data:
+                if data in updates:
+                    setattr(db_obj, data, updates[data])
+            self.db.add(db_obj)
+            await self.db.commit()
+            await self.db.refresh(db_obj)
+        except Exception as exc:
+            await self.db.rollback()
+            raise exc
+        return db_obj
+
+    async def delete(self, model_id: Union[str, int]):
+        """
+        Function deletes a model from the database.
+        If no such object exists in the database, it raises an exception.
+
+        Param model_id: Pass the ID of the model that is to be deleted.
+        Return: True.
+        """
+        try:
+            obj = await self.db.get(self.model, model_id)
+            if obj is None:
+                raise AppException(message=f"ID: {model_id} does not exist in Database.", code=400)
+            await self.db.delete(obj)
+            await self.db.commit()
+        except Exception as exc:
+            await self.db.rollback()
+            raise exc
+        return True
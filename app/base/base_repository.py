@@ -1,19 +1,33 @@
 """Base Repository class with CRUD operations, which is inherited by every other repository Model."""
-from typing import Union, Type, TypeVar, Generic
+from typing import Union, Type, TypeVar, Generic, Iterable, Optional, Sequence
 from fastapi.encoders import jsonable_encoder
+from sqlalchemy.dialects import mysql, sqlite
 
 from app.base.base_exception import AppException
+from app.base.loading_profile import LoadingProfile, NO_RELATIONSHIPS
+from app.base.pagination import Page, paginate, build_page
 from app.db import SessionLocal
 
 Model = TypeVar("Model")
+IN_CLAUSE_CHUNK_SIZE = 500
 
 
 class BaseCRUDRepository(Generic[Model]):
     """Base Class for CRUD operations. Class will be inherited by all Model Repositories."""
 
-    def __init__(self, db: SessionLocal, model: Type[Model]):
+    def __init__(self, db: SessionLocal, model: Type[Model], profile: LoadingProfile = NO_RELATIONSHIPS):
         self.db = db
         self.model = model
+        self.profile = profile
+
+    def base_query(self):
+        """
+        Function returns a query over the repository model with the loading profile applied.
+        Every read method that returns model objects should start from this query.
+
+        Return: Query object for the model.
+        """
+        return self.profile.apply(self.db.query(self.model), self.model)
 
     def create(self, attributes: dict):
         """
@@ -41,7 +55,7 @@ class BaseCRUDRepository(Generic[Model]):
         Return: All the models of a specific model.
         """
         try:
-            models = self.db.query(self.model).all()
+            models = self.base_query().all()
             return models
         except Exception as exc:
             self.db.rollback()
@@ -60,12 +74,59 @@ class BaseCRUDRepository(Generic[Model]):
         Return: A list of all the instances of the model class that are in the database.
         """
         try:
-            result = self.db.query(self.model).offset(skip).limit(limit).all()
+            result = self.base_query().offset(skip).limit(limit).all()
         except Exception as exc:
             self.db.rollback()
             raise AppException(message=str(exc), code=500) from exc
         return result
 
+    def read_page(self, *, page: int = 1, cursor: Optional[str] = None, limit: int = 100, query=None) -> Page:
+        """
+        Function returns one page of objects, ordered by the stable sort key of the model.
+        With a cursor, the page is read with a keyset condition instead of an offset, so deep pages cost
+        the same as the first one. The returned page carries the cursor of the next page.
+
+        Param page:int: Page number, used when no cursor is given.
+        Param cursor:str: Cursor returned with the previous page.
+        Param limit:int: Number of objects on a page.
+        Param query: Query to paginate, defaults to the base query of the repository.
+        Return: A Page of model objects.
+        """
+        query = paginate(self.base_query() if query is None else query, self.model,
+                         page=page, cursor=cursor, limit=limit)
+        try:
+            return build_page(query.all(), self.model, limit)
+        except Exception as exc:
+            self.db.rollback()
+            raise AppException(message=str(exc), code=500) from exc
+
+    def read_rows(self, columns: Sequence) -> list:
+        """
+        Function returns the given columns of all objects as rows, without loading model objects.
+
+        Param columns:Sequence: Columns to select, like a projection of a response schema.
+        Return: A list of rows.
+        """
+        try:
+            return self.db.query(*columns).all()
+        except Exception as exc:
+            self.db.rollback()
+            raise AppException(message=str(exc), code=500) from exc
+
+    def read_page_rows(self, columns: Sequence, *, page: int = 1, cursor: Optional[str] = None,
+                       limit: int = 100) -> Page:
+        """
+        Function returns the given columns of one page of objects as rows, without loading model objects.
+        The columns must include the sort key of the model, labelled with the names of its columns.
+
+        Param columns:Sequence: Columns to select, like a projection of a response schema.
+        Param page:int: Page number, used when no cursor is given.
+        Param cursor:str: Cursor returned with the previous page.
+        Param limit:int: Number of rows on a page.
+        Return: A Page of rows.
+        """
+        return self.read_page(page=page, cursor=cursor, limit=limit, query=self.db.query(*columns))
+
     def read_by_id(self, model_id: Union[str, int]):
         """
         Function accepts a model_id as an argument and returns the object with that ID.
@@ -76,7 +137,7 @@ class BaseCRUDRepository(Generic[Model]):
         Return: An object of the model class that matches the given ID.
         """
         try:
-            obj = self.db.query(self.model).filter(self.model.id == model_id).first()
+            obj = self.base_query().filter(self.model.id == model_id).first()
             if not obj:
                 self.db.rollback()
                 raise AppException(message=f"{self.model.__name__} ID: {model_id} does not exist in DB.", code=400)
@@ -85,6 +146,62 @@ class BaseCRUDRepository(Generic[Model]):
             self.db.rollback()
             raise exc
 
+    def read_by_ids(self, model_ids: Iterable[Union[str, int]], chunk_size: int = IN_CLAUSE_CHUNK_SIZE):
+        """
+        Function accepts a list of IDs and returns the objects with those IDs, fetched with one IN query
+        per chunk of IDs. Objects are returned in the order of the given IDs, IDs that do not exist are skipped.
+
+        Param model_ids:Iterable: IDs of the objects to retrieve.
+        Param chunk_size:int: Maximum number of IDs sent in a single IN clause.
+        Return: A list of objects of the model class.
+        """
+        try:
+            model_ids = list(dict.fromkeys(model_ids))
+            objects = {}
+            for start in range(0, len(model_ids), chunk_size):
+                chunk = model_ids[start:start + chunk_size]
+                for obj in self.base_query().filter(self.model.id.in_(chunk)).all():
+                    objects[obj.id] = obj
+            return [objects[model_id] for model_id in model_ids if model_id in objects]
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
+
+    def upsert_many(self, rows: list, keys: Sequence[str], replace: Sequence[str] = (),
+                    increment: Sequence[str] = ()):
+        """
+        Function inserts rows with a single multi-row statement, updating rows whose keys already exist:
+        replace columns take the new value, increment columns add it to the stored value.
+        Uses INSERT ... ON DUPLICATE KEY UPDATE on MySQL and INSERT ... ON CONFLICT on SQLite.
+        Changes are not committed.
+
+        Param rows:list: Dictionaries with the same columns for every row.
+        Param keys:Sequence[str]: Columns of the primary key or unique constraint that identifies a row.
+        Param replace:Sequence[str]: Columns overwritten on existing rows.
+        Param increment:Sequence[str]: Columns added to on existing rows.
+        Return: None.
+        """
+        if not rows:
+            return
+        table = self.model.__table__
+        try:
+            if self.db.get_bind().dialect.name == "mysql":
+                statement = mysql.insert(table).values(rows)
+                new = statement.inserted
+                self.db.execute(statement.on_duplicate_key_update(
+                    {**{column: new[column] for column in replace},
+                     **{column: table.c[column] + new[column] for column in increment}}))
+            else:
+                statement = sqlite.insert(table).values(rows)
+                new = statement.excluded
+                self.db.execute(statement.on_conflict_do_update(
+                    index_elements=[table.c[column] for column in keys],
+                    set_={**{column: new[column] for column in replace},
+                          **{column: table.c[column] + new[column] for column in increment}}))
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
+
     def update(self, db_obj, updates: dict):
         """
         Function updates an existing object in the database.
@@ -0,0 +1,62 @@
+"""Fast JSON serialization module"""
+from decimal import Decimal
+from functools import lru_cache
+from typing import Sequence
+
+import orjson
+from sqlalchemy import inspect
+from starlette.responses import Response
+
+from app.base.pagination import NEXT_CURSOR_HEADER
+
+
+def _default(value):
+    """Serializes values orjson does not know, like the Decimal averages of MySQL."""
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class FastJSONResponse(Response):
+    """JSON response rendered with orjson, for content that is already made of plain values."""
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+@lru_cache(maxsize=None)
+def projection(model, schema) -> tuple:
+    """
+    Function returns the columns of a model selected for a response schema, labelled with the names of its fields,
+    so rows of the select have the keys of the schema. Every field of the schema must be a column of the model.
+
+    Param model: Model class.
+    Param schema: Pydantic schema of the response.
+    Return: A tuple of labelled columns.
+    """
+    columns = inspect(model).columns
+    return tuple(columns[field.name].label(field.alias) for field in schema.__fields__.values())
+
+
+def fast_json_response(result, status_code: int = 200) -> Response:
+    """
+    Function renders the result of a route with orjson, without validating it with the response model
+    of the route. Rows of a projection are rendered as objects, and the next cursor of a page is set as a header.
+    Responses, like the messages of empty results, are returned unchanged.
+
+    Param result: Rows of a projection, or a list or dictionary of plain values.
+    Param status_code:int: Status code of the response.
+    Return: Response.
+    """
+    if isinstance(result, Response):
+        return result
+    content = result
+    if isinstance(result, Sequence) and result and hasattr(result[0], "_fields"):
+        keys = result[0]._fields
+        content = [dict(zip(keys, row)) for row in result]
+    response = FastJSONResponse(content, status_code)
+    next_cursor = getattr(result, "next_cursor", None)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return response
@@ -0,0 +1,49 @@
+"""Loading Profile module, describes which relationships a query should load eagerly."""
+from sqlalchemy.orm import selectinload
+
+
+class LoadingProfile:
+    """
+    Set of relationships that a service method needs loaded before its session is closed.
+    Relationships that are not listed stay lazy and are never fetched for detached objects.
+    Nested relationships are written with dots, e.g. 'movies.actors'.
+    """
+
+    def __init__(self, *relationships: str, strategy=selectinload):
+        self.relationships = relationships
+        self.strategy = strategy
+
+    def options(self, model) -> list:
+        """
+        Function builds loader options for the given model from the relationship names of the profile.
+
+        Param model: Model class that is the root entity of the query.
+        Return: A list of loader options that can be passed to Query.options().
+        """
+        options = []
+        for path in self.relationships:
+            entity = model
+            option = None
+            for name in path.split("."):
+                attribute = getattr(entity, name)
+                if option is None:
+                    option = self.strategy(attribute)
+                else:
+                    option = getattr(option, self.strategy.__name__)(attribute)
+                entity = attribute.property.mapper.class_
+            options.append(option)
+        return options
+
+    def apply(self, query, model):
+        """
+        Function applies the profile on a query.
+
+        Param query: SQLAlchemy Query object.
+        Param model: Model class that is the root entity of the query.
+        Return: Query object with loader options.
+        """
+        options = self.options(model)
+        return query.options(*options) if options else query
+
+
+NO_RELATIONSHIPS = LoadingProfile()
@@ -0,0 +1,122 @@
+"""Keyset (cursor) pagination module"""
+import base64
+import json
+from datetime import date, datetime
+from typing import Optional, Sequence
+
+from sqlalchemy import and_, or_
+
+from app.base.base_exception import AppException
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class Page(list):
+    """List of objects on one page of results, together with the cursor of the following page."""
+
+    def __init__(self, items: Sequence = (), next_cursor: Optional[str] = None):
+        super().__init__(items)
+        self.next_cursor = next_cursor
+
+
+def keyset_columns(model) -> tuple:
+    """
+    Function returns the stable sort key of a model. Models with date_added are sorted by (date_added, id),
+    all others by id alone.
+
+    Param model: Model class.
+    Return: A tuple of columns.
+    """
+    if hasattr(model, "date_added"):
+        return model.date_added, model.id
+    return (model.id,)
+
+
+def encode_cursor(obj, columns: Sequence) -> str:
+    """
+    Function encodes the sort key values of the given object into an opaque cursor.
+
+    Param obj: Last object of a page.
+    Param columns:Sequence: Sort key columns.
+    Return: Cursor string.
+    """
+    values = []
+    for column in columns:
+        value = getattr(obj, column.key)
+        values.append(value.isoformat() if isinstance(value, (date, datetime)) else str(value))
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def decode_cursor(cursor: str, columns: Sequence) -> list:
+    """
+    Function decodes a cursor into the sort key values, converted to the types of the columns.
+    If the cursor was not produced by encode_cursor for the same columns, it raises AppException with code 400.
+
+    Param cursor:str: Cursor string.
+    Param columns:Sequence: Sort key columns.
+    Return: A list of sort key values.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError(cursor)
+        decoded = []
+        for column, value in zip(columns, values):
+            python_type = column.type.python_type
+            decoded.append(python_type.fromisoformat(value) if python_type in (date, datetime) else value)
+        return decoded
+    except (ValueError, TypeError) as exc:
+        raise AppException(message=f"Invalid cursor: '{cursor}'.", code=400) from exc
+
+
+def paginate(query, model, *, page: int = 1, cursor: Optional[str] = None, limit: int = 100):
+    """
+    Function orders a query or a select statement by the sort key of the model and limits it to one page.
+    With a cursor, the page starts right after the cursor, otherwise the page number is used with an offset.
+    One row more than the limit is selected, so build_page can tell whether there is a next page.
+
+    Param query: Query or Select over the model.
+    Param model: Model class.
+    Param page:int: Page number, used when no cursor is given.
+    Param cursor:str: Cursor returned with the previous page.
+    Param limit:int: Number of objects on a page.
+    Return: The paginated query.
+    """
+    columns = keyset_columns(model)
+    query = query.order_by(*columns)
+    if cursor:
+        values = decode_cursor(cursor, columns)
+        conditions = [and_(*[column == value for column, value in zip(columns[:i], values[:i])],
+                           columns[i] > values[i]) for i in range(len(columns))]
+        query = query.filter(or_(*conditions))
+    else:
+        query = query.offset((page - 1) * limit)
+    return query.limit(limit + 1)
+
+
+def build_page(rows: Sequence, model, limit: int) -> Page:
+    """
+    Function builds a page from the rows selected by a query from paginate.
+
+    Param rows:Sequence: Selected objects.
+    Param model: Model class.
+    Param limit:int: Number of objects on a page.
+    Return: A Page with the next cursor, which is None on the last page.
+    """
+    items = list(rows[:limit])
+    next_cursor = encode_cursor(items[-1], keyset_columns(model)) if len(rows) > limit else None
+    return Page(items, next_cursor)
+
+
+def set_next_cursor(response, result):
+    """
+    Function sets the next cursor header on the response, if the result is a page with more pages after it.
+
+    Param response: Response of the route.
+    Param result: Result returned by the controller.
+    Return: The result.
+    """
+    next_cursor = getattr(result, "next_cursor", None)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return result
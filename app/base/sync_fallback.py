@@ -0,0 +1,25 @@
+"""Dispatch between the async and the sync database path."""
+from functools import wraps
+from typing import Callable
+
+from starlette.concurrency import run_in_threadpool
+
+from app.config import settings
+
+
+def sync_fallback(sync_function: Callable):
+    """
+    Function decorates an async controller method with its sync counterpart. When DB_ASYNC is disabled
+    the sync function is run in the threadpool, so async routes keep working on the sync driver.
+
+    Param sync_function:Callable: Sync controller method with the same arguments.
+    Return: Decorator for the async method.
+    """
+    def decorator(async_function: Callable):
+        @wraps(async_function)
+        async def wrapper(*args, **kwargs):
+            if not settings.DB_ASYNC:
+                return await run_in_threadpool(sync_function, *args, **kwargs)
+            return await async_function(*args, **kwargs)
+        return wrapper
+    return decorator
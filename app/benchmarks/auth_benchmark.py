@@ -0,0 +1,86 @@
+"""Auth Benchmark module
+
+Measures the time spent on authentication per request, verifying the token signature
+on every request (before) and resolving the principal through the verified token cache (after).
+
+Run with: python -m app.benchmarks.auth_benchmark --requests 20000 --tokens 100
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from uuid import uuid4
+
+from starlette.requests import Request
+
+from app.users.controller.user_auth_controller import JWTBearer
+from app.users.service import sign_jwt, decode_jwt
+from app.users.service.user_auth_service import verified_tokens
+
+
+def create_request(token: str) -> Request:
+    """
+    Function creates a request with the token in the authorization header.
+
+    Param token:str: Bearer token.
+    Return: Request.
+    """
+    headers = [(b"authorization", f"Bearer {token}".encode())]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+def summarize(timings: list) -> dict:
+    """
+    Function returns mean and percentiles of timings, in microseconds.
+
+    Param timings:list: Timings in seconds.
+    Return: A dictionary with the statistics.
+    """
+    timings = sorted(timings)
+
+    def percentile(share: float) -> float:
+        return round(timings[min(len(timings) - 1, int(share * len(timings)))] * 1e6, 2)
+    return {"mean_us": round(statistics.mean(timings) * 1e6, 2), "p50_us": percentile(0.50),
+            "p95_us": percentile(0.95), "p99_us": percentile(0.99)}
+
+
+async def run(requests: int, tokens: int) -> dict:
+    """
+    Function authenticates the given number of requests, spread over the given number of tokens,
+    with the token verified on every request and with the verified token cache.
+
+    Param requests:int: Number of requests to authenticate.
+    Param tokens:int: Number of distinct tokens.
+    Return: A dictionary with the statistics for both variants.
+    """
+    token_list = [sign_jwt(str(uuid4()), "regular_user")["access_token"] for _ in range(tokens)]
+    bearer = JWTBearer(["regular_user", "sub_user"])
+
+    before = []
+    for i in range(requests):
+        request = create_request(token_list[i % tokens])
+        start = time.perf_counter()
+        credentials = await super(JWTBearer, bearer).__call__(request)
+        payload = decode_jwt(credentials.credentials)
+        assert payload["role"] in bearer.role
+        before.append(time.perf_counter() - start)
+
+    verified_tokens.clear()
+    after = []
+    for i in range(requests):
+        request = create_request(token_list[i % tokens])
+        start = time.perf_counter()
+        await bearer(request)
+        after.append(time.perf_counter() - start)
+
+    return {"requests": requests, "tokens": tokens, "verify_every_request": summarize(before),
+            "verified_token_cache": summarize(after)}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark authentication overhead per request.")
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--tokens", type=int, default=100)
+    arguments = parser.parse_args()
+    print(json.dumps(asyncio.run(run(arguments.requests, arguments.tokens)), indent=2))
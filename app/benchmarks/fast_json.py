@@ -0,0 +1,136 @@
+"""Fast JSON Benchmark module
+
+Seeds a catalogue of movies and measures the latency of a list response of movies through FastAPI, with the
+default path, which loads Movie objects, validates them with MovieSchema and encodes them with the JSON encoder
+of FastAPI, and with the fast path, which selects the columns of MovieSchema as rows and renders them with orjson.
+Both routes read one page of the given size through the same repository, so the difference is the cost of
+loading objects, validation and serialization.
+Runs against the configured database. Everything the benchmark created is deleted afterwards.
+
+Run with: python -m app.benchmarks.fast_json --sizes 1000 10000 --requests 50
+"""
+import argparse
+import json
+import statistics
+import time
+from uuid import uuid4
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.base import projection, fast_json_response
+from app.db import SessionLocal, new_id
+from app.directors.models import Director
+from app.genres.models import Genre
+from app.main import app  # noqa: F401, applies pending migrations
+from app.movies.models import Movie
+from app.movies.repositories import MovieRepository
+from app.movies.schemas import MovieSchema
+
+
+def seed(titles: int) -> str:
+    """
+    Function creates the benchmark movies, with one director and one genre.
+
+    Param titles:int: Number of movies.
+    Return: Prefix of the names of everything the benchmark created.
+    """
+    prefix = f"Benchmark {uuid4().hex[:8]}"
+    director = {"id": new_id(), "first_name": prefix, "last_name": "Director", "country": "USA"}
+    genre = {"id": new_id(), "name": prefix}
+    movies = [{"id": new_id(), "title": f"{prefix} {i}", "year_published": "2022", "link": "https://example.com",
+               "description": f"Description of benchmark movie number {i}.", "genre_id": genre["id"],
+               "director_id": director["id"]} for i in range(titles)]
+    with SessionLocal() as db:
+        db.execute(Director.__table__.insert(), [director])
+        db.execute(Genre.__table__.insert(), [genre])
+        for start in range(0, len(movies), 1000):
+            db.execute(Movie.__table__.insert(), movies[start:start + 1000])
+        db.commit()
+    return prefix
+
+
+def clean_up(prefix: str):
+    """
+    Function deletes everything the benchmark created.
+
+    Param prefix:str: Prefix of the names of everything the benchmark created.
+    Return: None.
+    """
+    with SessionLocal() as db:
+        db.query(Movie).filter(Movie.title.like(f"{prefix} %")).delete(synchronize_session=False)
+        db.query(Director).filter(Director.first_name == prefix).delete(synchronize_session=False)
+        db.query(Genre).filter(Genre.name == prefix).delete(synchronize_session=False)
+        db.commit()
+
+
+def create_app(prefix: str) -> FastAPI:
+    """
+    Function creates an application with the default and the fast route over the benchmark movies.
+
+    Param prefix:str: Prefix of the titles of the benchmark movies.
+    Return: FastAPI.
+    """
+    bench = FastAPI()
+
+    @bench.get("/default", response_model=list[MovieSchema])
+    def default_route(size: int):
+        with SessionLocal() as db:
+            repository = MovieRepository(db, Movie)
+            return repository.read_page(limit=size, query=db.query(Movie).filter(Movie.title.like(f"{prefix} %")))
+
+    @bench.get("/fast", response_model=list[MovieSchema])
+    def fast_route(size: int):
+        with SessionLocal() as db:
+            repository = MovieRepository(db, Movie)
+            query = db.query(*projection(Movie, MovieSchema)).filter(Movie.title.like(f"{prefix} %"))
+            return fast_json_response(repository.read_page(limit=size, query=query))
+
+    return bench
+
+
+def latencies(client: TestClient, path: str, size: int, requests: int) -> dict:
+    """
+    Function requests a page of movies repeatedly and returns percentiles of the latency.
+
+    Param client:TestClient: Client of the benchmark application.
+    Param path:str: Path of the route.
+    Param size:int: Number of movies in the response.
+    Param requests:int: Number of measured requests.
+    Return: A dictionary of p50, p95 and p99 latencies in milliseconds, and the size of the response.
+    """
+    response = client.get(path, params={"size": size})
+    assert len(response.json()) == size, response.text
+    samples = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        client.get(path, params={"size": size})
+        samples.append((time.perf_counter() - start) * 1000)
+    percentiles = statistics.quantiles(samples, n=100)
+    return {"p50_ms": round(percentiles[49], 2), "p95_ms": round(percentiles[94], 2),
+            "p99_ms": round(percentiles[98], 2), "bytes": len(response.content)}
+
+
+def main():
+    """Function parses arguments, seeds the movies and prints latencies of both paths as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000], help="Numbers of movies per response.")
+    parser.add_argument("--requests", type=int, default=50, help="Number of measured requests per route and size.")
+    args = parser.parse_args()
+
+    prefix = seed(max(args.sizes))
+    try:
+        client = TestClient(create_app(prefix))
+        results = {}
+        for size in args.sizes:
+            default = latencies(client, "/default", size, args.requests)
+            fast = latencies(client, "/fast", size, args.requests)
+            results[size] = {"default": default, "fast": fast,
+                             "speedup_p50": round(default["p50_ms"] / fast["p50_ms"], 2)}
+        print(json.dumps(results, indent=2))
+    finally:
+        clean_up(prefix)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""
+Index usage report. Seeds the test database, calls repository methods that filter, join or sort,
+and runs EXPLAIN on every statement they execute, flagging full table scans.
+
+Run against the test database, which is created and dropped by the report:
+    python -m app.benchmarks.index_report --movies 20000
+    python -m app.benchmarks.index_report --compare    # also report without the indexes of migration 0002
+"""
+import argparse
+import json
+import random
+from datetime import date, timedelta
+from uuid import uuid4
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.actors.models import Actor
+from app.actors.repositories import ActorRepository
+from app.base import AppException
+from app.benchmarks.movie_year_ratings import BENCHMARK_URL, insert_in_batches
+from app.db import Base
+from app.db.migrations import downgrade, schema_migrations, upgrade
+from app.directors.models import Director
+from app.directors.repositories import DirectorRepository
+from app.genres.models import Genre
+from app.movies.models import Movie, MovieActor
+from app.movies.repositories import MovieRepository, MovieActorRepository
+from app.series.models import Series, Episode
+from app.series.repositories import SeriesRepository, EpisodeRepository
+from app.users.models import User
+from app.users.models.user import UserWatchMovie, UserWatchEpisode
+from app.users.repositories import UserRepository, UserWatchMovieRepository, UserWatchEpisodeRepository
+
+QUERY_INDEXES_VERSION = 2
+
+
+def seed(engine, movies: int) -> dict:
+    """
+    Function fills the database with synthetic catalogue, users and watch records,
+    and returns sample values for the repository calls.
+
+    Param engine: Engine of the report database.
+    Param movies:int: Number of movies, other tables are sized relative to it.
+    Return: A dictionary with sample values.
+    """
+    series_count, actors, users = max(movies // 5, 1), movies, max(movies // 2, 1)
+    directors = [{"id": str(uuid4()), "first_name": f"First {i}", "last_name": f"Director {i}", "country": "USA"}
+                 for i in range(max(movies // 100, 1))]
+    genres = [{"id": str(uuid4()), "name": f"Genre {i}"} for i in range(20)]
+    movie_rows = [{"id": str(uuid4()), "title": f"Movie {i}", "description": "Report movie",
+                   "year_published": str(2022 - i % 70), "date_added": date(2022, 1, 1) + timedelta(days=i % 365),
+                   "link": "https://example.com", "director_id": random.choice(directors)["id"],
+                   "genre_id": random.choice(genres)["id"]} for i in range(movies)]
+    series_rows = [{"id": str(uuid4()), "title": f"Series {i}", "description": "Report series",
+                    "year_published": str(2022 - i % 70), "date_added": date(2022, 1, 1) + timedelta(days=i % 365),
+                    "director_id": random.choice(directors)["id"], "genre_id": random.choice(genres)["id"]}
+                   for i in range(series_count)]
+    episode_rows = [{"id": str(uuid4()), "name": f"Episode {i}", "description": "Report episode",
+                     "link": "https://example.com", "series_id": series["id"]}
+                    for series in series_rows for i in range(10)]
+    actor_rows = [{"id": str(uuid4()), "first_name": f"First {i}", "last_name": f"Actor {i}",
+                   "date_of_birth": date(1950, 1, 1) + timedelta(days=i % 20000), "country": "USA"}
+                  for i in range(actors)]
+    user_rows = [{"id": str(uuid4()), "email": f"user{i}@example.com", "username": f"user{i}", "password_hashed": "x",
+                  "is_active": True, "is_superuser": False, "verification_code": 100000 + i} for i in range(users)]
+    with engine.begin() as connection:
+        insert_in_batches(connection, Director.__table__, directors)
+        insert_in_batches(connection, Genre.__table__, genres)
+        insert_in_batches(connection, Movie.__table__, movie_rows)
+        insert_in_batches(connection, Series.__table__, series_rows)
+        insert_in_batches(connection, Episode.__table__, episode_rows)
+        insert_in_batches(connection, Actor.__table__, actor_rows)
+        insert_in_batches(connection, User.__table__, user_rows)
+        insert_in_batches(connection, MovieActor.__table__, (
+            {"id": str(uuid4()), "movie_id": movie["id"], "actor_id": random.choice(actor_rows)["id"]}
+            for movie in movie_rows for _ in range(3)))
+        insert_in_batches(connection, UserWatchMovie.__table__, (
+            {"id": str(uuid4()), "user_id": user["id"], "movie_id": movie["id"], "rating": random.randint(1, 10)}
+            for user in user_rows for movie in random.sample(movie_rows, min(10, movies))))
+        insert_in_batches(connection, UserWatchEpisode.__table__, (
+            {"id": str(uuid4()), "user_id": user["id"], "episode_id": episode["id"], "rating": random.randint(1, 10)}
+            for user in user_rows for episode in random.sample(episode_rows, min(10, len(episode_rows)))))
+    movie, series, actor, user = movie_rows[len(movie_rows) // 2], series_rows[0], actor_rows[-1], user_rows[-1]
+    return {"movie": movie, "series": series, "episode": episode_rows[-1], "actor": actor, "user": user,
+            "director": directors[0], "genre": genres[0]}
+
+
+def repository_calls(sample: dict) -> dict:
+    """
+    Function returns the reported repository methods, each as a function of a session.
+
+    Param sample:dict: Sample values returned by seed.
+    Return: A dictionary with method name as key and function as value.
+    """
+    movie, series, episode, actor, user = (sample[key] for key in ("movie", "series", "episode", "actor", "user"))
+    director, genre = sample["director"], sample["genre"]
+    return {
+        "MovieRepository.read_movie_by_title": lambda db: MovieRepository(db, Movie).read_movie_by_title(
+            movie["title"]),
+        "MovieRepository.read_movies_by_year": lambda db: MovieRepository(db, Movie).read_movies_by_year(
+            movie["year_published"]),
+        "MovieRepository.read_latest_releases": lambda db: MovieRepository(db, Movie).read_latest_releases(
+            "2022-12-01"),
+        "MovieRepository.read_movies_by_director_name": lambda db: MovieRepository(
+            db, Movie).read_movies_by_director_name(director["last_name"]),
+        "MovieRepository.read_movies_by_genre_name": lambda db: MovieRepository(db, Movie).read_movies_by_genre_name(
+            genre["name"]),
+        "MovieActorRepository.read_by_actor": lambda db: MovieActorRepository(db, MovieActor).read_by_actor(
+            actor["id"]),
+        "SeriesRepository.read_series_by_title": lambda db: SeriesRepository(db, Series).read_series_by_title(
+            series["title"]),
+        "SeriesRepository.read_series_by_year": lambda db: SeriesRepository(db, Series).read_series_by_year(
+            series["year_published"]),
+        "SeriesRepository.read_series_by_episode_id": lambda db: SeriesRepository(
+            db, Series).read_series_by_episode_id(episode["id"]),
+        "EpisodeRepository.read_by_series_id": lambda db: EpisodeRepository(db, Episode).read_by_series_id(
+            series["id"]),
+        "EpisodeRepository.read_by_episode_name_and_series_id": lambda db: EpisodeRepository(
+            db, Episode).read_by_episode_name_and_series_id(episode["name"], episode["series_id"]),
+        "ActorRepository.read_actors_by_last_name": lambda db: ActorRepository(db, Actor).read_actors_by_last_name(
+            actor["last_name"], search=False),
+        "ActorRepository.read_actors_by_year_of_birth": lambda db: ActorRepository(
+            db, Actor).read_actors_by_year_of_birth(actor["date_of_birth"].year),
+        "DirectorRepository.read_directors_by_last_name": lambda db: DirectorRepository(
+            db, Director).read_directors_by_last_name(director["last_name"], search=False),
+        "UserRepository.read_user_by_email": lambda db: UserRepository(db, User).read_user_by_email(user["email"]),
+        "UserRepository.read_user_by_code": lambda db: UserRepository(db, User).read_user_by_code(
+            user["verification_code"]),
+        "UserWatchMovieRepository.read_movies_from_user": lambda db: UserWatchMovieRepository(
+            db, UserWatchMovie).read_movies_from_user(user["id"]),
+        "UserWatchMovieRepository.read_average_rating_for_movies": lambda db: UserWatchMovieRepository(
+            db, UserWatchMovie).read_average_rating_for_movies([movie["id"]]),
+        "UserWatchMovieRepository.read_average_rating_for_year": lambda db: UserWatchMovieRepository(
+            db, UserWatchMovie).read_average_rating_for_year(movie["year_published"]),
+        "UserWatchEpisodeRepository.read_by_user_id": lambda db: UserWatchEpisodeRepository(
+            db, UserWatchEpisode).read_by_user_id(user["id"]),
+        "UserWatchEpisodeRepository.read_average_rating_for_series_year": lambda db: UserWatchEpisodeRepository(
+            db, UserWatchEpisode).read_average_rating_for_series_year(series["year_published"]),
+    }
+
+
+def explain(connection, statement: str, parameters) -> list:
+    """
+    Function returns the query plan of a statement, one entry per accessed table.
+    On MySQL a table is fully scanned when its access type is ALL,
+    on SQLite when it is scanned without an index.
+
+    Param connection: Database connection.
+    Param statement:str: SQL statement as sent to the driver.
+    Param parameters: Parameters as sent to the driver.
+    Return: A list of dictionaries with table, access, index, rows and full_scan.
+    """
+    if connection.dialect.name == "mysql":
+        rows = connection.exec_driver_sql(f"EXPLAIN {statement}", parameters).mappings().all()
+        return [{"table": row["table"], "access": row["type"], "index": row["key"], "rows": row["rows"],
+                 "full_scan": row["type"] == "ALL"} for row in rows]
+    rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).mappings().all()
+    return [{"table": None, "access": row["detail"], "index": None, "rows": None,
+             "full_scan": row["detail"].startswith("SCAN") and " USING " not in row["detail"]} for row in rows]
+
+
+def report(engine, session_factory, calls: dict) -> dict:
+    """
+    Function runs every repository call, capturing its statements, and explains them.
+
+    Param engine: Engine of the report database.
+    Param session_factory: Session factory bound to the engine.
+    Param calls:dict: Repository calls returned by repository_calls.
+    Return: A dictionary with the plans of every method and the methods that scan full tables.
+    """
+    methods = {}
+    for name, call in calls.items():
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement, parameters))
+        event.listen(engine, "before_cursor_execute", capture)
+        error = None
+        try:
+            with session_factory() as db:
+                call(db)
+        except AppException as exc:
+            error = exc.message
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+        with engine.connect() as connection:
+            plans = [explain(connection, statement, parameters) for statement, parameters in statements]
+        methods[name] = {"statements": len(statements), "plans": plans, "error": error,
+                         "full_scans": sorted({step["access"] if step["table"] is None else step["table"]
+                                               for plan in plans for step in plan if step["full_scan"]})}
+    return {"methods": methods, "methods_with_full_scans": [name for name, method in methods.items()
+                                                            if method["full_scans"]]}
+
+
+def main():
+    """Function parses arguments, seeds the database and prints the report as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--movies", type=int, default=20000, help="Number of movies.")
+    parser.add_argument("--compare", action="store_true", help="Also report without the query indexes.")
+    args = parser.parse_args()
+
+    engine = create_engine(BENCHMARK_URL)
+    session_factory = sessionmaker(bind=engine)
+    Base.metadata.drop_all(bind=engine)
+    schema_migrations.drop(engine, checkfirst=True)
+    try:
+        upgrade(engine)
+        calls = repository_calls(seed(engine, args.movies))
+        result = {"with_indexes": report(engine, session_factory, calls)}
+        if args.compare:
+            downgrade(engine, QUERY_INDEXES_VERSION - 1)
+            result["without_indexes"] = report(engine, session_factory, calls)
+            upgrade(engine)
+        print(json.dumps(result, indent=2, default=str))
+    finally:
+        Base.metadata.drop_all(bind=engine)
+        schema_migrations.drop(engine, checkfirst=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+"""Load benchmark package, run with python -m app.benchmarks.load"""
+from .dataset import Dataset, seed, clean_up
+from .load_generator import Route, ROUTES, create_client, run_load
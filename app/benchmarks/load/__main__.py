@@ -0,0 +1,104 @@
+"""Load Benchmark module
+
+Seeds a dataset of the given scale, drives the application with concurrent requests of a weighted mix of routes
+and reports requests per second and p50, p95 and p99 latency of every route. Results are written to a JSON file
+with the commit, so results of two commits can be diffed, or compared with --compare, which exits with status 1
+when a p50 or p95 latency regressed by more than the threshold.
+Runs against the configured database, in-process unless --url of a running server is given. The seeded dataset
+is deleted afterwards, unless --keep is given.
+
+Run with: python -m app.benchmarks.load --scale 1 --concurrency 32 --duration 30 --output results.json
+"""
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import time
+
+from app.main import app  # noqa: F401, applies pending migrations
+from .dataset import seed, clean_up
+from .load_generator import ROUTES, create_client, run_load
+
+COMPARED = ("p50_ms", "p95_ms")
+
+
+def commit() -> str:
+    """Function returns the current git commit, or None outside a repository."""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(baseline: dict, results: dict, threshold: float) -> list:
+    """
+    Function compares latencies of every route with a baseline.
+
+    Param baseline:dict: Results of a previous run.
+    Param results:dict: Results of this run.
+    Param threshold:float: Allowed relative increase of a latency, like 0.2 for 20%.
+    Return: A list of regressions, empty when there are none.
+    """
+    regressions = []
+    for name, route in results["routes"].items():
+        before = baseline["routes"].get(name)
+        if not before:
+            continue
+        for key in COMPARED:
+            if before[key] and route[key] > before[key] * (1 + threshold):
+                regressions.append({"route": name, "metric": key, "baseline": before[key], "current": route[key],
+                                    "change": round(route[key] / before[key] - 1, 3)})
+    return regressions
+
+
+async def benchmark(args, dataset) -> dict:
+    """Function runs the load with the arguments of the command line."""
+    routes = [route for route in ROUTES if not args.routes or route.name in args.routes]
+    async with create_client(args.url, args.concurrency) as client:
+        return await run_load(client, dataset, routes, args.concurrency, args.duration, args.warmup, args.seed)
+
+
+def main():
+    """Function parses arguments, seeds the dataset, runs the load and writes results as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=float, default=1.0, help="Size of the dataset, in units of 1,000 users.")
+    parser.add_argument("--seed", type=int, default=1, help="Seed of the dataset and the requests.")
+    parser.add_argument("--concurrency", type=int, default=32, help="Number of concurrent requests.")
+    parser.add_argument("--duration", type=float, default=30.0, help="Measured seconds.")
+    parser.add_argument("--warmup", type=float, default=5.0, help="Seconds before the measurement.")
+    parser.add_argument("--url", help="Base URL of a running server, the application runs in-process by default.")
+    parser.add_argument("--routes", nargs="+", choices=[route.name for route in ROUTES], help="Routes of the load.")
+    parser.add_argument("--output", default="results.json", help="File the results are written to.")
+    parser.add_argument("--compare", help="File with results of a previous run to compare with.")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed relative increase of a latency.")
+    parser.add_argument("--keep", action="store_true", help="Keep the seeded dataset.")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    dataset = seed(args.scale, args.seed)
+    seed_seconds = time.perf_counter() - start
+    try:
+        load = asyncio.run(benchmark(args, dataset))
+    finally:
+        clean_up_seconds = None if args.keep else clean_up(dataset.name)
+    results = {
+        "commit": commit(),
+        "config": {key: value for key, value in vars(args).items() if key not in ("output", "compare", "keep")},
+        "dataset": {"name": dataset.name, "rows": dataset.rows, "seed_seconds": round(seed_seconds, 2),
+                    "clean_up_seconds": clean_up_seconds and round(clean_up_seconds, 2)},
+        **load,
+    }
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            results["regressions"] = compare(json.load(file), results, args.threshold)
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+    print(json.dumps(results, indent=2))
+    if results.get("regressions"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""Load Benchmark Dataset module
+
+Seeds a dataset whose size grows linearly with the scale: users with subusers, a catalogue of movies and series
+with genres, directors, actors and episodes, and watch and rating records of every user. At scale 1 there are
+1,000 users and 100,000 watch records, scale 10 gives a million. Rows are generated with FakeData and inserted
+with multi-row inserts in chunks, and summary tables and trending scores are rebuilt from the watch records.
+Everything is tagged with the name of the dataset, so it can be deleted afterwards.
+"""
+import time
+from datetime import date, timedelta
+from typing import NamedTuple
+from uuid import uuid4
+
+from app.actors.models import Actor
+from app.db import SessionLocal, new_id
+from app.directors.models import Director
+from app.genres.models import Genre
+from app.movies.models import Movie, MovieActor
+from app.series.models import Series, SeriesActor, Episode
+from app.stats.service import StatsServices
+from app.users.models import User, Subuser
+from app.users.models.user import UserWatchMovie, UserWatchEpisode
+from app.users.service import hash_password
+from app.utils import FakeData
+
+PASSWORD = "benchmark1"
+INSERT_CHUNK_SIZE = 5000
+# Numbers of rows per unit of scale.
+USERS = 1000
+GENRES = 20
+DIRECTORS = 100
+ACTORS = 1000
+MOVIES = 2000
+SERIES = 200
+EPISODES_PER_SERIES = 10
+CAST_SIZE = 4
+WATCHED_MOVIES_PER_USER = 50
+WATCHED_EPISODES_PER_USER = 50
+RATED_SHARE = 0.6
+HISTORY_DAYS = 365
+
+
+class Dataset(NamedTuple):
+    """Seeded dataset, with the values the load generator needs to build requests."""
+    name: str
+    user_ids: list
+    movie_ids: list
+    movie_titles: list
+    series_titles: list
+    rows: dict
+
+
+def insert(db, model, rows: list) -> int:
+    """
+    Function inserts rows of a model with multi-row inserts of INSERT_CHUNK_SIZE rows.
+
+    Param db: Database session.
+    Param model: Model class.
+    Param rows:list: Dictionaries of column values.
+    Return: Number of inserted rows.
+    """
+    for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+        db.execute(model.__table__.insert(), rows[start:start + INSERT_CHUNK_SIZE])
+    return len(rows)
+
+
+def people(fake: FakeData, number: int, name: str, **columns) -> list:
+    """
+    Function returns rows of directors or actors, whose first name is the name of the dataset.
+
+    Param fake:FakeData: Generator of fake values.
+    Param number:int: Number of rows.
+    Param name:str: Name of the dataset.
+    Param columns: Columns with a function generating their value.
+    Return: A list of rows.
+    """
+    return [{"id": new_id(), "first_name": name, "last_name": fake.last_name(), "country": fake.country(),
+             **{column: generate() for column, generate in columns.items()}} for _ in range(number)]
+
+
+def watch_records(fake: FakeData, user_ids: list, item_ids: list, column: str, per_user: int) -> list:
+    """
+    Function returns watch records of every user, for distinct titles or episodes, dated within HISTORY_DAYS
+    and rated with RATED_SHARE probability.
+
+    Param fake:FakeData: Generator of fake values.
+    Param user_ids:list: IDs of the users.
+    Param item_ids:list: IDs of movies or episodes.
+    Param column:str: Name of the column of the watched item.
+    Param per_user:int: Number of records of every user.
+    Return: A list of rows.
+    """
+    rng, today = fake.random, date.today()
+    rows = []
+    for user_id in user_ids:
+        for item_id in rng.sample(item_ids, min(per_user, len(item_ids))):
+            rating = rng.randint(1, 10) if rng.random() < RATED_SHARE else None
+            rows.append({"id": new_id(), "user_id": user_id, column: item_id, "rating": rating,
+                         "date_watched": today - timedelta(days=int(rng.expovariate(1 / 60)) % HISTORY_DAYS)})
+    return rows
+
+
+def seed(scale: float = 1.0, seed_value: int = 1) -> Dataset:
+    """
+    Function seeds a dataset of the given scale, and rebuilds summary tables and trending scores.
+
+    Param scale:float: Size of the dataset, in units of 1,000 users.
+    Param seed_value:int: Seed of the generator of fake values, the same seed generates the same values.
+    Return: Dataset.
+    """
+    fake = FakeData(seed_value)
+    rng = fake.random
+    name = f"Load{uuid4().hex[:8]}"
+
+    def count(per_unit: int) -> int:
+        return max(int(per_unit * scale), 1)
+
+    password_hashed = hash_password(PASSWORD)
+    users = [{"id": new_id(), "email": f"{name.lower()}.{i}@example.com", "username": name,
+              "password_hashed": password_hashed, "date_subscribed": fake.date_between(date(2020, 1, 1), date.today()),
+              "is_active": True, "is_superuser": False} for i in range(count(USERS))]
+    subusers = [{"id": new_id(), "name": subuser_name, "user_id": user["id"]}
+                for user in users for subuser_name in set(fake.first_name() for _ in range(rng.randint(0, 2)))]
+    genres = [{"id": new_id(), "name": f"{name} {i}"} for i in range(GENRES)]
+    directors = people(fake, count(DIRECTORS), name)
+    actors = people(fake, count(ACTORS), name,
+                    date_of_birth=lambda: fake.date_between(date(1940, 1, 1), date(2005, 12, 31)))
+    catalogue = {"genre_id": lambda: rng.choice(genres)["id"], "director_id": lambda: rng.choice(directors)["id"],
+                 "year_published": lambda: str(rng.randint(1950, 2023)), "description": fake.sentence}
+    movies = [{"id": new_id(), "title": f"{name} movie {i}", "link": fake.url(),
+               "date_added": fake.date_between(date(2020, 1, 1), date.today()),
+               **{column: generate() for column, generate in catalogue.items()}} for i in range(count(MOVIES))]
+    series = [{"id": new_id(), "title": f"{name} series {i}",
+               "date_added": fake.date_between(date(2020, 1, 1), date.today()),
+               **{column: generate() for column, generate in catalogue.items()}} for i in range(count(SERIES))]
+    episodes = [{"id": new_id(), "name": f"Episode {i + 1}", "description": fake.sentence(), "link": fake.url(),
+                 "series_id": title["id"]} for title in series for i in range(EPISODES_PER_SERIES)]
+    actor_ids = [actor["id"] for actor in actors]
+    movie_cast = [{"id": new_id(), "movie_id": movie["id"], "actor_id": actor_id}
+                  for movie in movies for actor_id in rng.sample(actor_ids, min(CAST_SIZE, len(actor_ids)))]
+    series_cast = [{"id": new_id(), "series_id": title["id"], "actor_id": actor_id}
+                   for title in series for actor_id in rng.sample(actor_ids, min(CAST_SIZE, len(actor_ids)))]
+    user_ids = [user["id"] for user in users]
+    watched_movies = watch_records(fake, user_ids, [movie["id"] for movie in movies], "movie_id",
+                                   WATCHED_MOVIES_PER_USER)
+    watched_episodes = watch_records(fake, user_ids, [episode["id"] for episode in episodes], "episode_id",
+                                     WATCHED_EPISODES_PER_USER)
+
+    with SessionLocal() as db:
+        rows = {model.__tablename__: insert(db, model, model_rows) for model, model_rows in (
+            (User, users), (Subuser, subusers), (Genre, genres), (Director, directors), (Actor, actors),
+            (Movie, movies), (Series, series), (Episode, episodes), (MovieActor, movie_cast),
+            (SeriesActor, series_cast), (UserWatchMovie, watched_movies), (UserWatchEpisode, watched_episodes))}
+        db.commit()
+    StatsServices.rebuild_stats()
+    StatsServices.rebuild_trending()
+    return Dataset(name, user_ids, [movie["id"] for movie in movies], [movie["title"] for movie in movies],
+                   [title["title"] for title in series], rows)
+
+
+def clean_up(name: str) -> float:
+    """
+    Function deletes everything of a dataset, including records created by the load, and rebuilds
+    summary tables and trending scores of the remaining records.
+
+    Param name:str: Name of the dataset.
+    Return: Duration in seconds.
+    """
+    start = time.perf_counter()
+    with SessionLocal() as db:
+        users = db.query(User.id).filter(User.username == name)
+        movies = db.query(Movie.id).filter(Movie.title.like(f"{name} movie %"))
+        series = db.query(Series.id).filter(Series.title.like(f"{name} series %"))
+        episodes = db.query(Episode.id).filter(Episode.series_id.in_(series))
+        for model, condition in (
+                (UserWatchMovie, UserWatchMovie.user_id.in_(users)),
+                (UserWatchMovie, UserWatchMovie.movie_id.in_(movies)),
+                (UserWatchEpisode, UserWatchEpisode.user_id.in_(users)),
+                (UserWatchEpisode, UserWatchEpisode.episode_id.in_(episodes)),
+                (Subuser, Subuser.user_id.in_(users)),
+                (MovieActor, MovieActor.movie_id.in_(movies)),
+                (SeriesActor, SeriesActor.series_id.in_(series)),
+                (Episode, Episode.series_id.in_(series)),
+                (Movie, Movie.title.like(f"{name} movie %")),
+                (Series, Series.title.like(f"{name} series %")),
+                (Actor, Actor.first_name == name),
+                (Director, Director.first_name == name),
+                (Genre, Genre.name.like(f"{name} %")),
+                (User, User.username == name)):
+            db.query(model).filter(condition).delete(synchronize_session=False)
+        db.commit()
+    StatsServices.rebuild_stats()
+    StatsServices.rebuild_trending()
+    return time.perf_counter() - start
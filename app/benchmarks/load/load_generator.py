@@ -0,0 +1,140 @@
+"""Load Generator module
+
+Drives the application with concurrent requests of a weighted mix of routes, for a fixed duration, and reports
+latency percentiles and requests per second of every route. Requests go to the application in-process through
+its ASGI interface, or to a running server when a URL is given.
+"""
+import asyncio
+import random
+import time
+from typing import Callable, NamedTuple, Optional
+
+import httpx
+
+from app.users.service import sign_jwt
+from .dataset import Dataset
+
+TRENDING_WINDOWS = ("24h", "7d", "all")
+USER_TOKENS = 100
+
+
+class Route(NamedTuple):
+    """Route of the load, with the function building the parameters and body of a request from the dataset."""
+    name: str
+    method: str
+    path: str
+    weight: int
+    role: Optional[str] = None
+    params: Callable = lambda dataset, rng: {}
+    body: Optional[Callable] = None
+
+
+ROUTES = (
+    Route("movies-page", "GET", "/api/movies/", 10, params=lambda dataset, rng: {"page": rng.randint(1, 10)}),
+    Route("actors-page", "GET", "/api/actors/", 5, params=lambda dataset, rng: {"page": rng.randint(1, 10)}),
+    Route("movie-by-id", "GET", "/api/movies/movie/id", 10, "super_user",
+          params=lambda dataset, rng: {"movie_id": rng.choice(dataset.movie_ids)}),
+    Route("search-movies-title", "GET", "/api/watch-movie/search-movies/title", 5,
+          params=lambda dataset, rng: {"title": rng.choice(dataset.movie_titles)}),
+    Route("top-ten-movies", "GET", "/api/watch-movie/top-ten-movies", 10, "regular_user",
+          params=lambda dataset, rng: {"window": rng.choice(TRENDING_WINDOWS)}),
+    Route("popular-series", "GET", "/api/watch_episode/get-popular-series", 5,
+          params=lambda dataset, rng: {"window": rng.choice(TRENDING_WINDOWS)}),
+    Route("best-rated-movie", "GET", "/api/watch-movie/get-movie/best-rated-movie", 5),
+    Route("movie-ratings", "GET", "/api/watch-movie/get-movies/ratings", 2, "regular_user"),
+    Route("my-movies", "GET", "/api/watch-movie/my-movies", 5, "regular_user"),
+    Route("my-recommendations", "GET", "/api/watch-movie/get-movies/my-recommendations", 5, "regular_user"),
+    Route("watch-movie", "POST", "/api/watch-movie/", 5, "regular_user",
+          body=lambda dataset, rng: {"title": rng.choice(dataset.movie_titles)}),
+    Route("all-users", "GET", "/api/users/get-all-users", 1, "super_user"),
+)
+
+
+def percentiles(samples: list) -> dict:
+    """
+    Function returns the mean and percentiles of latencies.
+
+    Param samples:list: Latencies in seconds.
+    Return: A dictionary of mean, p50, p95 and p99 latencies in milliseconds.
+    """
+    samples = sorted(samples)
+
+    def percentile(share: float) -> float:
+        return round(samples[min(len(samples) - 1, int(share * len(samples)))] * 1000, 2)
+    return {"mean_ms": round(sum(samples) / len(samples) * 1000, 2), "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95), "p99_ms": percentile(0.99)}
+
+
+def create_client(url: Optional[str] = None, concurrency: int = 32) -> httpx.AsyncClient:
+    """
+    Function creates the client of the load, for a running server or for the application in-process.
+    Unhandled exceptions of the application are counted as errors, like a server responding with 500.
+
+    Param url:str: Base URL of a running server, None for the application in-process.
+    Param concurrency:int: Number of concurrent requests.
+    Return: AsyncClient.
+    """
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    if url:
+        return httpx.AsyncClient(base_url=url, limits=limits, timeout=60)
+    from app.main import app  # pylint: disable=import-outside-toplevel
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    return httpx.AsyncClient(transport=transport, base_url="http://benchmark", limits=limits, timeout=60)
+
+
+async def run_load(client: httpx.AsyncClient, dataset: Dataset, routes=ROUTES, concurrency: int = 32,
+                   duration: float = 30.0, warmup: float = 5.0, seed_value: int = 1) -> dict:
+    """
+    Function sends requests of randomly chosen routes, by weight, from concurrent workers, and measures
+    their latency. Requests of the warmup are not measured.
+
+    Param client:AsyncClient: Client of create_client.
+    Param dataset:Dataset: Seeded dataset the requests are built from.
+    Param routes: Routes of the load.
+    Param concurrency:int: Number of concurrent workers.
+    Param duration:float: Measured seconds.
+    Param warmup:float: Seconds before the measurement.
+    Param seed_value:int: Seed of the random choices of the workers.
+    Return: A dictionary with requests, errors, requests per second and latencies of every route and in total.
+    """
+    tokens = {
+        "regular_user": [sign_jwt(user_id, "regular_user")["access_token"] for user_id in
+                         dataset.user_ids[:USER_TOKENS]],
+        "super_user": [sign_jwt(dataset.user_ids[-1], "super_user")["access_token"]],
+    }
+    samples = {route.name: [] for route in routes}
+    errors = {route.name: 0 for route in routes}
+    loop = asyncio.get_running_loop()
+    measure_from = loop.time() + warmup
+    stop_at = measure_from + duration
+
+    async def worker(number: int):
+        rng = random.Random(seed_value * 1000 + number)
+        while loop.time() < stop_at:
+            route = rng.choices(routes, weights=[route.weight for route in routes])[0]
+            headers = {"Authorization": f"Bearer {rng.choice(tokens[route.role])}"} if route.role else {}
+            body = route.body(dataset, rng) if route.body else None
+            started = loop.time()
+            start = time.perf_counter()
+            try:
+                response = await client.request(route.method, route.path, params=route.params(dataset, rng),
+                                                json=body, headers=headers)
+                failed = response.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+            elapsed = time.perf_counter() - start
+            if started >= measure_from and loop.time() <= stop_at:
+                samples[route.name].append(elapsed)
+                errors[route.name] += failed
+
+    await asyncio.gather(*(worker(number) for number in range(concurrency)))
+    results = {}
+    for route in routes:
+        if samples[route.name]:
+            results[route.name] = {"requests": len(samples[route.name]), "errors": errors[route.name],
+                                   "rps": round(len(samples[route.name]) / duration, 1),
+                                   **percentiles(samples[route.name])}
+    everything = [sample for route_samples in samples.values() for sample in route_samples]
+    total = {"requests": len(everything), "errors": sum(errors.values()), "rps": round(len(everything) / duration, 1),
+             **(percentiles(everything) if everything else {})}
+    return {"routes": results, "total": total}
@@ -0,0 +1,160 @@
+"""
+Benchmark for average movie rating per year. Compares the per-year loop with the grouped aggregate query.
+
+Run against the test database, which is created and dropped by the benchmark:
+    python -m app.benchmarks.movie_year_ratings --rows 1000000
+"""
+import argparse
+import random
+import time
+from uuid import uuid4
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.actors.models import Actor  # noqa: F401, registers all tables on Base.metadata
+from app.config import settings
+from app.db import Base
+from app.directors.models import Director  # noqa: F401
+from app.genres.models import Genre  # noqa: F401
+from app.movies.models import Movie
+from app.movies.repositories import MovieRepository
+from app.series.models import Series, Episode  # noqa: F401
+from app.users.models import User
+from app.users.models.user import UserWatchMovie
+from app.users.repositories import UserWatchMovieRepository
+
+BENCHMARK_URL = \
+    f"{settings.DB_HOST}://{settings.DB_USER}:{settings.DB_PASSWORD}@{settings.DB_HOSTNAME}:" \
+    f"{settings.DB_PORT}/{settings.DB_NAME_TEST}"
+INSERT_BATCH_SIZE = 10000
+
+
+def insert_in_batches(connection, table, rows):
+    """
+    Function inserts rows into a table with multi-row INSERT statements.
+
+    Param connection: Database connection.
+    Param table: Table to insert into.
+    Param rows: Iterable of dictionaries with column values.
+    Return: None.
+    """
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == INSERT_BATCH_SIZE:
+            connection.execute(table.insert(), batch)
+            batch = []
+    if batch:
+        connection.execute(table.insert(), batch)
+
+
+def seed(engine, rows: int, movies: int, years: int):
+    """
+    Function fills the database with synthetic movies, users and ratings.
+    Every user rates the same number of distinct movies, so the number of ratings equals rows.
+
+    Param engine: Engine of the benchmark database.
+    Param rows:int: Number of user_watch_movies rows.
+    Param movies:int: Number of movies.
+    Param years:int: Number of distinct publishing years.
+    Return: None.
+    """
+    per_user = min(movies, 100)
+    users = rows // per_user
+    movie_ids = [str(uuid4()) for _ in range(movies)]
+    user_ids = [str(uuid4()) for _ in range(users)]
+    with engine.begin() as connection:
+        insert_in_batches(connection, Movie.__table__, (
+            {"id": movie_id, "title": f"Movie {i}", "description": "Benchmark movie",
+             "year_published": str(2022 - i % years), "link": "https://example.com"}
+            for i, movie_id in enumerate(movie_ids)))
+        insert_in_batches(connection, User.__table__, (
+            {"id": user_id, "email": f"user{i}@example.com", "username": f"user{i}", "password_hashed": "x",
+             "is_active": True, "is_superuser": False}
+            for i, user_id in enumerate(user_ids)))
+        insert_in_batches(connection, UserWatchMovie.__table__, (
+            {"id": str(uuid4()), "user_id": user_id, "movie_id": movie_id, "rating": random.randint(1, 10)}
+            for user_id in user_ids for movie_id in random.sample(movie_ids, per_user)))
+
+
+def per_year_loop(db):
+    """
+    Function calculates average rating per year with one query for years, and two queries for every year.
+    This is how the average was calculated before the grouped aggregate was introduced.
+
+    Param db: Database session.
+    Return: A dictionary with the year as key and average rating as value.
+    """
+    movie_repository = MovieRepository(db, Movie)
+    user_watch_movie_repository = UserWatchMovieRepository(db, UserWatchMovie)
+    response = {}
+    for year in [obj.year_published for obj in movie_repository.read_movie_years()]:
+        ids = [movie.id for movie in movie_repository.read_movies_by_year(year)]
+        ratings = user_watch_movie_repository.read_average_rating_for_movies(movie_ids=ids)
+        all_ratings = [rating["Average Rating"] for rating in ratings if rating["Average Rating"]]
+        if all_ratings:
+            response.update({year: round(sum(all_ratings) / len(all_ratings), 2)})
+    return response
+
+
+def grouped_aggregate(db):
+    """
+    Function calculates average rating per year with a single grouped aggregate query.
+
+    Param db: Database session.
+    Return: A dictionary with the year as key and average rating as value.
+    """
+    user_watch_movie_repository = UserWatchMovieRepository(db, UserWatchMovie)
+    return {year: float(average) for year, average in user_watch_movie_repository.read_average_rating_per_year()}
+
+
+def measure(session_factory, function, repeat: int):
+    """
+    Function runs a benchmarked function in a new session and returns the best time.
+
+    Param session_factory: Session factory bound to the benchmark database.
+    Param function: Function that accepts a session.
+    Param repeat:int: Number of runs.
+    Return: A tuple with the best time in seconds and the result of the last run.
+    """
+    best, result = None, None
+    for _ in range(repeat):
+        with session_factory() as db:
+            start = time.perf_counter()
+            result = function(db)
+            elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    """Function parses arguments, seeds the database and prints timings of both paths."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000000, help="Number of user_watch_movies rows.")
+    parser.add_argument("--movies", type=int, default=20000, help="Number of movies.")
+    parser.add_argument("--years", type=int, default=70, help="Number of distinct years.")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of runs for each path.")
+    args = parser.parse_args()
+
+    engine = create_engine(BENCHMARK_URL)
+    session_factory = sessionmaker(bind=engine)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    try:
+        start = time.perf_counter()
+        seed(engine, args.rows, args.movies, args.years)
+        print(f"Seeded {args.rows} ratings for {args.movies} movies in {time.perf_counter() - start:.1f}s")
+        old_time, old_result = measure(session_factory, per_year_loop, args.repeat)
+        new_time, new_result = measure(session_factory, grouped_aggregate, args.repeat)
+        print(f"Per-year loop:      {old_time * 1000:10.1f} ms")
+        print(f"Grouped aggregate:  {new_time * 1000:10.1f} ms")
+        print(f"Speedup:            {old_time / new_time:10.1f}x")
+        differences = [year for year in old_result if abs(float(old_result[year]) - new_result.get(year, 0)) > 0.01]
+        print(f"Years with different averages: {len(differences)}")
+    finally:
+        Base.metadata.drop_all(bind=engine)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Password Hashing Benchmark module
+
+Measures login throughput and latency when passwords are verified with the legacy SHA-256 hash,
+and with the configured key derivation function in the caller (0 workers) and in process pools of various sizes.
+Logins are made from a thread pool, like sync routes served from the threadpool of an API worker.
+
+Run with: python -m app.benchmarks.password_hashing --logins 200 --concurrency 16 --workers 0 1 2 4
+"""
+import argparse
+import hashlib
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.benchmarks.auth_benchmark import summarize
+from app.users.service import HashingPool, Sha256Hasher
+from app.users.service.password_hasher import create_password_hasher
+
+PASSWORD = "Password123"
+
+
+def measure(pool: HashingPool, encoded: str, logins: int, concurrency: int) -> dict:
+    """
+    Function verifies the password the given number of times from concurrent threads.
+
+    Param pool:HashingPool: Pool verifying the password.
+    Param encoded:str: Stored password hash.
+    Param logins:int: Number of logins.
+    Param concurrency:int: Number of concurrent logins.
+    Return: A dictionary with logins per second and latency statistics.
+    """
+    def login(_):
+        start = time.perf_counter()
+        valid, _ = pool.verify(PASSWORD, encoded)
+        assert valid
+        return time.perf_counter() - start
+
+    pool.verify(PASSWORD, encoded)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as threads:
+        timings = list(threads.map(login, range(logins)))
+    elapsed = time.perf_counter() - start
+    return {"logins_per_second": round(logins / elapsed, 1), **summarize(timings)}
+
+
+def run(logins: int, concurrency: int, workers: list) -> dict:
+    """
+    Function runs the benchmark for the legacy hash and every pool size.
+
+    Param logins:int: Number of logins per measurement.
+    Param concurrency:int: Number of concurrent logins.
+    Param workers:list: Pool sizes to measure.
+    Return: A dictionary with the results.
+    """
+    hasher = create_password_hasher()
+    encoded = hasher.hash(PASSWORD)
+    legacy = HashingPool(Sha256Hasher(), legacy=(), workers=0, max_pending=0)
+    results = {"algorithm": hasher.algorithm, "logins": logins, "concurrency": concurrency,
+               "sha256": measure(legacy, hashlib.sha256(PASSWORD.encode()).hexdigest(), logins, concurrency)}
+    for size in workers:
+        pool = HashingPool(hasher, workers=size, max_pending=0)
+        try:
+            results[f"workers_{size}"] = measure(pool, encoded, logins, concurrency)
+        finally:
+            pool.shutdown()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark login throughput with password hashing.")
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 1, 2, 4])
+    arguments = parser.parse_args()
+    print(json.dumps(run(arguments.logins, arguments.concurrency, arguments.workers), indent=2))
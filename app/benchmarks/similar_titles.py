@@ -0,0 +1,130 @@
+"""Similar Titles Benchmark module
+
+Seeds a catalogue of movies with generated descriptions, genres, directors and cast, rebuilds their similar
+titles and measures the latency of reading the similar movies of a title, as the similar movies route does,
+with an empty cache and with cached results. Descriptions are drawn from a vocabulary with a Zipf distribution,
+so common words are held by many titles as in real descriptions.
+Runs against the configured database. Everything the benchmark created is deleted afterwards.
+
+Run with: python -m app.benchmarks.similar_titles --titles 100000 --lookups 2000
+"""
+import argparse
+import json
+import random
+import statistics
+import time
+from itertools import accumulate
+from uuid import uuid4
+
+from app.actors.models import Actor
+from app.cache import response_cache, SIMILAR_TITLES
+from app.db import SessionLocal, new_id
+from app.directors.models import Director
+from app.genres.models import Genre
+from app.main import app  # noqa: F401, applies pending migrations
+from app.movies.models import Movie, MovieActor
+from app.recommendations.models import MOVIES
+from app.recommendations.service import RecommendationServices, similar_titles_engine
+
+
+def seed(titles: int, vocabulary: int, rng: random.Random) -> list:
+    """
+    Function creates the benchmark catalogue: movies with 12 to 30 word descriptions, one of 20 genres,
+    one director per 20 movies and 4 actors per movie out of one actor per 5 movies.
+
+    Param titles:int: Number of movies.
+    Param vocabulary:int: Number of distinct words of descriptions.
+    Param rng:Random: Random generator.
+    Return: List of movie titles.
+    """
+    prefix = f"Benchmark {uuid4().hex[:8]}"
+    words = [f"word{i}" for i in range(vocabulary)]
+    weights = list(accumulate(1 / rank for rank in range(1, vocabulary + 1)))
+    genres = [{"id": new_id(), "name": f"{prefix} genre {i}"} for i in range(20)]
+    directors = [{"id": new_id(), "first_name": prefix, "last_name": str(i), "country": "USA"}
+                 for i in range(max(titles // 20, 1))]
+    actors = [{"id": new_id(), "first_name": prefix, "last_name": str(i), "date_of_birth": "1980-01-01",
+               "country": "USA"} for i in range(max(titles // 5, 4))]
+    movies = [{"id": new_id(), "title": f"{prefix} {i}", "year_published": "2022", "link": "https://example.com",
+               "description": " ".join(rng.choices(words, cum_weights=weights, k=rng.randint(12, 30))),
+               "genre_id": rng.choice(genres)["id"], "director_id": rng.choice(directors)["id"]}
+              for i in range(titles)]
+    cast = [{"id": new_id(), "movie_id": movie["id"], "actor_id": actor["id"]}
+            for movie in movies for actor in rng.sample(actors, 4)]
+    with SessionLocal() as db:
+        for model, rows in ((Genre, genres), (Director, directors), (Actor, actors), (Movie, movies),
+                            (MovieActor, cast)):
+            for start in range(0, len(rows), 1000):
+                db.execute(model.__table__.insert(), rows[start:start + 1000])
+        db.commit()
+    return [movie["title"] for movie in movies]
+
+
+def clean_up(titles: list):
+    """
+    Function deletes everything the benchmark created, and rebuilds the similar titles of the remaining movies.
+
+    Param titles:list: Titles of the benchmark movies.
+    Return: None.
+    """
+    prefix = titles[0].rsplit(" ", 1)[0]
+    with SessionLocal() as db:
+        movies = db.query(Movie.id).filter(Movie.title.like(f"{prefix} %"))
+        db.query(MovieActor).filter(MovieActor.movie_id.in_(movies)).delete(synchronize_session=False)
+        db.query(Movie).filter(Movie.title.like(f"{prefix} %")).delete(synchronize_session=False)
+        db.query(Actor).filter(Actor.first_name == prefix).delete(synchronize_session=False)
+        db.query(Director).filter(Director.first_name == prefix).delete(synchronize_session=False)
+        db.query(Genre).filter(Genre.name.like(f"{prefix} %")).delete(synchronize_session=False)
+        db.commit()
+    similar_titles_engine.rebuild(MOVIES)
+
+
+def latencies(titles: list, cached: bool) -> dict:
+    """
+    Function reads the similar movies of every title and returns percentiles of the latency.
+
+    Param titles:list: Titles to read similar movies of.
+    Param cached:bool: Read every title once right before measuring, so its result comes from the cache.
+    Return: A dictionary of p50, p95 and p99 latencies in milliseconds.
+    """
+    response_cache.invalidate(SIMILAR_TITLES)
+    samples = []
+    for title in titles:
+        if cached:
+            RecommendationServices.get_similar_movies(title)
+        start = time.perf_counter()
+        RecommendationServices.get_similar_movies(title)
+        samples.append((time.perf_counter() - start) * 1000)
+    percentiles = statistics.quantiles(samples, n=100)
+    return {"p50_ms": round(percentiles[49], 3), "p95_ms": round(percentiles[94], 3),
+            "p99_ms": round(percentiles[98], 3)}
+
+
+def main():
+    """Function parses arguments, seeds the catalogue, rebuilds similar titles and prints latencies as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--titles", type=int, default=100000, help="Number of movies in the catalogue.")
+    parser.add_argument("--vocabulary", type=int, default=50000, help="Number of distinct words of descriptions.")
+    parser.add_argument("--lookups", type=int, default=2000, help="Number of titles whose similar movies are read.")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes of the rebuild.")
+    parser.add_argument("--seed", type=int, default=1, help="Seed of the random generator.")
+    args = parser.parse_args()
+    if args.workers is not None:
+        similar_titles_engine.workers = args.workers
+
+    rng = random.Random(args.seed)
+    titles = seed(args.titles, args.vocabulary, rng)
+    try:
+        start = time.perf_counter()
+        rows = similar_titles_engine.rebuild(MOVIES)
+        rebuild = time.perf_counter() - start
+        lookups = rng.sample(titles, min(args.lookups, len(titles)))
+        print(json.dumps({
+            "titles": args.titles, "stored_rows": rows, "rebuild_seconds": round(rebuild, 1),
+            "uncached": latencies(lookups, cached=False), "cached": latencies(lookups, cached=True)}, indent=2))
+    finally:
+        clean_up(titles)
+
+
+if __name__ == "__main__":
+    main()
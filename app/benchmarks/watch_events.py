@@ -0,0 +1,133 @@
+"""Watch Events Benchmark module
+
+Compares events per second of the single-event routes, one request per watch or rating,
+with the batched watch events route. Every movie is watched and then rated, by a separate user per variant.
+Requests go through the application in-process, against the configured database.
+Movies, users, watch records and totals created by the benchmark are deleted afterwards.
+
+Run with: python -m app.benchmarks.watch_events --movies 1000 --batch-size 200
+"""
+import argparse
+import json
+import time
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from app.db import SessionLocal, new_id
+from app.main import app
+from app.movies.models import Movie
+from app.stats.models import MovieStats
+from app.users.models import User
+from app.users.models.user import UserWatchMovie
+from app.users.service import sign_jwt
+
+
+def seed(movies: int) -> tuple:
+    """
+    Function creates movies and two users for the benchmark.
+
+    Param movies:int: Number of movies.
+    Return: Tuple of movie titles and user IDs.
+    """
+    prefix = f"Benchmark {uuid4().hex[:8]}"
+    titles = [f"{prefix} {i}" for i in range(movies)]
+    user_ids = [new_id(), new_id()]
+    with SessionLocal() as db:
+        db.execute(Movie.__table__.insert(), [
+            {"id": new_id(), "title": title, "description": "Benchmark movie", "year_published": "2022",
+             "link": "https://example.com"} for title in titles])
+        db.execute(User.__table__.insert(), [
+            {"id": user_id, "email": f"{user_id}@example.com", "username": "benchmark", "password_hashed": "x",
+             "is_active": True, "is_superuser": False} for user_id in user_ids])
+        db.commit()
+    return titles, user_ids
+
+
+def clean_up(titles: list, user_ids: list):
+    """
+    Function deletes everything the benchmark created.
+
+    Param titles:list: Titles of the benchmark movies.
+    Param user_ids:list: IDs of the benchmark users.
+    Return: None.
+    """
+    with SessionLocal() as db:
+        movie_ids = [movie_id for movie_id, in db.query(Movie.id).filter(Movie.title.in_(titles))]
+        db.query(UserWatchMovie).filter(UserWatchMovie.user_id.in_(user_ids)).delete(synchronize_session=False)
+        db.query(MovieStats).filter(MovieStats.movie_id.in_(movie_ids)).delete(synchronize_session=False)
+        db.query(Movie).filter(Movie.id.in_(movie_ids)).delete(synchronize_session=False)
+        db.query(User).filter(User.id.in_(user_ids)).delete(synchronize_session=False)
+        db.commit()
+
+
+def single_events(client: TestClient, user_id: str, titles: list) -> float:
+    """
+    Function watches and rates every movie with one request per event.
+
+    Param client:TestClient: Client of the application.
+    Param user_id:str: ID of the user.
+    Param titles:list: Titles of the movies.
+    Return: Elapsed time in seconds.
+    """
+    headers = {"Authorization": f"Bearer {sign_jwt(user_id, 'regular_user')['access_token']}"}
+    start = time.perf_counter()
+    for i, title in enumerate(titles):
+        response = client.post("/api/watch-movie/", json={"title": title}, headers=headers)
+        assert response.status_code == 201, response.text
+        response = client.patch("/api/watch-movie/rate-movie", json={"title": title, "rating": i % 10 + 1},
+                                headers=headers)
+        assert response.status_code == 201, response.text
+    return time.perf_counter() - start
+
+
+def batched_events(client: TestClient, user_id: str, titles: list, batch_size: int) -> float:
+    """
+    Function sends the same watch and rating events as single_events, in batches.
+
+    Param client:TestClient: Client of the application.
+    Param user_id:str: ID of the user.
+    Param titles:list: Titles of the movies.
+    Param batch_size:int: Number of events per request.
+    Return: Elapsed time in seconds.
+    """
+    headers = {"Authorization": f"Bearer {sign_jwt(user_id, 'regular_user')['access_token']}"}
+    events = [event for i, title in enumerate(titles)
+              for event in ({"movie_title": title}, {"movie_title": title, "rating": i % 10 + 1})]
+    start = time.perf_counter()
+    for offset in range(0, len(events), batch_size):
+        response = client.post("/api/watch-events/", json={"events": events[offset:offset + batch_size]},
+                               headers=headers)
+        assert response.status_code == 200, response.text
+        assert set(response.json()["summary"]) <= {"created", "updated"}, response.text
+    return time.perf_counter() - start
+
+
+def main():
+    """Function parses arguments, runs both variants and prints events per second as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--movies", type=int, default=1000, help="Number of movies, every movie is two events.")
+    parser.add_argument("--batch-size", type=int, default=200, help="Number of events per batched request.")
+    args = parser.parse_args()
+
+    titles, user_ids = seed(args.movies)
+    try:
+        client = TestClient(app)
+        events = 2 * args.movies
+        single = single_events(client, user_ids[0], titles)
+        batched = batched_events(client, user_ids[1], titles, args.batch_size)
+        with SessionLocal() as db:
+            ratings = [sorted(rating for rating, in db.query(UserWatchMovie.rating).
+                              filter(UserWatchMovie.user_id == user_id)) for user_id in user_ids]
+        print(json.dumps({
+            "events": events, "batch_size": args.batch_size,
+            "single_events_per_second": round(events / single, 1),
+            "batched_events_per_second": round(events / batched, 1),
+            "speedup": round(single / batched, 1),
+            "same_ratings": ratings[0] == ratings[1]}, indent=2))
+    finally:
+        clean_up(titles, user_ids)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+from .cache_backend import CacheBackend, MemoryCacheBackend, RedisCacheBackend
+from .response_cache import ResponseCache, response_cache, cached, invalidate, GENRES, DIRECTORS, MOVIE_RATINGS, \
+    MOVIE_VIEWS, SERIES_VIEWS, EPISODE_RATINGS, SIMILAR_TITLES, NAMESPACES
@@ -0,0 +1,137 @@
+"""Cache Backend module"""
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional
+
+
+class CacheBackend:
+    """Base class for cache backends. Values are serialized strings, keys are namespaced strings."""
+
+    name = "base"
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Function returns the cached value, or None if the key is missing or expired.
+
+        Param key:str: Cache key.
+        Return: The cached value or None.
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, value: str, ttl: int):
+        """
+        Function stores the value under the key for ttl seconds.
+
+        Param key:str: Cache key.
+        Param value:str: Serialized value.
+        Param ttl:int: Time to live in seconds.
+        Return: None.
+        """
+        raise NotImplementedError
+
+    def delete_prefix(self, prefix: str):
+        """
+        Function deletes all keys starting with the prefix.
+
+        Param prefix:str: Key prefix.
+        Return: None.
+        """
+        raise NotImplementedError
+
+    def clear(self):
+        """
+        Function deletes all cached values.
+
+        Return: None.
+        """
+        raise NotImplementedError
+
+    def __len__(self):
+        return 0
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    In-process cache with expiring entries, evicting the least recently used entry when full.
+    Without max_entries entries are only dropped when they expire, expired entries are swept
+    whenever the number of entries doubled since the last sweep.
+    """
+
+    name = "memory"
+
+    def __init__(self, max_entries: Optional[int] = 1024):
+        self.max_entries = max_entries
+        self._lock = Lock()
+        self._entries = OrderedDict()
+        self._sweep_at = 1024
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl: int):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            if self.max_entries is None:
+                if len(self._entries) >= self._sweep_at:
+                    self._sweep()
+                return
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _sweep(self):
+        now = time.monotonic()
+        for key in [key for key, (_, expires_at) in self._entries.items() if expires_at <= now]:
+            del self._entries[key]
+        self._sweep_at = max(2 * len(self._entries), 1024)
+
+    def delete_prefix(self, prefix: str):
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Cache shared by all workers, kept in Redis. Expiry is left to Redis, eviction to its maxmemory policy.
+    Requires the redis package.
+    """
+
+    name = "redis"
+
+    def __init__(self, url: str, key_prefix: str = "response-cache:"):
+        import redis  # pylint: disable=import-outside-toplevel
+        self._client = redis.Redis.from_url(url)
+        self.key_prefix = key_prefix
+
+    def get(self, key: str) -> Optional[str]:
+        value = self._client.get(self.key_prefix + key)
+        return value.decode() if value is not None else None
+
+    def set(self, key: str, value: str, ttl: int):
+        self._client.set(self.key_prefix + key, value, ex=ttl)
+
+    def delete_prefix(self, prefix: str):
+        keys = list(self._client.scan_iter(match=f"{self.key_prefix}{prefix}*", count=500))
+        if keys:
+            self._client.delete(*keys)
+
+    def clear(self):
+        self.delete_prefix("")
@@ -0,0 +1,198 @@
+"""Response Cache module"""
+import functools
+import inspect
+import json
+from collections import defaultdict
+from threading import Lock
+from typing import Optional
+
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import Response
+
+from app.cache.cache_backend import CacheBackend, MemoryCacheBackend, RedisCacheBackend
+from app.config import settings
+
+GENRES = "genres"
+DIRECTORS = "directors"
+MOVIE_RATINGS = "movie-ratings"
+MOVIE_VIEWS = "movie-views"
+SERIES_VIEWS = "series-views"
+EPISODE_RATINGS = "episode-ratings"
+SIMILAR_TITLES = "similar-titles"
+NAMESPACES = (GENRES, DIRECTORS, MOVIE_RATINGS, MOVIE_VIEWS, SERIES_VIEWS, EPISODE_RATINGS, SIMILAR_TITLES)
+
+
+class ResponseCache:
+    """
+    Cache for results of read-mostly services. Results are grouped in namespaces,
+    and write services invalidate the namespaces their changes affect.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: int = 60):
+        self.backend = backend
+        self.ttl = ttl
+        self._lock = Lock()
+        self._generations = defaultdict(int)
+        self._counters = {namespace: {"hits": 0, "misses": 0, "invalidations": 0} for namespace in NAMESPACES}
+
+    def _count(self, namespace: str, counter: str):
+        with self._lock:
+            self._counters.setdefault(namespace, {"hits": 0, "misses": 0, "invalidations": 0})[counter] += 1
+
+    @staticmethod
+    def make_key(namespace: str, function, args: tuple, kwargs: dict) -> str:
+        """
+        Function returns the cache key for a call of the function.
+
+        Param namespace:str: Namespace of the cached result.
+        Param function: Cached function.
+        Param args:tuple: Positional arguments of the call.
+        Param kwargs:dict: Keyword arguments of the call.
+        Return: Cache key.
+        """
+        arguments = json.dumps([args, kwargs], default=str, sort_keys=True)
+        return f"{namespace}:{function.__name__}:{arguments}"
+
+    def get(self, namespace: str, key: str):
+        """
+        Function returns the cached result for the key, counting a hit or a miss.
+
+        Param namespace:str: Namespace of the key.
+        Param key:str: Cache key.
+        Return: A tuple of a found flag and the result.
+        """
+        value = self.backend.get(key)
+        if value is None:
+            self._count(namespace, "misses")
+            return False, None
+        self._count(namespace, "hits")
+        return True, json.loads(value)
+
+    def store(self, namespace: str, key: str, result, generation: int, ttl: Optional[int] = None, schema=None):
+        """
+        Function serializes the result and stores it, unless the namespace was invalidated
+        while the result was being computed. ORM objects are converted with the schema first.
+
+        Param namespace:str: Namespace of the key.
+        Param key:str: Cache key.
+        Param result: Result of the cached function.
+        Param generation:int: Generation of the namespace when the computation started.
+        Param ttl:int: Time to live in seconds, defaults to the cache TTL.
+        Param schema: Pydantic schema with orm_mode for converting ORM objects.
+        Return: The serializable form of the result.
+        """
+        if schema is not None:
+            result = [schema.from_orm(obj) for obj in result] if isinstance(result, list) else schema.from_orm(result)
+        result = jsonable_encoder(result)
+        if self._generations[namespace] == generation:
+            self.backend.set(key, json.dumps(result), ttl or self.ttl)
+        return result
+
+    def generation(self, namespace: str) -> int:
+        """
+        Function returns the number of times the namespace was invalidated in this process.
+
+        Param namespace:str: Namespace.
+        Return: Generation of the namespace.
+        """
+        return self._generations[namespace]
+
+    def invalidate(self, *namespaces: str):
+        """
+        Function deletes all cached results in the given namespaces.
+
+        Param namespaces:str: Namespaces to invalidate.
+        Return: None.
+        """
+        for namespace in namespaces:
+            with self._lock:
+                self._generations[namespace] += 1
+            self._count(namespace, "invalidations")
+            self.backend.delete_prefix(f"{namespace}:")
+
+    def clear(self):
+        """
+        Function deletes all cached results and resets the counters.
+
+        Return: None.
+        """
+        with self._lock:
+            for namespace in list(self._generations):
+                self._generations[namespace] += 1
+            for counters in self._counters.values():
+                counters.update(hits=0, misses=0, invalidations=0)
+        self.backend.clear()
+
+    def snapshot(self) -> dict:
+        """
+        Function returns hit and miss counters of this process, in total and per namespace.
+
+        Return: A dictionary with the cache metrics.
+        """
+        with self._lock:
+            namespaces = {namespace: dict(counters) for namespace, counters in self._counters.items()}
+        hits = sum(counters["hits"] for counters in namespaces.values())
+        misses = sum(counters["misses"] for counters in namespaces.values())
+        return {
+            "backend": self.backend.name,
+            "entries": len(self.backend),
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+            "namespaces": namespaces,
+        }
+
+    def cached(self, namespace: str, ttl: Optional[int] = None, schema=None):
+        """
+        Function returns a decorator caching results of a sync or async service function.
+        Results are stored in serialized form, and responses and exceptions are not cached.
+
+        Param namespace:str: Namespace invalidated by write services affecting the result.
+        Param ttl:int: Time to live in seconds, defaults to the cache TTL.
+        Param schema: Pydantic schema with orm_mode, for functions returning ORM objects.
+        Return: Decorator.
+        """
+        def decorator(function):
+            if inspect.iscoroutinefunction(function):
+                @functools.wraps(function)
+                async def async_wrapper(*args, **kwargs):
+                    key = self.make_key(namespace, function, args, kwargs)
+                    found, result = self.get(namespace, key)
+                    if found:
+                        return result
+                    generation = self.generation(namespace)
+                    result = await function(*args, **kwargs)
+                    if isinstance(result, Response):
+                        return result
+                    return self.store(namespace, key, result, generation, ttl, schema)
+                return async_wrapper
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                key = self.make_key(namespace, function, args, kwargs)
+                found, result = self.get(namespace, key)
+                if found:
+                    return result
+                generation = self.generation(namespace)
+                result = function(*args, **kwargs)
+                if isinstance(result, Response):
+                    return result
+                return self.store(namespace, key, result, generation, ttl, schema)
+            return wrapper
+        return decorator
+
+
+def create_cache_backend() -> CacheBackend:
+    """
+    Function creates the cache backend selected in the settings.
+
+    Return: CacheBackend.
+    """
+    if settings.CACHE_BACKEND == "redis":
+        return RedisCacheBackend(settings.CACHE_URL)
+    return MemoryCacheBackend(settings.CACHE_MAX_ENTRIES)
+
+
+response_cache = ResponseCache(create_cache_backend(), settings.CACHE_TTL)
+cached = response_cache.cached
+invalidate = response_cache.invalidate
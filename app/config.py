@@ -5,22 +5,82 @@ from pydantic import BaseSettings
 class Settings(BaseSettings):
     """Class for storing settings data."""
     DB_HOST: str
+    DB_ASYNC_HOST: str = "mysql+aiomysql"
+    DB_ASYNC: bool = False
     DB_HOSTNAME: str
     DB_PORT: int
     DB_USER: str
     DB_PASSWORD: str
     DB_NAME: str
     DB_NAME_TEST: str
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 3600
+    DB_POOL_PRE_PING: bool = True
+    DB_ECHO: bool = False
+    DB_AUTO_MIGRATE: bool = True
+    DB_COMPACT_KEYS: bool = False
+    DB_SLOW_QUERY_MS: float = 200.0
+    DB_SLOW_QUERY_PARAMETERS: bool = False
+    DB_QUERY_BUDGET: int = 0
+    DB_QUERY_BUDGET_STRICT: bool = False
+    DB_SERVER_TIMING: bool = True
     USER_SECRET: str
     ALGORYTHM: str
     TOKEN_DURATION_SECONDS: int
+    TOKEN_CACHE_SIZE: int = 10000
+    PASSWORD_HASHER: str = "scrypt"
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 64
+    SCRYPT_N: int = 16384
+    SCRYPT_R: int = 8
+    SCRYPT_P: int = 1
     MAIL_USERNAME: str
     MAIL_PASSWORD: str
     MAIL_PORT: int
     MAIL_SERVER: str
     MAIL_FROM: str
+    MAIL_STARTTLS: bool = True
+    MAIL_DISPATCHER_ENABLED: bool = True
+    MAIL_BATCH_SIZE: int = 50
+    MAIL_POOL_SIZE: int = 2
+    MAIL_POLL_SECONDS: float = 1.0
+    MAIL_MAX_ATTEMPTS: int = 5
+    MAIL_RETRY_BACKOFF_SECONDS: int = 30
+    MAIL_BREAKER_THRESHOLD: int = 5
+    MAIL_BREAKER_COOLDOWN_SECONDS: int = 60
     PER_PAGE: int
     MAX_NUMBER_SUBUSERS: int
+    SEARCH_BACKEND: str = "auto"
+    SEARCH_MIN_SIMILARITY: float = 0.5
+    CACHE_BACKEND: str = "memory"
+    CACHE_URL: str = ""
+    CACHE_TTL: int = 60
+    CACHE_MAX_ENTRIES: int = 1024
+    IMPORT_BATCH_SIZE: int = 1000
+    IMPORT_INSERT_CHUNK_SIZE: int = 500
+    WATCH_EVENTS_MAX_BATCH: int = 500
+    RECOMMENDATION_BACKEND: str = "auto"
+    RECOMMENDATION_NEIGHBOURS: int = 20
+    RECOMMENDATION_WORKERS: int = 2
+    RECOMMENDATION_CHUNK_SIZE: int = 500
+    RECOMMENDATION_MAX_RESULTS: int = 200
+    RECOMMENDATION_UPDATES_ENABLED: bool = True
+    RECOMMENDATION_UPDATE_SECONDS: float = 10.0
+    SIMILAR_TITLES_NEIGHBOURS: int = 20
+    SIMILAR_TITLES_MAX_FEATURE_TITLES: int = 200
+    SIMILAR_TITLES_REFRESH_ENABLED: bool = True
+    SIMILAR_TITLES_REFRESH_SECONDS: float = 300.0
+    TRENDING_WINDOWS: str = "24h,7d,all"
+    TRENDING_CAPACITY: int = 100
+    TRENDING_SYNC_ENABLED: bool = True
+    TRENDING_SYNC_SECONDS: float = 60.0
+    METRICS_ENABLED: bool = True
+    PROFILING_ENABLED: bool = True
+    PROFILING_STORE_SIZE: int = 20
+    PROFILING_RETENTION_SECONDS: int = 3600
+    PROFILING_SAMPLE_INTERVAL_MS: float = 5.0
 
     class Config:
         """Configuration Class"""
@@ -1 +1,5 @@
 from .database import *
+from .pool import pool_metrics
+from .instrumentation import QueryBudget, QueryStats, query_stats_scope, query_instrumentation_middleware
+from .request_session import request_session_scope, request_session_middleware
+from .keys import COMPACT_KEYS, UUIDKey, new_id, uuid7
@@ -1,14 +1,40 @@
 """Database settings module"""
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.config import settings as sttg
+from app.db.instrumentation import instrument
+from app.db.pool import TimedQueuePool
+from app.db.request_session import RequestScopedSessionmaker, RequestSession
 
 MYSQL_URL = f"{sttg.DB_HOST}://{sttg.DB_USER}:{sttg.DB_PASSWORD}@{sttg.DB_HOSTNAME}:{sttg.DB_PORT}/{sttg.DB_NAME}"
+ASYNC_MYSQL_URL = \
+    f"{sttg.DB_ASYNC_HOST}://{sttg.DB_USER}:{sttg.DB_PASSWORD}@{sttg.DB_HOSTNAME}:{sttg.DB_PORT}/{sttg.DB_NAME}"
 
-engine = create_engine(MYSQL_URL, echo=True)
+POOL_OPTIONS = {
+    "pool_size": sttg.DB_POOL_SIZE,
+    "max_overflow": sttg.DB_MAX_OVERFLOW,
+    "pool_timeout": sttg.DB_POOL_TIMEOUT,
+    "pool_recycle": sttg.DB_POOL_RECYCLE,
+    "pool_pre_ping": sttg.DB_POOL_PRE_PING,
+}
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=True, bind=engine)
+engine = create_engine(MYSQL_URL, echo=sttg.DB_ECHO, poolclass=TimedQueuePool, **POOL_OPTIONS)
+instrument(engine)
+
+# Within a request scope every SessionLocal() call returns the same session, see app.db.request_session.
+SessionLocal = RequestScopedSessionmaker(autocommit=False, autoflush=True, bind=engine, class_=RequestSession)
+
+# The async engine is created only when the async path is enabled, so the async driver is not required otherwise.
+async_engine = create_async_engine(ASYNC_MYSQL_URL, echo=sttg.DB_ECHO, poolclass=AsyncAdaptedQueuePool,
+                                   **POOL_OPTIONS) if sttg.DB_ASYNC else None
+if async_engine is not None:
+    instrument(async_engine.sync_engine)
+
+AsyncSessionLocal = sessionmaker(autocommit=False, autoflush=True, bind=async_engine, class_=AsyncSession,
+                                 expire_on_commit=False)
 
 Base = declarative_base()
 
@@ -19,3 +45,8 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
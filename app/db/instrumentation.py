@@ -0,0 +1,187 @@
+"""Query instrumentation module"""
+import json
+import logging
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from starlette.responses import JSONResponse
+
+from app.config import settings
+
+query_logger = logging.getLogger("app.db.queries")
+
+SLOWEST_STATEMENTS = 3
+STATEMENT_MAX_LENGTH = 2000
+SENSITIVE_PARAMETERS = re.compile(r"password|secret|token|email", re.IGNORECASE)
+SERVER_TIMING_HEADER = "Server-Timing"
+
+
+class QueryStats:
+    """Collects the number and duration of the statements of a request, and the slowest of them."""
+
+    def __init__(self, route: Optional[str] = None):
+        self.route = route
+        self.budget: Optional[int] = None
+        self.count = 0
+        self.seconds = 0.0
+        self.slowest = []
+
+    def observe(self, statement: str, seconds: float):
+        """
+        Function records a single statement and its duration.
+
+        Param statement:str: SQL statement, without parameter values.
+        Param seconds:float: Duration of the statement.
+        Return: None.
+        """
+        self.count += 1
+        self.seconds += seconds
+        if len(self.slowest) < SLOWEST_STATEMENTS or seconds > self.slowest[-1][0]:
+            self.slowest.append((seconds, statement))
+            self.slowest.sort(key=lambda item: item[0], reverse=True)
+            del self.slowest[SLOWEST_STATEMENTS:]
+
+    @property
+    def over_budget(self) -> bool:
+        """True when the request ran more statements than the budget of its route, or the default budget."""
+        budget = self.budget or settings.DB_QUERY_BUDGET
+        return bool(budget) and self.count > budget
+
+    def server_timing(self) -> str:
+        """Function returns the Server-Timing metric of the statements, like db;dur=12.5;desc="4 queries"."""
+        return f'db;dur={self.seconds * 1000:.2f};desc="{self.count} queries"'
+
+    def summary(self) -> dict:
+        """Function returns the statistics as a dictionary, with durations in milliseconds."""
+        return {"route": self.route, "queries": self.count, "budget": self.budget or settings.DB_QUERY_BUDGET,
+                "db_ms": round(self.seconds * 1000, 2),
+                "slowest": [{"ms": round(seconds * 1000, 2), "statement": compact(statement)}
+                            for seconds, statement in self.slowest]}
+
+
+_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def query_stats_scope(route: Optional[str] = None):
+    """
+    Function collects statistics of all statements executed within the scope, also in the threads of sync routes.
+
+    Param route:str: Name of the route, used in the slow query log.
+    Return: QueryStats.
+    """
+    stats = QueryStats(route)
+    token = _query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _query_stats.reset(token)
+
+
+class QueryBudget:
+    """
+    Route dependency that sets the maximal number of statements of a request, like
+    dependencies=[Depends(QueryBudget(3))]. It overrides the default budget of the DB_QUERY_BUDGET setting.
+    """
+
+    def __init__(self, queries: int):
+        self.queries = queries
+
+    async def __call__(self):
+        stats = _query_stats.get()
+        if stats is not None:
+            stats.budget = self.queries
+
+
+def compact(statement: str) -> str:
+    """Function collapses whitespace of a statement and truncates it to STATEMENT_MAX_LENGTH characters."""
+    return " ".join(statement.split())[:STATEMENT_MAX_LENGTH]
+
+
+def redact(parameters, executemany: bool = False):
+    """
+    Function returns parameters of a statement that are safe to log. Values are replaced by their type names,
+    unless DB_SLOW_QUERY_PARAMETERS is enabled, and values of named parameters of passwords, secrets, tokens
+    and emails are always redacted. Parameters of executemany are summarized by their number of rows.
+
+    Param parameters: Parameters of the statement, a dictionary or a sequence.
+    Param executemany:bool: True when the parameters are rows of executemany.
+    Return: Redacted parameters.
+    """
+    if executemany:
+        return {"rows": len(parameters)}
+
+    def value(name, parameter):
+        if not settings.DB_SLOW_QUERY_PARAMETERS or (name and SENSITIVE_PARAMETERS.search(name)):
+            return f"<{type(parameter).__name__}>"
+        return parameter if isinstance(parameter, (int, float, bool, type(None))) else str(parameter)
+
+    if isinstance(parameters, dict):
+        return {name: value(name, parameter) for name, parameter in parameters.items()}
+    return [value(None, parameter) for parameter in parameters or ()]
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    seconds = time.perf_counter() - conn.info["query_started"].pop()
+    stats = _query_stats.get()
+    if stats is not None:
+        stats.observe(statement, seconds)
+    if settings.DB_SLOW_QUERY_MS and seconds * 1000 >= settings.DB_SLOW_QUERY_MS:
+        query_logger.warning(json.dumps({
+            "event": "slow_query", "route": stats and stats.route, "ms": round(seconds * 1000, 2),
+            "statement": compact(statement), "parameters": redact(parameters, executemany)}, default=str))
+
+
+def _handle_error(exception_context):
+    started = exception_context.connection is not None and exception_context.connection.info.get("query_started")
+    if started:
+        started.pop()
+
+
+def instrument(bind):
+    """
+    Function registers the listeners that time every statement of an engine. Statements are recorded
+    in the statistics of the current request, and statements slower than DB_SLOW_QUERY_MS are logged.
+
+    Param bind: Engine, or the sync engine of an async engine.
+    Return: None.
+    """
+    if not event.contains(bind, "before_cursor_execute", _before_cursor_execute):
+        event.listen(bind, "before_cursor_execute", _before_cursor_execute)
+        event.listen(bind, "after_cursor_execute", _after_cursor_execute)
+        event.listen(bind, "handle_error", _handle_error)
+
+
+async def query_instrumentation_middleware(request, call_next):
+    """
+    Middleware function that collects statistics of the statements of every request and reports them
+    in the Server-Timing header. Requests that exceed the query budget of their route are logged,
+    and fail with status 500 when DB_QUERY_BUDGET_STRICT is enabled.
+
+    Param request: Incoming request.
+    Param call_next: Next handler in the chain.
+    Return: The response.
+    """
+    with query_stats_scope(f"{request.method} {request.url.path}") as stats:
+        response = await call_next(request)
+    route = request.scope.get("route")
+    if route is not None:
+        stats.route = f"{request.method} {route.path}"
+    if stats.over_budget:
+        summary = stats.summary()
+        query_logger.warning(json.dumps({"event": "query_budget_exceeded", **summary}))
+        if settings.DB_QUERY_BUDGET_STRICT:
+            response = JSONResponse({"detail": f"Query budget exceeded: {stats.count} queries, "
+                                               f"the budget of {stats.route} is {summary['budget']}.",
+                                     "queries": summary}, status_code=500)
+    if settings.DB_SERVER_TIMING:
+        response.headers.append(SERVER_TIMING_HEADER, stats.server_timing())
+    return response
@@ -0,0 +1,99 @@
+"""Key Types module"""
+import os
+import time
+from threading import Lock
+from typing import Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy.types import BINARY, String, TypeDecorator
+
+from app.config import settings
+
+COMPACT_KEYS = settings.DB_COMPACT_KEYS
+
+_lock = Lock()
+_last_timestamp = 0
+_sequence = 0
+
+
+def uuid7() -> UUID:
+    """
+    Function returns a time-ordered UUID (version 7): 48 bits of Unix time in milliseconds,
+    a 12 bit sequence keeping UUIDs of the same millisecond in order, and 62 random bits.
+    New rows are appended to the end of the primary key index instead of being scattered over it.
+
+    Return: UUID.
+    """
+    global _last_timestamp, _sequence  # pylint: disable=global-statement
+    with _lock:
+        timestamp = time.time_ns() // 1_000_000
+        if timestamp <= _last_timestamp:
+            timestamp = _last_timestamp
+            _sequence += 1
+            if _sequence > 0xFFF:
+                timestamp += 1
+                _sequence = 0
+        else:
+            _sequence = int.from_bytes(os.urandom(2), "big") & 0x3FF
+        _last_timestamp = timestamp
+        sequence = _sequence
+    random_bits = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+    value = (timestamp << 80) | (0x7 << 76) | (sequence << 64) | (0b10 << 62) | random_bits
+    return UUID(int=value)
+
+
+def new_id() -> str:
+    """
+    Function returns the ID of a new row, time-ordered in compact key mode and random otherwise.
+
+    Return: Canonical UUID string.
+    """
+    return str(uuid7() if COMPACT_KEYS else uuid4())
+
+
+class UUIDKey(TypeDecorator):
+    """
+    Primary and foreign key column holding a UUID. Stored as BINARY(16) in compact key mode
+    and as a string otherwise. Values are bound as UUIDs or strings and returned as canonical strings,
+    whichever form they are stored in. In compact key mode a value that is not a UUID cannot be stored,
+    it is only accepted in comparisons, where it matches no row.
+    """
+    impl = String(50)
+    cache_ok = True
+
+    def __init__(self, compact: Optional[bool] = None, lookup: bool = False):
+        super().__init__()
+        self.compact = COMPACT_KEYS if compact is None else compact
+        self.lookup = lookup
+
+    @property
+    def python_type(self):
+        return str
+
+    def load_dialect_impl(self, dialect):
+        return dialect.type_descriptor(BINARY(16) if self.compact else String(50))
+
+    def coerce_compared_value(self, op, value):
+        return UUIDKey(self.compact, lookup=True)
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if not self.compact:
+            return str(value)
+        if isinstance(value, bytes):
+            return value
+        if isinstance(value, UUID):
+            return value.bytes
+        try:
+            return UUID(str(value)).bytes
+        except ValueError as exc:
+            if not self.lookup:
+                raise ValueError(f"Invalid UUID key: {value!r}") from exc
+            # Malformed IDs from requests match no row, as they do with string keys.
+            return str(value).encode()
+
+    def process_result_value(self, value, dialect):
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return str(UUID(bytes=bytes(value)))
+        return value
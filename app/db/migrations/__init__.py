@@ -0,0 +1,2 @@
+from .migration_runner import Migration, load_migrations, applied_versions, current_version, pending_migrations, \
+    upgrade, downgrade, schema_migrations
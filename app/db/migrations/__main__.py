@@ -0,0 +1,41 @@
+"""
+Command line interface of the schema migrations.
+
+    python -m app.db.migrations upgrade [--target VERSION]
+    python -m app.db.migrations downgrade --target VERSION
+    python -m app.db.migrations status
+"""
+import argparse
+
+from app.db.database import engine
+from app.db.migrations import applied_versions, downgrade, load_migrations, upgrade
+
+
+def main():
+    """Function parses arguments and runs the migration command."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["upgrade", "downgrade", "status"])
+    parser.add_argument("--target", type=int, default=None, help="Version to upgrade or downgrade to.")
+    args = parser.parse_args()
+
+    if args.command == "upgrade":
+        for migration in upgrade(engine, args.target):
+            print(f"Applied {migration.version:04d} {migration.name}")
+    elif args.command == "downgrade":
+        if args.target is None:
+            parser.error("downgrade needs --target")
+        for migration in downgrade(engine, args.target):
+            print(f"Reverted {migration.version:04d} {migration.name}")
+    else:
+        with engine.begin() as connection:
+            applied = applied_versions(connection)
+        for migration in load_migrations():
+            if migration.version in applied:
+                state = "applied"
+            else:
+                state = "pending" if migration.applies() else "skipped"
+            print(f"{migration.version:04d} {migration.name:<20} {state:<8} {migration.description}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""Migration Runner module"""
+import importlib
+import pkgutil
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, select, text
+
+from app.db.migrations import versions
+
+LOCK_NAME = "schema_migrations"
+LOCK_TIMEOUT_SECONDS = 60
+
+schema_migrations = Table(
+    "schema_migrations", MetaData(),
+    Column("version", Integer(), primary_key=True, autoincrement=False),
+    Column("name", String(100), nullable=False),
+    Column("applied_at", DateTime(), nullable=False),
+)
+
+
+class Migration:
+    """
+    Versioned schema change, loaded from a module of the versions package named v<version>_<name>.
+    The module defines upgrade(connection) and may define downgrade(connection), and applies()
+    for migrations that only run when a setting enables them.
+    """
+
+    def __init__(self, version: int, name: str, module):
+        self.version = version
+        self.name = name
+        self.description = (module.__doc__ or "").strip()
+        self.upgrade = module.upgrade
+        self.downgrade = getattr(module, "downgrade", None)
+        self.applies = getattr(module, "applies", lambda: True)
+
+    def __repr__(self):
+        return f"<Migration {self.version:04d} {self.name}>"
+
+
+def load_migrations() -> List[Migration]:
+    """
+    Function loads all migrations of the versions package, ordered by version.
+
+    Return: A list of migrations.
+    """
+    migrations = []
+    for module_info in pkgutil.iter_modules(versions.__path__):
+        prefix, _, name = module_info.name.partition("_")
+        if not (prefix.startswith("v") and prefix[1:].isdigit()):
+            continue
+        module = importlib.import_module(f"{versions.__name__}.{module_info.name}")
+        migrations.append(Migration(int(prefix[1:]), name, module))
+    migrations.sort(key=lambda migration: migration.version)
+    numbers = [migration.version for migration in migrations]
+    if len(set(numbers)) != len(numbers):
+        raise RuntimeError(f"Duplicate migration versions: {numbers}")
+    return migrations
+
+
+def applied_versions(connection) -> set:
+    """
+    Function returns the versions of the migrations applied to the database.
+
+    Param connection: Database connection.
+    Return: A set of versions.
+    """
+    schema_migrations.create(connection, checkfirst=True)
+    return set(connection.execute(select(schema_migrations.c.version)).scalars())
+
+
+def current_version(engine) -> int:
+    """
+    Function returns the highest version applied to the database, 0 for a database without migrations.
+
+    Param engine: Engine of the database.
+    Return: Version number.
+    """
+    with engine.begin() as connection:
+        return max(applied_versions(connection), default=0)
+
+
+def pending_migrations(engine) -> List[Migration]:
+    """
+    Function returns the migrations that are not applied to the database yet.
+
+    Param engine: Engine of the database.
+    Return: A list of migrations.
+    """
+    with engine.begin() as connection:
+        applied = applied_versions(connection)
+    return [migration for migration in load_migrations() if migration.version not in applied]
+
+
+class _MigrationLock:
+    """Named MySQL lock, so workers starting at the same time do not run the same migration twice."""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.enabled = connection.dialect.name == "mysql"
+
+    def __enter__(self):
+        if self.enabled:
+            acquired = self.connection.execute(text("SELECT GET_LOCK(:name, :timeout)"),
+                                               {"name": LOCK_NAME, "timeout": LOCK_TIMEOUT_SECONDS}).scalar()
+            if acquired != 1:
+                raise RuntimeError("Could not acquire the schema migrations lock.")
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.enabled:
+            self.connection.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": LOCK_NAME})
+
+
+def upgrade(engine, target: Optional[int] = None) -> List[Migration]:
+    """
+    Function applies pending migrations up to the target version, each in its own transaction,
+    and records them in the schema_migrations table. Migrations disabled by the settings are skipped
+    and stay pending.
+
+    Param engine: Engine of the database.
+    Param target:int: Highest version to apply, defaults to the latest.
+    Return: A list of applied migrations.
+    """
+    applied = []
+    with engine.connect() as lock_connection, _MigrationLock(lock_connection):
+        for migration in load_migrations():
+            if target is not None and migration.version > target:
+                break
+            if not migration.applies():
+                continue
+            with engine.begin() as connection:
+                if migration.version in applied_versions(connection):
+                    continue
+                migration.upgrade(connection)
+                connection.execute(schema_migrations.insert().values(
+                    version=migration.version, name=migration.name, applied_at=datetime.utcnow()))
+            applied.append(migration)
+    return applied
+
+
+def downgrade(engine, target: int) -> List[Migration]:
+    """
+    Function reverts applied migrations above the target version, latest first.
+
+    Param engine: Engine of the database.
+    Param target:int: Version to revert to.
+    Return: A list of reverted migrations.
+    """
+    reverted = []
+    with engine.connect() as lock_connection, _MigrationLock(lock_connection):
+        for migration in reversed(load_migrations()):
+            if migration.version <= target:
+                break
+            with engine.begin() as connection:
+                if migration.version not in applied_versions(connection):
+                    continue
+                if migration.downgrade is None:
+                    raise RuntimeError(f"Migration {migration.version:04d} {migration.name} cannot be reverted.")
+                migration.downgrade(connection)
+                connection.execute(schema_migrations.delete().where(schema_migrations.c.version == migration.version))
+            reverted.append(migration)
+    return reverted
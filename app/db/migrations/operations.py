@@ -0,0 +1,253 @@
+"""Migration Operations module"""
+import re
+from typing import Callable, Optional, Sequence
+
+from sqlalchemy import ForeignKeyConstraint, Index, MetaData, Table, bindparam, inspect, select, text, tuple_, \
+    type_coerce
+from sqlalchemy.schema import AddConstraint, DropConstraint
+from sqlalchemy.types import NullType
+
+LEGACY_PREFIX = "legacy_"
+
+
+def table_names(connection) -> set:
+    """
+    Function returns the names of the tables in the database.
+
+    Param connection: Database connection.
+    Return: A set of table names.
+    """
+    return set(inspect(connection).get_table_names())
+
+
+def index_names(connection, table: str) -> set:
+    """
+    Function returns the names of the indexes and unique constraints of a table.
+
+    Param connection: Database connection.
+    Param table:str: Name of the table.
+    Return: A set of index names.
+    """
+    inspector = inspect(connection)
+    names = {index["name"] for index in inspector.get_indexes(table)}
+    names |= {constraint["name"] for constraint in inspector.get_unique_constraints(table)}
+    return names - {None}
+
+
+def create_index(connection, table: str, name: str, columns: Sequence[str], unique: bool = False) -> bool:
+    """
+    Function creates an index, unless the table already has an index with that name.
+    Tables are reflected, so migrations do not depend on the current models.
+
+    Param connection: Database connection.
+    Param table:str: Name of the table.
+    Param name:str: Name of the index.
+    Param columns:Sequence[str]: Indexed columns, in order.
+    Param unique:bool: Create a unique index.
+    Return: True if the index was created.
+    """
+    if name in index_names(connection, table):
+        return False
+    reflected = Table(table, MetaData(), autoload_with=connection)
+    Index(name, *(reflected.c[column] for column in columns), unique=unique).create(connection)
+    return True
+
+
+def drop_index(connection, table: str, name: str) -> bool:
+    """
+    Function drops an index, if the table has it.
+
+    Param connection: Database connection.
+    Param table:str: Name of the table.
+    Param name:str: Name of the index.
+    Return: True if the index was dropped.
+    """
+    if name not in index_names(connection, table):
+        return False
+    reflected = Table(table, MetaData(), autoload_with=connection)
+    next(index for index in reflected.indexes if index.name == name).drop(connection)
+    return True
+
+
+def create_fulltext_index(connection, table: str, name: str, columns: Sequence[str]) -> bool:
+    """
+    Function creates a MySQL FULLTEXT index, unless the table already has it. Other databases are skipped.
+
+    Param connection: Database connection.
+    Param table:str: Name of the table.
+    Param name:str: Name of the index.
+    Param columns:Sequence[str]: Indexed columns.
+    Return: True if the index was created.
+    """
+    if connection.dialect.name != "mysql" or name in index_names(connection, table):
+        return False
+    connection.execute(text(f"ALTER TABLE {table} ADD FULLTEXT INDEX {name} ({', '.join(columns)})"))
+    return True
+
+
+def set_foreign_key_checks(connection, enabled: bool):
+    """
+    Function enables or disables foreign key checks of the connection on MySQL.
+    SQLite does not change them within a transaction, and does not check them unless asked to.
+
+    Param connection: Database connection.
+    Param enabled:bool: Check foreign keys.
+    Return: None.
+    """
+    if connection.dialect.name == "mysql":
+        connection.execute(text(f"SET FOREIGN_KEY_CHECKS={int(enabled)}"))
+
+
+def copy_rows(connection, source: Table, target: Table, convert: Optional[Callable] = None, chunk_size: int = 1000):
+    """
+    Function copies rows of the source table into the target table in chunks, walking the primary key of the source.
+    Columns whose type changes are read as stored and left to convert. Columns missing in the source
+    get their default, columns missing in the target are left out.
+
+    Param connection: Database connection.
+    Param source:Table: Table to copy from, with a primary key.
+    Param target:Table: Table to copy to.
+    Param convert:Callable: Function receiving the target table and a row dictionary,
+    returning the converted row or None to skip it.
+    Param chunk_size:int: Number of rows read and inserted at once.
+    Return: Number of copied rows.
+    """
+    dialect = connection.dialect
+    columns = [type_coerce(source.c[column.name], column.type
+                           if source.c[column.name].type.compile(dialect) == column.type.compile(dialect)
+                           else NullType()).label(column.name)
+               for column in target.columns if column.name in source.c]
+    # Keys are compared as stored, reflected types may not match the stored values.
+    key = [type_coerce(column, NullType()) for column in source.primary_key.columns]
+    statement = select(*columns, *(column.label(f"key_{i}") for i, column in enumerate(key))).order_by(*key)
+    copied, last = 0, None
+    while True:
+        page = statement if last is None else \
+            statement.where(tuple_(*key) > tuple_(*(bindparam(None, value, NullType()) for value in last)))
+        rows = connection.execute(page.limit(chunk_size)).mappings().all()
+        if not rows:
+            return copied
+        last = [rows[-1][f"key_{i}"] for i in range(len(key))]
+        values = [dict(row) for row in rows]
+        if convert is not None:
+            values = [row for row in (convert(target, row) for row in values) if row is not None]
+        values = [{name: value for name, value in row.items() if name in target.c} for row in values]
+        if values:
+            connection.execute(target.insert(), values)
+            copied += len(values)
+
+
+def rebuild_tables(connection, tables: Sequence[Table], convert: Optional[Callable] = None,
+                   chunk_size: int = 1000) -> dict:
+    """
+    Function recreates existing tables from their current definition and copies their rows over,
+    for changes of column types and primary keys that cannot be altered in place on every database.
+    Old tables are renamed with a legacy prefix and dropped once all rows are copied. Foreign key checks are
+    off meanwhile. MySQL commits every DDL statement, so an interrupted rebuild leaves the legacy tables behind.
+
+    Param connection: Database connection.
+    Param tables:Sequence[Table]: Tables to rebuild, parents before children.
+    Param convert:Callable: Function converting copied rows, see copy_rows.
+    Param chunk_size:int: Number of rows copied at once.
+    Return: A dictionary with the number of copied rows per table.
+    """
+    existing = table_names(connection)
+    tables = [table for table in tables if table.name in existing]
+    set_foreign_key_checks(connection, False)
+    try:
+        for table in tables:
+            if connection.dialect.name != "mysql":
+                # Index names are unique per database outside of MySQL, the new table reuses them.
+                for index in inspect(connection).get_indexes(table.name):
+                    connection.execute(text(f"DROP INDEX {index['name']}"))
+            connection.execute(text(f"ALTER TABLE {table.name} RENAME TO {LEGACY_PREFIX}{table.name}"))
+        copied = {}
+        for table in tables:
+            table.create(connection)
+            legacy = Table(f"{LEGACY_PREFIX}{table.name}", MetaData(), autoload_with=connection)
+            copied[table.name] = copy_rows(connection, legacy, table, convert, chunk_size)
+        for table in reversed(tables):
+            connection.execute(text(f"DROP TABLE {LEGACY_PREFIX}{table.name}"))
+    finally:
+        set_foreign_key_checks(connection, True)
+    return copied
+
+
+def rebuild_sqlite_table(connection, table: str, edit: Callable[[str], str]):
+    """
+    Function recreates a SQLite table from its edited CREATE TABLE statement and copies its rows over,
+    since SQLite cannot alter columns and constraints in place. Indexes of the table are created again.
+
+    Param connection: Database connection.
+    Param table:str: Name of the table.
+    Param edit:Callable: Function receiving the CREATE TABLE statement of the table and returning the new one.
+    Return: None.
+    """
+    statement = connection.execute(text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                                   {"name": table}).scalar()
+    indexes = connection.execute(text("SELECT sql FROM sqlite_master WHERE type = 'index' AND tbl_name = :name "
+                                      "AND sql IS NOT NULL"), {"name": table}).scalars().all()
+    created = re.sub(rf'^(CREATE TABLE\s+)["`]?{table}["`]?', rf"\1{LEGACY_PREFIX}{table}", edit(statement))
+    connection.execute(text(created))
+    connection.execute(text(f"INSERT INTO {LEGACY_PREFIX}{table} SELECT * FROM {table}"))
+    connection.execute(text(f"DROP TABLE {table}"))
+    connection.execute(text(f"ALTER TABLE {LEGACY_PREFIX}{table} RENAME TO {table}"))
+    for index in indexes:
+        connection.execute(text(index))
+
+
+def set_foreign_key_ondelete(connection, table: str, column: str, ondelete: Optional[str]) -> bool:
+    """
+    Function changes the ON DELETE action of the foreign key of a column, unless it already has that action.
+
+    Param connection: Database connection.
+    Param table:str: Name of the table.
+    Param column:str: Name of the column with the foreign key.
+    Param ondelete:str: Action, like CASCADE, or None for the default.
+    Return: True if the foreign key was changed.
+    """
+    key = next(key for key in inspect(connection).get_foreign_keys(table) if key["constrained_columns"] == [column])
+    if (key["options"].get("ondelete") or "").upper() == (ondelete or "").upper():
+        return False
+    if connection.dialect.name == "sqlite":
+        pattern = re.compile(rf'(FOREIGN KEY\s*\(\s*["`]?{column}["`]?\s*\)\s*REFERENCES\s+[^(]+\([^)]*\))'
+                             r"(\s+ON DELETE\s+(SET NULL|SET DEFAULT|NO ACTION|CASCADE|RESTRICT))?", re.IGNORECASE)
+        action = f" ON DELETE {ondelete}" if ondelete else ""
+        rebuild_sqlite_table(connection, table, lambda statement: pattern.sub(rf"\1{action}", statement, count=1))
+        return True
+    reflected = Table(table, MetaData(), autoload_with=connection)
+    existing = next(constraint for constraint in reflected.foreign_key_constraints
+                    if constraint.column_keys == [column])
+    connection.execute(DropConstraint(existing))
+    replacement = ForeignKeyConstraint([column], [element.target_fullname for element in existing.elements],
+                                       name=existing.name, ondelete=ondelete)
+    reflected.append_constraint(replacement)
+    connection.execute(AddConstraint(replacement))
+    return True
+
+
+def set_column_nullable(connection, table: str, column: str, nullable: bool) -> bool:
+    """
+    Function allows or disallows NULL values of a column, unless the column already does so.
+    Rows with NULL values must be filled in before NULL values are disallowed.
+
+    Param connection: Database connection.
+    Param table:str: Name of the table.
+    Param column:str: Name of the column.
+    Param nullable:bool: Allow NULL values.
+    Return: True if the column was changed.
+    """
+    reflected = next(item for item in inspect(connection).get_columns(table) if item["name"] == column)
+    if reflected["nullable"] == nullable:
+        return False
+    constraint = "NULL" if nullable else "NOT NULL"
+    if connection.dialect.name == "sqlite":
+        pattern = re.compile(rf'^(\s*["`]?{column}["`]?\s+[A-Z]+(\s*\([^)]*\))?)(\s+NOT NULL)?', re.MULTILINE)
+        clause = "" if nullable else " NOT NULL"
+        rebuild_sqlite_table(connection, table, lambda statement: pattern.sub(rf"\1{clause}", statement, count=1))
+    elif connection.dialect.name == "mysql":
+        column_type = reflected["type"].compile(connection.dialect)
+        connection.execute(text(f"ALTER TABLE {table} MODIFY {column} {column_type} {constraint}"))
+    else:
+        connection.execute(text(f"ALTER TABLE {table} ALTER COLUMN {column} {'DROP' if nullable else 'SET'} NOT NULL"))
+    return True
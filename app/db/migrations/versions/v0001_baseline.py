@@ -0,0 +1,158 @@
+"""Tables as they were created before migrations existed, where missing. Existing databases keep their tables."""
+from sqlalchemy import Boolean, Column, Date, DateTime, ForeignKey, Index, Integer, MetaData, String, Table, Text, \
+    UniqueConstraint
+
+# A snapshot of the tables, so this migration does not change with the models. Keys are strings, as they were
+# then, and the indexes of the query index set are left to migration 0002.
+metadata = MetaData()
+
+Table(
+    "actors", metadata,
+    Column("id", String(50), primary_key=True),
+    Column("first_name", String(50), nullable=False),
+    Column("last_name", String(50), nullable=False),
+    Column("date_of_birth", Date()),
+    Column("country", String(50)),
+)
+
+Table(
+    "directors", metadata,
+    Column("id", String(50), primary_key=True),
+    Column("first_name", String(50), nullable=False),
+    Column("last_name", String(50), nullable=False),
+    Column("country", String(50), nullable=False),
+)
+
+Table(
+    "genres", metadata,
+    Column("id", String(50), primary_key=True),
+    Column("name", String(50), nullable=False, unique=True),
+)
+
+Table(
+    "movies", metadata,
+    Column("id", String(50), primary_key=True),
+    Column("title", String(100), nullable=False),
+    Column("description", String(500), nullable=False),
+    Column("date_added", Date()),
+    Column("year_published", String(5), nullable=False),
+    Column("link", String(100), nullable=False),
+    Column("director_id", String(50), ForeignKey("directors.id")),
+    Column("genre_id", String(50), ForeignKey("genres.id")),
+    UniqueConstraint("title", "director_id", name="same_director_different_title"),
+)
+
+Table(
+    "movie_actors", metadata,
+    Column("id", String(50), primary_key=True),
+    Column("movie_id", String(50), ForeignKey("movies.id")),
+    Column("actor_id", String(50), ForeignKey("actors.id")),
+)
+
+Table(
+    "series", metadata,
+    Column("id", String(50), primary_key=True),
+    Column("title", String(100), nullable=False),
+    Column("description", String(500), nullable=False),
+    Column("date_added", Date()),
+    Column("year_published", String(5), nullable=False),
+    Column("director_id", String(50), ForeignKey("directors.id")),
+    Column("genre_id", String(50), ForeignKey("genres.id")),
+    UniqueConstraint("title", "director_id", name="same_director_different_title"),
+)
+
+Table(
+    "series_actors", metadata,
+    Column("id", String(50), primary_key=True),
+    Column("series_id", String(50), ForeignKey("series.id")),
+    Column("actor_id", String(50), ForeignKey("actors.id")),
+)
+
+Table(
+    "episodes", metadata,
+    Column("id", String(50), primary_key=True),
+    Column("name", String(50), nullable=False),
+    Column("description", String(500), nullable=False),
+    Column("link", String(100), nullable=False),
+    Column("series_id", String(50), ForeignKey("series.id")),
+)
+
+Table(
+    "users", metadata,
+    Column("id", String(50), primary_key=True),
+    Column("email", String(100), unique=True),
+    Column("password_hashed", String(100)),
+    Column("username", String(100)),
+    Column("date_subscribed", Date()),
+    Column("is_active", Boolean()),
+    Column("is_superuser", Boolean()),
+    Column("verification_code", Integer(), nullable=True),
+)
+
+Table(
+    "user_watch_movies", metadata,
+    Column("id", String(50), primary_key=True),
+    Column("user_id", String(50), ForeignKey("users.id")),
+    Column("movie_id", String(50), ForeignKey("movies.id")),
+    Column("rating", Integer(), nullable=True),
+    Column("date_watched", Date()),
+    UniqueConstraint("user_id", "movie_id", name="one_user_one_rating"),
+)
+
+Table(
+    "user_watch_episodes", metadata,
+    Column("id", String(50), primary_key=True),
+    Column("user_id", String(50), ForeignKey("users.id")),
+    Column("episode_id", String(50), ForeignKey("episodes.id")),
+    Column("rating", Integer(), nullable=True),
+    Column("date_watched", Date()),
+    UniqueConstraint("user_id", "episode_id", name="one_user_one_rate"),
+)
+
+Table(
+    "subusers", metadata,
+    Column("id", String(50), primary_key=True),
+    Column("name", String(100), nullable=False),
+    Column("date_subscribed", Date()),
+    Column("user_id", String(50), ForeignKey("users.id")),
+    UniqueConstraint("user_id", "name", name="unique_subuser_name"),
+)
+
+Table(
+    "admins", metadata,
+    Column("id", String(50), primary_key=True),
+    Column("first_name", String(50), nullable=False),
+    Column("last_name", String(50), nullable=False),
+    Column("address", String(100), nullable=False),
+    Column("country", String(100), nullable=False),
+    Column("user_id", String(50), ForeignKey("users.id")),
+)
+
+for name, key, title in (("movie_stats", "movie_id", "movies"), ("episode_stats", "episode_id", "episodes"),
+                         ("series_stats", "series_id", "series")):
+    Table(
+        name, metadata,
+        Column(key, String(50), ForeignKey(f"{title}.id"), primary_key=True),
+        Column("views", Integer(), nullable=False, index=True),
+        Column("rating_sum", Integer(), nullable=False),
+        Column("rating_count", Integer(), nullable=False),
+    )
+
+Table(
+    "mail_outbox", metadata,
+    Column("id", String(50), primary_key=True),
+    Column("recipient", String(100), nullable=False),
+    Column("subject", String(200), nullable=False),
+    Column("body", Text(), nullable=False),
+    Column("status", String(10), nullable=False),
+    Column("attempts", Integer(), nullable=False),
+    Column("next_attempt_at", DateTime(), nullable=False),
+    Column("last_error", String(500)),
+    Column("created_at", DateTime(), nullable=False),
+    Column("sent_at", DateTime()),
+    Index("ix_mail_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+)
+
+
+def upgrade(connection):
+    metadata.create_all(bind=connection)
@@ -0,0 +1,39 @@
+"""Indexes for the columns repositories filter, join, group and sort on."""
+from app.db.migrations.operations import create_index, drop_index
+
+# Columns already covered by a leading column of another index are left out:
+# movies.title and series.title by same_director_different_title, movies.date_added by ix_movies_date_added_id,
+# subusers.user_id by unique_subuser_name and user_id of the watch tables by their unique constraints.
+INDEXES = (
+    ("user_watch_movies", "ix_user_watch_movies_movie_id_rating", ("movie_id", "rating")),
+    ("user_watch_episodes", "ix_user_watch_episodes_episode_id_rating", ("episode_id", "rating")),
+    ("movies", "ix_movies_year_published", ("year_published",)),
+    ("movies", "ix_movies_director_id", ("director_id",)),
+    ("movies", "ix_movies_genre_id", ("genre_id",)),
+    ("series", "ix_series_year_published", ("year_published",)),
+    ("series", "ix_series_director_id", ("director_id",)),
+    ("series", "ix_series_genre_id", ("genre_id",)),
+    ("series", "ix_series_date_added_id", ("date_added", "id")),
+    ("movies", "ix_movies_date_added_id", ("date_added", "id")),
+    ("episodes", "ix_episodes_series_id_name", ("series_id", "name")),
+    ("movie_actors", "ix_movie_actors_movie_id_actor_id", ("movie_id", "actor_id")),
+    ("movie_actors", "ix_movie_actors_actor_id", ("actor_id",)),
+    ("series_actors", "ix_series_actors_series_id_actor_id", ("series_id", "actor_id")),
+    ("series_actors", "ix_series_actors_actor_id", ("actor_id",)),
+    ("users", "ix_users_verification_code", ("verification_code",)),
+    ("users", "ix_users_username", ("username",)),
+    ("actors", "ix_actors_last_name", ("last_name",)),
+    ("actors", "ix_actors_first_name", ("first_name",)),
+    ("actors", "ix_actors_date_of_birth", ("date_of_birth",)),
+    ("directors", "ix_directors_last_name", ("last_name",)),
+)
+
+
+def upgrade(connection):
+    for table, name, columns in INDEXES:
+        create_index(connection, table, name, columns)
+
+
+def downgrade(connection):
+    for table, name, _ in reversed(INDEXES):
+        drop_index(connection, table, name)
@@ -0,0 +1,23 @@
+"""FULLTEXT indexes used by the full-text search backend on MySQL, for tables created before they were declared."""
+from app.db.migrations.operations import create_fulltext_index, drop_index
+
+FULLTEXT_INDEXES = (
+    ("movies", "ft_movies_title", ("title",)),
+    ("series", "ft_series_title", ("title",)),
+    ("episodes", "ft_episodes_name_description", ("name", "description")),
+    ("actors", "ft_actors_first_name", ("first_name",)),
+    ("actors", "ft_actors_last_name", ("last_name",)),
+    ("directors", "ft_directors_first_name", ("first_name",)),
+    ("directors", "ft_directors_last_name", ("last_name",)),
+)
+
+
+def upgrade(connection):
+    for table, name, columns in FULLTEXT_INDEXES:
+        create_fulltext_index(connection, table, name, columns)
+
+
+def downgrade(connection):
+    if connection.dialect.name == "mysql":
+        for table, name, _ in FULLTEXT_INDEXES:
+            drop_index(connection, table, name)
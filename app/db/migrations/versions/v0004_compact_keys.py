@@ -0,0 +1,88 @@
+"""UUID keys stored as BINARY(16) and composite primary keys of the watch tables, when DB_COMPACT_KEYS is enabled.
+The tables are rebuilt as the models declare them, since the keys can be made compact at any later version."""
+from uuid import UUID
+
+from sqlalchemy import inspect, text
+
+from app.config import settings
+from app.db import Base, UUIDKey
+from app.db.migrations.operations import rebuild_tables, table_names
+import app.actors.models  # noqa: F401, registers the tables of all models on Base.metadata
+import app.directors.models  # noqa: F401
+import app.genres.models  # noqa: F401
+import app.imports.models  # noqa: F401
+import app.mail.models  # noqa: F401
+import app.movies.models  # noqa: F401
+import app.recommendations.models  # noqa: F401
+import app.series.models  # noqa: F401
+import app.stats.models  # noqa: F401
+import app.users.models  # noqa: F401
+from app.db.migrations.versions import v0002_query_indexes, v0003_fulltext_indexes, v0010_date_added_not_null
+
+
+def applies():
+    return settings.DB_COMPACT_KEYS
+
+
+def uses_compact_keys(connection) -> bool:
+    """
+    Function checks whether keys of the database are stored in binary form.
+
+    Param connection: Database connection.
+    Return: True if the users table has a binary primary key.
+    """
+    if "users" not in table_names(connection):
+        return False
+    if connection.dialect.name == "sqlite":
+        # SQLite reflects BINARY(16) with numeric affinity, the declared type is read instead.
+        declared = {row[1]: row[2] for row in connection.execute(text("PRAGMA table_info(users)"))}
+        return declared["id"].upper().startswith("BINARY")
+    column = next(column for column in inspect(connection).get_columns("users") if column["name"] == "id")
+    try:
+        return column["type"].python_type is bytes
+    except NotImplementedError:
+        return False
+
+
+def convert_keys(table, row: dict):
+    """
+    Function converts key values of a copied row to canonical UUID strings, bound by the key type of the new table.
+    Rows with a missing primary key value are dropped, since composite primary keys cannot hold NULL.
+
+    Param table: Table the row is copied to.
+    Param row:dict: Copied row.
+    Return: Converted row, or None.
+    """
+    for column in table.columns:
+        if not isinstance(column.type, UUIDKey) or column.name not in row:
+            continue
+        value = row[column.name]
+        if value is None:
+            if column.primary_key:
+                return None
+            continue
+        row[column.name] = str(UUID(bytes=bytes(value)) if isinstance(value, (bytes, bytearray, memoryview))
+                               else UUID(str(value)))
+    return row
+
+
+def rebuild(connection):
+    tables = [table for table in Base.metadata.sorted_tables
+              if any(isinstance(column.type, UUIDKey) for column in table.columns)]
+    # The tables are created as the models declare them, so rows must satisfy their constraints.
+    v0010_date_added_not_null.backfill(connection)
+    rebuild_tables(connection, tables, convert_keys)
+    v0002_query_indexes.upgrade(connection)
+    v0003_fulltext_indexes.upgrade(connection)
+
+
+def upgrade(connection):
+    if not uses_compact_keys(connection):
+        rebuild(connection)
+
+
+def downgrade(connection):
+    if settings.DB_COMPACT_KEYS:
+        raise RuntimeError("Disable DB_COMPACT_KEYS before reverting compact keys.")
+    if uses_compact_keys(connection):
+        rebuild(connection)
@@ -0,0 +1,28 @@
+"""Import jobs table, holding progress and checkpoints of bulk catalogue imports."""
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, Text
+
+from app.db import UUIDKey
+
+import_jobs = Table(
+    "import_jobs", MetaData(),
+    Column("id", UUIDKey(), primary_key=True),
+    Column("kind", String(20), nullable=False),
+    Column("source", String(200), nullable=False),
+    Column("fingerprint", String(64), nullable=False),
+    Column("status", String(10), nullable=False),
+    Column("rows_read", Integer(), nullable=False),
+    Column("inserted", Integer(), nullable=False),
+    Column("skipped", Integer(), nullable=False),
+    Column("invalid", Integer(), nullable=False),
+    Column("errors", Text(), nullable=False),
+    Column("started_at", DateTime(), nullable=False),
+    Column("updated_at", DateTime(), nullable=False),
+)
+
+
+def upgrade(connection):
+    import_jobs.create(connection, checkfirst=True)
+
+
+def downgrade(connection):
+    import_jobs.drop(connection, checkfirst=True)
@@ -0,0 +1,20 @@
+"""Item neighbours table, holding the precomputed most similar titles of every movie and series."""
+from sqlalchemy import Column, Float, MetaData, String, Table
+
+from app.db import UUIDKey
+
+item_neighbours = Table(
+    "item_neighbours", MetaData(),
+    Column("kind", String(10), primary_key=True),
+    Column("item_id", UUIDKey(), primary_key=True),
+    Column("neighbour_id", UUIDKey(), primary_key=True),
+    Column("similarity", Float(), nullable=False),
+)
+
+
+def upgrade(connection):
+    item_neighbours.create(connection, checkfirst=True)
+
+
+def downgrade(connection):
+    item_neighbours.drop(connection, checkfirst=True)
@@ -0,0 +1,20 @@
+"""Similar titles table, holding the precomputed most similar titles of every movie and series by content."""
+from sqlalchemy import Column, Float, MetaData, String, Table
+
+from app.db import UUIDKey
+
+similar_titles = Table(
+    "similar_titles", MetaData(),
+    Column("kind", String(10), primary_key=True),
+    Column("item_id", UUIDKey(), primary_key=True),
+    Column("neighbour_id", UUIDKey(), primary_key=True),
+    Column("similarity", Float(), nullable=False),
+)
+
+
+def upgrade(connection):
+    similar_titles.create(connection, checkfirst=True)
+
+
+def downgrade(connection):
+    similar_titles.drop(connection, checkfirst=True)
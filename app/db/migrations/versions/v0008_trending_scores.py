@@ -0,0 +1,21 @@
+"""Trending scores table, holding decayed views of movies and series persisted by the trending engine."""
+from sqlalchemy import BigInteger, Column, Float, MetaData, String, Table
+
+from app.db import UUIDKey
+
+trending_scores = Table(
+    "trending_scores", MetaData(),
+    Column("kind", String(10), primary_key=True),
+    Column("time_window", String(10), primary_key=True),
+    Column("landmark", BigInteger(), primary_key=True, autoincrement=False),
+    Column("item_id", UUIDKey(), primary_key=True),
+    Column("score", Float(), nullable=False),
+)
+
+
+def upgrade(connection):
+    trending_scores.create(connection, checkfirst=True)
+
+
+def downgrade(connection):
+    trending_scores.drop(connection, checkfirst=True)
@@ -0,0 +1,22 @@
+"""Totals of titles deleted together with the titles, by ON DELETE CASCADE foreign keys of the stats tables."""
+from app.db.migrations.operations import set_foreign_key_ondelete, table_names
+
+FOREIGN_KEYS = (
+    ("movie_stats", "movie_id"),
+    ("episode_stats", "episode_id"),
+    ("series_stats", "series_id"),
+)
+
+
+def upgrade(connection):
+    existing = table_names(connection)
+    for table, column in FOREIGN_KEYS:
+        if table in existing:
+            set_foreign_key_ondelete(connection, table, column, "CASCADE")
+
+
+def downgrade(connection):
+    existing = table_names(connection)
+    for table, column in FOREIGN_KEYS:
+        if table in existing:
+            set_foreign_key_ondelete(connection, table, column, None)
@@ -0,0 +1,40 @@
+"""Dates when movies and series were added required, so every title has a complete (date_added, id) sort key."""
+from datetime import date
+
+from sqlalchemy import text
+
+from app.db.migrations.operations import set_column_nullable, table_names
+
+TABLES = ("movies", "series")
+
+
+def backfill(connection):
+    """
+    Function fills in missing dates when titles were added with the earliest known date of the table,
+    or today for tables without any date, so the titles keep their place at the start of the sort order.
+
+    Param connection: Database connection.
+    Return: None.
+    """
+    existing = table_names(connection)
+    for table in TABLES:
+        if table not in existing:
+            continue
+        earliest = connection.execute(text(f"SELECT MIN(date_added) FROM {table}")).scalar()
+        connection.execute(text(f"UPDATE {table} SET date_added = :earliest WHERE date_added IS NULL"),
+                           {"earliest": earliest or date.today()})
+
+
+def upgrade(connection):
+    backfill(connection)
+    existing = table_names(connection)
+    for table in TABLES:
+        if table in existing:
+            set_column_nullable(connection, table, "date_added", False)
+
+
+def downgrade(connection):
+    existing = table_names(connection)
+    for table in TABLES:
+        if table in existing:
+            set_column_nullable(connection, table, "date_added", True)
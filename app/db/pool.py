@@ -0,0 +1,72 @@
+"""Connection pool module"""
+import time
+from threading import Lock
+
+from sqlalchemy.pool import QueuePool
+
+
+class PoolMetrics:
+    """Collects the time requests spend waiting for a connection from the pool."""
+
+    def __init__(self):
+        self._lock = Lock()
+        self.checkouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def observe(self, seconds: float):
+        """
+        Function records a single checkout and the time it took.
+
+        Param seconds:float: Time spent waiting for the connection.
+        Return: None.
+        """
+        with self._lock:
+            self.checkouts += 1
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+    def reset(self):
+        """
+        Function clears all recorded checkouts.
+
+        Return: None.
+        """
+        with self._lock:
+            self.checkouts = 0
+            self.wait_seconds_total = 0.0
+            self.wait_seconds_max = 0.0
+
+    def snapshot(self, pool=None) -> dict:
+        """
+        Function returns the recorded checkout wait times, together with the state of the given pool.
+
+        Param pool: Pool of the engine, if its current state should be included.
+        Return: A dictionary with the metrics.
+        """
+        with self._lock:
+            average = self.wait_seconds_total / self.checkouts if self.checkouts else 0.0
+            result = {
+                "checkouts": self.checkouts,
+                "wait_seconds_total": round(self.wait_seconds_total, 6),
+                "wait_seconds_avg": round(average, 6),
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+            }
+        if isinstance(pool, QueuePool):
+            result.update(size=pool.size(), checked_in=pool.checkedin(), checked_out=pool.checkedout(),
+                          overflow=pool.overflow())
+        return result
+
+
+pool_metrics = PoolMetrics()
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long every checkout waited, including opening a new connection."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            pool_metrics.observe(time.perf_counter() - start)
@@ -0,0 +1,80 @@
+"""Request-scoped session module"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy.orm import Session, sessionmaker
+
+
+class RequestScope:
+    """Holds the session shared by everything that runs within one request. Session is opened on first use."""
+
+    def __init__(self):
+        self.session: Optional[Session] = None
+        self.closed = False
+
+    def close(self):
+        """
+        Function closes the shared session, if it was opened, and returns its connection to the pool.
+
+        Return: None.
+        """
+        self.closed = True
+        if self.session is not None:
+            self.session.close()
+
+
+_request_scope: ContextVar[Optional[RequestScope]] = ContextVar("request_scope", default=None)
+
+
+class RequestSession(Session):
+    """Session that is not closed by the services while it is shared by a request."""
+
+    def close(self):
+        scope = _request_scope.get()
+        if scope is not None and scope.session is self and not scope.closed:
+            return
+        super().close()
+
+
+class RequestScopedSessionmaker(sessionmaker):
+    """
+    Sessionmaker that returns the session of the current request, if there is one.
+    Outside of a request scope, every call creates a new session as before.
+    """
+
+    def __call__(self, **local_kw):
+        scope = _request_scope.get()
+        if scope is None or scope.closed or local_kw:
+            return super().__call__(**local_kw)
+        if scope.session is None:
+            scope.session = super().__call__()
+        return scope.session
+
+
+@contextmanager
+def request_session_scope():
+    """
+    Function opens a request scope, so all sessions created within it share a single session and connection.
+
+    Return: The request scope.
+    """
+    scope = RequestScope()
+    token = _request_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        scope.close()
+        _request_scope.reset(token)
+
+
+async def request_session_middleware(request, call_next):
+    """
+    Middleware function that runs every request within its own request session scope.
+
+    Param request: Incoming request.
+    Param call_next: Next handler in the chain.
+    Return: The response.
+    """
+    with request_session_scope():
+        return await call_next(request)
@@ -1 +1,2 @@
 from .director_controller import DirectorController
+from .async_director_controller import AsyncDirectorController
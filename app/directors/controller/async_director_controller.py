@@ -0,0 +1,28 @@
+"""Async Director Controller module"""
+from fastapi import HTTPException
+from starlette.responses import JSONResponse
+
+from app.directors.controller.director_controller import DirectorController
+from app.directors.service import AsyncDirectorServices
+from app.base import AppException, sync_fallback
+
+
+class AsyncDirectorController:
+    """Async controller for Director catalogue routes. Falls back to DirectorController when DB_ASYNC is disabled."""
+    @staticmethod
+    @sync_fallback(DirectorController.get_all_directors)
+    async def get_all_directors():
+        """
+        Function returns all directors in our Database.
+
+        Return: A list of all directors in our database.
+        """
+        try:
+            directors = await AsyncDirectorServices.get_all_directors()
+            if not directors:
+                return JSONResponse("No directors in our Database yet.", status_code=200)
+            return directors
+        except AppException as exc:
+            raise HTTPException(status_code=exc.code, detail=exc.message) from exc
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
@@ -1,21 +1,19 @@
 """Director Model module"""
-from uuid import uuid4
-
 from sqlalchemy import Column, String
 from sqlalchemy.orm import relationship
 
-from app.db import Base
+from app.db import Base, UUIDKey, new_id
 
 
 class Director(Base):
     """Base Model for Director"""
     __tablename__ = "directors"
-    id = Column(String(50), primary_key=True, default=uuid4)
+    id = Column(UUIDKey(), primary_key=True, default=new_id)
     first_name = Column(String(50), nullable=False)
-    last_name = Column(String(50), nullable=False)
+    last_name = Column(String(50), nullable=False, index=True)
     country = Column(String(50), nullable=False)
 
-    movies = relationship("Movie", lazy='subquery')
+    movies = relationship("Movie")
 
     def __init__(self, first_name: str, last_name: str, country: str, ):
         self.first_name = first_name
@@ -1,6 +1,7 @@
 """Director Repository module"""
 from app.base import BaseCRUDRepository
 from app.directors.models import Director
+from app.search import search_ids
 
 
 class DirectorRepository(BaseCRUDRepository):
@@ -18,9 +19,9 @@ class DirectorRepository(BaseCRUDRepository):
         """
         try:
             if search:
-                result = self.db.query(Director).filter(Director.country.ilike(f"%{country}%")).all()
+                result = self.base_query().filter(Director.country.ilike(f"%{country}%")).all()
             else:
-                result = self.db.query(Director).filter(Director.country == country).all()
+                result = self.base_query().filter(Director.country == country).all()
             return result
         except Exception as exc:
             self.db.rollback()
@@ -39,9 +40,9 @@ class DirectorRepository(BaseCRUDRepository):
         """
         try:
             if search:
-                result = self.db.query(Director).filter(Director.last_name.ilike(f"%{last_name}%")).all()
+                result = self.read_by_ids(search_ids(self.db, Director, ("last_name",), last_name))
             else:
-                result = self.db.query(Director).filter(Director.last_name == last_name).first()
+                result = self.base_query().filter(Director.last_name == last_name).first()
             return result
         except Exception as exc:
             self.db.rollback()
@@ -59,9 +60,9 @@ class DirectorRepository(BaseCRUDRepository):
         """
         try:
             if search:
-                directors = self.db.query(Director).filter(Director.first_name.ilike(f"%{first_name}%")).all()
+                directors = self.read_by_ids(search_ids(self.db, Director, ("first_name",), first_name))
             else:
-                directors = self.db.query(Director).filter(Director.first_name == first_name).first()
+                directors = self.base_query().filter(Director.first_name == first_name).first()
             return directors
         except Exception as exc:
             self.db.rollback()
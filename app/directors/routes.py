@@ -2,7 +2,7 @@
 from fastapi import APIRouter, Depends, status, Query
 
 from app.directors.schemas import DirectorSchema, DirectorSchemaIn
-from app.directors.controller import DirectorController
+from app.directors.controller import DirectorController, AsyncDirectorController
 from app.users.controller import JWTBearer
 
 director_router = APIRouter(tags=["Directors"], prefix="/api/directors")
@@ -26,13 +26,13 @@ def create_new_director(director: DirectorSchemaIn):
 
 
 @director_router.get("/", response_model=list[DirectorSchema])
-def get_all_directors():
+async def get_all_directors():
     """
     Function returns a list of all directors in the database.
 
     Return: A list of all directors in the database.
     """
-    return DirectorController.get_all_directors()
+    return await AsyncDirectorController.get_all_directors()
 
 
 @director_router.get("/get-director/id",
@@ -1,10 +1,12 @@
 """Director Schemas module"""
-from pydantic import BaseModel, UUID4
+from uuid import UUID
+
+from pydantic import BaseModel
 
 
 class DirectorSchema(BaseModel):
     """Base Director schema"""
-    id: UUID4
+    id: UUID
     first_name: str
     last_name: str
     country: str
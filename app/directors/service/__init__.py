@@ -1 +1,2 @@
 from .director_services import DirectorServices
+from .async_director_services import AsyncDirectorServices
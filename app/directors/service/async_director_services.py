@@ -0,0 +1,24 @@
+"""Async Director Service module"""
+from app.base import AsyncBaseCRUDRepository
+from app.cache import cached, DIRECTORS
+from app.db import AsyncSessionLocal
+from app.directors.models import Director
+from app.directors.schemas import DirectorSchema
+
+
+class AsyncDirectorServices:
+    """Async service for Director catalogue routes"""
+    @staticmethod
+    @cached(DIRECTORS, schema=DirectorSchema)
+    async def get_all_directors():
+        """
+        Function returns all directors in the database.
+
+        Return: A list of all the directors.
+        """
+        try:
+            async with AsyncSessionLocal() as db:
+                repository = AsyncBaseCRUDRepository(db, Director)
+                return await repository.read_all()
+        except Exception as exc:
+            raise exc
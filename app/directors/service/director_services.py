@@ -1,7 +1,9 @@
 """Director Service module"""
+from app.cache import cached, invalidate, DIRECTORS
 from app.directors.repositories import DirectorRepository
 from app.db.database import SessionLocal
 from app.directors.models import Director
+from app.directors.schemas import DirectorSchema
 
 
 class DirectorServices:
@@ -22,11 +24,14 @@ class DirectorServices:
             with SessionLocal() as db:
                 repository = DirectorRepository(db, Director)
                 fields = {"first_name": first_name, "last_name": last_name, "country": country}
-                return repository.create(fields)
+                director = repository.create(fields)
+                invalidate(DIRECTORS)
+                return director
         except Exception as exc:
             raise exc
 
     @staticmethod
+    @cached(DIRECTORS, schema=DirectorSchema)
     def get_all_directors():
         """
         Function returns all directors in the database.
@@ -119,7 +124,9 @@ class DirectorServices:
             with SessionLocal() as db:
                 repository = DirectorRepository(db, Director)
                 director = repository.read_by_id(director_id)
-                return repository.update(director, attributes)
+                director = repository.update(director, attributes)
+                invalidate(DIRECTORS)
+                return director
         except Exception as exc:
             raise exc
 
@@ -135,6 +142,8 @@ class DirectorServices:
         try:
             with SessionLocal() as db:
                 repository = DirectorRepository(db, Director)
-                return repository.delete(director_id)
+                response = repository.delete(director_id)
+                invalidate(DIRECTORS)
+                return response
         except Exception as exc:
             raise exc
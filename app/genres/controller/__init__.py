@@ -1 +1,2 @@
 from .genre_controller import GenreController
+from .async_genre_controller import AsyncGenreController
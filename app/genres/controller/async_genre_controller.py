@@ -0,0 +1,28 @@
+"""Async Genre Controller module"""
+from fastapi import HTTPException
+from starlette.responses import JSONResponse
+
+from app.genres.controller.genre_controller import GenreController
+from app.genres.service import AsyncGenreServices
+from app.base import AppException, sync_fallback
+
+
+class AsyncGenreController:
+    """Async controller for Genre catalogue routes. Falls back to GenreController when DB_ASYNC is disabled."""
+    @staticmethod
+    @sync_fallback(GenreController.get_all_genres)
+    async def get_all_genres():
+        """
+        Function returns a list of all genres in the database.
+
+        Return: A list of all genres in the database.
+        """
+        try:
+            genres = await AsyncGenreServices.get_all_genres()
+            if not genres:
+                return JSONResponse(content="No Genres in our Database yet.", status_code=200)
+            return genres
+        except AppException as exc:
+            raise HTTPException(status_code=exc.code, detail=exc.message) from exc
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
@@ -35,9 +35,9 @@ class GenreRepository(BaseCRUDRepository):
         """
         try:
             if search:
-                genres = self.db.query(Genre).filter(Genre.name.ilike(f"%{name}%")).all()
+                genres = self.base_query().filter(Genre.name.ilike(f"%{name}%")).all()
             else:
-                genres = self.db.query(Genre).filter(Genre.name == name).first()
+                genres = self.base_query().filter(Genre.name == name).first()
             return genres
         except Exception as exc:
             self.db.rollback()
@@ -2,7 +2,7 @@
 from fastapi import APIRouter, Depends, status, Body
 
 from app.genres.schemas import GenreSchema, GenreSchemaIn
-from app.genres.controller import GenreController
+from app.genres.controller import GenreController, AsyncGenreController
 from app.users.controller import JWTBearer
 
 genre_router = APIRouter(tags=["Genres"], prefix="/api/genres")
@@ -26,13 +26,13 @@ def create_new_genre(genre: GenreSchemaIn):
 
 
 @genre_router.get("/", response_model=list[GenreSchema])
-def get_all_genres():
+async def get_all_genres():
     """
     Function returns a list of all genres in the database.
 
     Return: A list of all the genres in the database.
     """
-    return GenreController.get_all_genres()
+    return await AsyncGenreController.get_all_genres()
 
 
 @genre_router.get("/get-genre/id",
@@ -1,10 +1,12 @@
 """Genre Schemas module"""
-from pydantic import BaseModel, UUID4
+from uuid import UUID
+
+from pydantic import BaseModel
 
 
 class GenreSchema(BaseModel):
     """Base Genre schema"""
-    id: UUID4
+    id: UUID
     name: str
 
     class Config:
@@ -1 +1,2 @@
 from .genre_services import GenreServices
+from .async_genre_services import AsyncGenreServices
@@ -0,0 +1,24 @@
+"""Async Genre Service module"""
+from app.base import AsyncBaseCRUDRepository
+from app.cache import cached, GENRES
+from app.db import AsyncSessionLocal
+from app.genres.models import Genre
+from app.genres.schemas import GenreSchema
+
+
+class AsyncGenreServices:
+    """Async service for Genre catalogue routes"""
+    @staticmethod
+    @cached(GENRES, schema=GenreSchema)
+    async def get_all_genres():
+        """
+        Function returns all genres in the database.
+
+        Return: A list of all the genres in the database.
+        """
+        try:
+            async with AsyncSessionLocal() as db:
+                repository = AsyncBaseCRUDRepository(db, Genre)
+                return await repository.read_all()
+        except Exception as exc:
+            raise exc
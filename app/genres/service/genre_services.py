@@ -1,7 +1,9 @@
 """Genre Service module"""
+from app.cache import cached, invalidate, GENRES
 from app.genres.repositories import GenreRepository
 from app.db.database import SessionLocal
 from app.genres.models import Genre
+from app.genres.schemas import GenreSchema
 
 
 class GenreServices:
@@ -22,11 +24,14 @@ class GenreServices:
             with SessionLocal() as db:
                 repository = GenreRepository(db, Genre)
                 fields = {"name": name}
-                return repository.create_new_genre(fields)
+                genre = repository.create_new_genre(fields)
+                invalidate(GENRES)
+                return genre
         except Exception as exc:
             raise exc
 
     @staticmethod
+    @cached(GENRES, schema=GenreSchema)
     def get_all_genres():
         """
         Function returns all genres in the database.
@@ -87,6 +92,8 @@ class GenreServices:
                 repository = GenreRepository(db, Genre)
                 genre = repository.read_by_id(genre_id)
                 updates = {"name": name}
-                return repository.update(genre, updates)
+                genre = repository.update(genre, updates)
+                invalidate(GENRES)
+                return genre
         except Exception as exc:
             raise exc
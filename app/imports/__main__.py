@@ -0,0 +1,47 @@
+"""
+Command for bulk importing catalogue records from CSV or JSON Lines files.
+
+    python -m app.imports KIND FILE [--format csv|jsonl] [--resume JOB_ID]
+
+KIND is one of genres, directors, actors, movies, series, episodes, movie-actors and series-actors.
+Import directors and genres before movies and series, and titles and actors before their cast links.
+"""
+import argparse
+import json
+import time
+
+from app.main import app  # noqa: F401, applies pending migrations
+from app.base import AppException
+from app.imports.service import IMPORTS, ImportServices
+
+
+def main():
+    """Function parses arguments, runs the import and prints its progress."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("kind", choices=sorted(IMPORTS))
+    parser.add_argument("file")
+    parser.add_argument("--format", dest="file_format", choices=["csv", "jsonl"], default=None)
+    parser.add_argument("--resume", dest="job_id", default=None, help="ID of an interrupted import job.")
+    args = parser.parse_args()
+    started = time.perf_counter()
+    announced = set()
+
+    def progress(job):
+        if job.id not in announced:
+            announced.add(job.id)
+            print(f"Import job {job.id}, resume with --resume {job.id}")
+        rate = job.rows_read / max(time.perf_counter() - started, 1e-9)
+        print(f"{job.kind}: {job.rows_read} rows read, {job.inserted} inserted, {job.skipped} skipped, "
+              f"{job.invalid} invalid ({rate:.0f} rows/s)", flush=True)
+
+    try:
+        with open(args.file, "rb") as stream:
+            report = ImportServices.import_catalogue(args.kind, stream, args.file, args.file_format, args.job_id,
+                                                     progress)
+    except AppException as exc:
+        parser.exit(1, f"{exc.message}\n")
+    print(json.dumps(report, default=str, indent=2))
+
+
+if __name__ == "__main__":
+    main()
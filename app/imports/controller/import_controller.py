@@ -0,0 +1,45 @@
+"""Import Controller module"""
+from typing import IO, Optional
+
+from fastapi import HTTPException
+
+from app.base import AppException
+from app.imports.service import ImportServices
+
+
+class ImportController:
+    """Controller for Import routes"""
+    @staticmethod
+    def import_catalogue(kind: str, stream: IO, filename: str, file_format: Optional[str] = None,
+                         job_id: Optional[str] = None):
+        """
+        Function streams records of an uploaded file into the catalogue.
+
+        Param kind:str: Kind of imported records.
+        Param stream:IO: Uploaded file.
+        Param filename:str: Name of the uploaded file.
+        Param file_format:str: Format of the file, csv or jsonl, overrides the extension.
+        Param job_id:str: ID of an interrupted import job to resume.
+        Return: Progress report of the import job.
+        """
+        try:
+            return ImportServices.import_catalogue(kind, stream, filename, file_format, job_id)
+        except AppException as exc:
+            raise HTTPException(status_code=exc.code, detail=exc.message) from exc
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+    @staticmethod
+    def get_import_job(job_id: str):
+        """
+        Function returns the progress report of an import job.
+
+        Param job_id:str: ID of the import job.
+        Return: Progress report of the import job.
+        """
+        try:
+            return ImportServices.get_import_job(job_id)
+        except AppException as exc:
+            raise HTTPException(status_code=exc.code, detail=exc.message) from exc
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
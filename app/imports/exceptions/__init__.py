@@ -0,0 +1 @@
+from .import_exceptions import *
@@ -0,0 +1,27 @@
+"""Custom exceptions for Catalogue Import logic"""
+from app.base import AppException
+
+
+class UnknownImportKindException(AppException):
+    """Exception raised when an import is started for a kind of record that cannot be imported."""
+    message = "Unknown import kind. Choose one of: genres, directors, actors, movies, series, episodes, " \
+              "movie-actors, series-actors."
+    code = 400
+
+
+class UnsupportedImportFormatException(AppException):
+    """Exception raised when the format of an import file is neither CSV nor JSON Lines."""
+    message = "Unsupported import format. Upload a .csv or .jsonl file."
+    code = 400
+
+
+class ImportJobNotFoundException(AppException):
+    """Exception raised when an import job with the given ID does not exist."""
+    message = "Import job with this ID does not exist."
+    code = 404
+
+
+class ImportResumeMismatchException(AppException):
+    """Exception raised when an import is resumed with a different kind or file than it was started with."""
+    message = "Import job was started for a different kind or file."
+    code = 409
@@ -0,0 +1 @@
+from .import_job import ImportJob, RUNNING, COMPLETED, FAILED
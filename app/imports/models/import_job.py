@@ -0,0 +1,36 @@
+"""ImportJob Model module"""
+from datetime import datetime
+
+from sqlalchemy import Column, String, Integer, DateTime, Text
+
+from app.db import Base, UUIDKey, new_id
+
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+
+class ImportJob(Base):
+    """
+    Base Model for ImportJob, progress of a bulk catalogue import. rows_read is the checkpoint:
+    it is committed together with every batch, and a resumed import skips that many records.
+    """
+    __tablename__ = "import_jobs"
+
+    id = Column(UUIDKey(), primary_key=True, default=new_id)
+    kind = Column(String(20), nullable=False)
+    source = Column(String(200), nullable=False)
+    fingerprint = Column(String(64), nullable=False)
+    status = Column(String(10), nullable=False, default=RUNNING)
+    rows_read = Column(Integer(), nullable=False, default=0)
+    inserted = Column(Integer(), nullable=False, default=0)
+    skipped = Column(Integer(), nullable=False, default=0)
+    invalid = Column(Integer(), nullable=False, default=0)
+    errors = Column(Text(), nullable=False, default="[]")
+    started_at = Column(DateTime(), nullable=False, default=datetime.utcnow)
+    updated_at = Column(DateTime(), nullable=False, default=datetime.utcnow)
+
+    def __init__(self, kind: str, source: str, fingerprint: str):
+        self.kind = kind
+        self.source = source
+        self.fingerprint = fingerprint
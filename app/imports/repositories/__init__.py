@@ -0,0 +1 @@
+from .import_job_repository import ImportJobRepository
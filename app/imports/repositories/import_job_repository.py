@@ -0,0 +1,85 @@
+"""Import Job Repository module"""
+import json
+from datetime import datetime
+
+from app.base import BaseCRUDRepository
+from app.imports.models import ImportJob
+
+
+class ImportJobRepository(BaseCRUDRepository):
+    """Repository for ImportJob Model"""
+
+    def read_job(self, job_id: str):
+        """
+        Function returns the import job with the given ID.
+
+        Param job_id:str: ID of the import job.
+        Return: ImportJob or None.
+        """
+        try:
+            return self.db.query(ImportJob).filter(ImportJob.id == job_id).first()
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
+
+    def insert_rows(self, table, rows: list, chunk_size: int):
+        """
+        Function inserts rows in chunks of at most chunk_size rows, without committing.
+        Every chunk is executed as a single statement with many parameter sets, which the MySQL drivers
+        send as one multi-row INSERT, while the compiled statement is reused between chunks.
+
+        Param table: Table the rows are inserted into.
+        Param rows:list: Dictionaries with the values of every row.
+        Param chunk_size:int: Number of rows in one statement.
+        Return: None.
+        """
+        statement = table.insert()
+        for start in range(0, len(rows), chunk_size):
+            self.db.execute(statement, rows[start:start + chunk_size])
+
+    def save_checkpoint(self, job: ImportJob, rows_read: int, inserted: int, skipped: int, errors: list,
+                        max_errors: int):
+        """
+        Function adds the results of a batch to the job and commits them together with the inserted rows.
+        Only the first max_errors row errors are kept.
+
+        Param job:ImportJob: Import job.
+        Param rows_read:int: Number of records read in the batch.
+        Param inserted:int: Number of inserted rows.
+        Param skipped:int: Number of rows skipped as already existing.
+        Param errors:list: Errors of invalid rows, as dictionaries with the row number and the error.
+        Param max_errors:int: Maximum number of kept errors.
+        Return: None.
+        """
+        try:
+            job.rows_read += rows_read
+            job.inserted += inserted
+            job.skipped += skipped
+            job.invalid += len(errors)
+            if errors:
+                kept = json.loads(job.errors)
+                job.errors = json.dumps(kept + errors[:max(max_errors - len(kept), 0)])
+            job.updated_at = datetime.utcnow()
+            self.db.commit()
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
+
+    def finish(self, job: ImportJob, status: str, error: str = None):
+        """
+        Function sets the final status of the job.
+
+        Param job:ImportJob: Import job.
+        Param status:str: Completed or failed.
+        Param error:str: Error that stopped the import.
+        Return: None.
+        """
+        try:
+            job.status = status
+            if error:
+                job.errors = json.dumps(json.loads(job.errors) + [{"row": job.rows_read + 1, "error": error[:500]}])
+            job.updated_at = datetime.utcnow()
+            self.db.commit()
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
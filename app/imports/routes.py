@@ -0,0 +1,48 @@
+"""Import routes module"""
+from typing import Optional
+
+from fastapi import APIRouter, Depends, File, UploadFile, status
+
+from app.imports.controller import ImportController
+from app.imports.schemas import ImportJobSchema
+from app.users.controller.user_auth_controller import JWTBearer
+
+import_router = APIRouter(tags=["Imports"], prefix="/api/imports")
+
+
+@import_router.post("/{kind}",
+                    response_model=ImportJobSchema,
+                    summary="Bulk import catalogue records from a CSV or JSON Lines file. Admin Route.",
+                    dependencies=[Depends(JWTBearer(["super_user"]))],
+                    status_code=status.HTTP_201_CREATED
+                    )
+def import_catalogue(kind: str, file: UploadFile = File(...), file_format: Optional[str] = None,
+                     job_id: Optional[str] = None):
+    """
+    Function streams an uploaded file of genres, directors, actors, movies, series, episodes,
+    movie-actors or series-actors into the database, in batches committed with a checkpoint.
+    Movies and series reference directors by full name and genres by name, episodes and cast links
+    reference titles. An interrupted import is resumed by uploading the same file with the job_id of the report.
+
+    Param kind:str: Kind of imported records.
+    Param file:UploadFile: CSV file with a header row, or JSON Lines file.
+    Param file_format:str: csv or jsonl, when the file name has another extension.
+    Param job_id:str: ID of the import job to resume.
+    Return: Progress report of the import job.
+    """
+    return ImportController.import_catalogue(kind, file.file, file.filename, file_format, job_id)
+
+
+@import_router.get("/{job_id}",
+                   response_model=ImportJobSchema,
+                   summary="Show progress of a bulk import. Admin Route.",
+                   dependencies=[Depends(JWTBearer(["super_user"]))]
+                   )
+def get_import_job(job_id: str):
+    """
+    Function returns the progress report of an import job, updated after every committed batch.
+
+    Param job_id:str: ID of the import job.
+    Return: Progress report of the import job.
+    """
+    return ImportController.get_import_job(job_id)
@@ -0,0 +1 @@
+from .import_schemas import *
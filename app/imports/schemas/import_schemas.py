@@ -0,0 +1,86 @@
+"""Catalogue Import Schemas module"""
+from datetime import date, datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, constr
+
+
+class ImportRecordSchema(BaseModel):
+    """Base Schema for imported records, strips whitespace and ignores unknown columns"""
+
+    class Config:
+        """Configuration Class"""
+        anystr_strip_whitespace = True
+
+
+class GenreImportSchema(ImportRecordSchema):
+    """Genre Schema for import"""
+    name: constr(min_length=1, max_length=50)
+
+
+class DirectorImportSchema(ImportRecordSchema):
+    """Director Schema for import"""
+    first_name: constr(min_length=1, max_length=50)
+    last_name: constr(min_length=1, max_length=50)
+    country: constr(min_length=1, max_length=50)
+
+
+class ActorImportSchema(ImportRecordSchema):
+    """Actor Schema for import"""
+    first_name: constr(min_length=1, max_length=50)
+    last_name: constr(min_length=1, max_length=50)
+    date_of_birth: Optional[date]
+    country: Optional[constr(max_length=50)]
+
+
+class MovieImportSchema(ImportRecordSchema):
+    """Movie Schema for import, with the director's full name and the genre name"""
+    title: constr(min_length=1, max_length=100)
+    description: constr(max_length=500)
+    year_published: constr(min_length=1, max_length=5)
+    director: str
+    genre: str
+    link: Optional[constr(max_length=100)]
+    date_added: Optional[date]
+
+
+class SeriesImportSchema(MovieImportSchema):
+    """Series Schema for import, with the director's full name and the genre name"""
+
+
+class EpisodeImportSchema(ImportRecordSchema):
+    """Episode Schema for import, with the series title and optionally the full name of its director"""
+    name: constr(min_length=1, max_length=50)
+    description: constr(max_length=500)
+    series: str
+    director: Optional[str]
+    link: Optional[constr(max_length=100)]
+
+
+class CastImportSchema(ImportRecordSchema):
+    """Movie-Actor and Series-Actor Schema for import, with the title and optionally the full name of its director"""
+    title: str
+    first_name: str
+    last_name: str
+    director: Optional[str]
+
+
+class ImportErrorSchema(BaseModel):
+    """Schema of an invalid imported row"""
+    row: int
+    error: str
+
+
+class ImportJobSchema(BaseModel):
+    """Import Job Schema, progress report of a bulk import"""
+    id: str
+    kind: str
+    source: str
+    status: str
+    rows_read: int
+    inserted: int
+    skipped: int
+    invalid: int
+    errors: List[ImportErrorSchema]
+    started_at: datetime
+    updated_at: datetime
@@ -0,0 +1,3 @@
+from .record_readers import InvalidRecord, detect_format, read_records
+from .catalogue_importer import CatalogueImporter, CatalogueImport, IMPORTS, ImportRowError, catalogue_importer
+from .import_services import ImportServices
@@ -0,0 +1,481 @@
+"""Catalogue Importer module"""
+import hashlib
+import itertools
+import json
+from datetime import date
+from typing import Callable, Iterable, Iterator, Optional
+
+from pydantic import ValidationError
+from sqlalchemy import select
+
+from app.actors.models import Actor
+from app.cache import response_cache, NAMESPACES
+from app.config import settings
+from app.db import SessionLocal, new_id
+from app.directors.models import Director
+from app.genres.models import Genre
+from app.imports.exceptions import ImportJobNotFoundException, ImportResumeMismatchException, \
+    UnknownImportKindException
+from app.imports.models import ImportJob, RUNNING, COMPLETED, FAILED
+from app.imports.repositories import ImportJobRepository
+from app.imports.schemas import GenreImportSchema, DirectorImportSchema, ActorImportSchema, MovieImportSchema, \
+    SeriesImportSchema, EpisodeImportSchema, CastImportSchema
+from app.imports.service.record_readers import InvalidRecord
+from app.movies.models import Movie, MovieActor
+from app.recommendations.models import MOVIES, SERIES
+from app.recommendations.service import similar_titles_refresher
+from app.search import clear_search_indexes
+from app.series.models import Series, SeriesActor, Episode
+from app.utils import generate_fake_url
+
+AMBIGUOUS = object()
+
+
+class ImportRowError(ValueError):
+    """Error of a single imported row, counted as invalid without stopping the import."""
+
+
+def normalize(*parts) -> str:
+    """
+    Function returns the lookup key of a name: words separated by single spaces, in lower case.
+    Several parts are joined with a separator that cannot appear in names.
+
+    Param parts: Parts of the name.
+    Return: Lookup key.
+    """
+    return "\x00".join(" ".join(str(part or "").split()).lower() for part in parts)
+
+
+class NameLookup:
+    """IDs of existing objects by name, resolved in memory. Names shared by several objects are ambiguous."""
+
+    def __init__(self, what: str, rows: Iterable = ()):
+        self.what = what
+        self.ids = {}
+        for object_id, *name in rows:
+            self.add(object_id, *name)
+
+    def add(self, object_id: str, *name):
+        """
+        Function adds an object under its name.
+
+        Param object_id:str: ID of the object.
+        Param name: Parts of the name.
+        Return: None.
+        """
+        key = normalize(*name)
+        self.ids[key] = AMBIGUOUS if self.ids.get(key, object_id) != object_id else object_id
+
+    def resolve(self, *name) -> str:
+        """
+        Function returns the ID of the object with the name.
+
+        Param name: Parts of the name.
+        Return: ID of the object.
+        """
+        object_id = self.ids.get(normalize(*name))
+        label = " ".join(part for part in name if part)
+        if object_id is None:
+            raise ImportRowError(f"{self.what} '{label}' does not exist.")
+        if object_id is AMBIGUOUS:
+            raise ImportRowError(f"{self.what} '{label}' is ambiguous.")
+        return object_id
+
+
+class TitleLookup(NameLookup):
+    """IDs of movies or series by title, or by title and director's full name when titles are shared."""
+
+    def __init__(self, what: str, rows: Iterable = ()):
+        super().__init__(what)
+        for object_id, title, first_name, last_name in rows:
+            self.add(object_id, title)
+            self.add(object_id, title, f"{first_name or ''} {last_name or ''}")
+
+    def resolve_title(self, title: str, director: Optional[str]) -> str:
+        """
+        Function returns the ID of the movie or series with the title, made by the director if one is given.
+
+        Param title:str: Title.
+        Param director:str: Full name of the director.
+        Return: ID of the movie or series.
+        """
+        return self.resolve(title, director) if director else self.resolve(title)
+
+
+class CatalogueImport:
+    """
+    Import of one kind of records. Lookups of referenced objects and natural keys of existing rows
+    are loaded once, rows whose natural key already exists are skipped, so an interrupted import can be repeated.
+    """
+    model = None
+    schema = None
+
+    def __init__(self, db):
+        self.db = db
+        self.table = self.model.__table__
+        self.existing = set()
+        self.load()
+
+    def load(self):
+        """Function loads lookups and natural keys of existing rows."""
+
+    def build(self, values) -> dict:
+        """
+        Function returns the values of the inserted row for a validated record.
+
+        Param values: Validated record.
+        Return: A dictionary with a value for every column.
+        """
+        raise NotImplementedError
+
+    def key(self, row: dict) -> tuple:
+        """
+        Function returns the natural key of a row.
+
+        Param row:dict: Values of the row.
+        Return: Key tuple.
+        """
+        raise NotImplementedError
+
+    def complete(self, row: dict) -> dict:
+        """
+        Function fills in generated values of a row that will be inserted.
+
+        Param row:dict: Values of the row.
+        Return: The row.
+        """
+        return row
+
+    def prepare(self, record) -> Optional[dict]:
+        """
+        Function validates a record and returns the row to insert, or None if the row already exists.
+
+        Param record: Dictionary read from the import file.
+        Return: A dictionary with the values of the row, or None.
+        """
+        if isinstance(record, InvalidRecord):
+            raise ImportRowError(record.error)
+        try:
+            values = self.schema.parse_obj(record)
+        except ValidationError as exc:
+            raise ImportRowError("; ".join(f"{'.'.join(map(str, error['loc']))}: {error['msg']}"
+                                           for error in exc.errors())) from exc
+        row = self.build(values)
+        key = self.key(row)
+        if key in self.existing:
+            return None
+        self.existing.add(key)
+        return self.complete({"id": new_id(), **row})
+
+
+class GenreImport(CatalogueImport):
+    """Import of genres, unique by name"""
+    model = Genre
+    schema = GenreImportSchema
+
+    def load(self):
+        self.existing = {(normalize(name),) for name in self.db.execute(select(Genre.name)).scalars()}
+
+    def build(self, values) -> dict:
+        return {"name": values.name}
+
+    def key(self, row: dict) -> tuple:
+        return (normalize(row["name"]),)
+
+
+class DirectorImport(CatalogueImport):
+    """Import of directors, unique by name and country"""
+    model = Director
+    schema = DirectorImportSchema
+
+    def load(self):
+        self.existing = {(normalize(*row),) for row in
+                         self.db.execute(select(Director.first_name, Director.last_name, Director.country))}
+
+    def build(self, values) -> dict:
+        return {"first_name": values.first_name, "last_name": values.last_name, "country": values.country}
+
+    def key(self, row: dict) -> tuple:
+        return (normalize(row["first_name"], row["last_name"], row["country"]),)
+
+
+class ActorImport(CatalogueImport):
+    """Import of actors, unique by name and date of birth"""
+    model = Actor
+    schema = ActorImportSchema
+
+    def load(self):
+        self.existing = {(normalize(first_name, last_name), date_of_birth) for first_name, last_name, date_of_birth
+                         in self.db.execute(select(Actor.first_name, Actor.last_name, Actor.date_of_birth))}
+
+    def build(self, values) -> dict:
+        return {"first_name": values.first_name, "last_name": values.last_name,
+                "date_of_birth": values.date_of_birth, "country": values.country}
+
+    def key(self, row: dict) -> tuple:
+        return normalize(row["first_name"], row["last_name"]), row["date_of_birth"]
+
+
+class MovieImport(CatalogueImport):
+    """Import of movies, unique by title and director, with directors and genres resolved by name"""
+    model = Movie
+    schema = MovieImportSchema
+
+    def load(self):
+        self.directors = NameLookup("Director", ((director_id, f"{first_name} {last_name}") for
+                                                 director_id, first_name, last_name in
+                                                 self.db.execute(select(Director.id, Director.first_name,
+                                                                        Director.last_name))))
+        self.genres = NameLookup("Genre", self.db.execute(select(Genre.id, Genre.name)))
+        self.existing = {(normalize(title), director_id) for title, director_id in
+                         self.db.execute(select(self.model.title, self.model.director_id))}
+
+    def build(self, values) -> dict:
+        return {"title": values.title, "description": values.description, "year_published": values.year_published,
+                "director_id": self.directors.resolve(values.director), "genre_id": self.genres.resolve(values.genre),
+                "date_added": values.date_added or date.today(), "link": values.link}
+
+    def key(self, row: dict) -> tuple:
+        return normalize(row["title"]), row["director_id"]
+
+    def complete(self, row: dict) -> dict:
+        row["link"] = row["link"] or generate_fake_url()
+        return row
+
+
+class SeriesImport(MovieImport):
+    """Import of series, unique by title and director, with directors and genres resolved by name"""
+    model = Series
+    schema = SeriesImportSchema
+
+    def build(self, values) -> dict:
+        row = super().build(values)
+        del row["link"]
+        return row
+
+    def complete(self, row: dict) -> dict:
+        return row
+
+
+def title_rows(db, model):
+    """
+    Function returns ID, title and the director's name of every movie or series.
+
+    Param db: Session.
+    Param model: Movie or Series.
+    Return: Result rows.
+    """
+    return db.execute(select(model.id, model.title, Director.first_name, Director.last_name)
+                      .outerjoin(Director, model.director_id == Director.id))
+
+
+class EpisodeImport(CatalogueImport):
+    """Import of episodes, unique by name within a series, with series resolved by title"""
+    model = Episode
+    schema = EpisodeImportSchema
+
+    def load(self):
+        self.series = TitleLookup("Series", title_rows(self.db, Series))
+        self.existing = {(series_id, normalize(name)) for series_id, name in
+                         self.db.execute(select(Episode.series_id, Episode.name))}
+
+    def build(self, values) -> dict:
+        return {"name": values.name, "description": values.description,
+                "series_id": self.series.resolve_title(values.series, values.director), "link": values.link}
+
+    def key(self, row: dict) -> tuple:
+        return row["series_id"], normalize(row["name"])
+
+    def complete(self, row: dict) -> dict:
+        row["link"] = row["link"] or generate_fake_url()
+        return row
+
+
+class MovieActorImport(CatalogueImport):
+    """Import of cast links between movies and actors, resolved by title and the actor's name"""
+    model = MovieActor
+    schema = CastImportSchema
+    titled = Movie
+    link_column = "movie_id"
+
+    def load(self):
+        self.titles = TitleLookup(self.titled.__name__, title_rows(self.db, self.titled))
+        self.actors = NameLookup("Actor", self.db.execute(select(Actor.id, Actor.first_name, Actor.last_name)))
+        columns = self.table.c
+        self.existing = set(self.db.execute(select(columns[self.link_column], columns.actor_id)))
+
+    def build(self, values) -> dict:
+        return {self.link_column: self.titles.resolve_title(values.title, values.director),
+                "actor_id": self.actors.resolve(values.first_name, values.last_name)}
+
+    def key(self, row: dict) -> tuple:
+        return row[self.link_column], row["actor_id"]
+
+
+class SeriesActorImport(MovieActorImport):
+    """Import of cast links between series and actors, resolved by title and the actor's name"""
+    model = SeriesActor
+    titled = Series
+    link_column = "series_id"
+
+
+IMPORTS = {
+    "genres": GenreImport,
+    "directors": DirectorImport,
+    "actors": ActorImport,
+    "movies": MovieImport,
+    "series": SeriesImport,
+    "episodes": EpisodeImport,
+    "movie-actors": MovieActorImport,
+    "series-actors": SeriesActorImport,
+}
+# Kind of similar titles to refresh after an import, inserted with Core statements that skip ORM events.
+SIMILAR_TITLE_KINDS = {"movies": MOVIES, "movie-actors": MOVIES, "series": SERIES, "series-actors": SERIES}
+
+
+def fingerprint(record) -> str:
+    """
+    Function returns the digest of the first record of a file, compared when an import is resumed.
+
+    Param record: First record, or None for an empty file.
+    Return: Hex digest.
+    """
+    raw = record.raw if isinstance(record, InvalidRecord) else json.dumps(record, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def job_report(job: ImportJob) -> dict:
+    """
+    Function returns the progress report of an import job.
+
+    Param job:ImportJob: Import job.
+    Return: A dictionary with the state and counters of the job.
+    """
+    return {"id": job.id, "kind": job.kind, "source": job.source, "status": job.status,
+            "rows_read": job.rows_read, "inserted": job.inserted, "skipped": job.skipped, "invalid": job.invalid,
+            "errors": json.loads(job.errors), "started_at": job.started_at, "updated_at": job.updated_at}
+
+
+def batched(records: Iterator, size: int) -> Iterator[list]:
+    """
+    Function splits records into lists of at most size records.
+
+    Param records:Iterator: Records.
+    Param size:int: Size of a batch.
+    Return: Iterator of lists.
+    """
+    while True:
+        batch = list(itertools.islice(records, size))
+        if not batch:
+            return
+        yield batch
+
+
+class CatalogueImporter:
+    """
+    Streaming bulk import of catalogue records. Records are validated in batches, each batch is inserted
+    with multi-row INSERT statements and committed together with the checkpoint of its import job,
+    so memory use does not grow with the file and an interrupted import resumes after the last committed batch.
+    """
+
+    def __init__(self, session_factory=SessionLocal, batch_size: int = 1000, chunk_size: int = 500,
+                 max_errors: int = 100):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+        self.max_errors = max_errors
+
+    @staticmethod
+    def start(repository: ImportJobRepository, kind: str, source: str, digest: str, job_id: Optional[str]):
+        """
+        Function creates a new import job, or returns the job being resumed after checking
+        that it was started for the same kind and file.
+
+        Param repository:ImportJobRepository: Repository of import jobs.
+        Param kind:str: Kind of imported records.
+        Param source:str: Name of the import file.
+        Param digest:str: Fingerprint of the import file.
+        Param job_id:str: ID of the job to resume.
+        Return: ImportJob.
+        """
+        if job_id is None:
+            return repository.create({"kind": kind, "source": source[-200:], "fingerprint": digest})
+        job = repository.read_job(job_id)
+        if job is None:
+            raise ImportJobNotFoundException
+        if job.kind != kind or job.fingerprint != digest:
+            raise ImportResumeMismatchException
+        return job
+
+    def run(self, kind: str, records: Iterable, source: str, job_id: Optional[str] = None,
+            progress: Optional[Callable] = None) -> dict:
+        """
+        Function imports records of the kind, starting a new import job or resuming the given one.
+        Caches and search indexes are cleared once rows were inserted.
+
+        Param kind:str: Kind of imported records, one of IMPORTS.
+        Param records:Iterable: Records read from the import file.
+        Param source:str: Name of the import file.
+        Param job_id:str: ID of the job to resume.
+        Param progress:Callable: Function called with the job after every committed batch.
+        Return: Progress report of the job.
+        """
+        if kind not in IMPORTS:
+            raise UnknownImportKindException
+        records = iter(records)
+        first = next(records, None)
+        records = itertools.chain(() if first is None else (first,), records)
+        with self.session_factory() as db:
+            repository = ImportJobRepository(db, ImportJob)
+            job = self.start(repository, kind, source, fingerprint(first), job_id)
+            if job.status == COMPLETED:
+                return job_report(job)
+            job.status = RUNNING
+            inserted = job.inserted
+            try:
+                catalogue_import = IMPORTS[kind](db)
+                for batch in batched(itertools.islice(records, job.rows_read, None), self.batch_size):
+                    self.load_batch(repository, job, catalogue_import, batch)
+                    if progress is not None:
+                        progress(job)
+            except Exception as exc:
+                db.rollback()
+                repository.finish(job, FAILED, str(exc))
+                raise exc
+            finally:
+                if job.inserted != inserted:
+                    response_cache.invalidate(*NAMESPACES)
+                    clear_search_indexes()
+                    if kind in SIMILAR_TITLE_KINDS:
+                        similar_titles_refresher.record(SIMILAR_TITLE_KINDS[kind])
+            repository.finish(job, COMPLETED)
+            return job_report(job)
+
+    def load_batch(self, repository: ImportJobRepository, job: ImportJob, catalogue_import: CatalogueImport,
+                   batch: list):
+        """
+        Function validates a batch of records, inserts the new rows and commits them with the checkpoint.
+
+        Param repository:ImportJobRepository: Repository of import jobs.
+        Param job:ImportJob: Import job.
+        Param catalogue_import:CatalogueImport: Import of the kind of the records.
+        Param batch:list: Records of the batch.
+        Return: None.
+        """
+        rows, errors, skipped = [], [], 0
+        for number, record in enumerate(batch, start=job.rows_read + 1):
+            try:
+                row = catalogue_import.prepare(record)
+            except ImportRowError as exc:
+                errors.append({"row": number, "error": str(exc)})
+                continue
+            if row is None:
+                skipped += 1
+            else:
+                rows.append(row)
+        repository.insert_rows(catalogue_import.table, rows, self.chunk_size)
+        repository.save_checkpoint(job, len(batch), len(rows), skipped, errors, self.max_errors)
+
+
+catalogue_importer = CatalogueImporter(batch_size=settings.IMPORT_BATCH_SIZE,
+                                       chunk_size=settings.IMPORT_INSERT_CHUNK_SIZE)
@@ -0,0 +1,49 @@
+"""Import Service module"""
+from typing import IO, Callable, Optional
+
+from app.db import SessionLocal
+from app.imports.exceptions import ImportJobNotFoundException
+from app.imports.models import ImportJob
+from app.imports.repositories import ImportJobRepository
+from app.imports.service.catalogue_importer import catalogue_importer, job_report
+from app.imports.service.record_readers import detect_format, read_records
+
+
+class ImportServices:
+    """Service for Import routes and the import command"""
+    @staticmethod
+    def import_catalogue(kind: str, stream: IO, filename: str, file_format: Optional[str] = None,
+                         job_id: Optional[str] = None, progress: Optional[Callable] = None):
+        """
+        Function streams records of a CSV or JSON Lines file into the catalogue.
+
+        Param kind:str: Kind of imported records.
+        Param stream:IO: Open file or uploaded file.
+        Param filename:str: Name of the file, its extension selects the format.
+        Param file_format:str: Format of the file, csv or jsonl, overrides the extension.
+        Param job_id:str: ID of an interrupted import job to resume.
+        Param progress:Callable: Function called with the job after every committed batch.
+        Return: Progress report of the import job.
+        """
+        try:
+            records = read_records(stream, detect_format(filename, file_format))
+            return catalogue_importer.run(kind, records, filename, job_id, progress)
+        except Exception as exc:
+            raise exc
+
+    @staticmethod
+    def get_import_job(job_id: str):
+        """
+        Function returns the progress report of an import job.
+
+        Param job_id:str: ID of the import job.
+        Return: Progress report of the import job.
+        """
+        try:
+            with SessionLocal() as db:
+                job = ImportJobRepository(db, ImportJob).read_job(job_id)
+                if job is None:
+                    raise ImportJobNotFoundException
+                return job_report(job)
+        except Exception as exc:
+            raise exc
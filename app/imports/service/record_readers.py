@@ -0,0 +1,90 @@
+"""Record Readers module"""
+import codecs
+import csv
+import json
+from typing import IO, Iterator, Optional
+
+from app.imports.exceptions import UnsupportedImportFormatException
+
+CSV = "csv"
+JSONL = "jsonl"
+FORMATS = {".csv": CSV, ".jsonl": JSONL, ".ndjson": JSONL}
+
+
+class InvalidRecord:
+    """Line of an import file that could not be parsed, reported as an invalid row instead of stopping the import."""
+
+    __slots__ = ("raw", "error")
+
+    def __init__(self, raw: str, error: str):
+        self.raw = raw
+        self.error = error
+
+
+def detect_format(filename: str, file_format: Optional[str] = None) -> str:
+    """
+    Function returns the format of an import file, given explicitly or by the file extension.
+
+    Param filename:str: Name of the file.
+    Param file_format:str: Format given by the caller, csv or jsonl.
+    Return: csv or jsonl.
+    """
+    if file_format:
+        if file_format.lower() not in (CSV, JSONL):
+            raise UnsupportedImportFormatException
+        return file_format.lower()
+    extension = filename[filename.rfind("."):].lower() if "." in filename else ""
+    if extension not in FORMATS:
+        raise UnsupportedImportFormatException
+    return FORMATS[extension]
+
+
+def text_lines(stream: IO) -> Iterator[str]:
+    """
+    Function returns the lines of a text or binary stream, decoding binary streams as UTF-8 as they are read.
+    A byte order mark at the start is dropped.
+
+    Param stream:IO: Open file or uploaded file.
+    Return: Iterator of lines.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    for chunk in iter(lambda: stream.read(64 * 1024), type(stream.read(0))()):
+        pending += decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line + "\n"
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+def read_records(stream: IO, file_format: str) -> Iterator:
+    """
+    Function streams the records of a CSV file with a header row, or of a JSON Lines file with an object
+    on every line. Empty CSV values are read as missing. Lines that cannot be parsed are returned as InvalidRecord.
+
+    Param stream:IO: Open file or uploaded file, in text or binary mode.
+    Param file_format:str: csv or jsonl.
+    Return: Iterator of dictionaries and invalid records.
+    """
+    lines = text_lines(stream)
+    if file_format == CSV:
+        for row in csv.DictReader(lines):
+            if None in row:
+                yield InvalidRecord(",".join(row.pop(None)), "Row has more values than the header.")
+                continue
+            yield {key.strip(): value for key, value in row.items() if value not in ("", None)}
+        return
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            yield InvalidRecord(line, f"Invalid JSON: {exc}")
+            continue
+        if isinstance(record, dict):
+            yield record
+        else:
+            yield InvalidRecord(line, "Line is not a JSON object.")
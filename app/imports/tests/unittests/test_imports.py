@@ -0,0 +1,164 @@
+"""Test Catalogue Import module"""
+import io
+
+import pytest
+
+from app.base import AppException
+from app.directors.models import Director
+from app.genres.models import Genre
+from app.imports.models import ImportJob, COMPLETED, FAILED
+from app.imports.service import CatalogueImporter, InvalidRecord, read_records
+from app.movies.models import Movie, MovieActor
+from app.series.models import Series
+from app.tests import TestClass, TestingSessionLocal, QueryCounter
+
+MOVIES_CSV = "title,description,year_published,director,genre\n" + "".join(
+    f"Movie {i},Description,1994,Quentin Tarantino,Drama\n" for i in range(12))
+
+
+def csv_records(text: str) -> list:
+    """
+    Function reads records of CSV text, as they are read from an uploaded file.
+
+    Param text:str: CSV text with a header row.
+    Return: A list of records.
+    """
+    return list(read_records(io.BytesIO(text.encode()), "csv"))
+
+
+class TestRecordReaders:
+    """Test streaming of CSV and JSON Lines records."""
+
+    def test_csv_and_jsonl_records(self):
+        """
+        Function tests that empty CSV values are left out, quoted values may span lines,
+        and that lines that cannot be parsed are returned as invalid records.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        records = csv_records('\ufeffname,description\nPilot,"First\nepisode"\nFinale,\n')
+        assert records == [{"name": "Pilot", "description": "First\nepisode"}, {"name": "Finale"}]
+
+        stream = io.BytesIO(b'{"name": "Drama"}\n\nnot json\n[1, 2]\n{"name": "Comedy"}')
+        records = list(read_records(stream, "jsonl"))
+        assert [record for record in records if isinstance(record, dict)] == [{"name": "Drama"}, {"name": "Comedy"}]
+        assert [record.raw.strip() for record in records if isinstance(record, InvalidRecord)] == \
+               ["not json", "[1, 2]"]
+
+
+class TestCatalogueImporter(TestClass):
+    """Test validation, batching and resuming of bulk catalogue imports."""
+
+    @staticmethod
+    def create_importer(**kwargs) -> CatalogueImporter:
+        """
+        Function creates an importer on the test database, with small batches.
+
+        Return: CatalogueImporter.
+        """
+        return CatalogueImporter(TestingSessionLocal, **{"batch_size": 5, "chunk_size": 2, **kwargs})
+
+    def test_movies_are_inserted_in_chunks(self):
+        """
+        Function tests that directors and genres are resolved by name, invalid and existing rows
+        are reported without stopping the import, and that rows are inserted with multi-row statements.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        importer = self.create_importer()
+        importer.run("directors", csv_records("first_name,last_name,country\nQuentin,Tarantino,USA\n"), "d.csv")
+        importer.run("genres", [{"name": "Drama"}, {"name": " drama "}], "genres.jsonl")
+        records = csv_records(MOVIES_CSV + "Movie 3,Description,1994,Quentin Tarantino,Drama\n"
+                                           "Unknown,Description,1994,Nobody,Drama\n,Description,1994,,Drama\n")
+        with QueryCounter() as counter:
+            report = importer.run("movies", records, "movies.csv")
+        assert report["status"] == COMPLETED
+        assert (report["rows_read"], report["inserted"], report["skipped"], report["invalid"]) == (15, 12, 1, 2)
+        assert [error["row"] for error in report["errors"]] == [14, 15]
+        assert "Director 'Nobody' does not exist." in report["errors"][0]["error"]
+        assert len([statement for statement in counter.statements if statement.startswith("INSERT INTO movies")]) \
+               == 7
+        with TestingSessionLocal() as db:
+            assert db.query(Movie).count() == 12
+            assert db.query(Genre).count() == 1
+            assert {movie.director_id for movie in db.query(Movie)} == {db.query(Director).one().id}
+
+    def test_interrupted_import_is_resumed(self):
+        """
+        Function tests that an import stopped after a committed batch resumes from its checkpoint
+        without inserting rows twice, and that it cannot be resumed with another file.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        importer = self.create_importer()
+        importer.run("directors", [{"first_name": "Quentin", "last_name": "Tarantino", "country": "USA"}], "d.csv")
+        importer.run("genres", [{"name": "Drama"}], "g.csv")
+
+        def stop(job):
+            if job.rows_read >= 5:
+                raise RuntimeError("Connection lost")
+
+        with pytest.raises(RuntimeError):
+            importer.run("movies", csv_records(MOVIES_CSV), "movies.csv", progress=stop)
+        with TestingSessionLocal() as db:
+            assert db.query(Movie).count() == 5
+            job = db.query(ImportJob).filter(ImportJob.kind == "movies").one()
+            assert (job.status, job.rows_read) == (FAILED, 5)
+            job_id = job.id
+
+        with pytest.raises(AppException) as exc_info:
+            importer.run("series", csv_records(MOVIES_CSV), "movies.csv", job_id=job_id)
+        assert exc_info.value.code == 409
+
+        report = importer.run("movies", csv_records(MOVIES_CSV), "movies.csv", job_id=job_id)
+        assert (report["status"], report["rows_read"], report["inserted"], report["skipped"]) == (COMPLETED, 12, 12, 0)
+        with TestingSessionLocal() as db:
+            assert db.query(Movie).count() == 12
+
+    def test_cast_links_are_resolved_by_title(self):
+        """
+        Function tests that cast links are resolved by title and actor name, that titles shared by
+        several series need the director's name, and that repeated links are skipped.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        importer = self.create_importer()
+        importer.run("directors", [{"first_name": "Quentin", "last_name": "Tarantino", "country": "USA"},
+                                   {"first_name": "David", "last_name": "Lynch", "country": "USA"}], "d.jsonl")
+        importer.run("genres", [{"name": "Drama"}], "g.jsonl")
+        importer.run("actors", [{"first_name": "Uma", "last_name": "Thurman", "date_of_birth": "1970-04-29"}],
+                     "a.jsonl")
+        importer.run("movies", csv_records(MOVIES_CSV), "movies.csv")
+        series = [{"title": "Twin Peaks", "description": "Description", "year_published": "1990",
+                   "director": director, "genre": "Drama"} for director in ("David Lynch", "Quentin Tarantino")]
+        assert importer.run("series", series, "s.jsonl")["inserted"] == 2
+
+        links = [{"title": "Movie 1", "first_name": "Uma", "last_name": "Thurman"},
+                 {"title": "movie 1", "first_name": "uma", "last_name": "thurman"}]
+        report = importer.run("movie-actors", links, "ma.jsonl")
+        assert (report["inserted"], report["skipped"]) == (1, 1)
+
+        links = [{"title": "Twin Peaks", "first_name": "Uma", "last_name": "Thurman"},
+                 {"title": "Twin Peaks", "director": "David Lynch", "first_name": "Uma", "last_name": "Thurman"}]
+        report = importer.run("series-actors", links, "sa.jsonl")
+        assert (report["inserted"], report["invalid"]) == (1, 1)
+        assert report["errors"][0]["error"] == "Series 'Twin Peaks' is ambiguous."
+        with TestingSessionLocal() as db:
+            assert db.query(MovieActor).count() == 1
+            lynch = db.query(Director).filter(Director.last_name == "Lynch").one()
+            assert db.query(Series).filter(Series.director_id == lynch.id).one().actors[0].first_name == "Uma"
+
+    def test_unknown_kind_is_rejected(self):
+        """
+        Function tests that an import of an unknown kind is rejected with code 400.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        with pytest.raises(AppException) as exc_info:
+            self.create_importer().run("users", [{"email": "user@gmail.com"}], "users.jsonl")
+        assert exc_info.value.code == 400
@@ -0,0 +1 @@
+from .outbox_message import OutboxMessage, PENDING, SENDING, SENT, FAILED
@@ -0,0 +1,36 @@
+"""OutboxMessage Model module"""
+from datetime import datetime
+
+from sqlalchemy import Column, String, Integer, DateTime, Text, Index
+
+from app.db import Base, UUIDKey, new_id
+
+PENDING = "pending"
+SENDING = "sending"
+SENT = "sent"
+FAILED = "failed"
+
+
+class OutboxMessage(Base):
+    """
+    Base Model for OutboxMessage, an email committed together with the change that caused it
+    and sent later by the mail dispatcher
+    """
+    __tablename__ = "mail_outbox"
+    __table_args__ = (Index("ix_mail_outbox_status_next_attempt_at", "status", "next_attempt_at"),)
+
+    id = Column(UUIDKey(), primary_key=True, default=new_id)
+    recipient = Column(String(100), nullable=False)
+    subject = Column(String(200), nullable=False)
+    body = Column(Text(), nullable=False)
+    status = Column(String(10), nullable=False, default=PENDING)
+    attempts = Column(Integer(), nullable=False, default=0)
+    next_attempt_at = Column(DateTime(), nullable=False, default=datetime.utcnow)
+    last_error = Column(String(500))
+    created_at = Column(DateTime(), nullable=False, default=datetime.utcnow)
+    sent_at = Column(DateTime())
+
+    def __init__(self, recipient: str, subject: str, body: str):
+        self.recipient = recipient
+        self.subject = subject
+        self.body = body
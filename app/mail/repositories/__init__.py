@@ -0,0 +1 @@
+from .outbox_repository import OutboxRepository
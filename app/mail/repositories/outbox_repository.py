@@ -0,0 +1,130 @@
+"""Outbox Repository module"""
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, or_
+
+from app.base import BaseCRUDRepository
+from app.mail.models import OutboxMessage, PENDING, SENDING, SENT, FAILED
+
+
+class OutboxRepository(BaseCRUDRepository):
+    """Repository for OutboxMessage Model"""
+
+    def enqueue(self, recipient: str, subject: str, body: str):
+        """
+        Function adds a message to the outbox without committing it, so the message is committed
+        together with the change that caused it.
+
+        Param recipient:str: Email address of the recipient.
+        Param subject:str: Subject of the message.
+        Param body:str: HTML body of the message.
+        Return: The outbox message.
+        """
+        try:
+            message = OutboxMessage(recipient, subject, body)
+            self.db.add(message)
+            self.db.flush()
+            return message
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
+
+    def claim_due(self, limit: int, lease_seconds: float) -> list:
+        """
+        Function claims up to limit messages that are due for sending, and leases them for lease_seconds.
+        Messages whose lease ran out, because the dispatcher holding them stopped, are claimed again.
+        On MySQL the rows are locked with SKIP LOCKED, so dispatchers of different workers claim different messages.
+
+        Param limit:int: Maximum number of messages.
+        Param lease_seconds:float: Time the dispatcher has to send the messages.
+        Return: A list of dictionaries with id, recipient, subject, body and attempts of every message.
+        """
+        try:
+            now = datetime.utcnow()
+            messages = self.db.query(OutboxMessage) \
+                .filter(or_(OutboxMessage.status == PENDING, OutboxMessage.status == SENDING),
+                        OutboxMessage.next_attempt_at <= now) \
+                .order_by(OutboxMessage.next_attempt_at) \
+                .limit(limit).with_for_update(skip_locked=True).all()
+            claimed = []
+            for message in messages:
+                message.status = SENDING
+                message.next_attempt_at = now + timedelta(seconds=lease_seconds)
+                claimed.append({"id": message.id, "recipient": message.recipient, "subject": message.subject,
+                                "body": message.body, "attempts": message.attempts})
+            self.db.commit()
+            return claimed
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
+
+    def mark_sent(self, message_ids: list):
+        """
+        Function marks messages as sent.
+
+        Param message_ids:list: IDs of the sent messages.
+        Return: None.
+        """
+        try:
+            if message_ids:
+                self.db.query(OutboxMessage).filter(OutboxMessage.id.in_(message_ids)).update(
+                    {OutboxMessage.status: SENT, OutboxMessage.sent_at: datetime.utcnow(),
+                     OutboxMessage.last_error: None}, synchronize_session=False)
+                self.db.commit()
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
+
+    def mark_failed(self, message_id: str, attempts: int, error: str, retry_at: datetime = None):
+        """
+        Function records a failed attempt of sending a message. The message is retried at retry_at,
+        or marked as failed for good when retry_at is None.
+
+        Param message_id:str: ID of the message.
+        Param attempts:int: Number of attempts made so far.
+        Param error:str: Error of the last attempt.
+        Param retry_at:datetime: Time of the next attempt.
+        Return: None.
+        """
+        try:
+            updates = {OutboxMessage.attempts: attempts, OutboxMessage.last_error: error[:500],
+                       OutboxMessage.status: PENDING if retry_at else FAILED}
+            if retry_at:
+                updates[OutboxMessage.next_attempt_at] = retry_at
+            self.db.query(OutboxMessage).filter(OutboxMessage.id == message_id).update(
+                updates, synchronize_session=False)
+            self.db.commit()
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
+
+    def release(self, message_ids: list):
+        """
+        Function returns claimed messages to the outbox without counting an attempt,
+        used when the dispatcher stops sending before it tried them.
+
+        Param message_ids:list: IDs of the claimed messages.
+        Return: None.
+        """
+        try:
+            if message_ids:
+                self.db.query(OutboxMessage).filter(OutboxMessage.id.in_(message_ids)).update(
+                    {OutboxMessage.status: PENDING, OutboxMessage.next_attempt_at: datetime.utcnow()},
+                    synchronize_session=False)
+                self.db.commit()
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
+
+    def count_by_status(self) -> dict:
+        """
+        Function returns the number of messages in every status.
+
+        Return: A dictionary with status as key and number of messages as value.
+        """
+        try:
+            rows = self.db.query(OutboxMessage.status, func.count()).group_by(OutboxMessage.status).all()
+            return dict(rows)
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
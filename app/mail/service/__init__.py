@@ -0,0 +1,3 @@
+from .circuit_breaker import CircuitBreaker
+from .smtp_pool import SMTPConnectionPool
+from .mail_dispatcher import MailDispatcher, create_mail_dispatcher, is_permanent_error, mail_dispatcher
@@ -0,0 +1,76 @@
+"""Circuit Breaker module"""
+import time
+from threading import Lock
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class CircuitBreaker:
+    """
+    Stops calls to a failing service. After threshold consecutive failures the circuit opens and calls
+    are refused for cooldown_seconds, then a single trial call decides whether it closes or opens again.
+    """
+
+    def __init__(self, threshold: int = 5, cooldown_seconds: float = 60, clock=time.monotonic):
+        self.threshold = threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.clock = clock
+        self._lock = Lock()
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = None
+
+    def allow(self) -> bool:
+        """
+        Function checks whether a call may be made, moving an open circuit to half-open after the cooldown.
+
+        Return: True if the call may be made.
+        """
+        with self._lock:
+            if self.state == OPEN and self.clock() - self.opened_at >= self.cooldown_seconds:
+                self.state = HALF_OPEN
+            return self.state != OPEN
+
+    def retry_after(self) -> float:
+        """
+        Function returns the number of seconds until an open circuit allows a trial call.
+
+        Return: Seconds until the end of the cooldown, 0 if the circuit is not open.
+        """
+        with self._lock:
+            if self.state != OPEN:
+                return 0.0
+            return max(0.0, self.cooldown_seconds - (self.clock() - self.opened_at))
+
+    def record_success(self):
+        """
+        Function closes the circuit after a successful call.
+
+        Return: None.
+        """
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        """
+        Function counts a failed call, opening the circuit when the threshold is reached or the trial call failed.
+
+        Return: None.
+        """
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.threshold:
+                self.state = OPEN
+                self.opened_at = self.clock()
+
+    def snapshot(self) -> dict:
+        """
+        Function returns the state of the circuit.
+
+        Return: A dictionary with state and number of consecutive failures.
+        """
+        with self._lock:
+            return {"state": self.state, "failures": self.failures}
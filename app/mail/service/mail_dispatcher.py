@@ -0,0 +1,223 @@
+"""Mail Dispatcher module"""
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from email.message import EmailMessage
+
+from aiosmtplib import SMTPRecipientsRefused, SMTPResponseException
+from starlette.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.db.database import SessionLocal
+from app.mail.models import OutboxMessage
+from app.mail.repositories import OutboxRepository
+from app.metrics import metrics_registry
+from .circuit_breaker import CircuitBreaker
+from .smtp_pool import SMTPConnectionPool
+
+logger = logging.getLogger(__name__)
+
+MAIL_SEND_SECONDS = metrics_registry.histogram("mail_send_duration_seconds", "Latency of sending a message by outcome.",
+                                               ("outcome",))
+MAIL_MESSAGES = metrics_registry.counter("mail_messages_total", "Outbox messages by outcome: sent, failed_permanent, "
+                                                                "failed_transient or released.", ("outcome",))
+
+
+def is_permanent_error(exc: Exception) -> bool:
+    """
+    Function checks whether retrying a failed message could succeed. Refused recipients and 5xx replies
+    are permanent, connection errors, timeouts and 4xx replies are transient.
+
+    Param exc:Exception: Error raised while sending the message.
+    Return: True if the message should not be retried.
+    """
+    if isinstance(exc, SMTPRecipientsRefused):
+        return True
+    return isinstance(exc, SMTPResponseException) and exc.code >= 500
+
+
+class MailDispatcher:
+    """
+    Background task sending messages from the outbox. Due messages are claimed in batches and sent
+    concurrently over pooled SMTP connections. Transient errors are retried with exponential backoff,
+    and open the circuit breaker when the SMTP server keeps failing.
+    """
+
+    def __init__(self, pool: SMTPConnectionPool, breaker: CircuitBreaker, session_factory=SessionLocal,
+                 sender: str = "", batch_size: int = 50, max_attempts: int = 5, backoff_seconds: float = 30,
+                 max_backoff_seconds: float = 3600, poll_seconds: float = 1.0, lease_seconds: float = 300):
+        self.pool = pool
+        self.breaker = breaker
+        self.session_factory = session_factory
+        self.sender = sender
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.poll_seconds = poll_seconds
+        self.lease_seconds = lease_seconds
+        self._slots = None
+        self._stopping = None
+        self._task = None
+
+    def retry_at(self, attempts: int):
+        """
+        Function returns the time of the next attempt, or None if the message ran out of attempts.
+
+        Param attempts:int: Number of attempts made so far.
+        Return: Datetime of the next attempt or None.
+        """
+        if attempts >= self.max_attempts:
+            return None
+        delay = min(self.backoff_seconds * 2 ** (attempts - 1), self.max_backoff_seconds)
+        return datetime.utcnow() + timedelta(seconds=delay)
+
+    def claim(self, limit: int) -> list:
+        """
+        Function claims due messages from the outbox.
+
+        Param limit:int: Maximum number of messages.
+        Return: A list of claimed messages.
+        """
+        with self.session_factory() as db:
+            return OutboxRepository(db, OutboxMessage).claim_due(limit, self.lease_seconds)
+
+    def record(self, sent: list, failed: list, released: list):
+        """
+        Function records the results of a batch in the outbox.
+
+        Param sent:list: IDs of the sent messages.
+        Param failed:list: Tuples of ID, number of attempts, error and time of the next attempt.
+        Param released:list: IDs of the messages that were not tried.
+        Return: None.
+        """
+        with self.session_factory() as db:
+            repository = OutboxRepository(db, OutboxMessage)
+            repository.mark_sent(sent)
+            for message_id, attempts, error, retry_at in failed:
+                repository.mark_failed(message_id, attempts, error, retry_at)
+            repository.release(released)
+
+    def build_message(self, message: dict) -> EmailMessage:
+        """
+        Function builds the email for an outbox message.
+
+        Param message:dict: Claimed outbox message.
+        Return: EmailMessage.
+        """
+        email = EmailMessage()
+        email["From"] = self.sender
+        email["To"] = message["recipient"]
+        email["Subject"] = message["subject"]
+        email.set_content(message["body"], subtype="html")
+        return email
+
+    async def send(self, message: dict, results: dict):
+        """
+        Function sends one message and stores the outcome in results. At most one message per pooled
+        connection is in flight, and messages are not tried once the circuit breaker opened.
+
+        Param message:dict: Claimed outbox message.
+        Param results:dict: Lists of sent, failed and released messages of the batch.
+        Return: None.
+        """
+        async with self._slots:
+            if not self.breaker.allow():
+                results["released"].append(message["id"])
+                MAIL_MESSAGES.inc("released")
+                return
+            attempts = message["attempts"] + 1
+            start = time.perf_counter()
+            try:
+                async with self.pool.connection() as smtp:
+                    await smtp.send_message(self.build_message(message))
+            except Exception as exc:  # pylint: disable=broad-except
+                if is_permanent_error(exc):
+                    retry_at, outcome = None, "failed_permanent"
+                else:
+                    self.breaker.record_failure()
+                    retry_at, outcome = self.retry_at(attempts), "failed_transient"
+                MAIL_SEND_SECONDS.observe(time.perf_counter() - start, outcome)
+                MAIL_MESSAGES.inc(outcome)
+                results["failed"].append((message["id"], attempts, f"{type(exc).__name__}: {exc}", retry_at))
+                return
+            MAIL_SEND_SECONDS.observe(time.perf_counter() - start, "sent")
+            MAIL_MESSAGES.inc("sent")
+            self.breaker.record_success()
+            results["sent"].append(message["id"])
+
+    async def dispatch_batch(self) -> dict:
+        """
+        Function claims a batch of due messages, sends them and records the results.
+        While the circuit breaker is half-open only a single message is tried.
+
+        Return: A dictionary with the number of sent, failed and released messages.
+        """
+        results = {"sent": [], "failed": [], "released": []}
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.pool.size)
+        if self.breaker.allow():
+            limit = self.batch_size if self.breaker.snapshot()["state"] == "closed" else 1
+            messages = await run_in_threadpool(self.claim, limit)
+            await asyncio.gather(*(self.send(message, results) for message in messages))
+            await run_in_threadpool(self.record, results["sent"], results["failed"], results["released"])
+        return {status: len(messages) for status, messages in results.items()}
+
+    async def run(self):
+        """
+        Function dispatches batches until the dispatcher is stopped. Full batches are followed
+        by the next one immediately, otherwise the dispatcher waits for poll_seconds.
+
+        Return: None.
+        """
+        while not self._stopping.is_set():
+            try:
+                counts = await self.dispatch_batch()
+                busy = counts["sent"] + counts["failed"] >= self.batch_size
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Failed dispatching mail")
+                busy = False
+            if not busy:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), self.poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+
+    def start(self):
+        """
+        Function starts the dispatcher as a task of the running event loop.
+
+        Return: None.
+        """
+        self._stopping = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self.run())
+
+    async def stop(self):
+        """
+        Function stops the dispatcher after the current batch and closes pooled connections.
+
+        Return: None.
+        """
+        if self._task is not None:
+            self._stopping.set()
+            await self._task
+            self._task = None
+        await self.pool.close()
+
+
+def create_mail_dispatcher() -> MailDispatcher:
+    """
+    Function creates the mail dispatcher configured in the settings.
+
+    Return: MailDispatcher.
+    """
+    pool = SMTPConnectionPool(settings.MAIL_SERVER, settings.MAIL_PORT, settings.MAIL_USERNAME,
+                              settings.MAIL_PASSWORD, start_tls=settings.MAIL_STARTTLS, size=settings.MAIL_POOL_SIZE)
+    breaker = CircuitBreaker(settings.MAIL_BREAKER_THRESHOLD, settings.MAIL_BREAKER_COOLDOWN_SECONDS)
+    return MailDispatcher(pool, breaker, sender=settings.MAIL_FROM, batch_size=settings.MAIL_BATCH_SIZE,
+                          max_attempts=settings.MAIL_MAX_ATTEMPTS, backoff_seconds=settings.MAIL_RETRY_BACKOFF_SECONDS,
+                          poll_seconds=settings.MAIL_POLL_SECONDS)
+
+
+mail_dispatcher = create_mail_dispatcher()
@@ -0,0 +1,85 @@
+"""SMTP Connection Pool module"""
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+from aiosmtplib import SMTP, SMTPRecipientsRefused, SMTPResponseException
+
+
+class SMTPConnectionPool:
+    """
+    Pool of open SMTP connections, so messages are not paying for a TCP, TLS and AUTH handshake each.
+    Connections idle for longer than idle_seconds are reopened, since servers drop idle clients.
+    """
+
+    def __init__(self, hostname: str, port: int, username: str = None, password: str = None,
+                 start_tls: bool = True, size: int = 2, idle_seconds: float = 60, timeout: float = 30):
+        self.hostname = hostname
+        self.port = port
+        self.username = username or None
+        self.password = password or None
+        self.start_tls = start_tls
+        self.size = size
+        self.idle_seconds = idle_seconds
+        self.timeout = timeout
+        self.connections_opened = 0
+        self._idle = []
+        self._semaphore = None
+
+    async def _connect(self) -> SMTP:
+        smtp = SMTP(hostname=self.hostname, port=self.port, username=self.username, password=self.password,
+                    start_tls=self.start_tls, timeout=self.timeout)
+        await smtp.connect()
+        self.connections_opened += 1
+        return smtp
+
+    @staticmethod
+    async def _discard(smtp: SMTP):
+        try:
+            if smtp.is_connected:
+                await smtp.quit()
+        except Exception:  # pylint: disable=broad-except
+            smtp.close()
+
+    @asynccontextmanager
+    async def connection(self):
+        """
+        Function lends an open connection from the pool, opening a new one if there is no usable idle connection.
+        Connections are returned to the pool, unless the error raised while using them could have broken them.
+
+        Return: Async context manager yielding an SMTP client.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.size)
+        async with self._semaphore:
+            smtp = None
+            while self._idle and smtp is None:
+                smtp, last_used = self._idle.pop()
+                if not smtp.is_connected or time.monotonic() - last_used > self.idle_seconds:
+                    await self._discard(smtp)
+                    smtp = None
+            if smtp is None:
+                smtp = await self._connect()
+            try:
+                yield smtp
+            except (SMTPRecipientsRefused, SMTPResponseException):
+                self._release(smtp)
+                raise
+            except BaseException:
+                await self._discard(smtp)
+                raise
+            self._release(smtp)
+
+    def _release(self, smtp: SMTP):
+        if smtp.is_connected:
+            self._idle.append((smtp, time.monotonic()))
+
+    async def close(self):
+        """
+        Function closes all idle connections.
+
+        Return: None.
+        """
+        idle, self._idle = self._idle, []
+        for smtp, _ in idle:
+            await self._discard(smtp)
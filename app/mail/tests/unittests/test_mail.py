@@ -0,0 +1,224 @@
+"""Test Mail module"""
+import socket
+from datetime import datetime
+
+import pytest
+from aiosmtpd.controller import Controller
+
+from app.mail.models import OutboxMessage, PENDING, SENT, FAILED
+from app.mail.repositories import OutboxRepository
+from app.mail.service import CircuitBreaker, MailDispatcher, SMTPConnectionPool
+from app.mail.service.mail_dispatcher import MAIL_MESSAGES, MAIL_SEND_SECONDS
+from app.tests import TestClass, TestingSessionLocal
+from app.users.models import User
+from app.users.repositories import UserRepository
+from app.users.service import EmailServices
+
+
+@pytest.fixture
+def anyio_backend():
+    """Run async tests on asyncio only."""
+    return "asyncio"
+
+
+def free_port() -> int:
+    """
+    Function returns a local port that nothing listens on.
+
+    Return: Port number.
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class RecordingHandler:
+    """SMTP handler of the local test server, accepting or refusing messages by recipient."""
+
+    def __init__(self):
+        self.messages = []
+        self.connections = 0
+
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):  # pylint: disable=invalid-name
+        """Count the connections opened by the client."""
+        self.connections += 1
+        session.host_name = hostname
+        return responses
+
+    async def handle_DATA(self, server, session, envelope):  # pylint: disable=invalid-name
+        """Accept the message, unless its recipient asks for a permanent or a transient error."""
+        recipient = envelope.rcpt_tos[0]
+        if recipient.startswith("unknown"):
+            return "550 Mailbox unavailable"
+        if recipient.startswith("busy"):
+            return "451 Try again later"
+        self.messages.append(envelope)
+        return "250 OK"
+
+
+@pytest.fixture
+def smtp_server():
+    """Run a local SMTP server for the duration of a test."""
+    handler = RecordingHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=free_port())
+    controller.start()
+    yield controller
+    controller.stop()
+
+
+class TestCircuitBreaker:
+    """Test state changes of the circuit breaker."""
+
+    def test_breaker_opens_and_recovers(self):
+        """
+        Function tests that the breaker opens after the threshold of consecutive failures, allows a trial call
+        after the cooldown, opens again if the trial fails and closes once a call succeeds.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        now = [0.0]
+        breaker = CircuitBreaker(threshold=2, cooldown_seconds=10, clock=lambda: now[0])
+        breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+        assert not breaker.allow()
+        now[0] = 10
+        assert breaker.allow()
+        breaker.record_failure()
+        assert not breaker.allow()
+        assert breaker.retry_after() == 10
+        now[0] = 20
+        assert breaker.allow()
+        breaker.record_success()
+        assert breaker.snapshot() == {"state": "closed", "failures": 0}
+
+
+class TestMailOutbox(TestClass):
+    """Test the outbox and the dispatcher against a local SMTP server."""
+
+    @staticmethod
+    def enqueue(*recipients: str):
+        """
+        Function adds a message for every recipient to the outbox.
+
+        Param recipients:str: Email addresses of the recipients.
+        Return: None.
+        """
+        with TestingSessionLocal() as db:
+            for recipient in recipients:
+                EmailServices.queue_code_for_verification(db, recipient, 123456)
+            db.commit()
+
+    @staticmethod
+    def read_messages() -> dict:
+        """
+        Function reads all outbox messages.
+
+        Return: A dictionary with recipient as key and message as value.
+        """
+        with TestingSessionLocal() as db:
+            return {message.recipient: message for message in db.query(OutboxMessage).all()}
+
+    @staticmethod
+    def create_dispatcher(port: int, threshold: int = 5) -> MailDispatcher:
+        """
+        Function creates a dispatcher sending to the local SMTP server.
+
+        Param port:int: Port of the SMTP server.
+        Param threshold:int: Failures opening the circuit breaker.
+        Return: MailDispatcher.
+        """
+        pool = SMTPConnectionPool("127.0.0.1", port, start_tls=False, size=2, timeout=5)
+        return MailDispatcher(pool, CircuitBreaker(threshold, 60), TestingSessionLocal, sender="netflix@gmail.com",
+                              batch_size=10, max_attempts=3, backoff_seconds=30)
+
+    def test_message_is_committed_with_user(self):
+        """
+        Function tests that the verification email is only queued if the user it belongs to is committed.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        with TestingSessionLocal() as db:
+            EmailServices.queue_code_for_verification(db, "rollback@gmail.com", 123456)
+            db.rollback()
+            EmailServices.queue_code_for_verification(db, "dummy@gmail.com", 123456)
+            UserRepository(db, User).create({"email": "dummy@gmail.com", "password_hashed": "123",
+                                             "username": "dummy", "verification_code": 123456})
+        messages = self.read_messages()
+        assert list(messages) == ["dummy@gmail.com"]
+        assert messages["dummy@gmail.com"].status == PENDING
+        assert "123456" in messages["dummy@gmail.com"].body
+
+    @pytest.mark.anyio
+    async def test_batches_are_sent_over_pooled_connections(self, smtp_server):
+        """
+        Function tests that a batch is sent over at most one connection per pool slot,
+        and that the next batch reuses the open connections.
+
+        Param self: Access the test class and its methods.
+        Param smtp_server: Local SMTP server.
+        Return: None.
+        """
+        dispatcher = self.create_dispatcher(smtp_server.port)
+        self.enqueue(*(f"user{i}@gmail.com" for i in range(6)))
+        assert await dispatcher.dispatch_batch() == {"sent": 6, "failed": 0, "released": 0}
+        self.enqueue("late@gmail.com")
+        assert await dispatcher.dispatch_batch() == {"sent": 1, "failed": 0, "released": 0}
+        assert await dispatcher.dispatch_batch() == {"sent": 0, "failed": 0, "released": 0}
+        await dispatcher.stop()
+        assert len(smtp_server.handler.messages) == 7
+        assert smtp_server.handler.connections == dispatcher.pool.connections_opened <= 2
+        assert {message.status for message in self.read_messages().values()} == {SENT}
+
+    @pytest.mark.anyio
+    async def test_failed_messages_are_retried_with_backoff(self, smtp_server):
+        """
+        Function tests that transient errors are retried later, and that permanent errors
+        and messages out of attempts are marked as failed.
+
+        Param self: Access the test class and its methods.
+        Param smtp_server: Local SMTP server.
+        Return: None.
+        """
+        dispatcher = self.create_dispatcher(smtp_server.port)
+        self.enqueue("busy@gmail.com", "unknown@gmail.com", "user@gmail.com")
+        counted, timed = MAIL_MESSAGES.values(), MAIL_SEND_SECONDS.values()
+        assert await dispatcher.dispatch_batch() == {"sent": 1, "failed": 2, "released": 0}
+        for outcome in ("sent", "failed_permanent", "failed_transient"):
+            assert MAIL_MESSAGES.values()[(outcome,)] == counted.get((outcome,), 0) + 1
+            sends = sum(MAIL_SEND_SECONDS.values()[(outcome,)][:-1]) - sum(timed.get((outcome,), [0])[:-1])
+            assert sends == 1
+        messages = self.read_messages()
+        assert (messages["unknown@gmail.com"].status, messages["unknown@gmail.com"].attempts) == (FAILED, 1)
+        busy = messages["busy@gmail.com"]
+        assert (busy.status, busy.attempts) == (PENDING, 1)
+        assert 25 < (busy.next_attempt_at - datetime.utcnow()).total_seconds() <= 30
+        assert busy.last_error.startswith("SMTPDataError")
+        assert dispatcher.retry_at(2) - datetime.utcnow() > dispatcher.retry_at(1) - datetime.utcnow()
+        assert dispatcher.retry_at(3) is None
+        with TestingSessionLocal() as db:
+            OutboxRepository(db, OutboxMessage).mark_failed(busy.id, 2, "451 Try again later", datetime.utcnow())
+        assert await dispatcher.dispatch_batch() == {"sent": 0, "failed": 1, "released": 0}
+        await dispatcher.stop()
+        assert self.read_messages()["busy@gmail.com"].status == FAILED
+
+    @pytest.mark.anyio
+    async def test_breaker_stops_sending_to_unavailable_server(self):
+        """
+        Function tests that the circuit breaker opens when the server cannot be reached,
+        and that messages not tried are returned to the outbox without counting an attempt.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        dispatcher = self.create_dispatcher(free_port(), threshold=2)
+        self.enqueue(*(f"user{i}@gmail.com" for i in range(5)))
+        assert await dispatcher.dispatch_batch() == {"sent": 0, "failed": 2, "released": 3}
+        assert dispatcher.breaker.snapshot()["state"] == "open"
+        assert await dispatcher.dispatch_batch() == {"sent": 0, "failed": 0, "released": 0}
+        await dispatcher.stop()
+        attempts = sorted(message.attempts for message in self.read_messages().values())
+        assert attempts == [0, 0, 0, 1, 1]
+        assert {message.status for message in self.read_messages().values()} == {PENDING}
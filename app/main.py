@@ -2,16 +2,53 @@
 import uvicorn
 from fastapi import FastAPI
 
-from app.db.database import engine, Base
-from app.users.routes import user_router, subuser_router, admin_router
+from app.db.database import engine
+from app.db.migrations import upgrade
+from app.db.request_session import request_session_middleware
+from app.db.instrumentation import query_instrumentation_middleware
+from app.config import settings
+from app.mail.service import mail_dispatcher
+from app.users.service import password_hasher
+from app.users.routes import user_router, subuser_router, admin_router, watch_events_router
 from app.directors.routes import director_router
 from app.genres.routes import genre_router
 from app.actors.routes import actor_router
 from app.movies.routes import movie_router, movie_actor_router, watch_movie
 from app.series.routes import series_router, episode_router, series_actor_router, watch_episode
-
-
-Base.metadata.create_all(bind=engine)
+from app.stats.routes import stats_router
+from app.stats.service import trending_engine
+from app.imports.routes import import_router
+from app.recommendations.routes import recommendation_router
+from app.recommendations.service import recommendation_updater, similar_titles_refresher
+from app.metrics.collectors import label_router, request_metrics_middleware
+from app.metrics.routes import metrics_router
+from app.profiling import profile_routes, profiling_middleware
+from app.profiling.routes import profile_router
+
+# Routers by name, the name labels the request metrics of their routes.
+ROUTERS = {
+    "user_router": user_router,
+    "subuser_router": subuser_router,
+    "admin_router": admin_router,
+    "watch_movie": watch_movie,
+    "watch_episode": watch_episode,
+    "watch_events_router": watch_events_router,
+    "movie_router": movie_router,
+    "series_router": series_router,
+    "episode_router": episode_router,
+    "movie_actor_router": movie_actor_router,
+    "series_actor_router": series_actor_router,
+    "actor_router": actor_router,
+    "director_router": director_router,
+    "genre_router": genre_router,
+    "stats_router": stats_router,
+    "import_router": import_router,
+    "recommendation_router": recommendation_router,
+    "profile_router": profile_router,
+}
+
+if settings.DB_AUTO_MIGRATE:
+    upgrade(engine)
 
 
 def init_app():
@@ -20,23 +57,34 @@ def init_app():
     Return: FastAPI instance.
     """
     my_app = FastAPI()
-    my_app.include_router(user_router)
-    my_app.include_router(subuser_router)
-    my_app.include_router(admin_router)
-    my_app.include_router(watch_movie)
-    my_app.include_router(watch_episode)
-
-    my_app.include_router(movie_router)
-
-    my_app.include_router(series_router)
-    my_app.include_router(episode_router)
-
-    my_app.include_router(movie_actor_router)
-    my_app.include_router(series_actor_router)
-
-    my_app.include_router(actor_router)
-    my_app.include_router(director_router)
-    my_app.include_router(genre_router)
+    my_app.middleware("http")(request_session_middleware)
+    my_app.middleware("http")(query_instrumentation_middleware)
+    for name, router in ROUTERS.items():
+        my_app.include_router(router)
+        if settings.METRICS_ENABLED:
+            label_router(name, router)
+    if settings.METRICS_ENABLED:
+        my_app.include_router(metrics_router)
+        my_app.middleware("http")(request_metrics_middleware)
+    if settings.PROFILING_ENABLED:
+        profile_routes(my_app)
+        my_app.middleware("http")(profiling_middleware)
+
+    if settings.MAIL_DISPATCHER_ENABLED:
+        my_app.on_event("startup")(mail_dispatcher.start)
+        my_app.on_event("shutdown")(mail_dispatcher.stop)
+    if settings.RECOMMENDATION_UPDATES_ENABLED:
+        my_app.on_event("startup")(recommendation_updater.start)
+        my_app.on_event("shutdown")(recommendation_updater.stop)
+    if settings.SIMILAR_TITLES_REFRESH_ENABLED:
+        my_app.on_event("startup")(similar_titles_refresher.start)
+        my_app.on_event("shutdown")(similar_titles_refresher.stop)
+    if settings.TRENDING_SYNC_ENABLED:
+        my_app.on_event("startup")(trending_engine.start)
+        my_app.on_event("shutdown")(trending_engine.stop)
+    else:
+        my_app.on_event("startup")(trending_engine.preload)
+    my_app.on_event("shutdown")(password_hasher.shutdown)
 
     return my_app
 
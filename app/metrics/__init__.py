@@ -0,0 +1 @@
+from .registry import MetricsRegistry, Counter, Gauge, Histogram, metrics_registry
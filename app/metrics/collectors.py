@@ -0,0 +1,107 @@
+"""Application metrics module"""
+import time
+
+from anyio.to_thread import current_default_thread_limiter
+
+from app.cache import response_cache
+from app.db import engine, pool_metrics
+from app.metrics.registry import metrics_registry
+
+APP_ROUTER = "app"
+UNMATCHED = "unmatched"
+
+# Name of the router of every endpoint, used as a label of the request metrics.
+_routers = {}
+
+REQUEST_SECONDS = metrics_registry.histogram(
+    "http_request_duration_seconds", "Latency of HTTP requests by router and route.", ("router", "route", "method"))
+REQUESTS = metrics_registry.counter(
+    "http_requests_total", "HTTP requests by router, route and status code.", ("router", "route", "method", "status"))
+REQUESTS_IN_FLIGHT = metrics_registry.gauge("http_requests_in_flight", "HTTP requests being processed.")
+
+
+def label_router(name: str, router):
+    """
+    Function labels the request metrics of all routes of a router with the name of the router.
+
+    Param name:str: Name of the router, like movie_router.
+    Param router:APIRouter: Router.
+    Return: None.
+    """
+    for route in router.routes:
+        _routers[route.endpoint] = name
+
+
+async def request_metrics_middleware(request, call_next):
+    """
+    Middleware function that records the latency and status code of every request, and the number of requests
+    in flight. Requests of unknown paths are recorded under one unmatched route.
+
+    Param request: Incoming request.
+    Param call_next: Next handler in the chain.
+    Return: The response.
+    """
+    REQUESTS_IN_FLIGHT.inc()
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        seconds = time.perf_counter() - start
+        REQUESTS_IN_FLIGHT.dec()
+        route = request.scope.get("route")
+        router = _routers.get(route.endpoint, APP_ROUTER) if route is not None else APP_ROUTER
+        path = route.path if route is not None else UNMATCHED
+        REQUEST_SECONDS.observe(seconds, router, path, request.method)
+        REQUESTS.inc(router, path, request.method, str(status))
+
+
+def threadpool_usage() -> list:
+    """
+    Function returns the usage of the threadpool running sync routes and services, called in the event loop.
+
+    Return: Pairs of the state of threads and their number.
+    """
+    statistics = current_default_thread_limiter().statistics()
+    return [(("busy",), statistics.borrowed_tokens), (("limit",), statistics.total_tokens),
+            (("waiting",), statistics.tasks_waiting)]
+
+
+def pool_connections() -> list:
+    """
+    Function returns the connections of the engine pool by state. The pool reports a negative overflow
+    while it holds fewer connections than its size, it is reported as 0.
+
+    Return: Pairs of the state of connections and their number.
+    """
+    snapshot = pool_metrics.snapshot(engine.pool)
+    return [((state,), max(snapshot.get(state, 0), 0)) for state in ("size", "checked_out", "checked_in", "overflow")]
+
+
+def pool_metric(key: str):
+    """Function returns a collect function of a key of the connection pool metrics."""
+    return lambda: [((), pool_metrics.snapshot()[key])]
+
+
+def cache_counter(counter: str):
+    """Function returns a collect function of a counter of the response cache, per namespace."""
+    return lambda: [((namespace,), counters[counter]) for namespace, counters in
+                    response_cache.snapshot()["namespaces"].items()]
+
+
+metrics_registry.gauge("threadpool_threads", "Threads of the threadpool that are busy, their limit and tasks "
+                                             "waiting for a thread.", ("state",), collect=threadpool_usage)
+metrics_registry.gauge("db_pool_connections", "Connections of the engine pool by state.", ("state",),
+                       collect=pool_connections)
+metrics_registry.counter("db_pool_checkouts_total", "Connection checkouts from the engine pool.",
+                         collect=pool_metric("checkouts"))
+metrics_registry.counter("db_pool_wait_seconds_total", "Time checkouts waited for a connection.",
+                         collect=pool_metric("wait_seconds_total"))
+metrics_registry.gauge("db_pool_wait_seconds_max", "Longest time a checkout waited for a connection.",
+                       collect=pool_metric("wait_seconds_max"))
+metrics_registry.counter("cache_hits_total", "Response cache hits by namespace.", ("namespace",),
+                         collect=cache_counter("hits"))
+metrics_registry.counter("cache_misses_total", "Response cache misses by namespace.", ("namespace",),
+                         collect=cache_counter("misses"))
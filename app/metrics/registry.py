@@ -0,0 +1,229 @@
+"""Metrics registry module"""
+import math
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Callable, Optional
+
+CONTENT_TYPE = "text/plain; version=0.0.4"
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _Shards:
+    """
+    Values of a metric kept per thread. Every thread updates only its own shard, so updates never wait
+    for a lock, and shards are added up when the metrics are rendered.
+    """
+
+    def __init__(self, factory: Callable):
+        self._factory = factory
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards = []
+
+    def local(self):
+        """Function returns the shard of the current thread, created on its first update."""
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = self._factory()
+            with self._lock:
+                self._shards.append(shard)
+            return shard
+
+    def copies(self) -> list:
+        """Function returns copies of all shards, a copy of a dictionary is atomic."""
+        with self._lock:
+            shards = list(self._shards)
+        return [shard.copy() for shard in shards]
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _format_labels(names: tuple, values: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class Metric:
+    """
+    Metric of the registry, with names of its labels. Values are either updated by the application,
+    or read from a collect function when the metrics are rendered.
+    """
+    kind = "untyped"
+
+    def __init__(self, name: str, description: str, labels: tuple = (), collect: Optional[Callable] = None):
+        self.name = name
+        self.description = description
+        self.labels = tuple(labels)
+        self.collect = collect
+        self._shards = _Shards(lambda: defaultdict(float))
+
+    def _add(self, amount: float, labels: tuple):
+        self._shards.local()[labels] += amount
+
+    def values(self) -> dict:
+        """
+        Function returns the values of the metric by labels, added up from all threads or read from the
+        collect function, which returns pairs of label values and a value.
+
+        Return: A dictionary of values by tuples of label values.
+        """
+        if self.collect is not None:
+            return {tuple(labels): value for labels, value in self.collect()}
+        values = defaultdict(float)
+        for shard in self._shards.copies():
+            for labels, value in shard.items():
+                values[labels] += value
+        return values
+
+    def samples(self) -> list:
+        """Function returns the lines of the metric in the Prometheus text format."""
+        return [f"{self.name}{_format_labels(self.labels, labels)} {_format_value(value)}"
+                for labels, value in sorted(self.values().items())]
+
+    def render(self) -> str:
+        """Function returns the metric with its help and type in the Prometheus text format."""
+        return "\n".join([f"# HELP {self.name} {self.description}", f"# TYPE {self.name} {self.kind}",
+                          *self.samples()])
+
+
+class Counter(Metric):
+    """Monotonically increasing value, like the number of requests."""
+    kind = "counter"
+
+    def inc(self, *labels, amount: float = 1.0):
+        """
+        Function increases the counter.
+
+        Param labels: Values of the labels of the counter.
+        Param amount:float: Increase, 1 by default.
+        Return: None.
+        """
+        self._add(amount, labels)
+
+
+class Gauge(Metric):
+    """Value that goes up and down, like the number of requests in flight."""
+    kind = "gauge"
+
+    def inc(self, *labels, amount: float = 1.0):
+        """Function increases the gauge, by 1 by default."""
+        self._add(amount, labels)
+
+    def dec(self, *labels, amount: float = 1.0):
+        """Function decreases the gauge, by 1 by default."""
+        self._add(-amount, labels)
+
+
+class Histogram(Metric):
+    """
+    Distribution of observed values in buckets fixed in advance, like request latencies.
+    An observation only increases the count of its bucket, buckets are made cumulative when rendered.
+    """
+    kind = "histogram"
+
+    def __init__(self, name: str, description: str, labels: tuple = (), buckets: tuple = DEFAULT_BUCKETS):
+        super().__init__(name, description, labels)
+        self.buckets = tuple(sorted(buckets))
+        size = len(self.buckets) + 1
+        # Counts of the buckets and of the values above the last bucket, followed by the sum of the values.
+        self._shards = _Shards(lambda: defaultdict(lambda: [0] * size + [0.0]))
+
+    def observe(self, value: float, *labels):
+        """
+        Function records an observed value.
+
+        Param value:float: Observed value, like a duration in seconds.
+        Param labels: Values of the labels of the histogram.
+        Return: None.
+        """
+        counts = self._shards.local()[labels]
+        counts[bisect_left(self.buckets, value)] += 1
+        counts[-1] += value
+
+    def values(self) -> dict:
+        """
+        Function returns the counts of the buckets and the sum of the observed values, added up from all threads.
+
+        Return: A dictionary of lists of bucket counts followed by the sum, by tuples of label values.
+        """
+        values = {}
+        for shard in self._shards.copies():
+            for labels, counts in shard.items():
+                total = values.setdefault(labels, [0] * len(counts))
+                for index, count in enumerate(list(counts)):
+                    total[index] += count
+        return values
+
+    def samples(self) -> list:
+        lines = []
+        for labels, counts in sorted(self.values().items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                bucket_labels = _format_labels(self.labels, labels, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labels, labels)} {_format_value(counts[-1])}")
+            lines.append(f"{self.name}_count{_format_labels(self.labels, labels)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Metrics of the process, rendered in the Prometheus text exposition format."""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: Metric) -> Metric:
+        """
+        Function adds a metric to the registry, a metric with the same name is returned instead.
+
+        Param metric:Metric: Metric.
+        Return: The registered metric.
+        """
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, description: str, labels: tuple = (), collect: Optional[Callable] = None) -> Counter:
+        """Function registers a counter, see Metric."""
+        return self.register(Counter(name, description, labels, collect))
+
+    def gauge(self, name: str, description: str, labels: tuple = (), collect: Optional[Callable] = None) -> Gauge:
+        """Function registers a gauge, see Metric."""
+        return self.register(Gauge(name, description, labels, collect))
+
+    def histogram(self, name: str, description: str, labels: tuple = (),
+                  buckets: tuple = DEFAULT_BUCKETS) -> Histogram:
+        """Function registers a histogram, see Histogram."""
+        return self.register(Histogram(name, description, labels, buckets))
+
+    def render(self) -> str:
+        """
+        Function renders all metrics. Metrics whose collect function fails are left out.
+
+        Return: Metrics in the Prometheus text format.
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        rendered = []
+        for metric in metrics:
+            try:
+                rendered.append(metric.render())
+            except Exception:  # pylint: disable=broad-except
+                continue
+        return "\n".join(rendered) + "\n"
+
+
+metrics_registry = MetricsRegistry()
@@ -0,0 +1,18 @@
+"""Metrics routes module"""
+from fastapi import APIRouter
+from starlette.responses import Response
+
+from app.metrics.registry import CONTENT_TYPE, metrics_registry
+
+metrics_router = APIRouter(tags=["Metrics"])
+
+
+@metrics_router.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """
+    Function returns the metrics of this process in the Prometheus text exposition format.
+    The route is async, so the threadpool is measured from the event loop.
+
+    Return: Response.
+    """
+    return Response(metrics_registry.render(), media_type=CONTENT_TYPE)
@@ -1,2 +1,3 @@
 from .movie_controller import MovieController
 from .movie_actor_controller import MovieActorController
+from .async_movie_controller import AsyncMovieController
@@ -0,0 +1,130 @@
+"""Async Movie Controller module"""
+from typing import Optional
+
+from fastapi import HTTPException
+from starlette.responses import JSONResponse
+
+from app.base import AppException, sync_fallback
+from app.movies.controller.movie_controller import MovieController
+from app.movies.service import AsyncMovieServices
+
+
+class AsyncMovieController:
+    """Async controller for movie catalogue routes. Falls back to MovieController when DB_ASYNC is disabled."""
+    @staticmethod
+    @sync_fallback(MovieController.get_all_movies)
+    async def get_all_movies(page: int, cursor: Optional[str] = None, schema=None):
+        """
+        Function returns a page of movies in the database.
+
+        Param page:int: Specify the page number of the movies to be returned
+        Param cursor:str: Cursor returned with the previous page, used instead of the page number.
+        Param schema: Response schema whose columns are selected, rows are returned instead of movies if given.
+        Return: A list of movies, or a message stating that there are no more movies to return.
+        """
+        try:
+            movies = await AsyncMovieServices.get_all_movies(page, cursor, schema)
+            if not movies:
+                return JSONResponse(content="End of query.", status_code=200)
+            return movies
+        except AppException as exc:
+            raise HTTPException(status_code=exc.code, detail=exc.message) from exc
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+    @staticmethod
+    @sync_fallback(MovieController.search_movies_by_name)
+    async def search_movies_by_name(title: str):
+        """
+        Function searches for movies by name in our database.
+
+        Param title:str: Search for a movie by title.
+        Return: A list of movies that match the title.
+        """
+        try:
+            movies = await AsyncMovieServices.search_movies_by_name(title)
+            if not movies:
+                return JSONResponse(content=f"No Movie with title: '{title}' in our Database.", status_code=200)
+            return movies
+        except AppException as exc:
+            raise HTTPException(status_code=exc.code, detail=exc.message) from exc
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+    @staticmethod
+    @sync_fallback(MovieController.search_movies_by_director)
+    async def search_movies_by_director(director: str, page: int = 1):
+        """
+        Function searches for movies by a given director.
+
+        Param director:str: Search for movies by a specific director.
+        Param page:int: Page of the results.
+        Return: A list of movies from the given director.
+        """
+        try:
+            movies = await AsyncMovieServices.search_movies_by_director(director, page)
+            if not movies:
+                return JSONResponse(content=f"No Movie from Director: '{director}' in our Database.", status_code=200)
+            return movies
+        except AppException as exc:
+            raise HTTPException(status_code=exc.code, detail=exc.message) from exc
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+    @staticmethod
+    @sync_fallback(MovieController.search_movies_by_genre)
+    async def search_movies_by_genre(genre: str, page: int = 1):
+        """
+        Function searches for movies with a specific genre.
+
+        Param genre:str: Search for movies with the given genre
+        Param page:int: Page of the results.
+        Return: A list of movies that have the genre passed in as a parameter.
+        """
+        try:
+            movies = await AsyncMovieServices.search_movies_by_genre(genre, page)
+            if not movies:
+                return JSONResponse(content=f"No Movie with genre: '{genre}' in our Database.", status_code=200)
+            return movies
+        except AppException as exc:
+            raise HTTPException(status_code=exc.code, detail=exc.message) from exc
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+    @staticmethod
+    @sync_fallback(MovieController.get_movies_by_year)
+    async def get_movies_by_year(year: int):
+        """
+        Function returns a list of movies from the given year.
+
+        Param year:int: Filter the movies by year
+        Return: A list of movies from a given year.
+        """
+        try:
+            movies = await AsyncMovieServices.get_movies_by_year(year)
+            if not movies:
+                return JSONResponse(content=f"No Movie from year: '{year}' in our Database.", status_code=200)
+            return movies
+        except AppException as exc:
+            raise HTTPException(status_code=exc.code, detail=exc.message) from exc
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+    @staticmethod
+    @sync_fallback(MovieController.get_latest_features)
+    async def get_latest_features(date_limit: str):
+        """
+        Function returns a list of movies added after the date limit.
+
+        Param date_limit:str: Limit the amount of movies returned
+        Return: A list of movies that are in the latest list.
+        """
+        try:
+            movies = await AsyncMovieServices.get_latest_features(date_limit)
+            if not movies:
+                return JSONResponse(content="No movies in latest list.", status_code=200)
+            return movies
+        except AppException as exc:
+            raise HTTPException(status_code=exc.code, detail=exc.message) from exc
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
@@ -4,7 +4,7 @@ from starlette.responses import JSONResponse
 
 from app.base import AppException
 from app.movies.controller import MovieController
-from app.movies.service import MovieActorService
+from app.movies.service import MovieActorService, MOVIE_WITH_ACTORS
 from app.directors.service import DirectorServices
 from app.genres.service import GenreServices
 
@@ -40,7 +40,7 @@ class MovieActorController:
         Return: A movie with actors.
         """
         try:
-            return MovieController.get_movie_by_id(movie_id)
+            return MovieController.get_movie_by_id(movie_id, MOVIE_WITH_ACTORS)
         except AppException as exc:
             raise HTTPException(status_code=exc.code, detail=exc.message) from exc
         except Exception as exc:
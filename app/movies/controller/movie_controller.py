@@ -1,9 +1,11 @@
 """Movie Controller module"""
+from typing import Optional
+
 from fastapi import HTTPException
 from starlette.responses import JSONResponse
 
-from app.base import AppException
-from app.movies.service import MovieServices
+from app.base import AppException, LoadingProfile, NO_RELATIONSHIPS
+from app.movies.service import MovieServices, MOVIE_WITH_ACTORS
 from app.directors.service import DirectorServices
 from app.genres.service import GenreServices
 
@@ -37,17 +39,19 @@ class MovieController:
             raise HTTPException(status_code=500, detail=str(exc)) from exc
 
     @staticmethod
-    def get_all_movies(page: int):
+    def get_all_movies(page: int, cursor: Optional[str] = None, schema=None):
         """
         Function returns all movies in the database.
         The function takes one argument, page, which specifies the page of results to return.
         If there are no more pages of results left, it will return an empty list.
 
         Param page:int: Specify the page number of the movies to be returned
+        Param cursor:str: Cursor returned with the previous page, used instead of the page number.
+        Param schema: Response schema whose columns are selected, rows are returned instead of movies if given.
         Return: A list of movies, or a message stating that there are no more movies to return.
         """
         try:
-            movies = MovieServices.get_all_movies(page)
+            movies = MovieServices.get_all_movies(page, cursor, schema)
             if not movies:
                 return JSONResponse(content="End of query.", status_code=200)
             return movies
@@ -67,7 +71,7 @@ class MovieController:
         Return: A movie object.
         """
         try:
-            movie = MovieServices.get_movie_by_title(title)
+            movie = MovieServices.get_movie_by_title(title, MOVIE_WITH_ACTORS)
             genre = GenreServices.get_genre_by_id(movie.genre_id)
             director = DirectorServices.get_director_by_id(movie.director_id)
             movie.genre = genre
@@ -79,16 +83,17 @@ class MovieController:
             raise HTTPException(status_code=500, detail=str(exc)) from exc
 
     @staticmethod
-    def get_movie_by_id(movie_id: str):
+    def get_movie_by_id(movie_id: str, profile: LoadingProfile = NO_RELATIONSHIPS):
         """
         Function is used to retrieve a movie by its ID.
         It takes in the movie_id as an argument and returns the corresponding Movie object.
 
         Param movie_id:str: Specify the movie_id of the movie that is to be retrieved
+        Param profile:LoadingProfile: Relationships that caller needs loaded.
         Return: A movie object.
         """
         try:
-            return MovieServices.get_movie_by_id(movie_id)
+            return MovieServices.get_movie_by_id(movie_id, profile)
         except AppException as exc:
             raise HTTPException(status_code=exc.code, detail=exc.message) from exc
         except Exception as exc:
@@ -114,17 +119,18 @@ class MovieController:
             raise HTTPException(status_code=500, detail=str(exc)) from exc
 
     @staticmethod
-    def search_movies_by_director(director: str):
+    def search_movies_by_director(director: str, page: int = 1):
         """
         Function searches for movies by a given director.
         It takes in a string representing the name of the director and returns all movies from that director.
         If no movie is found, it returns an error message.
 
         Param director:str: Search for movies by a specific director.
+        Param page:int: Page of the results.
         Return: A list of movies from the given director.
         """
         try:
-            movies = MovieServices.search_movies_by_director(director)
+            movies = MovieServices.search_movies_by_director(director, page)
             if not movies:
                 return JSONResponse(content=f"No Movie from Director: '{director}' in our Database.", status_code=200)
             return movies
@@ -134,16 +140,17 @@ class MovieController:
             raise HTTPException(status_code=500, detail=str(exc)) from exc
 
     @staticmethod
-    def search_movies_by_genre(genre: str):
+    def search_movies_by_genre(genre: str, page: int = 1):
         """
         Function searches for movies with a specific genre.
         It takes in a string as an argument and returns the list of movies that match the genre.
 
         Param genre:str: Search for movies with the given genre
+        Param page:int: Page of the results.
         Return: A list of movies that have the genre passed in as a parameter.
         """
         try:
-            movies = MovieServices.search_movies_by_genre(genre)
+            movies = MovieServices.search_movies_by_genre(genre, page)
             if not movies:
                 return JSONResponse(content=f"No Movie with genre: '{genre}' in our Database.", status_code=200)
             return movies
@@ -1,20 +1,20 @@
 """Movie, MovieActor Model module"""
-from uuid import uuid4
 from datetime import date
 
-from sqlalchemy import Column, String, Date, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, String, Date, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 
-from app.db import Base
+from app.db import Base, UUIDKey, new_id
 from app.utils import generate_fake_url
 
 
 class MovieActor(Base):
     """Base Model for Movie-Actor"""
     __tablename__ = "movie_actors"
-    id = Column(String(50), primary_key=True, default=uuid4)
-    movie_id = Column(String(50), ForeignKey('movies.id'))
-    actor_id = Column(String(50), ForeignKey('actors.id'))
+    __table_args__ = (Index("ix_movie_actors_movie_id_actor_id", "movie_id", "actor_id"),)
+    id = Column(UUIDKey(), primary_key=True, default=new_id)
+    movie_id = Column(UUIDKey(), ForeignKey('movies.id'))
+    actor_id = Column(UUIDKey(), ForeignKey('actors.id'), index=True)
 
     def __init__(self, movie_id: str, actor_id: str):
         self.movie_id = movie_id
@@ -24,19 +24,20 @@ class MovieActor(Base):
 class Movie(Base):
     """Base Model for Movie"""
     __tablename__ = "movies"
-    __table_args__ = (UniqueConstraint("title", "director_id", name="same_director_different_title"),)
+    __table_args__ = (UniqueConstraint("title", "director_id", name="same_director_different_title"),
+                      Index("ix_movies_date_added_id", "date_added", "id"))
 
-    id = Column(String(50), primary_key=True, default=uuid4)
+    id = Column(UUIDKey(), primary_key=True, default=new_id)
     title = Column(String(100), nullable=False)
     description = Column(String(500), nullable=False)
-    date_added = Column(Date(), default=date.today())
-    year_published = Column(String(5), nullable=False)
+    date_added = Column(Date(), nullable=False, default=date.today())
+    year_published = Column(String(5), nullable=False, index=True)
     link = Column(String(100), nullable=False, default=generate_fake_url)
-    director_id = Column(String(50), ForeignKey("directors.id"))
-    genre_id = Column(String(50), ForeignKey("genres.id"))
+    director_id = Column(UUIDKey(), ForeignKey("directors.id"), index=True)
+    genre_id = Column(UUIDKey(), ForeignKey("genres.id"), index=True)
 
-    actors = relationship('Actor', secondary="movie_actors", back_populates='movies', lazy='subquery')
-    users = relationship('User', secondary="user_watch_movies", back_populates='watched_movies', lazy='subquery')
+    actors = relationship('Actor', secondary="movie_actors", back_populates='movies')
+    users = relationship('User', secondary="user_watch_movies", back_populates='watched_movies')
 
     def __init__(self, title: str, description: str, year_published: str, director_id: str, genre_id: str,
                  date_added: str = date.today()):
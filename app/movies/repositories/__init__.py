@@ -1,2 +1,3 @@
 from .movie_repository import MovieRepository
 from .movie_actor_repository import MovieActorRepository
+from .async_movie_repository import AsyncMovieRepository
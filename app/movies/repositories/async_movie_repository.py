@@ -0,0 +1,95 @@
+"""Async Movie Repository module"""
+from app.base import AsyncBaseCRUDRepository
+from app.directors.models import Director
+from app.genres.models import Genre
+from app.movies.models import Movie
+from app.movies.exceptions import NonExistingMovieTitleException
+from app.search import search_ids
+from app.config import settings
+
+PER_PAGE = settings.PER_PAGE
+
+
+class AsyncMovieRepository(AsyncBaseCRUDRepository):
+    """Async repository for Movie Model, covering the catalogue reads of MovieRepository."""
+    async def read_movie_by_title(self, title: str, search=False):
+        """
+        Function takes a title as an argument and returns the movie object with that title.
+        If no such movie exists, it raises NonExistingMovieTitleException.
+
+        Param title:str: Get the movie title from the database.
+        Param search=False: Determine if the movie title is being searched for or not.
+        Return: A movie object, or a list of movie objects when searching.
+        """
+        try:
+            if search:
+                movie = await self.read_by_ids(await self.db.run_sync(search_ids, Movie, ("title",), title))
+            else:
+                result = await self.db.execute(self.base_select().filter(Movie.title == title))
+                movie = result.scalars().first()
+            if not movie:
+                raise NonExistingMovieTitleException
+            return movie
+        except Exception as exc:
+            await self.db.rollback()
+            raise exc
+
+    async def read_latest_releases(self, date_limit: str):
+        """
+        Function returns a list of all movies added to the database after the date-limit.
+
+        Param date limit:str: Limit the query to only those movies that were added after the date-limit.
+        Return: A list of movie objects.
+        """
+        try:
+            return await self.scalars(self.base_select().filter(Movie.date_added >= date_limit))
+        except Exception as exc:
+            await self.db.rollback()
+            raise exc
+
+    async def read_movies_by_director_name(self, last_name: str, page: int = 1):
+        """
+        Function returns one page of movies from directors with the given last name.
+
+        Param last_name:str: Last name of the director.
+        Param page:int: Page of the results.
+        Return: A list of movie objects.
+        """
+        try:
+            skip = (page - 1) * PER_PAGE
+            statement = self.base_select().join(Director, Movie.director_id == Director.id) \
+                .filter(Director.last_name == last_name).order_by(Movie.title).offset(skip).limit(PER_PAGE)
+            return await self.scalars(statement)
+        except Exception as exc:
+            await self.db.rollback()
+            raise exc
+
+    async def read_movies_by_genre_name(self, name: str, page: int = 1):
+        """
+        Function returns one page of movies with the given genre.
+
+        Param name:str: Name of the genre.
+        Param page:int: Page of the results.
+        Return: A list of movie objects.
+        """
+        try:
+            skip = (page - 1) * PER_PAGE
+            statement = self.base_select().join(Genre, Movie.genre_id == Genre.id) \
+                .filter(Genre.name == name).order_by(Movie.title).offset(skip).limit(PER_PAGE)
+            return await self.scalars(statement)
+        except Exception as exc:
+            await self.db.rollback()
+            raise exc
+
+    async def read_movies_by_year(self, year: str):
+        """
+        Function accepts a year as input and returns all movies that were published in that year.
+
+        Param year:str: Filter the movies by a year.
+        Return: A list of movie objects.
+        """
+        try:
+            return await self.scalars(self.base_select().filter(Movie.year_published == year))
+        except Exception as exc:
+            await self.db.rollback()
+            raise exc
@@ -1,7 +1,13 @@
 """Movie Repository module"""
+from typing import Optional
+
 from app.base import BaseCRUDRepository
+from app.base.base_repository import IN_CLAUSE_CHUNK_SIZE
+from app.directors.models import Director
+from app.genres.models import Genre
 from app.movies.models import Movie
 from app.movies.exceptions import NonExistingMovieTitleException
+from app.search import search_ids
 from app.users.models.user import UserWatchMovie
 from app.config import settings
 
@@ -21,9 +27,9 @@ class MovieRepository(BaseCRUDRepository):
         """
         try:
             if search:
-                movie = self.db.query(Movie).filter(Movie.title.ilike(f"%{title}%")).all()
+                movie = self.read_by_ids(search_ids(self.db, Movie, ("title",), title))
             else:
-                movie = self.db.query(Movie).filter(Movie.title == title).first()
+                movie = self.base_query().filter(Movie.title == title).first()
             if not movie:
                 self.db.rollback()
                 raise NonExistingMovieTitleException
@@ -32,6 +38,26 @@ class MovieRepository(BaseCRUDRepository):
             self.db.rollback()
             raise exc
 
+    def read_by_titles(self, titles: list) -> dict:
+        """
+        Function returns movies with the given exact titles, fetched with one IN query per chunk of titles.
+        If several movies share a title, the first one found is returned, as by read_movie_by_title.
+
+        Param titles:list: Titles of the movies.
+        Return: A dictionary of movies by title, titles that do not exist are left out.
+        """
+        try:
+            titles = list(dict.fromkeys(titles))
+            movies = {}
+            for start in range(0, len(titles), IN_CLAUSE_CHUNK_SIZE):
+                chunk = titles[start:start + IN_CLAUSE_CHUNK_SIZE]
+                for movie in self.base_query().filter(Movie.title.in_(chunk)):
+                    movies.setdefault(movie.title, movie)
+            return movies
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
+
     def read_movies_from_specific_year(self, year: str):
         """
         Function takes a year as an argument and returns all movies from that year.
@@ -40,7 +66,7 @@ class MovieRepository(BaseCRUDRepository):
         Return: A list of movies that were released in the specified year.
         """
         try:
-            movies = self.db.query(Movie).filter(Movie.year == year).all()
+            movies = self.base_query().filter(Movie.year == year).all()
             return movies
         except Exception as exc:
             self.db.rollback()
@@ -55,7 +81,7 @@ class MovieRepository(BaseCRUDRepository):
         Return: A list of movie objects.
         """
         try:
-            movies = self.db.query(Movie).filter(Movie.date_added >= date_limit).all()
+            movies = self.base_query().filter(Movie.date_added >= date_limit).all()
             return movies
         except Exception as exc:
             self.db.rollback()
@@ -75,24 +101,56 @@ class MovieRepository(BaseCRUDRepository):
             self.db.rollback()
             raise exc
 
-    def read_movies_by_group_of_genres(self, page: int, genres: list):
+    def read_movies_by_director_name(self, last_name: str, page: int = 1):
         """
-        Function takes a page number and a list of genres as arguments.
-        It queries the database for all movies that have one of the genres in the list,
-        then returns them in a paginated format.
+        Function returns one page of movies from directors with the given last name.
+        Director is joined by name, so only the requested page of movies is loaded.
 
-        Param page:int: Skip the movies that are not in the current page.
-        Param genres:list: Filter the movies by a genre.
+        Param last_name:str: Last name of the director.
+        Param page:int: Page of the results.
         Return: A list of movie objects.
         """
         try:
             skip = (page - 1) * PER_PAGE
-            movies = self.db.query(Movie).filter(Movie.genre_id.in_(genres)).offset(skip).limit(PER_PAGE).all()
+            movies = self.base_query().join(Director, Movie.director_id == Director.id) \
+                .filter(Director.last_name == last_name).order_by(Movie.title).offset(skip).limit(PER_PAGE).all()
             return movies
         except Exception as exc:
             self.db.rollback()
             raise exc
 
+    def read_movies_by_genre_name(self, name: str, page: int = 1):
+        """
+        Function returns one page of movies with the given genre.
+        Genre is joined by name, so only the requested page of movies is loaded.
+
+        Param name:str: Name of the genre.
+        Param page:int: Page of the results.
+        Return: A list of movie objects.
+        """
+        try:
+            skip = (page - 1) * PER_PAGE
+            movies = self.base_query().join(Genre, Movie.genre_id == Genre.id) \
+                .filter(Genre.name == name).order_by(Movie.title).offset(skip).limit(PER_PAGE).all()
+            return movies
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
+
+    def read_movies_by_group_of_genres(self, page: int, genres: list, cursor: Optional[str] = None):
+        """
+        Function takes a page number and a list of genres as arguments.
+        It queries the database for all movies that have one of the genres in the list,
+        then returns them in a paginated format. When a cursor is given, the page after the cursor is returned.
+
+        Param page:int: Skip the movies that are not in the current page.
+        Param genres:list: Filter the movies by a genre.
+        Param cursor:str: Cursor returned with the previous page.
+        Return: A page of movie objects.
+        """
+        query = self.base_query().filter(Movie.genre_id.in_(genres))
+        return self.read_page(page=page, cursor=cursor, limit=PER_PAGE, query=query)
+
     def read_movies_by_year(self, year: str):
         """
         Function accepts a year as input and returns all movies that were published in that year.
@@ -101,7 +159,7 @@ class MovieRepository(BaseCRUDRepository):
         Return: A list of movie objects.
         """
         try:
-            result = self.db.query(Movie).filter(Movie.year_published == year).all()
+            result = self.base_query().filter(Movie.year_published == year).all()
             return result
         except Exception as exc:
             self.db.rollback()
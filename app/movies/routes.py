@@ -1,9 +1,14 @@
 """Movie and Movie-Actor routes"""
-from fastapi import APIRouter, Depends, status, HTTPException, Body
+from typing import Optional
+
+from fastapi import APIRouter, Depends, status, HTTPException, Body, Response
 from starlette.requests import Request
 
-from app.movies.controller import MovieController, MovieActorController
+from app.base import set_next_cursor, fast_json_response
+from app.db import QueryBudget
+from app.movies.controller import MovieController, MovieActorController, AsyncMovieController
 from app.movies.schemas import *
+from app.recommendations.controller import RecommendationController
 from app.users.controller import UserWatchMovieController, JWTBearer
 from app.users.schemas.user_watch_movie_schema import UserWatchMovieSchema
 from app.utils import get_day_before_one_month
@@ -31,24 +36,43 @@ def add_new_movie(movie: MovieSchemaIn):
 
 @movie_router.get("/",
                   response_model=list[MovieSchema],
-                  summary="Search all Movies."
+                  summary="Search all Movies.",
+                  dependencies=[Depends(QueryBudget(2))]
                   )
-def get_all_movies(page: int = 1):
+async def get_all_movies(page: int = 1, cursor: Optional[str] = None):
     """
     Function returns a list of all movies in the database.
     The get_all_movies function takes an optional parameter, page, which specifies
     which subset of movies should be returned. The default value for a page is 1.
+    Movies are selected as rows of the columns of the schema and serialized with orjson.
 
     Param page:int=1: Indicate the page number of the movies to be retrieved
+    Param cursor:str: Cursor from the X-Next-Cursor header of the previous response, used instead of the page.
     Return: A list of movie objects.
     """
-    return MovieController.get_all_movies(page)
+    movies = await AsyncMovieController.get_all_movies(page, cursor, schema=MovieSchema)
+    return fast_json_response(movies)
+
+
+@movie_router.get("/similar",
+                  response_model=list[MovieSchema],
+                  summary="Search Movies similar to a Movie."
+                  )
+def get_similar_movies(title: str):
+    """
+    Function returns the movies most similar to a movie by its description, genre, director and cast,
+    precomputed for every movie and cached per title.
+
+    Param title:str: Title of the movie.
+    Return: A list of movies, most similar first.
+    """
+    return RecommendationController.get_similar_movies(title)
 
 
 @movie_router.get("/movie/id",
                   response_model=MovieWithDirectorAndGenreSchema,
                   summary="Read Movie with Genre and Director. Admin Route.",
-                  dependencies=[Depends(JWTBearer(["super_user"]))]
+                  dependencies=[Depends(JWTBearer(["super_user"])), Depends(QueryBudget(4))]
                   )
 def get_movie_with_genre_and_director(movie_id: str):
     """
@@ -137,18 +161,18 @@ watch_movie = APIRouter(prefix="/api/watch-movie", tags=["Watch Movie"])
 @watch_movie.post("/",
                   summary="Select movie to watch. User Route.",
                   status_code=status.HTTP_201_CREATED,
-                  dependencies=[Depends(JWTBearer(["regular_user", "sub_user"]))]
+                  dependencies=[Depends(JWTBearer(["regular_user", "sub_user"])), Depends(QueryBudget(8))]
                   )
 def user_watch_movie(request: Request, title: str = Body(embed=True)):
     """
     Function allows a user to watch a movie.
     It takes in the title of the movie and returns an error if it does not exist.
 
-    Param request:Request: Get the user_id from the cookie
+    Param request:Request: Get the user_id from the principal of the token.
     Param title:str: Pass in the title of the movie that is being watched
     Return: A dictionary.
     """
-    user_id = request.cookies.get("user_id")
+    user_id = request.state.principal.profile_id
     return UserWatchMovieController.user_watch_movie(user_id, title)
 
 
@@ -164,14 +188,14 @@ def user_rate_movie(request: Request, title: str = Body(embed=True), rating: int
     It takes in the title of the movie and rating as parameters.
     The function returns an object with the updated rating.
 
-    Param request:Request: Get the user_id from the cookie
+    Param request:Request: Get the user_id from the principal of the token.
     Param title:str: Specify the movie title
     Param rating:int: Specify the rating of the movie
     Return: The movie object that was rated.
     """
     if not 0 < rating <= 10:
         raise HTTPException(status_code=400, detail="Rating must be between 1 and 10.")
-    user_id = request.cookies.get("user_id")
+    user_id = request.state.principal.profile_id
     obj = UserWatchMovieController.user_rate_movie(user_id, title.strip(), rating)
     return obj
 
@@ -206,7 +230,7 @@ def get_movie_with_actors(movie_id: str):
     return MovieActorController.get_movie_with_actors(movie_id)
 
 
-@watch_movie.get("/get-movie/best-rated-movie")
+@watch_movie.get("/get-movie/best-rated-movie", dependencies=[Depends(QueryBudget(3))])
 def show_best_rated_movie():
     """
     Function returns the movie with the highest rating.
@@ -229,42 +253,44 @@ def show_worst_rated_movie():
 @watch_movie.get("/my-movies",
                  response_model=list[MovieSchema],
                  summary="Get user's watched Movies list. User Route.",
-                 dependencies=[Depends(JWTBearer(["regular_user", "sub_user"]))]
+                 dependencies=[Depends(JWTBearer(["regular_user", "sub_user"])), Depends(QueryBudget(3))]
                  )
 def get_my_watched_movies_list(request: Request):
     """
     Function returns a list of movies that the user has watched.
-    It takes in a Request object as an argument, and uses the cookies to get the user_id.
+    It takes in a Request object as an argument, and uses the token principal to get the user_id.
     It then calls UserWatchMovieController's get_my_watched_movies function to retrieve this information.
 
-    Param request:Request: Get the user_id from the cookies
+    Param request:Request: Get the user_id from the principal of the token.
     Return: A list of movie objects that the user has watched.
     """
-    user_id = request.cookies.get("user_id")
+    user_id = request.state.principal.profile_id
     return UserWatchMovieController.get_my_watched_movies_list(user_id)
 
 
 @watch_movie.get("/top-ten-movies",
                  summary="Top Ten Movies. User route.",
-                 dependencies=[Depends(JWTBearer(["regular_user", "sub_user"]))]
+                 dependencies=[Depends(JWTBearer(["regular_user", "sub_user"])), Depends(QueryBudget(2))]
                  )
-def get_top_ten_movies():
+def get_top_ten_movies(window: str = "all"):
     """
-    Function returns a dictionary of the top ten movies by number of views.
-    The function takes no arguments and returns a dictionary with movie IDS as keys and number of views as values.
+    Function returns a dictionary of the top ten trending movies of a time window, like 24h or 7d.
+    Views are decayed with a half-life of the window, and all-time scores are the number of views.
 
+    Param window:str: Time window, all by default.
     Return: A dictionary of the top ten movies in descending order.
     """
-    top_ten = UserWatchMovieController.get_popular_movies()
+    top_ten = UserWatchMovieController.get_popular_movies(window)
     sorted_movies = {k: {"Views": v} for k, v in sorted(top_ten.items(), key=lambda item: item[1], reverse=True)}
     return sorted_movies
 
 
 @watch_movie.get("/search-movies/title",
                  summary="Search Movies by title.",
-                 response_model=list[MovieWithActorsSchema]
+                 response_model=list[MovieWithActorsSchema],
+                 dependencies=[Depends(QueryBudget(4))]
                  )
-def search_movies_by_title(title: str):
+async def search_movies_by_title(title: str):
     """
     Function searches for movies by title.
     It takes a string as an argument and returns a list of dictionaries containing the movie's details.
@@ -272,38 +298,40 @@ def search_movies_by_title(title: str):
     Param title:str: Search for a movie by its title
     Return: A list of movie objects.
     """
-    return MovieController.search_movies_by_name(title)
+    return await AsyncMovieController.search_movies_by_name(title)
 
 
 @watch_movie.get("/search-movies/director",
                  summary="Search Movies by director.",
                  response_model=list[MovieWithActorsSchema]
                  )
-def search_movies_by_director(director: str):
+async def search_movies_by_director(director: str, page: int = 1):
     """
     Function searches for all movies by a given director.
     It takes in a string representing the director's name and returns a list of dictionaries,
     each dictionary containing information about one movie.
 
     Param director:str: Search for a movie by the director's name
+    Param page:int=1: Indicate the page number of the movies to be retrieved
     Return: A list of movies that match the director's name.
     """
-    return MovieController.search_movies_by_director(director)
+    return await AsyncMovieController.search_movies_by_director(director, page)
 
 
 @watch_movie.get("/search-movies/genre",
                  summary="Search Movies by genre.",
                  response_model=list[MovieWithActorsSchema]
                  )
-def search_movies_by_genre(genre: str):
+async def search_movies_by_genre(genre: str, page: int = 1):
     """
     Function searches for movies by a genre.
     It takes a string as an argument and returns a list of movie objects.
 
     Param genre:str: Search for movies by genre
+    Param page:int=1: Indicate the page number of the movies to be retrieved
     Return: A list of movies that match the given genre.
     """
-    return MovieController.search_movies_by_genre(genre)
+    return await AsyncMovieController.search_movies_by_genre(genre, page)
 
 
 @watch_movie.get("/get-movies/year",
@@ -311,7 +339,7 @@ def search_movies_by_genre(genre: str):
                  response_model=list[MovieSchema],
                  dependencies=[Depends(JWTBearer(["regular_user", "sub_user"]))]
                  )
-def get_movies_by_year(year: int):
+async def get_movies_by_year(year: int):
     """
     Function returns a list of movies from the provided year.
     If no movies are found, it returns an empty list.
@@ -321,12 +349,12 @@ def get_movies_by_year(year: int):
     """
     if not 1900 < year < 2100:
         raise HTTPException(status_code=200, detail="Sorry, we have no movies from provided year.")
-    return MovieController.get_movies_by_year(year)
+    return await AsyncMovieController.get_movies_by_year(year)
 
 
 @watch_movie.get("/get-movies/ratings",
                  summary="Get average Movie ratings. User Route",
-                 dependencies=[Depends(JWTBearer(["regular_user", "sub_user"]))]
+                 dependencies=[Depends(JWTBearer(["regular_user", "sub_user"])), Depends(QueryBudget(2))]
                  )
 def get_average_ratings():
     """
@@ -335,7 +363,7 @@ def get_average_ratings():
 
     Return: A dictionary of all the movies and their average ratings.
     """
-    return UserWatchMovieController.get_average_ratings()
+    return fast_json_response(UserWatchMovieController.get_average_ratings())
 
 
 @watch_movie.get("/get-movies/by-rating",
@@ -357,7 +385,7 @@ def get_movie_with_average_rating_above_requested(rating: float):
                  summary="Show latest features",
                  response_model=list[MovieWithActorsSchema]
                  )
-def show_latest_features():
+async def show_latest_features():
     """
     Function returns a list of the latest features added to the database.
     The date limit parameter is used to filter out any features that were created before this date.
@@ -365,7 +393,7 @@ def show_latest_features():
     Return: The latest features of movies in the database.
     """
     date_limit = get_day_before_one_month()
-    return MovieController.get_latest_features(date_limit)
+    return await AsyncMovieController.get_latest_features(date_limit)
 
 
 @watch_movie.get("/get-movies/never-downloaded",
@@ -384,20 +412,22 @@ def show_least_popular_movies():
 @watch_movie.get("/get-movies/my-recommendations",
                  summary="Show recommended Movies. User route.",
                  response_model=list[MovieSchema],
-                 dependencies=[Depends(JWTBearer(["regular_user", "sub_user"]))]
+                 dependencies=[Depends(JWTBearer(["regular_user", "sub_user"])), Depends(QueryBudget(4))]
                  )
-def get_my_recommendations(request: Request, page: int = 1):
+def get_my_recommendations(request: Request, response: Response, page: int = 1, cursor: Optional[str] = None):
     """
     Function returns a list of movies that the user has not watched, but is recommended
     for them based on their previous movie ratings. The function takes in a page number as an argument and returns
     a list of movies from that page.
 
-    Param request:Request: Get the user_id from the cookie
+    Param request:Request: Get the user_id from the principal of the token.
     Param page:int=1: Specify, which page of the recommendation list to display
+    Param cursor:str: Cursor from the X-Next-Cursor header of the previous response, used instead of the page.
     Return: A list of movies that are recommended for the user.
     """
-    user_id = request.cookies.get("user_id")
-    return UserWatchMovieController.get_my_recommendations(user_id, page)
+    user_id = request.state.principal.profile_id
+    movies = UserWatchMovieController.get_my_recommendations(user_id, page, cursor)
+    return set_next_cursor(response, movies)
 
 
 @watch_movie.get("/get-rating/year",
@@ -1,6 +1,8 @@
 """Movie Schemas module"""
 from datetime import date
-from pydantic import BaseModel, UUID4
+from uuid import UUID
+
+from pydantic import BaseModel
 
 from app.actors.schemas import ActorSchema
 from app.directors.schemas import DirectorSchema
@@ -9,7 +11,7 @@ from app.genres.schemas import GenreSchema
 
 class MovieSchema(BaseModel):
     """Base Movie Schema"""
-    id: UUID4
+    id: UUID
     title: str
     description: str
     date_added: date
@@ -47,7 +49,7 @@ class MovieSchemaIn(BaseModel):
 
 class MovieWithActorsSchema(BaseModel):
     """Movie schema with Actors"""
-    id: UUID4
+    id: UUID
     title: str
     description: str
     year_published: str
@@ -62,7 +64,7 @@ class MovieWithActorsSchema(BaseModel):
 
 class MovieWithDirectorAndGenreSchema(BaseModel):
     """Movie schema with Genre and Director"""
-    id: UUID4
+    id: UUID
     title: str
     description: str
     year_published: str
@@ -78,7 +80,7 @@ class MovieWithDirectorAndGenreSchema(BaseModel):
 
 class MovieFullSchema(BaseModel):
     """Full Movie Schema"""
-    id: UUID4
+    id: UUID
     title: str
     description: str
     year_published: str
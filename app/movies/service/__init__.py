@@ -1,2 +1,3 @@
-from .movie_services import MovieServices
+from .movie_services import MovieServices, MOVIE_WITH_ACTORS
 from .movie_actor_service import MovieActorService
+from .async_movie_services import AsyncMovieServices
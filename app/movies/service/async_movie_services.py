@@ -0,0 +1,125 @@
+"""Async Movie Service module"""
+from typing import Optional
+
+from app.base import AsyncBaseCRUDRepository, projection
+from app.config import settings
+from app.db import AsyncSessionLocal
+from app.directors.exceptions.director_exceptions import NonExistingDirectorException
+from app.directors.models import Director
+from app.genres.exceptions.genre_exceptions import NonExistingGenreException
+from app.genres.models import Genre
+from app.movies.models import Movie
+from app.movies.repositories import AsyncMovieRepository
+from app.movies.service.movie_services import MOVIE_WITH_ACTORS
+
+PER_PAGE = settings.PER_PAGE
+
+
+class AsyncMovieServices:
+    """Async service for movie catalogue routes"""
+    @staticmethod
+    async def get_all_movies(page: int, cursor: Optional[str] = None, schema=None):
+        """
+        Function returns a page of movies from the database.
+
+        Param page:int: Specify the page number of the movies to be returned
+        Param cursor:str: Cursor returned with the previous page, used instead of the page number.
+        Param schema: Response schema whose columns are selected, rows are returned instead of movies if given.
+        Return: A page of movies.
+        """
+        try:
+            async with AsyncSessionLocal() as db:
+                repository = AsyncMovieRepository(db, Movie)
+                if schema is not None:
+                    return await repository.read_page_rows(projection(Movie, schema), page=page, cursor=cursor,
+                                                           limit=PER_PAGE)
+                return await repository.read_page(page=page, cursor=cursor, limit=PER_PAGE)
+        except Exception as exc:
+            raise exc
+
+    @staticmethod
+    async def search_movies_by_name(title: str):
+        """
+        Function searches for movies by title.
+
+        Param title:str: Search for a movie by its title.
+        Return: A list of movies that match the title passed to it.
+        """
+        try:
+            async with AsyncSessionLocal() as db:
+                repository = AsyncMovieRepository(db, Movie, MOVIE_WITH_ACTORS)
+                return await repository.read_movie_by_title(title, search=True)
+        except Exception as exc:
+            raise exc
+
+    @staticmethod
+    async def search_movies_by_director(director: str, page: int = 1):
+        """
+        Function searches for one page of movies by a given director.
+
+        Param director:str: Search for movies by the director's last name.
+        Param page:int: Page of the results.
+        Return: A list of movie objects.
+        """
+        try:
+            async with AsyncSessionLocal() as db:
+                repository = AsyncMovieRepository(db, Movie, MOVIE_WITH_ACTORS)
+                movies = await repository.read_movies_by_director_name(director, page)
+                if not movies:
+                    director_repo = AsyncBaseCRUDRepository(db, Director)
+                    if not await director_repo.exists(Director.last_name == director):
+                        raise NonExistingDirectorException(message=f"No movies by director: '{director}'")
+                return movies
+        except Exception as exc:
+            raise exc
+
+    @staticmethod
+    async def search_movies_by_genre(genre: str, page: int = 1):
+        """
+        Function searches for one page of movies by a genre.
+
+        Param genre:str: Search for movies with a specific genre.
+        Param page:int: Page of the results.
+        Return: A list of movies that have the genre passed as a parameter.
+        """
+        try:
+            async with AsyncSessionLocal() as db:
+                repository = AsyncMovieRepository(db, Movie, MOVIE_WITH_ACTORS)
+                movies = await repository.read_movies_by_genre_name(genre, page)
+                if not movies:
+                    genre_repo = AsyncBaseCRUDRepository(db, Genre)
+                    if not await genre_repo.exists(Genre.name == genre):
+                        raise NonExistingGenreException(message=f"No movies with genre: '{genre}'")
+                return movies
+        except Exception as exc:
+            raise exc
+
+    @staticmethod
+    async def get_movies_by_year(year: int):
+        """
+        Function returns a list of movies that were released in the given year.
+
+        Param year:int: Filter the movies by a year.
+        Return: A list of movies for a given year.
+        """
+        try:
+            async with AsyncSessionLocal() as db:
+                repository = AsyncMovieRepository(db, Movie)
+                return await repository.read_movies_by_year(str(year))
+        except Exception as exc:
+            raise exc
+
+    @staticmethod
+    async def get_latest_features(date_limit: str):
+        """
+        Function returns a list of movies that were added after the date limit.
+
+        Param date_limit:str: Filter the results by date.
+        Return: A list of movies.
+        """
+        try:
+            async with AsyncSessionLocal() as db:
+                repository = AsyncMovieRepository(db, Movie, MOVIE_WITH_ACTORS)
+                return await repository.read_latest_releases(date_limit)
+        except Exception as exc:
+            raise exc
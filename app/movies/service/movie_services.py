@@ -1,6 +1,9 @@
 """Movie Service module"""
 from datetime import date
+from typing import Optional
 
+from app.base import LoadingProfile, NO_RELATIONSHIPS, projection
+from app.cache import invalidate, MOVIE_RATINGS, MOVIE_VIEWS
 from app.config import settings
 from app.db import SessionLocal
 from app.directors.exceptions.director_exceptions import NonExistingDirectorException
@@ -11,8 +14,11 @@ from app.genres.models import Genre
 from app.genres.repositories import GenreRepository
 from app.movies.models import Movie
 from app.movies.repositories import MovieRepository
+from app.stats.models import MovieStats
+from app.stats.repositories import MovieStatsRepository
 
 PER_PAGE = settings.PER_PAGE
+MOVIE_WITH_ACTORS = LoadingProfile("actors")
 
 
 class MovieServices:
@@ -44,52 +50,58 @@ class MovieServices:
             raise exc
 
     @staticmethod
-    def get_all_movies(page: int):
+    def get_all_movies(page: int, cursor: Optional[str] = None, schema=None):
         """
         Function returns a list of all movies in the database.
         The function accepts an optional page parameter, which allows you to specify,
         which 'page' of results you want returned. The default page is 1.
 
         Param page:int: Specify the page number of the movies to be returned
-        Return: A list of movies.
+        Param cursor:str: Cursor returned with the previous page, used instead of the page number.
+        Param schema: Response schema whose columns are selected, rows are returned instead of movies if given.
+        Return: A page of movies.
         """
         try:
             with SessionLocal() as db:
                 repository = MovieRepository(db, Movie)
-                skip = (page - 1) * PER_PAGE
-                movies = repository.read_many(skip=skip, limit=PER_PAGE)
+                if schema is not None:
+                    return repository.read_page_rows(projection(Movie, schema), page=page, cursor=cursor,
+                                                     limit=PER_PAGE)
+                movies = repository.read_page(page=page, cursor=cursor, limit=PER_PAGE)
                 return movies
         except Exception as exc:
             raise exc
 
     @staticmethod
-    def get_movie_by_id(movie_id: str):
+    def get_movie_by_id(movie_id: str, profile: LoadingProfile = NO_RELATIONSHIPS):
         """
         Function is used to retrieve a movie by its ID.
         It takes in the movie_id as an argument and returns the movie object.
 
         Param movie_id:str: Pass the ID of the movie that we want to get from the database.
+        Param profile:LoadingProfile: Relationships that caller needs loaded.
         Return: A movie object.
         """
         try:
             with SessionLocal() as db:
-                repository = MovieRepository(db, Movie)
+                repository = MovieRepository(db, Movie, profile)
                 movie = repository.read_by_id(movie_id)
                 return movie
         except Exception as exc:
             raise exc
 
     @staticmethod
-    def get_movie_by_title(title: str):
+    def get_movie_by_title(title: str, profile: LoadingProfile = NO_RELATIONSHIPS):
         """
         Function takes a movie title as an argument and returns the movie object associated with that title.
 
         Param title:str: Search for a movie by title
+        Param profile:LoadingProfile: Relationships that caller needs loaded.
         Return: A movie object.
         """
         try:
             with SessionLocal() as db:
-                repository = MovieRepository(db, Movie)
+                repository = MovieRepository(db, Movie, profile)
                 movie = repository.read_movie_by_title(title)
                 return movie
         except Exception as exc:
@@ -106,53 +118,53 @@ class MovieServices:
         """
         try:
             with SessionLocal() as db:
-                repository = MovieRepository(db, Movie)
+                repository = MovieRepository(db, Movie, MOVIE_WITH_ACTORS)
                 movies = repository.read_movie_by_title(title, search=True)
                 return movies
         except Exception as exc:
             raise exc
 
     @staticmethod
-    def search_movies_by_director(director: str):
+    def search_movies_by_director(director: str, page: int = 1):
         """
         Function searches for all movies by a given director.
         It takes in the name of the director as an argument and returns a list of Movie objects.
 
         Param director:str: Search for movies by the director's last name.
+        Param page:int: Page of the results.
         Return: A list of movie objects.
         """
         try:
             with SessionLocal() as db:
-                director_repo = DirectorRepository(db, Director)
-                obj = director_repo.read_directors_by_last_name(director, search=False)
-                if not obj:
-                    raise NonExistingDirectorException(message=f"No movies by director: '{director}'")
-                repository = MovieRepository(db, Movie)
-                movies = repository.read_all()
-                response = [movie for movie in movies if movie.director_id == obj.id]
-                return response
+                repository = MovieRepository(db, Movie, MOVIE_WITH_ACTORS)
+                movies = repository.read_movies_by_director_name(director, page)
+                if not movies:
+                    director_repo = DirectorRepository(db, Director)
+                    if not director_repo.read_directors_by_last_name(director, search=False):
+                        raise NonExistingDirectorException(message=f"No movies by director: '{director}'")
+                return movies
         except Exception as exc:
             raise exc
 
     @staticmethod
-    def search_movies_by_genre(genre: str):
+    def search_movies_by_genre(genre: str, page: int = 1):
         """
         Function searches for movies by a genre.
         It takes a string as an argument and returns a list of movie objects that match the genre.
 
         Param genre:str: Search for movies with a specific genre.
+        Param page:int: Page of the results.
         Return: A list of movies that have the genre passed as a parameter.
         """
         try:
             with SessionLocal() as db:
-                genre_repo = GenreRepository(db, Genre)
-                obj = genre_repo.read_genres_by_name(genre, search=False)
-                if not obj:
-                    raise NonExistingGenreException(message=f"No movies with genre: '{genre}'")
-                repository = MovieRepository(db, Movie)
-                movies = repository.read_all()
-                response = [movie for movie in movies if movie.genre_id == obj.id]
-                return response
+                repository = MovieRepository(db, Movie, MOVIE_WITH_ACTORS)
+                movies = repository.read_movies_by_genre_name(genre, page)
+                if not movies:
+                    genre_repo = GenreRepository(db, Genre)
+                    if not genre_repo.read_genres_by_name(genre, search=False):
+                        raise NonExistingGenreException(message=f"No movies with genre: '{genre}'")
+                return movies
         except Exception as exc:
             raise exc
 
@@ -184,7 +196,7 @@ class MovieServices:
         """
         try:
             with SessionLocal() as db:
-                repository = MovieRepository(db, Movie)
+                repository = MovieRepository(db, Movie, MOVIE_WITH_ACTORS)
                 movies = repository.read_latest_releases(date_limit)
                 return movies
         except Exception as exc:
@@ -219,6 +231,7 @@ class MovieServices:
                 repository = MovieRepository(db, Movie)
                 obj = repository.read_by_id(movie_id)
                 movie = repository.update(obj, attributes)
+                invalidate(MOVIE_RATINGS, MOVIE_VIEWS)
                 return movie
         except Exception as exc:
             raise exc
@@ -235,6 +248,9 @@ class MovieServices:
         try:
             with SessionLocal() as db:
                 repository = MovieRepository(db, Movie)
-                return repository.delete(movie_id)
+                MovieStatsRepository(db, MovieStats).delete_totals([movie_id])
+                response = repository.delete(movie_id)
+                invalidate(MOVIE_RATINGS, MOVIE_VIEWS)
+                return response
         except Exception as exc:
             raise exc
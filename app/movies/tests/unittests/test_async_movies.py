@@ -0,0 +1,111 @@
+"""Test Async Movie module"""
+import pytest
+
+from app.base import AsyncBaseCRUDRepository, sync_fallback
+from app.config import settings
+from app.directors.models import Director
+from app.movies.exceptions import NonExistingMovieTitleException
+from app.movies.models import Movie
+from app.movies.repositories import AsyncMovieRepository
+from app.movies.service import MOVIE_WITH_ACTORS
+from app.movies.tests.unittests import test_movies
+from app.tests import TestClass, AsyncTestingSessionLocal, QueryCounter, async_engine
+
+PER_PAGE = settings.PER_PAGE
+
+
+@pytest.fixture
+def anyio_backend():
+    """Run async tests on asyncio only."""
+    return "asyncio"
+
+
+class TestAsyncMovieRepository(TestClass):
+    """Test reads and writes of the async movie repository."""
+
+    @pytest.mark.anyio
+    async def test_read_movies_with_actors(self):
+        """
+        Function tests that movies with actors are read with a fixed number of statements,
+        and that actors stay available after the session is closed.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        test_movies.TestMovieLoading.create_movies(4)
+        async with AsyncTestingSessionLocal() as db:
+            movie_repository = AsyncMovieRepository(db, Movie, MOVIE_WITH_ACTORS)
+            with QueryCounter(bind=async_engine.sync_engine) as counter:
+                movies = await movie_repository.read_all()
+        assert counter.count == 2
+        assert len(movies) == 4
+        assert all(len(movie.actors) == 2 for movie in movies)
+
+    @pytest.mark.anyio
+    async def test_read_movies_by_director_name(self):
+        """
+        Function tests that movies are filtered by director name and paginated in the database.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        test_movies.TestMovieLoading.create_movies(PER_PAGE + 2, actors_per_movie=0)
+        async with AsyncTestingSessionLocal() as db:
+            movie_repository = AsyncMovieRepository(db, Movie)
+            first_page = await movie_repository.read_movies_by_director_name("Tarantino", page=1)
+            second_page = await movie_repository.read_movies_by_director_name("Tarantino", page=2)
+            unknown = await movie_repository.read_movies_by_director_name("Unknown")
+            director_repository = AsyncBaseCRUDRepository(db, Director)
+            assert await director_repository.exists(Director.last_name == "Tarantino")
+            assert not await director_repository.exists(Director.last_name == "Unknown")
+        assert len(first_page) == PER_PAGE
+        assert len(second_page) == 2
+        assert unknown == []
+
+    @pytest.mark.anyio
+    async def test_create_update_and_delete_movie(self):
+        """
+        Function tests create, read, update and delete of a movie through the async repository.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        async with AsyncTestingSessionLocal() as db:
+            movie_repository = AsyncMovieRepository(db, Movie)
+            movie = await movie_repository.create({"title": "Pulp Fiction", "description": "Description",
+                                                   "year_published": "1994", "director_id": None, "genre_id": None})
+            await movie_repository.update(movie, {"year_published": "1995"})
+            found = await movie_repository.read_movie_by_title("Pulp Fiction")
+            with pytest.raises(NonExistingMovieTitleException):
+                await movie_repository.read_movie_by_title("Pulp")
+            searched = await movie_repository.read_movie_by_title("Pulp", search=True)
+            by_ids = await movie_repository.read_by_ids([movie.id, "missing", movie.id])
+            assert await movie_repository.delete(movie.id)
+            assert await movie_repository.read_all() == []
+        assert found.id == movie.id
+        assert [obj.id for obj in searched] == [movie.id]
+        assert [obj.id for obj in by_ids] == [movie.id]
+        assert movie.year_published == "1995"
+
+
+class TestSyncFallback:
+    """Test dispatching of async controller methods between the async and the sync path."""
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize("db_async, expected", [(True, "async"), (False, "sync")])
+    async def test_sync_fallback(self, monkeypatch, db_async, expected):
+        """
+        Function tests that the sync function is used when DB_ASYNC is disabled.
+
+        Param monkeypatch: Pytest fixture for overriding settings.
+        Param db_async:bool: Value of the DB_ASYNC setting.
+        Param expected:str: Path that should have been taken.
+        Return: None.
+        """
+        monkeypatch.setattr(settings, "DB_ASYNC", db_async)
+
+        @sync_fallback(lambda value: f"sync {value}")
+        async def read(value):
+            return f"async {value}"
+
+        assert await read(1) == f"{expected} 1"
@@ -0,0 +1,273 @@
+"""Test Movie module"""
+import json
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+from app.base import AppException, NO_RELATIONSHIPS, NEXT_CURSOR_HEADER, projection, fast_json_response
+from app.config import settings
+from app.tests import TestClass, TestingSessionLocal, QueryCounter
+from app.actors.models import Actor
+from app.directors.models import Director
+from app.genres.models import Genre
+from app.movies.models import Movie, MovieActor
+from app.movies.repositories import MovieRepository
+from app.movies.schemas import MovieSchema
+from app.movies.service import MOVIE_WITH_ACTORS
+from app.users.models import User
+from app.users.models.user import UserWatchMovie
+from app.users.repositories import UserWatchMovieRepository
+
+PER_PAGE = settings.PER_PAGE
+
+
+class TestMovieLoading(TestClass):
+    """Test number of statements executed when movies are loaded with different loading profiles."""
+
+    @staticmethod
+    def create_movies(number_of_movies: int, actors_per_movie: int = 2):
+        """
+        Function creates a director, a genre and the given number of movies, each with its own actors.
+
+        Param number_of_movies:int: Number of movies to create.
+        Param actors_per_movie:int: Number of actors linked to every movie.
+        Return: None.
+        """
+        with TestingSessionLocal() as db:
+            director = Director("Quentin", "Tarantino", "USA")
+            genre = Genre(f"Drama {number_of_movies}")
+            db.add_all([director, genre])
+            db.commit()
+            for i in range(number_of_movies):
+                movie = Movie(f"Movie {i}", "Description", "1994", director.id, genre.id)
+                db.add(movie)
+                db.commit()
+                for j in range(actors_per_movie):
+                    actor = Actor(f"First {i}-{j}", f"Last {i}-{j}", "1983-10-10", "USA")
+                    db.add(actor)
+                    db.commit()
+                    db.add(MovieActor(movie.id, actor.id))
+                db.commit()
+
+    def test_read_movies_without_relationships(self):
+        """
+        Function tests that reading movies with no loading profile runs a single statement
+        and leaves actors unloaded.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        self.create_movies(5)
+        with TestingSessionLocal() as db:
+            movie_repository = MovieRepository(db, Movie, NO_RELATIONSHIPS)
+            with QueryCounter() as counter:
+                movies = movie_repository.read_all()
+        assert len(movies) == 5
+        assert counter.count == 1
+        assert all("actors" not in vars(movie) for movie in movies)
+
+    def test_read_movies_with_actors(self):
+        """
+        Function tests that reading movies with actors runs the same number of statements
+        for a small and a large number of movies.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        self.create_movies(3)
+        with TestingSessionLocal() as db:
+            movie_repository = MovieRepository(db, Movie, MOVIE_WITH_ACTORS)
+            with QueryCounter() as small:
+                movies = movie_repository.read_all()
+        assert len(movies) == 3
+        assert all(len(movie.actors) == 2 for movie in movies)
+
+        self.create_movies(20)
+        with TestingSessionLocal() as db:
+            movie_repository = MovieRepository(db, Movie, MOVIE_WITH_ACTORS)
+            with QueryCounter() as large:
+                movies = movie_repository.read_all()
+        assert len(movies) == 23
+        assert small.count == large.count == 2
+
+    def test_read_watched_movies_in_bulk(self):
+        """
+        Function tests that the watched movies of a user are read with a fixed number of statements,
+        one for the watch records and one for the movies, no matter how many movies the user watched.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        self.create_movies(15, actors_per_movie=0)
+        with TestingSessionLocal() as db:
+            user = User("watcher@gmail.com", "123", "watcher")
+            db.add(user)
+            db.commit()
+            movie_ids = [movie.id for movie in MovieRepository(db, Movie).read_all()]
+            db.add_all([UserWatchMovie(user.id, movie_id) for movie_id in movie_ids])
+            db.commit()
+            user_id = user.id
+        with TestingSessionLocal() as db:
+            with QueryCounter() as counter:
+                watched = UserWatchMovieRepository(db, UserWatchMovie).read_movies_from_user(user_id)
+                movies = MovieRepository(db, Movie).read_by_ids(obj.movie_id for obj in watched)
+        assert sorted(movie.id for movie in movies) == sorted(movie_ids)
+        assert counter.count == 2
+
+    def test_read_movies_by_director_name(self):
+        """
+        Function tests that movies are filtered by director name in the database,
+        returning at most one page of results per call.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        self.create_movies(PER_PAGE + 2, actors_per_movie=0)
+        with TestingSessionLocal() as db:
+            movie_repository = MovieRepository(db, Movie)
+            with QueryCounter() as counter:
+                first_page = movie_repository.read_movies_by_director_name("Tarantino", page=1)
+            second_page = movie_repository.read_movies_by_director_name("Tarantino", page=2)
+            unknown = movie_repository.read_movies_by_director_name("Unknown")
+        assert counter.count == 1
+        assert len(first_page) == PER_PAGE
+        assert len(second_page) == 2
+        assert not set(movie.id for movie in first_page) & set(movie.id for movie in second_page)
+        assert unknown == []
+
+    def test_read_movies_by_genre_name(self):
+        """
+        Function tests that movies are filtered by genre name in the database.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        self.create_movies(3, actors_per_movie=0)
+        self.create_movies(4, actors_per_movie=0)
+        with TestingSessionLocal() as db:
+            movie_repository = MovieRepository(db, Movie)
+            with QueryCounter() as counter:
+                movies = movie_repository.read_movies_by_genre_name("Drama 4")
+        assert counter.count == 1
+        assert len(movies) == 4
+
+
+class TestMoviePagination(TestClass):
+    """Test page and cursor pagination of movies."""
+
+    def test_read_movies_with_cursor(self):
+        """
+        Function tests that following cursors walks through all movies once, in the same order as page numbers,
+        and that the last page has no cursor.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        TestMovieLoading.create_movies(2 * PER_PAGE + 3, actors_per_movie=0)
+        with TestingSessionLocal() as db:
+            movie_repository = MovieRepository(db, Movie)
+            by_page = [movie_repository.read_page(page=page, limit=PER_PAGE) for page in range(1, 4)]
+            by_cursor, cursor = [], None
+            while True:
+                with QueryCounter() as counter:
+                    page = movie_repository.read_page(cursor=cursor, limit=PER_PAGE)
+                assert counter.count == 1
+                by_cursor.append(page)
+                cursor = page.next_cursor
+                if cursor is None:
+                    break
+        assert [len(page) for page in by_cursor] == [PER_PAGE, PER_PAGE, 3]
+        assert [[movie.id for movie in page] for page in by_cursor] == \
+               [[movie.id for movie in page] for page in by_page]
+        assert len({movie.id for page in by_cursor for movie in page}) == 2 * PER_PAGE + 3
+
+    def test_read_movies_with_invalid_cursor(self):
+        """
+        Function tests that a cursor that was not returned by the API is rejected with code 400.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        with TestingSessionLocal() as db:
+            with pytest.raises(AppException) as exc_info:
+                MovieRepository(db, Movie).read_page(cursor="not-a-cursor")
+        assert exc_info.value.code == 400
+
+    def test_fast_json_rows_match_schema(self):
+        """
+        Function tests that rows of the projection of a schema render the same JSON and next cursor
+        as the movies validated by the schema.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        TestMovieLoading.create_movies(5, actors_per_movie=0)
+        with TestingSessionLocal() as db:
+            movie_repository = MovieRepository(db, Movie)
+            movies = movie_repository.read_page(limit=3)
+            rows = movie_repository.read_page_rows(projection(Movie, MovieSchema), limit=3)
+        response = fast_json_response(rows)
+        assert json.loads(response.body) == jsonable_encoder([MovieSchema.from_orm(movie) for movie in movies])
+        assert response.headers[NEXT_CURSOR_HEADER] == movies.next_cursor
+        assert fast_json_response([("Movie 1", 7.5)]).body == b'[["Movie 1",7.5]]'
+
+
+class TestMovieRatingAnalytics(TestClass):
+    """Test grouped rating aggregates for movies."""
+
+    @staticmethod
+    def create_ratings(ratings: dict):
+        """
+        Function creates movies with ratings. Every key of the dictionary is a year, and every value
+        is a list with a list of ratings for each movie published in that year.
+
+        Param ratings:dict: Ratings of movies, grouped by year.
+        Return: None.
+        """
+        with TestingSessionLocal() as db:
+            users = [User(f"user{i}@gmail.com", "123", f"user{i}") for i in range(3)]
+            db.add_all(users)
+            db.commit()
+            for year, movies in ratings.items():
+                for number, movie_ratings in enumerate(movies):
+                    movie = Movie(f"Movie {year}-{number}", "Description", year, None, None)
+                    db.add(movie)
+                    db.commit()
+                    for user, rating in zip(users, movie_ratings):
+                        db.add(UserWatchMovie(user.id, movie.id, rating))
+                    db.commit()
+
+    def test_read_average_rating_per_year(self):
+        """
+        Function tests that average rating for every year is calculated in a single query,
+        as the average of average ratings of movies from that year.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        self.create_ratings({"1994": [[10, 8], [6]], "2001": [[4, 2, 3]], "2010": [[None]]})
+        with TestingSessionLocal() as db:
+            repository = UserWatchMovieRepository(db, UserWatchMovie)
+            with QueryCounter() as counter:
+                averages = dict(repository.read_average_rating_per_year())
+        assert counter.count == 1
+        assert {year: float(average) for year, average in averages.items()} == {"1994": 7.5, "2001": 3.0}
+
+    def test_read_average_rating_for_year(self):
+        """
+        Function tests that number of movies and their average rating for a year are read in a single query,
+        counting movies without ratings as well.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        self.create_ratings({"1994": [[10, 8], [6], []]})
+        with TestingSessionLocal() as db:
+            repository = UserWatchMovieRepository(db, UserWatchMovie)
+            with QueryCounter() as counter:
+                result = repository.read_average_rating_for_year("1994")
+                empty = repository.read_average_rating_for_year("1800")
+        assert counter.count == 2
+        assert result.Movies == 3
+        assert float(result._mapping["Average Rating"]) == 7.5
+        assert empty.Movies == 0
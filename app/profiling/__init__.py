@@ -0,0 +1 @@
+from .profiler import ProfileStore, RequestProfile, profile_store, profile_routes, profiling_middleware
@@ -0,0 +1,316 @@
+"""Request profiling module"""
+import asyncio
+import cProfile
+import heapq
+import json
+import marshal
+import pstats
+import sys
+import threading
+import time
+from contextvars import ContextVar
+from datetime import datetime
+from functools import wraps
+from typing import Optional
+from uuid import uuid4
+
+from fastapi.routing import APIRoute
+
+from app.config import settings
+from app.users.controller.user_auth_controller import JWTBearer
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_PARAMETER = "profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+PROFILE_URL_HEADER = "X-Profile-Url"
+PROFILES_PATH = "/api/profiles"
+ADMIN_ROLE = "super_user"
+
+
+class CProfileSession:
+    """
+    Deterministic profile of a request made with cProfile, with exact call counts, in the pstats format
+    of python -m pstats, snakeviz and similar tools.
+    """
+    format = "pstats"
+    media_type = "application/octet-stream"
+    extension = "pstats"
+
+    def __init__(self):
+        self._profilers = []
+
+    def start(self):
+        """Function starts profiling the current thread and returns the profiler to stop."""
+        profiler = cProfile.Profile()
+        self._profilers.append(profiler)
+        profiler.enable()
+        return profiler
+
+    def stop(self, profiler):
+        """Function stops profiling the current thread."""
+        profiler.disable()
+
+    def artifact(self, name: str) -> bytes:
+        """
+        Function returns the statistics of all profiled threads, as written by pstats.Stats.dump_stats.
+
+        Param name:str: Name of the profiled request.
+        Return: Marshalled statistics.
+        """
+        if not self._profilers:
+            return marshal.dumps({})
+        return marshal.dumps(pstats.Stats(*self._profilers).stats)
+
+
+class SamplingSession:
+    """
+    Sampling profile of a request. A thread records the stacks of the threads running the request every sampling
+    interval, so the request runs at almost full speed. Stacks are returned in the speedscope JSON format.
+    """
+    format = "speedscope"
+    media_type = "application/json"
+    extension = "speedscope.json"
+
+    def __init__(self, interval: Optional[float] = None):
+        self.interval = interval or settings.PROFILING_SAMPLE_INTERVAL_MS / 1000
+        self._threads = set()
+        self._frames = {}
+        self._samples = []
+        self._weights = []
+        self._stopped = threading.Event()
+        self._sampler = None
+
+    def start(self):
+        """Function starts sampling the current thread and returns its ID to stop."""
+        if self._sampler is None:
+            self._sampler = threading.Thread(target=self.sample, name="request-profiler", daemon=True)
+            self._sampler.start()
+        ident = threading.get_ident()
+        self._threads.add(ident)
+        return ident
+
+    def stop(self, ident: int):
+        """Function stops sampling the thread."""
+        self._threads.discard(ident)
+
+    def frame_index(self, code) -> int:
+        """Function returns the index of a frame in the shared frames of the profile."""
+        key = (code.co_name, code.co_filename, code.co_firstlineno)
+        index = self._frames.get(key)
+        if index is None:
+            index = self._frames[key] = len(self._frames)
+        return index
+
+    def sample(self):
+        """
+        Function records the stacks of the sampled threads, from the outermost frame, until the session is finished.
+
+        Return: None.
+        """
+        last = time.perf_counter()
+        while not self._stopped.wait(self.interval):
+            now = time.perf_counter()
+            frames = sys._current_frames()  # pylint: disable=protected-access
+            for ident in list(self._threads):
+                frame, stack = frames.get(ident), []
+                while frame is not None:
+                    stack.append(self.frame_index(frame.f_code))
+                    frame = frame.f_back
+                if stack:
+                    self._samples.append(stack[::-1])
+                    self._weights.append(now - last)
+            last = now
+
+    def artifact(self, name: str) -> bytes:
+        """
+        Function finishes sampling and returns the samples as a speedscope sampled profile.
+
+        Param name:str: Name of the profiled request.
+        Return: JSON.
+        """
+        self._stopped.set()
+        if self._sampler is not None:
+            self._sampler.join()
+        frames = [{"name": function, "file": file, "line": line} for function, file, line in self._frames]
+        return json.dumps({
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "app.profiling",
+            "shared": {"frames": frames},
+            "profiles": [{"type": "sampled", "name": name, "unit": "seconds", "startValue": 0,
+                          "endValue": sum(self._weights), "samples": self._samples, "weights": self._weights}],
+        }).encode()
+
+
+SESSIONS = {CProfileSession.format: CProfileSession, SamplingSession.format: SamplingSession}
+
+_profile_session: ContextVar[Optional[object]] = ContextVar("profile_session", default=None)
+
+
+class RequestProfile:
+    """Profile of a request, with the route, duration and status of the request."""
+
+    def __init__(self, session, route: str, seconds: float, status: int):
+        self.id = uuid4().hex
+        self.route = route
+        self.seconds = seconds
+        self.status = status
+        self.created = datetime.utcnow()
+        self.format = session.format
+        self.media_type = session.media_type
+        self.filename = f"profile-{self.id}.{session.extension}"
+        self.data = session.artifact(route)
+
+    def summary(self) -> dict:
+        """Function returns the profile without its data."""
+        return {"id": self.id, "route": self.route, "ms": round(self.seconds * 1000, 2), "status": self.status,
+                "created": self.created.isoformat(), "format": self.format, "bytes": len(self.data),
+                "url": f"{PROFILES_PATH}/{self.id}"}
+
+
+class ProfileStore:
+    """
+    Rolling store of the slowest recent profiles. The latest profile is always kept, so it can be downloaded,
+    and when the store is full the fastest of the other profiles is dropped. Profiles expire after max_age seconds.
+    """
+
+    def __init__(self, capacity: int = 20, max_age: float = 3600):
+        self.capacity = capacity
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._profiles = {}
+
+    def _expire(self):
+        oldest = datetime.utcnow().timestamp() - self.max_age
+        for profile_id in [key for key, profile in self._profiles.items() if profile.created.timestamp() < oldest]:
+            del self._profiles[profile_id]
+
+    def add(self, profile: RequestProfile) -> RequestProfile:
+        """
+        Function stores a profile, and drops the fastest other profiles while the store is over capacity.
+
+        Param profile:RequestProfile: Profile.
+        Return: The profile.
+        """
+        with self._lock:
+            self._expire()
+            others = list(self._profiles.values())
+            self._profiles[profile.id] = profile
+            for fastest in heapq.nsmallest(max(len(self._profiles) - self.capacity, 0), others,
+                                           key=lambda other: other.seconds):
+                del self._profiles[fastest.id]
+        return profile
+
+    def get(self, profile_id: str) -> Optional[RequestProfile]:
+        """Function returns a stored profile, or None."""
+        with self._lock:
+            self._expire()
+            return self._profiles.get(profile_id)
+
+    def list(self) -> list:
+        """Function returns summaries of the stored profiles, the slowest first."""
+        with self._lock:
+            self._expire()
+            profiles = sorted(self._profiles.values(), key=lambda profile: profile.seconds, reverse=True)
+        return [profile.summary() for profile in profiles]
+
+    def clear(self):
+        """Function drops all profiles."""
+        with self._lock:
+            self._profiles.clear()
+
+
+profile_store = ProfileStore(settings.PROFILING_STORE_SIZE, settings.PROFILING_RETENTION_SECONDS)
+# Profilers of concurrent requests would replace each other, so one request per process is profiled at a time.
+_profiling = threading.Lock()
+
+
+def profiled(call):
+    """
+    Function wraps an endpoint, so it is profiled in the thread running it when its request is profiled.
+    Sync endpoints run in the threadpool, async endpoints in the event loop together with other requests.
+
+    Param call: Endpoint function.
+    Return: Wrapped endpoint function.
+    """
+    if asyncio.iscoroutinefunction(call):
+        @wraps(call)
+        async def profiled_call(*args, **kwargs):
+            session = _profile_session.get()
+            if session is None:
+                return await call(*args, **kwargs)
+            token = session.start()
+            try:
+                return await call(*args, **kwargs)
+            finally:
+                session.stop(token)
+    else:
+        @wraps(call)
+        def profiled_call(*args, **kwargs):
+            session = _profile_session.get()
+            if session is None:
+                return call(*args, **kwargs)
+            token = session.start()
+            try:
+                return call(*args, **kwargs)
+            finally:
+                session.stop(token)
+    return profiled_call
+
+
+def profile_routes(app):
+    """
+    Function makes the endpoints of all routes of an application profilable. Request handlers call the
+    endpoint of their dependant, so it is replaced after the routes were included.
+
+    Param app:FastAPI: Application.
+    Return: None.
+    """
+    for route in app.routes:
+        if isinstance(route, APIRoute) and not hasattr(route.dependant.call, "__wrapped__"):
+            route.dependant.call = profiled(route.dependant.call)
+
+
+def is_admin(request) -> bool:
+    """
+    Function checks whether the request is made by an active admin, with the super_user role of its bearer token.
+
+    Param request: Incoming request.
+    Return: True for admins.
+    """
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme != "Bearer" or not token:
+        return False
+    principal = JWTBearer.get_principal(token)
+    return principal is not None and principal.is_active and principal.role == ADMIN_ROLE
+
+
+async def profiling_middleware(request, call_next):
+    """
+    Middleware function that profiles requests of admins with the X-Profile header or the profile query parameter,
+    set to pstats for cProfile or to speedscope for the sampling profiler. The profile is stored, and its ID
+    and download URL are returned in the X-Profile-Id and X-Profile-Url headers. Other requests are not affected.
+
+    Param request: Incoming request.
+    Param call_next: Next handler in the chain.
+    Return: The response.
+    """
+    profile_format = request.headers.get(PROFILE_HEADER) or request.query_params.get(PROFILE_PARAMETER)
+    if profile_format not in SESSIONS or not is_admin(request) or not _profiling.acquire(blocking=False):
+        return await call_next(request)
+    try:
+        session = SESSIONS[profile_format]()
+        token = _profile_session.set(session)
+        start = time.perf_counter()
+        try:
+            response = await call_next(request)
+        finally:
+            _profile_session.reset(token)
+        route = request.scope.get("route")
+        name = f"{request.method} {route.path if route is not None else request.url.path}"
+        profile = profile_store.add(RequestProfile(session, name, time.perf_counter() - start, response.status_code))
+    finally:
+        _profiling.release()
+    response.headers[PROFILE_ID_HEADER] = profile.id
+    response.headers[PROFILE_URL_HEADER] = f"{PROFILES_PATH}/{profile.id}"
+    return response
@@ -0,0 +1,41 @@
+"""Profiling routes module"""
+from fastapi import APIRouter, Depends, HTTPException, status
+from starlette.responses import Response
+
+from app.profiling.profiler import PROFILES_PATH, profile_store
+from app.users.controller.user_auth_controller import JWTBearer
+
+profile_router = APIRouter(tags=["Profiles"], prefix=PROFILES_PATH)
+
+
+@profile_router.get("/",
+                    summary="Show the latest and the slowest recent request profiles. Admin route.",
+                    dependencies=[Depends(JWTBearer(["super_user"]))]
+                    )
+def get_profiles():
+    """
+    Function returns the stored request profiles, the slowest first. Requests of admins are profiled
+    with the X-Profile header or the profile query parameter, set to pstats or speedscope.
+
+    Return: A list of profiles with their route, duration, format and download URL.
+    """
+    return profile_store.list()
+
+
+@profile_router.get("/{profile_id}",
+                    summary="Download a request profile. Admin route.",
+                    dependencies=[Depends(JWTBearer(["super_user"]))]
+                    )
+def download_profile(profile_id: str):
+    """
+    Function returns a stored profile as a file, pstats for python -m pstats or snakeviz,
+    or speedscope JSON for https://www.speedscope.app.
+
+    Param profile_id:str: ID of the profile, from the X-Profile-Id header of the profiled response.
+    Return: The profile.
+    """
+    profile = profile_store.get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found or expired.")
+    return Response(profile.data, media_type=profile.media_type,
+                    headers={"Content-Disposition": f'attachment; filename="{profile.filename}"'})
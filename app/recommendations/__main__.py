@@ -0,0 +1,36 @@
+"""
+Command for rebuilding the precomputed neighbours of movies and series, run periodically,
+for example nightly from cron, to pick up changes missed by incremental updates.
+With --similar, the similar titles by content are rebuilt instead.
+
+    python -m app.recommendations [--kind movies|series] [--workers N] [--similar]
+"""
+import argparse
+import json
+import time
+
+from app.main import app  # noqa: F401, applies pending migrations
+from app.recommendations.models import MOVIES, SERIES
+from app.recommendations.service import RecommendationServices, recommendation_engine, similar_titles_engine
+
+
+def main():
+    """Function parses arguments, rebuilds the neighbours and prints the number of stored rows."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--kind", choices=[MOVIES, SERIES], default=None, help="Rebuild only movies or series.")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes, 0 for none.")
+    parser.add_argument("--similar", action="store_true", help="Rebuild similar titles by content.")
+    args = parser.parse_args()
+    if args.workers is not None:
+        recommendation_engine.workers = args.workers
+        similar_titles_engine.workers = args.workers
+    start = time.perf_counter()
+    if args.similar:
+        rows = RecommendationServices.rebuild_similar_titles(args.kind)
+    else:
+        rows = RecommendationServices.rebuild_recommendations(args.kind)
+    print(json.dumps({"rows": rows, "seconds": round(time.perf_counter() - start, 2)}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+from .recommendation_controller import RecommendationController
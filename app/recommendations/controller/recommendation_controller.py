@@ -0,0 +1,70 @@
+"""Recommendation Controller module"""
+from typing import Optional
+
+from fastapi import HTTPException
+
+from app.base import AppException
+from app.recommendations.service import RecommendationServices
+
+
+class RecommendationController:
+    """Controller for Recommendation routes"""
+    @staticmethod
+    def rebuild_recommendations(kind: Optional[str] = None):
+        """
+        Function recomputes the neighbours of all movies, all series, or both.
+
+        Param kind:str: movies or series, None for both.
+        Return: A dictionary with the number of stored neighbour rows of every kind.
+        """
+        try:
+            return RecommendationServices.rebuild_recommendations(kind)
+        except AppException as exc:
+            raise HTTPException(status_code=exc.code, detail=exc.message) from exc
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+    @staticmethod
+    def rebuild_similar_titles(kind: Optional[str] = None):
+        """
+        Function recomputes the similar titles of all movies, all series, or both.
+
+        Param kind:str: movies or series, None for both.
+        Return: A dictionary with the number of stored rows of every kind.
+        """
+        try:
+            return RecommendationServices.rebuild_similar_titles(kind)
+        except AppException as exc:
+            raise HTTPException(status_code=exc.code, detail=exc.message) from exc
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+    @staticmethod
+    def get_similar_movies(title: str):
+        """
+        Function returns the movies most similar to a movie by content.
+
+        Param title:str: Title of the movie.
+        Return: A list of movies, most similar first.
+        """
+        try:
+            return RecommendationServices.get_similar_movies(title)
+        except AppException as exc:
+            raise HTTPException(status_code=exc.code, detail=exc.message) from exc
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+    @staticmethod
+    def get_similar_series(title: str):
+        """
+        Function returns the series most similar to a series by content.
+
+        Param title:str: Title of the series.
+        Return: A list of series, most similar first.
+        """
+        try:
+            return RecommendationServices.get_similar_series(title)
+        except AppException as exc:
+            raise HTTPException(status_code=exc.code, detail=exc.message) from exc
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
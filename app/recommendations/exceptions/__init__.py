@@ -0,0 +1 @@
+from .recommendation_exceptions import *
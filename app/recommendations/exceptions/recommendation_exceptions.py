@@ -0,0 +1,14 @@
+"""Custom exceptions for Recommendation logic"""
+from app.base import AppException
+
+
+class UnknownRecommendationKindException(AppException):
+    """Exception raised when recommendations are rebuilt for a kind of title that is not recommended."""
+    message = "Unknown recommendation kind. Choose one of: movies, series."
+    code = 400
+
+
+class InvalidRecommendationCursorException(AppException):
+    """Exception raised when a cursor of recommendations was not returned with a previous page."""
+    message = "Invalid recommendations cursor."
+    code = 400
@@ -0,0 +1,2 @@
+from .item_neighbour import ItemNeighbour, MOVIES, SERIES
+from .similar_title import SimilarTitle
@@ -0,0 +1,27 @@
+"""ItemNeighbour Model module"""
+from sqlalchemy import Column, String, Float
+
+from app.db import Base, UUIDKey
+
+MOVIES = "movies"
+SERIES = "series"
+
+
+class ItemNeighbour(Base):
+    """
+    Base Model for ItemNeighbour, one of the most similar titles of a movie or series, precomputed by
+    item-item collaborative filtering. The primary key starts with the kind and the title, so the neighbours
+    of the titles a user watched are read with an index range scan.
+    """
+    __tablename__ = "item_neighbours"
+
+    kind = Column(String(10), primary_key=True)
+    item_id = Column(UUIDKey(), primary_key=True)
+    neighbour_id = Column(UUIDKey(), primary_key=True)
+    similarity = Column(Float(), nullable=False)
+
+    def __init__(self, kind: str, item_id: str, neighbour_id: str, similarity: float):
+        self.kind = kind
+        self.item_id = item_id
+        self.neighbour_id = neighbour_id
+        self.similarity = similarity
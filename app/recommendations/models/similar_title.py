@@ -0,0 +1,24 @@
+"""SimilarTitle Model module"""
+from sqlalchemy import Column, String, Float
+
+from app.db import Base, UUIDKey
+
+
+class SimilarTitle(Base):
+    """
+    Base Model for SimilarTitle, one of the movies or series most similar to a title by its content:
+    the description, genre, director and cast. The primary key starts with the kind and the title,
+    so the similar titles of a title are read with an index range scan.
+    """
+    __tablename__ = "similar_titles"
+
+    kind = Column(String(10), primary_key=True)
+    item_id = Column(UUIDKey(), primary_key=True)
+    neighbour_id = Column(UUIDKey(), primary_key=True)
+    similarity = Column(Float(), nullable=False)
+
+    def __init__(self, kind: str, item_id: str, neighbour_id: str, similarity: float):
+        self.kind = kind
+        self.item_id = item_id
+        self.neighbour_id = neighbour_id
+        self.similarity = similarity
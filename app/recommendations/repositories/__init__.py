@@ -0,0 +1,2 @@
+from .item_neighbour_repository import ItemNeighbourRepository, ratings_select, WATCHED_WITHOUT_RATING
+from .similar_title_repository import SimilarTitleRepository
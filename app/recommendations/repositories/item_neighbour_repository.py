@@ -0,0 +1,171 @@
+"""ItemNeighbour Repository module"""
+from sqlalchemy import func, select
+
+from app.base import BaseCRUDRepository
+from app.base.base_repository import IN_CLAUSE_CHUNK_SIZE
+from app.recommendations.models import MOVIES
+from app.series.models import Episode
+from app.users.models.user import UserWatchMovie, UserWatchEpisode
+
+# A watched title without a rating counts as rated in the middle of the scale.
+WATCHED_WITHOUT_RATING = 5
+
+
+def rating_columns(kind: str) -> tuple:
+    """
+    Function returns the user and title columns of the watch records of movies or series.
+
+    Param kind:str: movies or series.
+    Return: Tuple of the user ID and title ID columns.
+    """
+    if kind == MOVIES:
+        return UserWatchMovie.user_id, UserWatchMovie.movie_id
+    return UserWatchEpisode.user_id, Episode.series_id
+
+
+def watch_select(kind: str, *columns):
+    """
+    Function returns a select of columns of the watch records of movies, or of episodes joined with their series.
+
+    Param kind:str: movies or series.
+    Param columns: Selected columns.
+    Return: Select statement.
+    """
+    statement = select(*columns)
+    if kind != MOVIES:
+        statement = statement.select_from(UserWatchEpisode).join(Episode, Episode.id == UserWatchEpisode.episode_id)
+    return statement
+
+
+def ratings_select(kind: str, user_ids=None, item_ids=None):
+    """
+    Function returns a select of (user_id, item_id, value) rows of the user x title matrix.
+    Movies are rated directly, a series is rated with the average rating of its episodes the user watched.
+
+    Param kind:str: movies or series.
+    Param user_ids: Select statement or list of user IDs to limit the rows to.
+    Param item_ids: Select statement or list of title IDs to limit the rows to.
+    Return: Select statement.
+    """
+    user_id, item_id = rating_columns(kind)
+    if kind == MOVIES:
+        value = func.coalesce(UserWatchMovie.rating, WATCHED_WITHOUT_RATING)
+    else:
+        value = func.coalesce(func.avg(UserWatchEpisode.rating), WATCHED_WITHOUT_RATING)
+    statement = watch_select(kind, user_id, item_id.label("item_id"), value.label("value"))
+    if user_ids is not None:
+        statement = statement.where(user_id.in_(user_ids))
+    if item_ids is not None:
+        statement = statement.where(item_id.in_(item_ids))
+    return statement.group_by(user_id, item_id) if kind != MOVIES else statement
+
+
+class ItemNeighbourRepository(BaseCRUDRepository):
+    """Repository for ItemNeighbour Model, and for SimilarTitle Model of the same columns"""
+
+    def read_ratings(self, kind: str) -> list:
+        """
+        Function returns all ratings of movies or series.
+
+        Param kind:str: movies or series.
+        Return: A list of (user ID, title ID, rating) tuples.
+        """
+        try:
+            return [tuple(row) for row in self.db.execute(ratings_select(kind))]
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
+
+    def read_related_ratings(self, kind: str, item_ids: list) -> list:
+        """
+        Function returns all ratings of the given titles and of every title that shares a user with them,
+        which is all that is needed to compute their similarities.
+
+        Param kind:str: movies or series.
+        Param item_ids:list: IDs of the titles.
+        Return: A list of (user ID, title ID, rating) tuples.
+        """
+        try:
+            user_id, item_id = rating_columns(kind)
+            users = watch_select(kind, user_id).where(item_id.in_(item_ids)).distinct()
+            related = watch_select(kind, item_id).where(user_id.in_(users)).distinct()
+            return [tuple(row) for row in self.db.execute(ratings_select(kind, item_ids=related))]
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
+
+    def read_neighbours(self, kind: str, item_ids: list) -> dict:
+        """
+        Function returns the stored neighbours of the given titles.
+
+        Param kind:str: movies or series.
+        Param item_ids:list: IDs of the titles.
+        Return: A dictionary of lists of (neighbour ID, similarity) tuples by ID of the title.
+        """
+        try:
+            item_ids = list(dict.fromkeys(item_ids))
+            neighbours = {}
+            for start in range(0, len(item_ids), IN_CLAUSE_CHUNK_SIZE):
+                chunk = item_ids[start:start + IN_CLAUSE_CHUNK_SIZE]
+                rows = self.db.query(self.model.item_id, self.model.neighbour_id, self.model.similarity).\
+                    filter(self.model.kind == kind, self.model.item_id.in_(chunk)).all()
+                for item_id, neighbour_id, similarity in rows:
+                    neighbours.setdefault(item_id, []).append((neighbour_id, similarity))
+            return neighbours
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
+
+    def replace_neighbours(self, kind: str, neighbours: dict, everything: bool = False, chunk_size: int = 1000):
+        """
+        Function replaces the stored neighbours of titles, inserted with multi-row statements.
+        Changes are not committed.
+
+        Param kind:str: movies or series.
+        Param neighbours:dict: Lists of (neighbour ID, similarity) tuples by ID of the title.
+        Param everything:bool: Delete the neighbours of all titles of the kind, not only of the given ones.
+        Param chunk_size:int: Number of rows inserted with one statement.
+        Return: Number of inserted rows.
+        """
+        try:
+            query = self.db.query(self.model).filter(self.model.kind == kind)
+            if everything:
+                query.delete(synchronize_session=False)
+            else:
+                item_ids = list(neighbours)
+                for start in range(0, len(item_ids), IN_CLAUSE_CHUNK_SIZE):
+                    query.filter(self.model.item_id.in_(item_ids[start:start + IN_CLAUSE_CHUNK_SIZE])).\
+                        delete(synchronize_session=False)
+            rows = [{"kind": kind, "item_id": item_id, "neighbour_id": neighbour_id, "similarity": similarity}
+                    for item_id, pairs in neighbours.items() for neighbour_id, similarity in pairs]
+            for start in range(0, len(rows), chunk_size):
+                self.db.execute(self.model.__table__.insert(), rows[start:start + chunk_size])
+            return len(rows)
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
+
+    def read_recommendations(self, kind: str, user_id: str, limit: int) -> list:
+        """
+        Function ranks titles the user has not watched by the sum of their similarities to the titles
+        the user watched, weighted by the user's ratings. Reads the stored neighbours of the watched titles
+        with a single query on the primary key.
+
+        Param kind:str: movies or series.
+        Param user_id:str: Identify the user.
+        Param limit:int: Maximum number of titles.
+        Return: A list of (title ID, score) tuples, best first.
+        """
+        try:
+            watched = ratings_select(kind, user_ids=[user_id]).subquery()
+            user_column, item_column = rating_columns(kind)
+            watched_ids = watch_select(kind, item_column).where(user_column == user_id)
+            score = func.sum(self.model.similarity * watched.c.value).label("score")
+            statement = select(self.model.neighbour_id, score).\
+                join(watched, self.model.item_id == watched.c.item_id).\
+                where(self.model.kind == kind, self.model.neighbour_id.not_in(watched_ids)).\
+                group_by(self.model.neighbour_id).order_by(score.desc(), self.model.neighbour_id).limit(limit)
+            return [tuple(row) for row in self.db.execute(statement)]
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
@@ -0,0 +1,49 @@
+"""SimilarTitle Repository module"""
+from sqlalchemy import select
+
+from app.movies.models import Movie, MovieActor
+from app.recommendations.models import MOVIES
+from app.series.models import Series, SeriesActor
+from .item_neighbour_repository import ItemNeighbourRepository
+
+
+class SimilarTitleRepository(ItemNeighbourRepository):
+    """Repository for SimilarTitle Model"""
+
+    def read_features(self, kind: str) -> tuple:
+        """
+        Function returns the content of all movies or series that similar titles are computed from.
+
+        Param kind:str: movies or series.
+        Return: Tuple of a list of (title ID, description, genre ID, director ID) tuples
+        and a list of (title ID, actor ID) tuples.
+        """
+        try:
+            model, link, actor_id = (Movie, MovieActor.movie_id, MovieActor.actor_id) if kind == MOVIES else \
+                (Series, SeriesActor.series_id, SeriesActor.actor_id)
+            titles = self.db.execute(select(model.id, model.description, model.genre_id, model.director_id))
+            cast = self.db.execute(select(link, actor_id).where(link.is_not(None)).distinct())
+            return [tuple(row) for row in titles], [tuple(row) for row in cast]
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
+
+    def read_similar(self, kind: str, title: str, limit: int) -> list:
+        """
+        Function returns the titles most similar to the movie or series with the given title, read with
+        a single query joining an index range scan of the stored similar titles with the titles.
+
+        Param kind:str: movies or series.
+        Param title:str: Title of the movie or series.
+        Param limit:int: Maximum number of titles.
+        Return: A list of movies or series, most similar first.
+        """
+        try:
+            model = Movie if kind == MOVIES else Series
+            item_id = select(model.id).where(model.title == title).limit(1).scalar_subquery()
+            return self.db.query(model).join(self.model, self.model.neighbour_id == model.id).\
+                filter(self.model.kind == kind, self.model.item_id == item_id).\
+                order_by(self.model.similarity.desc(), self.model.neighbour_id).limit(limit).all()
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
@@ -0,0 +1,39 @@
+"""Recommendation routes module"""
+from typing import Optional
+
+from fastapi import APIRouter, Depends
+
+from app.recommendations.controller import RecommendationController
+from app.users.controller.user_auth_controller import JWTBearer
+
+recommendation_router = APIRouter(tags=["Recommendations"], prefix="/api/recommendations")
+
+
+@recommendation_router.post("/rebuild",
+                            summary="Recompute similar titles of all movies and series. Admin Route.",
+                            dependencies=[Depends(JWTBearer(["super_user"]))]
+                            )
+def rebuild_recommendations(kind: Optional[str] = None):
+    """
+    Function recomputes the most similar titles of every movie and series from the ratings of all users,
+    in a pool of worker processes. Watch events update them incrementally between rebuilds.
+
+    Param kind:str: movies or series, both if not given.
+    Return: A dictionary with the number of stored neighbour rows of every kind.
+    """
+    return RecommendationController.rebuild_recommendations(kind)
+
+
+@recommendation_router.post("/rebuild-similar",
+                            summary="Recompute similar titles of all movies and series by content. Admin Route.",
+                            dependencies=[Depends(JWTBearer(["super_user"]))]
+                            )
+def rebuild_similar_titles(kind: Optional[str] = None):
+    """
+    Function recomputes the most similar titles of every movie and series from their descriptions, genres,
+    directors and cast. Catalogue changes rebuild them in the background between manual rebuilds.
+
+    Param kind:str: movies or series, both if not given.
+    Return: A dictionary with the number of stored rows of every kind.
+    """
+    return RecommendationController.rebuild_similar_titles(kind)
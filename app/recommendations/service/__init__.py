@@ -0,0 +1,7 @@
+from .similarity import ItemSimilarity, MatrixItemSimilarity, create_similarity, top_k
+from .recommendation_engine import RecommendationEngine, RecommendationUpdater, recommendation_engine, \
+    recommendation_updater
+from .content_similarity import ContentSimilarity, create_content_similarity, feature_vectors, tokenize
+from .similar_titles import SimilarTitlesEngine, SimilarTitlesRefresher, similar_titles_engine, \
+    similar_titles_refresher
+from .recommendation_services import RecommendationServices
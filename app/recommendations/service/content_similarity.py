@@ -0,0 +1,111 @@
+"""Content Similarity module"""
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Iterable, Optional
+
+from .similarity import ItemSimilarity, MatrixItemSimilarity, matrix_backend_available
+
+TOKEN = re.compile(r"[a-z0-9]+")
+STOP_WORDS = frozenset("""
+    about after all also and are been but can for from had has have her his into its more not one only other out
+    over she that the their them then there they this two was were when where which while who will with would you
+""".split())
+# Every group of features is normalized to unit length and scaled by its weight before the whole vector is
+# normalized, so a long cast or description does not outweigh the genre and the director.
+FEATURE_WEIGHTS = {"text": 1.0, "genre": 0.5, "director": 0.5, "cast": 0.75}
+
+
+def tokenize(text: Optional[str]) -> list:
+    """
+    Function splits a description into lower case terms, leaving out short words and stop words.
+
+    Param text:str: Description of a title.
+    Return: A list of terms.
+    """
+    return [term for term in TOKEN.findall((text or "").lower()) if len(term) > 2 and term not in STOP_WORDS]
+
+
+def feature_vectors(titles: Iterable[tuple], cast: Iterable[tuple]) -> list:
+    """
+    Function returns the sparse feature matrix of titles: TF-IDF weights of the terms of their descriptions,
+    with sublinear term frequencies, and one-hot features of their genre, director and actors.
+
+    Param titles:Iterable: Tuples of (title ID, description, genre ID, director ID).
+    Param cast:Iterable: Tuples of (title ID, actor ID).
+    Return: A list of (feature, title ID, weight) tuples.
+    """
+    titles = list(titles)
+    terms = {item_id: Counter(tokenize(description)) for item_id, description, _, _ in titles}
+    frequencies = Counter(term for counts in terms.values() for term in counts)
+    idf = {term: math.log((1 + len(titles)) / (1 + frequency)) + 1 for term, frequency in frequencies.items()}
+    actors = defaultdict(set)
+    for item_id, actor_id in cast:
+        actors[item_id].add(actor_id)
+    features = []
+    for item_id, _, genre_id, director_id in titles:
+        groups = {
+            "text": {f"term:{term}": (1 + math.log(count)) * idf[term] for term, count in terms[item_id].items()},
+            "genre": {f"genre:{genre_id}": 1.0} if genre_id else {},
+            "director": {f"director:{director_id}": 1.0} if director_id else {},
+            "cast": {f"actor:{actor_id}": 1.0 for actor_id in actors.get(item_id, ())},
+        }
+        for group, weights in groups.items():
+            norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+            features.extend((feature, item_id, FEATURE_WEIGHTS[group] * weight / norm)
+                            for feature, weight in weights.items())
+    return features
+
+
+class ContentSimilarity(ItemSimilarity):
+    """
+    Cosine similarity of titles over the sparse title x feature matrix of feature_vectors, kept as
+    a column per title and a row per feature. Candidates of a title are the titles sharing one of its
+    features held by at most max_feature_titles titles. Features held by more titles, usually genres,
+    add to the similarity of the candidates but do not make titles candidates, so titles sharing nothing
+    else are not compared and the work does not grow with the square of the size of the largest genre.
+    """
+
+    def __init__(self, features: Iterable[tuple], max_feature_titles: Optional[int] = None):
+        super().__init__(features)
+        self.max_feature_titles = max_feature_titles
+
+    def similarities(self, item_id) -> dict:
+        """
+        Function returns the cosine similarity of a title to every candidate title.
+
+        Param item_id: ID of the title.
+        Return: A dictionary of similarities by ID of the other title.
+        """
+        dots, common = defaultdict(float), []
+        for feature, value in self.columns.get(item_id, {}).items():
+            row = self.rows[feature]
+            if self.max_feature_titles is not None and len(row) > self.max_feature_titles:
+                common.append((value, row))
+                continue
+            for other_id, other_value in row.items():
+                if other_id != item_id:
+                    dots[other_id] += value * other_value
+        for value, row in common:
+            for other_id in dots:
+                if other_id in row:
+                    dots[other_id] += value * row[other_id]
+        norm = self.norms.get(item_id)
+        return {other_id: dot / (norm * self.norms[other_id]) for other_id, dot in dots.items() if dot > 0}
+
+
+def create_content_similarity(features: Iterable[tuple], backend: str = "auto",
+                              max_feature_titles: Optional[int] = None) -> ItemSimilarity:
+    """
+    Function creates the content similarity model of the configured backend. The matrix backend
+    compares every pair of titles sharing a feature, with batched sparse matrix products.
+
+    Param features:Iterable: Tuples of (feature, title ID, weight) of feature_vectors.
+    Param backend:str: auto, matrix or python.
+    Param max_feature_titles:int: Number of titles above which a feature does not make titles candidates
+    of the python backend, None for no limit.
+    Return: ItemSimilarity.
+    """
+    if backend == "matrix" or (backend == "auto" and matrix_backend_available()):
+        return MatrixItemSimilarity(features)
+    return ContentSimilarity(features, max_feature_titles)
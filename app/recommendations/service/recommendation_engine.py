@@ -0,0 +1,203 @@
+"""Recommendation Engine module"""
+import asyncio
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from threading import Lock
+
+from starlette.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.db import SessionLocal
+from app.recommendations.models import ItemNeighbour, MOVIES, SERIES
+from app.recommendations.repositories import ItemNeighbourRepository
+from .similarity import ItemSimilarity, create_similarity, top_k
+
+logger = logging.getLogger(__name__)
+
+_worker_similarity = None
+
+
+def _init_worker(similarity: ItemSimilarity):
+    """Keeps the similarity model in the worker process, so it is sent once per worker instead of once per chunk."""
+    global _worker_similarity  # pylint: disable=global-statement
+    _worker_similarity = similarity
+
+
+def _worker_neighbours(items: list, k: int) -> dict:
+    return _worker_similarity.neighbours(items, k)
+
+
+class RecommendationEngine:
+    """
+    Item-item collaborative filtering. The k most similar titles of every movie and series are computed
+    from the ratings of all users and stored in the item_neighbours table, where recommendations are read from.
+    A full rebuild splits titles into chunks computed in a pool of worker processes. Incremental updates
+    recompute only the titles changed by new watch events, and merge them into the neighbours of related titles.
+    """
+
+    def __init__(self, session_factory=SessionLocal, neighbours: int = 20, workers: int = 2, chunk_size: int = 500,
+                 backend: str = "auto"):
+        self.session_factory = session_factory
+        self.neighbours = neighbours
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.backend = backend
+
+    def compute(self, similarity: ItemSimilarity, items: list) -> dict:
+        """
+        Function computes the neighbours of titles, in worker processes when there is more than one chunk.
+        With no workers the neighbours are computed in the caller.
+
+        Param similarity:ItemSimilarity: Similarity model of all ratings.
+        Param items:list: IDs of the titles.
+        Return: A dictionary of lists of (neighbour ID, similarity) tuples by ID of the title.
+        """
+        chunks = [items[start:start + self.chunk_size] for start in range(0, len(items), self.chunk_size)]
+        if not self.workers or len(chunks) <= 1:
+            return similarity.neighbours(items, self.neighbours)
+        neighbours = {}
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(chunks)), initializer=_init_worker,
+                                 initargs=(similarity,)) as executor:
+            for chunk_neighbours in executor.map(_worker_neighbours, chunks, repeat(self.neighbours)):
+                neighbours.update(chunk_neighbours)
+        return neighbours
+
+    def rebuild(self, kind: str) -> int:
+        """
+        Function recomputes the neighbours of all movies or series and replaces the stored ones
+        in a single transaction.
+
+        Param kind:str: movies or series.
+        Return: Number of stored neighbour rows.
+        """
+        with self.session_factory() as db:
+            repository = ItemNeighbourRepository(db, ItemNeighbour)
+            similarity = create_similarity(repository.read_ratings(kind), self.backend)
+            rows = repository.replace_neighbours(kind, self.compute(similarity, similarity.items), everything=True)
+            db.commit()
+            return rows
+
+    def update(self, kind: str, item_ids: list) -> int:
+        """
+        Function recomputes the neighbours of titles whose ratings changed, from the ratings of the titles
+        that share a user with them. Their similarity to every related title is merged into the stored
+        neighbours of that title, replacing the previous value. A related title that loses a neighbour
+        keeps fewer than k neighbours until the next full rebuild.
+
+        Param kind:str: movies or series.
+        Param item_ids:list: IDs of the changed titles.
+        Return: Number of titles whose neighbours were replaced.
+        """
+        with self.session_factory() as db:
+            repository = ItemNeighbourRepository(db, ItemNeighbour)
+            similarity = ItemSimilarity(repository.read_related_ratings(kind, item_ids))
+            similarities = {item_id: similarity.similarities(item_id) for item_id in item_ids}
+            changed = {item_id: top_k(similar.items(), self.neighbours) for item_id, similar in similarities.items()}
+            related = {other_id for similar in similarities.values() for other_id in similar} - set(similarities)
+            stored = repository.read_neighbours(kind, list(related))
+            for other_id in related:
+                pairs = [(neighbour_id, value) for neighbour_id, value in stored.get(other_id, [])
+                         if neighbour_id not in similarities]
+                pairs.extend((item_id, similar[other_id]) for item_id, similar in similarities.items()
+                             if other_id in similar)
+                pairs = top_k(pairs, self.neighbours)
+                if sorted(pairs) != sorted(stored.get(other_id, [])):
+                    changed[other_id] = pairs
+            repository.replace_neighbours(kind, changed)
+            db.commit()
+            return len(changed)
+
+
+class RecommendationUpdater:
+    """
+    Titles rated or watched since the last incremental update, recorded by the watch services after commit.
+    A background task of the running event loop applies the updates every poll_seconds. Pending titles
+    are kept per worker, so titles recorded by a worker that stops are picked up by the next full rebuild.
+    """
+
+    def __init__(self, engine: RecommendationEngine, poll_seconds: float = 10.0, enabled: bool = True):
+        self.engine = engine
+        self.poll_seconds = poll_seconds
+        self.enabled = enabled
+        self._lock = Lock()
+        self._pending = {MOVIES: set(), SERIES: set()}
+        self._stopping = None
+        self._task = None
+
+    def record(self, kind: str, item_ids):
+        """
+        Function records titles whose ratings changed.
+
+        Param kind:str: movies or series.
+        Param item_ids: IDs of the titles.
+        Return: None.
+        """
+        if self.enabled:
+            with self._lock:
+                self._pending[kind].update(item_ids)
+
+    def flush(self) -> dict:
+        """
+        Function applies incremental updates for all pending titles. Titles of a failed update stay pending.
+
+        Return: A dictionary with the number of updated titles of every kind.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {MOVIES: set(), SERIES: set()}
+        updated, error = {}, None
+        for kind, item_ids in pending.items():
+            if not item_ids:
+                continue
+            try:
+                updated[kind] = self.engine.update(kind, sorted(item_ids, key=str))
+            except Exception as exc:  # pylint: disable=broad-except
+                self.record(kind, item_ids)
+                error = exc
+        if error is not None:
+            raise error
+        return updated
+
+    async def run(self):
+        """
+        Function applies pending updates every poll_seconds until the updater is stopped.
+
+        Return: None.
+        """
+        while not self._stopping.is_set():
+            try:
+                await run_in_threadpool(self.flush)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Failed applying recommendation updates")
+            try:
+                await asyncio.wait_for(self._stopping.wait(), self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self):
+        """
+        Function starts the updater as a task of the running event loop.
+
+        Return: None.
+        """
+        self._stopping = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self.run())
+
+    async def stop(self):
+        """
+        Function stops the updater after the current update.
+
+        Return: None.
+        """
+        if self._task is not None:
+            self._stopping.set()
+            await self._task
+            self._task = None
+
+
+recommendation_engine = RecommendationEngine(neighbours=settings.RECOMMENDATION_NEIGHBOURS,
+                                             workers=settings.RECOMMENDATION_WORKERS,
+                                             chunk_size=settings.RECOMMENDATION_CHUNK_SIZE,
+                                             backend=settings.RECOMMENDATION_BACKEND)
+recommendation_updater = RecommendationUpdater(recommendation_engine, settings.RECOMMENDATION_UPDATE_SECONDS,
+                                               enabled=settings.RECOMMENDATION_UPDATES_ENABLED)
@@ -0,0 +1,151 @@
+"""Recommendation Service module"""
+import base64
+import json
+from typing import Optional
+
+from app.base import Page
+from app.cache import cached, SIMILAR_TITLES
+from app.config import settings
+from app.db import SessionLocal
+from app.movies.models import Movie
+from app.movies.repositories import MovieRepository
+from app.movies.schemas import MovieSchema
+from app.recommendations.exceptions import UnknownRecommendationKindException, \
+    InvalidRecommendationCursorException
+from app.recommendations.models import ItemNeighbour, SimilarTitle, MOVIES, SERIES
+from app.recommendations.repositories import ItemNeighbourRepository, SimilarTitleRepository
+from app.series.exceptions.series_exceptions import UnknownSeriesException
+from app.series.models import Series
+from app.series.repositories import SeriesRepository
+from app.series.schemas import SeriesSchema
+from .recommendation_engine import recommendation_engine
+from .similar_titles import similar_titles_engine
+
+REPOSITORIES = {MOVIES: (MovieRepository, Movie), SERIES: (SeriesRepository, Series)}
+
+
+def encode_position(position: int) -> str:
+    """
+    Function encodes the position of the next page in a ranked list into an opaque cursor.
+
+    Param position:int: Index of the first title of the next page.
+    Return: Cursor string.
+    """
+    return base64.urlsafe_b64encode(json.dumps({"rank": position}).encode()).decode()
+
+
+def decode_position(cursor: str) -> int:
+    """
+    Function decodes a cursor of encode_position.
+
+    Param cursor:str: Cursor string.
+    Return: Index of the first title of the page.
+    """
+    try:
+        position = json.loads(base64.urlsafe_b64decode(cursor.encode()))["rank"]
+        if not isinstance(position, int) or position < 0:
+            raise ValueError(cursor)
+        return position
+    except (ValueError, TypeError, KeyError) as exc:
+        raise InvalidRecommendationCursorException from exc
+
+
+class RecommendationServices:
+    """Service for Recommendation routes, the rebuild command and the recommendation routes of users"""
+    @staticmethod
+    def rebuild_recommendations(kind: Optional[str] = None) -> dict:
+        """
+        Function recomputes the neighbours of all movies, all series, or both.
+
+        Param kind:str: movies or series, None for both.
+        Return: A dictionary with the number of stored neighbour rows of every kind.
+        """
+        try:
+            if kind is not None and kind not in REPOSITORIES:
+                raise UnknownRecommendationKindException
+            return {name: recommendation_engine.rebuild(name) for name in REPOSITORIES if kind in (None, name)}
+        except Exception as exc:
+            raise exc
+
+    @staticmethod
+    def rebuild_similar_titles(kind: Optional[str] = None) -> dict:
+        """
+        Function recomputes the similar titles of all movies, all series, or both, from their content.
+
+        Param kind:str: movies or series, None for both.
+        Return: A dictionary with the number of stored rows of every kind.
+        """
+        try:
+            if kind is not None and kind not in REPOSITORIES:
+                raise UnknownRecommendationKindException
+            return {name: similar_titles_engine.rebuild(name) for name in REPOSITORIES if kind in (None, name)}
+        except Exception as exc:
+            raise exc
+
+    @staticmethod
+    @cached(SIMILAR_TITLES, schema=MovieSchema)
+    def get_similar_movies(title: str) -> list:
+        """
+        Function returns the movies most similar to a movie by its description, genre, director and cast.
+        Results are cached per title until the catalogue changes.
+
+        Param title:str: Title of the movie.
+        Return: A list of movies, most similar first.
+        """
+        try:
+            with SessionLocal() as db:
+                movies = SimilarTitleRepository(db, SimilarTitle).read_similar(
+                    MOVIES, title, settings.SIMILAR_TITLES_NEIGHBOURS)
+                if not movies:
+                    MovieRepository(db, Movie).read_movie_by_title(title)
+                return movies
+        except Exception as exc:
+            raise exc
+
+    @staticmethod
+    @cached(SIMILAR_TITLES, schema=SeriesSchema)
+    def get_similar_series(title: str) -> list:
+        """
+        Function returns the series most similar to a series by its description, genre, director and cast.
+        Results are cached per title until the catalogue changes.
+
+        Param title:str: Title of the series.
+        Return: A list of series, most similar first.
+        """
+        try:
+            with SessionLocal() as db:
+                series = SimilarTitleRepository(db, SimilarTitle).read_similar(
+                    SERIES, title, settings.SIMILAR_TITLES_NEIGHBOURS)
+                if not series and not SeriesRepository(db, Series).read_series_by_title(title):
+                    raise UnknownSeriesException
+                return series
+        except Exception as exc:
+            raise exc
+
+    @staticmethod
+    def get_recommendations(kind: str, user_id: str, page: int = 1, cursor: Optional[str] = None) \
+            -> Optional[Page]:
+        """
+        Function returns a page of titles the user has not watched, ranked by their similarity to the titles
+        the user watched and rated. The ranking is a single query on the stored neighbours, limited to
+        RECOMMENDATION_MAX_RESULTS titles, and only titles of the page are read.
+
+        Param kind:str: movies or series.
+        Param user_id:str: Identify the user.
+        Param page:int: Page number, used when no cursor is given.
+        Param cursor:str: Cursor returned with the previous page.
+        Return: A page of movies or series, or None if the user has no recommendations yet.
+        """
+        try:
+            with SessionLocal() as db:
+                ranked = ItemNeighbourRepository(db, ItemNeighbour).read_recommendations(
+                    kind, user_id, settings.RECOMMENDATION_MAX_RESULTS)
+                if not ranked:
+                    return None
+                start = decode_position(cursor) if cursor else (page - 1) * settings.PER_PAGE
+                end = start + settings.PER_PAGE
+                repository, model = REPOSITORIES[kind]
+                titles = repository(db, model).read_by_ids(item_id for item_id, _ in ranked[start:end])
+                return Page(titles, encode_position(end) if end < len(ranked) else None)
+        except Exception as exc:
+            raise exc
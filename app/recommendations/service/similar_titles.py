@@ -0,0 +1,126 @@
+"""Similar Titles module"""
+from typing import Iterable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.cache import invalidate, SIMILAR_TITLES
+from app.config import settings
+from app.db import SessionLocal
+from app.movies.models import Movie, MovieActor
+from app.recommendations.models import SimilarTitle, MOVIES, SERIES
+from app.recommendations.repositories import SimilarTitleRepository
+from app.series.models import Series, SeriesActor
+from .content_similarity import feature_vectors, create_content_similarity
+from .recommendation_engine import RecommendationEngine, RecommendationUpdater
+
+# Kind of title and the column holding the ID of the title, of every model that is part of the content.
+CATALOGUE_MODELS = {Movie: (MOVIES, "id"), MovieActor: (MOVIES, "movie_id"), Series: (SERIES, "id"),
+                    SeriesActor: (SERIES, "series_id")}
+PENDING_TITLES = "similar_titles_pending"
+
+
+class SimilarTitlesEngine(RecommendationEngine):
+    """
+    Content-based similarity of titles. The feature matrix of all movies or series, TF-IDF of descriptions
+    and one-hot genre, director and cast, is built from the catalogue, and the k most similar titles
+    of every title are computed in chunks in a pool of worker processes and stored in the similar_titles table.
+    Document frequencies change with every title, so the neighbours are always rebuilt in full.
+    """
+
+    def __init__(self, session_factory=SessionLocal, neighbours: int = 20, workers: int = 2, chunk_size: int = 500,
+                 backend: str = "auto", max_feature_titles: Optional[int] = None):
+        super().__init__(session_factory, neighbours, workers, chunk_size, backend)
+        self.max_feature_titles = max_feature_titles
+
+    def rebuild(self, kind: str) -> int:
+        """
+        Function recomputes the similar titles of all movies or series and replaces the stored ones
+        in a single transaction.
+
+        Param kind:str: movies or series.
+        Return: Number of stored rows.
+        """
+        with self.session_factory() as db:
+            repository = SimilarTitleRepository(db, SimilarTitle)
+            similarity = create_content_similarity(feature_vectors(*repository.read_features(kind)), self.backend,
+                                                   self.max_feature_titles)
+            rows = repository.replace_neighbours(kind, self.compute(similarity, similarity.items), everything=True)
+            db.commit()
+            return rows
+
+    def update(self, kind: str, item_ids: list) -> int:
+        """
+        Function recomputes the similar titles after changes of the given titles, with a full rebuild.
+
+        Param kind:str: movies or series.
+        Param item_ids:list: IDs of the changed titles.
+        Return: Number of stored rows.
+        """
+        return self.rebuild(kind)
+
+
+class SimilarTitlesRefresher(RecommendationUpdater):
+    """
+    Movies and series changed since the last refresh, recorded after commit of catalogue changes.
+    Cached similar titles are invalidated right away, so a renamed or deleted title is not served from
+    the cache, and a background task rebuilds the similar titles of changed kinds every poll_seconds.
+    """
+
+    def record(self, kind: str, item_ids: Iterable = ()):
+        """
+        Function records a change of the content of movies or series.
+
+        Param kind:str: movies or series.
+        Param item_ids: IDs of the changed titles, if known.
+        Return: None.
+        """
+        if self.enabled:
+            with self._lock:
+                self._pending[kind].update(item_ids or [None])
+        invalidate(SIMILAR_TITLES)
+
+    def flush(self) -> dict:
+        """
+        Function rebuilds the similar titles of every kind with pending changes. Kinds of a failed
+        rebuild stay pending.
+
+        Return: A dictionary with the number of stored rows of every rebuilt kind.
+        """
+        refreshed = super().flush()
+        if refreshed:
+            invalidate(SIMILAR_TITLES)
+        return refreshed
+
+
+@event.listens_for(Session, "after_flush")
+def _record_catalogue_changes(session, _flush_context):
+    """Keeps titles whose content was written in the flush, to be recorded after commit."""
+    for objects in (session.new, session.dirty, session.deleted):
+        for obj in objects:
+            model = CATALOGUE_MODELS.get(type(obj))
+            if model is not None and (obj not in session.dirty or session.is_modified(obj)):
+                kind, column = model
+                session.info.setdefault(PENDING_TITLES, {}).setdefault(kind, set()).add(getattr(obj, column))
+
+
+@event.listens_for(Session, "after_commit")
+def _refresh_similar_titles(session):
+    """Records committed changes of titles for the refresh of similar titles."""
+    for kind, item_ids in session.info.pop(PENDING_TITLES, {}).items():
+        similar_titles_refresher.record(kind, item_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_catalogue_changes(session):
+    """Drops changes of titles that were rolled back."""
+    session.info.pop(PENDING_TITLES, None)
+
+
+similar_titles_engine = SimilarTitlesEngine(neighbours=settings.SIMILAR_TITLES_NEIGHBOURS,
+                                            workers=settings.RECOMMENDATION_WORKERS,
+                                            chunk_size=settings.RECOMMENDATION_CHUNK_SIZE,
+                                            backend=settings.RECOMMENDATION_BACKEND,
+                                            max_feature_titles=settings.SIMILAR_TITLES_MAX_FEATURE_TITLES)
+similar_titles_refresher = SimilarTitlesRefresher(similar_titles_engine, settings.SIMILAR_TITLES_REFRESH_SECONDS,
+                                                  enabled=settings.SIMILAR_TITLES_REFRESH_ENABLED)
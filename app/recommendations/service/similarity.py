@@ -0,0 +1,161 @@
+"""Item Similarity module"""
+import heapq
+import importlib.util
+import math
+from collections import defaultdict
+from typing import Iterable
+
+
+class ItemSimilarity:
+    """
+    Cosine similarity of titles over the sparse user x title matrix of ratings, kept as a column per title
+    and a row per user. Only titles that share at least one user are compared, so the work grows with
+    the sum of squared row lengths rather than with the square of the number of titles.
+    """
+
+    def __init__(self, ratings: Iterable[tuple]):
+        self.columns = defaultdict(dict)
+        self.rows = defaultdict(dict)
+        for user_id, item_id, value in ratings:
+            self.columns[item_id][user_id] = float(value)
+            self.rows[user_id][item_id] = float(value)
+        self.norms = {item_id: math.sqrt(sum(value * value for value in column.values()))
+                      for item_id, column in self.columns.items()}
+
+    @property
+    def items(self) -> list:
+        """IDs of all titles with at least one rating, in a stable order."""
+        return sorted(self.columns, key=str)
+
+    def similarities(self, item_id) -> dict:
+        """
+        Function returns the cosine similarity of a title to every title that shares a user with it.
+
+        Param item_id: ID of the title.
+        Return: A dictionary of similarities by ID of the other title.
+        """
+        dots = defaultdict(float)
+        for user_id, value in self.columns.get(item_id, {}).items():
+            for other_id, other_value in self.rows[user_id].items():
+                if other_id != item_id:
+                    dots[other_id] += value * other_value
+        norm = self.norms.get(item_id)
+        return {other_id: dot / (norm * self.norms[other_id]) for other_id, dot in dots.items() if dot > 0}
+
+    def neighbours(self, items: Iterable, k: int) -> dict:
+        """
+        Function returns the k most similar titles of every given title. Ties are broken by ID,
+        so rebuilds of the same ratings store the same neighbours.
+
+        Param items:Iterable: IDs of the titles.
+        Param k:int: Number of neighbours per title.
+        Return: A dictionary of lists of (neighbour ID, similarity) tuples, most similar first.
+        """
+        return {item_id: top_k(self.similarities(item_id).items(), k) for item_id in items}
+
+
+class MatrixItemSimilarity(ItemSimilarity):
+    """
+    Cosine similarity computed with sparse matrix products of SciPy. Columns of the user x title matrix are
+    normalized once, and the similarities of a chunk of titles are a single product of the chunk with the matrix.
+    Used for full rebuilds when NumPy and SciPy are installed.
+    """
+
+    def __init__(self, ratings: Iterable[tuple]):  # pylint: disable=super-init-not-called
+        import numpy  # pylint: disable=import-outside-toplevel
+        from scipy import sparse  # pylint: disable=import-outside-toplevel
+
+        ratings = list(ratings)
+        user_index, item_index = {}, {}
+        for user_id, item_id, _ in ratings:
+            user_index.setdefault(user_id, len(user_index))
+            item_index.setdefault(item_id, len(item_index))
+        self.item_ids = list(item_index)
+        self.item_index = item_index
+        matrix = sparse.csc_matrix(
+            (numpy.fromiter((value for _, _, value in ratings), dtype=numpy.float64, count=len(ratings)),
+             ([user_index[user_id] for user_id, _, _ in ratings], [item_index[item_id] for _, item_id, _ in ratings])),
+            shape=(len(user_index), len(item_index)))
+        norms = numpy.sqrt(numpy.asarray(matrix.multiply(matrix).sum(axis=0)).ravel())
+        norms[norms == 0] = 1.0
+        self.matrix = (matrix @ sparse.diags(1.0 / norms)).tocsc()
+
+    @property
+    def items(self) -> list:
+        """IDs of all titles with at least one rating, in a stable order."""
+        return sorted(self.item_ids, key=str)
+
+    def similarities(self, item_id) -> dict:
+        """
+        Function returns the cosine similarity of a title to every title that shares a user with it.
+
+        Param item_id: ID of the title.
+        Return: A dictionary of similarities by ID of the other title.
+        """
+        return dict(self.neighbours([item_id], None)[item_id])
+
+    def neighbours(self, items: Iterable, k: int) -> dict:
+        """
+        Function returns the k most similar titles of every given title, k of None returns all of them.
+
+        Param items:Iterable: IDs of the titles.
+        Param k:int: Number of neighbours per title.
+        Return: A dictionary of lists of (neighbour ID, similarity) tuples, most similar first.
+        """
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        items = list(items)
+        indexes = [self.item_index[item_id] for item_id in items]
+        block = (self.matrix[:, indexes].T @ self.matrix).tocsr()
+        result = {}
+        for row, (item_id, index) in enumerate(zip(items, indexes)):
+            start, end = block.indptr[row], block.indptr[row + 1]
+            columns, values = block.indices[start:end], block.data[start:end]
+            keep = (columns != index) & (values > 0)
+            columns, values = columns[keep], values[keep]
+            if k is not None and len(values) > k:
+                # Candidates at the k-th similarity are all kept, so ties are broken by ID as in ItemSimilarity.
+                threshold = numpy.partition(values, len(values) - k)[len(values) - k]
+                keep = values >= threshold
+                columns, values = columns[keep], values[keep]
+            pairs = ((self.item_ids[column], float(value)) for column, value in zip(columns, values))
+            result[item_id] = top_k(pairs, k)
+        return result
+
+
+def top_k(similarities: Iterable[tuple], k) -> list:
+    """
+    Function returns the k pairs with the highest similarity, ties broken by ID.
+
+    Param similarities:Iterable: Tuples of (ID, similarity).
+    Param k:int: Number of pairs, None for all of them.
+    Return: A list of (ID, similarity) tuples, most similar first.
+    """
+    def key(pair):
+        return -pair[1], str(pair[0])
+    if k is None:
+        return sorted(similarities, key=key)
+    return heapq.nsmallest(k, similarities, key=key)
+
+
+def matrix_backend_available() -> bool:
+    """
+    Function checks whether NumPy and SciPy are installed.
+
+    Return: True if the matrix backend can be used.
+    """
+    return all(importlib.util.find_spec(name) is not None for name in ("numpy", "scipy"))
+
+
+def create_similarity(ratings: Iterable[tuple], backend: str = "auto") -> ItemSimilarity:
+    """
+    Function creates the similarity model of the configured backend. With backend auto,
+    the matrix backend is used when NumPy and SciPy are installed, and the pure Python backend otherwise.
+
+    Param ratings:Iterable: Tuples of (user ID, title ID, rating).
+    Param backend:str: auto, matrix or python.
+    Return: ItemSimilarity.
+    """
+    if backend == "matrix" or (backend == "auto" and matrix_backend_available()):
+        return MatrixItemSimilarity(ratings)
+    return ItemSimilarity(ratings)
@@ -0,0 +1,312 @@
+"""Test Recommendations module"""
+import math
+
+import pytest
+
+from app.actors.models import Actor
+from app.directors.models import Director
+from app.genres.models import Genre
+from app.movies.models import Movie, MovieActor
+from app.recommendations.models import ItemNeighbour, MOVIES, SERIES
+from app.recommendations.repositories import ItemNeighbourRepository
+from app.recommendations.service import ItemSimilarity, RecommendationEngine, RecommendationUpdater, \
+    create_similarity, ContentSimilarity, SimilarTitlesEngine, SimilarTitlesRefresher, feature_vectors, tokenize
+from app.series.models import Series, Episode
+from app.tests import TestClass, TestingSessionLocal, QueryCounter, client
+from app.users.models import User
+from app.users.models.user import UserWatchMovie, UserWatchEpisode
+
+RATINGS = [("u1", "a", 5), ("u1", "b", 5), ("u2", "a", 4), ("u2", "b", 2), ("u2", "c", 4), ("u3", "c", 3),
+           ("u3", "d", 1)]
+TITLES = [("alien", "The crew of a spaceship fights a deadly alien creature", "scifi", "scott"),
+          ("aliens", "Marines fight deadly alien creatures on a colony", "scifi", "cameron"),
+          ("runner", "A detective hunts replicants in a rainy city", "scifi", "scott"),
+          ("notting", "A bookseller falls in love with an actress", "romance", "michell")]
+
+
+class TestItemSimilarity:
+    """Test cosine similarity of titles over sparse ratings."""
+
+    def test_cosine_similarity_of_co_rated_titles(self):
+        """
+        Function tests that similarities are cosines of rating columns, that only titles sharing a user
+        are compared, and that neighbours are ordered by similarity with ties broken by ID.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        similarity = ItemSimilarity(RATINGS)
+        assert similarity.items == ["a", "b", "c", "d"]
+        assert similarity.similarities("a") == pytest.approx({
+            "b": (25 + 8) / (math.sqrt(41) * math.sqrt(29)), "c": 16 / (math.sqrt(41) * 5)})
+        assert "a" not in similarity.similarities("d")
+        neighbours = similarity.neighbours(["c"], 2)["c"]
+        assert [item_id for item_id, _ in neighbours] == ["d", "a"]
+        assert ItemSimilarity([("u1", "x", 3), ("u1", "z", 3), ("u1", "y", 3)]).neighbours(["x"], 1) == \
+               {"x": [("y", pytest.approx(1.0))]}
+
+    def test_matrix_backend_matches_python_backend(self):
+        """
+        Function tests that the NumPy and SciPy backend stores the same neighbours as the pure Python backend.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        pytest.importorskip("scipy")
+        python = ItemSimilarity(RATINGS)
+        matrix = create_similarity(RATINGS, "matrix")
+        expected = python.neighbours(python.items, 2)
+        computed = matrix.neighbours(matrix.items, 2)
+        assert {item_id: [neighbour for neighbour, _ in pairs] for item_id, pairs in computed.items()} == \
+               {item_id: [neighbour for neighbour, _ in pairs] for item_id, pairs in expected.items()}
+
+
+class TestContentSimilarity:
+    """Test the feature matrix and cosine similarity of titles by content."""
+
+    def test_feature_vectors(self):
+        """
+        Function tests that terms of descriptions are weighted with TF-IDF, and that every group of features
+        of a title is normalized and scaled by its weight.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        assert tokenize("The crew of a SPACESHIP, the crew!") == ["crew", "spaceship", "crew"]
+        features = {(feature, item_id): weight for feature, item_id, weight in feature_vectors(TITLES, [])}
+        assert features["genre:scifi", "alien"] == pytest.approx(0.5)
+        assert features["director:scott", "runner"] == pytest.approx(0.5)
+        assert features["term:deadly", "alien"] < features["term:spaceship", "alien"]
+        text = [weight for (feature, item_id), weight in features.items()
+                if item_id == "alien" and feature.startswith("term:")]
+        assert math.sqrt(sum(weight * weight for weight in text)) == pytest.approx(1.0)
+        cast = feature_vectors(TITLES, [("alien", "weaver"), ("alien", "hurt")])
+        assert [weight for feature, _, weight in cast if feature.startswith("actor:")] == \
+               pytest.approx([0.75 / math.sqrt(2)] * 2)
+
+    def test_common_features_only_add_to_candidates(self):
+        """
+        Function tests that features held by more than max_feature_titles titles add to the similarity
+        of candidates, without making titles that share nothing else candidates.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        features = feature_vectors(TITLES, [("alien", "weaver"), ("aliens", "weaver")])
+        exact = ItemSimilarity(features)
+        pruned = ContentSimilarity(features, max_feature_titles=2)
+        assert [item_id for item_id, _ in exact.neighbours(["alien"], 3)["alien"]] == ["aliens", "runner"]
+        assert pruned.similarities("alien") == pytest.approx(exact.similarities("alien"))
+        assert set(exact.similarities("aliens")) == {"alien", "runner"}
+        assert pruned.similarities("aliens") == pytest.approx({"alien": exact.similarities("aliens")["alien"]})
+
+
+class TestRecommendationEngine(TestClass):
+    """Test rebuilding, updating and reading precomputed neighbours."""
+
+    @staticmethod
+    def create_ratings(db, ratings: list) -> tuple:
+        """
+        Function creates users and movies for (user, title, rating) tuples of RATINGS, and their watch records.
+
+        Param db: Database session.
+        Param ratings:list: Tuples of user name, movie title and rating.
+        Return: Dictionaries of user IDs by name and movie IDs by title.
+        """
+        users = {name: User(f"{name}@gmail.com", "123", name) for name in sorted({user for user, _, _ in ratings})}
+        movies = {title: Movie(title, "Description", "1994", None, None)
+                  for title in sorted({title for _, title, _ in ratings})}
+        db.add_all([*users.values(), *movies.values()])
+        db.commit()
+        db.add_all([UserWatchMovie(users[user].id, movies[title].id, rating) for user, title, rating in ratings])
+        db.commit()
+        return {name: user.id for name, user in users.items()}, {title: movie.id for title, movie in movies.items()}
+
+    @staticmethod
+    def stored_neighbours(kind: str = MOVIES) -> dict:
+        """
+        Function returns the stored neighbours of all titles of a kind.
+
+        Param kind:str: movies or series.
+        Return: A dictionary of lists of neighbour IDs, most similar first, by ID of the title.
+        """
+        with TestingSessionLocal() as db:
+            rows = db.query(ItemNeighbour).filter(ItemNeighbour.kind == kind).\
+                order_by(ItemNeighbour.item_id, ItemNeighbour.similarity.desc(), ItemNeighbour.neighbour_id).all()
+        neighbours = {}
+        for row in rows:
+            neighbours.setdefault(row.item_id, []).append(row.neighbour_id)
+        return neighbours
+
+    def test_rebuild_in_worker_processes(self):
+        """
+        Function tests that a rebuild split into chunks computed by worker processes stores the same
+        neighbours as a rebuild in the caller, and that recommendations are read with a single query,
+        leaving out movies the user already watched.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        with TestingSessionLocal() as db:
+            users, movies = self.create_ratings(db, RATINGS)
+        assert RecommendationEngine(TestingSessionLocal, neighbours=2, workers=0).rebuild(MOVIES) == 7
+        inline = self.stored_neighbours()
+        assert RecommendationEngine(TestingSessionLocal, neighbours=2, workers=2, chunk_size=1).rebuild(MOVIES) == 7
+        assert self.stored_neighbours() == inline
+        assert inline[movies["a"]] == [movies["b"], movies["c"]]
+
+        with TestingSessionLocal() as db:
+            with QueryCounter() as counter:
+                ranked = ItemNeighbourRepository(db, ItemNeighbour).read_recommendations(MOVIES, users["u1"], 10)
+        assert counter.count == 1
+        assert [item_id for item_id, _ in ranked] == [movies["c"]]
+
+    def test_incremental_update_matches_rebuild(self):
+        """
+        Function tests that after new ratings, an incremental update of the changed movies stores
+        the neighbours a full rebuild computes for them, and updates the neighbours of related movies.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        with TestingSessionLocal() as db:
+            users, movies = self.create_ratings(db, RATINGS)
+        engine = RecommendationEngine(TestingSessionLocal, neighbours=3, workers=0)
+        engine.rebuild(MOVIES)
+        assert movies["d"] not in self.stored_neighbours()[movies["a"]]
+
+        with TestingSessionLocal() as db:
+            db.add(UserWatchMovie(users["u1"], movies["d"], 5))
+            db.commit()
+        updater = RecommendationUpdater(engine)
+        updater.record(MOVIES, [movies["d"]])
+        assert updater.flush() == {MOVIES: 4}
+        assert updater.flush() == {}
+        updated = self.stored_neighbours()
+        engine.rebuild(MOVIES)
+        rebuilt = self.stored_neighbours()
+        assert updated[movies["d"]] == rebuilt[movies["d"]]
+        assert movies["d"] in updated[movies["a"]]
+        assert updated == rebuilt
+
+    def test_series_are_rated_by_their_episodes(self):
+        """
+        Function tests that series are compared by the average rating of the watched episodes,
+        with watched episodes without a rating counted in the middle of the scale.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        with TestingSessionLocal() as db:
+            user = User("viewer@gmail.com", "123", "viewer")
+            series = [Series(title, "2004", None, None) for title in ("Lost", "Dark")]
+            for obj in series:
+                obj.description = "Description"
+            db.add_all([user, *series])
+            db.commit()
+            episodes = [Episode(f"{obj.title} {i}", obj.id) for obj in series for i in range(2)]
+            for episode in episodes:
+                episode.description = "Description"
+            db.add_all(episodes)
+            db.commit()
+            db.add_all([UserWatchEpisode(user.id, episodes[0].id, 8), UserWatchEpisode(user.id, episodes[1].id, 4),
+                        UserWatchEpisode(user.id, episodes[2].id)])
+            db.commit()
+            ratings = sorted((value, item_id) for _, item_id, value in
+                             ItemNeighbourRepository(db, ItemNeighbour).read_ratings(SERIES))
+            assert [float(value) for value, _ in ratings] == [5.0, 6.0]
+            assert RecommendationEngine(TestingSessionLocal, neighbours=2, workers=0).rebuild(SERIES) == 2
+
+
+class TestSimilarTitles(TestClass):
+    """Test rebuilding, serving and refreshing similar titles by content."""
+
+    @pytest.fixture(autouse=True)
+    def test_database(self, monkeypatch):
+        """
+        Function serves and refreshes similar titles from the test database.
+
+        Param monkeypatch: Replace the session factory of the service and the refresher of catalogue changes.
+        Return: None.
+        """
+        self.engine = SimilarTitlesEngine(TestingSessionLocal, neighbours=3, workers=0)
+        self.refresher = SimilarTitlesRefresher(self.engine)
+        monkeypatch.setattr("app.recommendations.service.recommendation_services.SessionLocal", TestingSessionLocal)
+        monkeypatch.setattr("app.recommendations.service.recommendation_services.similar_titles_engine", self.engine)
+        monkeypatch.setattr("app.recommendations.service.similar_titles.similar_titles_refresher", self.refresher)
+
+    @staticmethod
+    def create_catalogue(db) -> dict:
+        """
+        Function creates the movies of TITLES with their genres and directors, and an actor of the first two.
+
+        Param db: Database session.
+        Return: A dictionary of movie IDs by title.
+        """
+        genres = {name: Genre(name) for name in ("scifi", "romance")}
+        directors = {name: Director(name, name, "USA") for name in ("scott", "cameron", "michell")}
+        actor = Actor("Sigourney", "Weaver", "1949-10-08", "USA")
+        db.add_all([*genres.values(), *directors.values(), actor])
+        db.commit()
+        movies = {title: Movie(title, description, "1986", directors[director].id, genres[genre].id)
+                  for title, description, genre, director in TITLES}
+        db.add_all(movies.values())
+        db.commit()
+        db.add_all([MovieActor(movies["alien"].id, actor.id), MovieActor(movies["aliens"].id, actor.id)])
+        db.commit()
+        return {title: movie.id for title, movie in movies.items()}
+
+    def test_similar_movies_are_cached_and_refreshed(self):
+        """
+        Function tests that similar movies are served in the order of similarity, that results are cached
+        per title, and that a change of a description invalidates them and schedules a rebuild
+        that picks up the change.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        with TestingSessionLocal() as db:
+            movies = self.create_catalogue(db)
+        self.refresher.flush()
+        response = client.get("/api/movies/similar", params={"title": "alien"})
+        assert response.status_code == 200, response.text
+        assert [movie["title"] for movie in response.json()] == ["aliens", "runner"]
+        assert client.get("/api/movies/similar", params={"title": "unknown"}).status_code == 404
+
+        with QueryCounter() as counter:
+            assert client.get("/api/movies/similar", params={"title": "alien"}).json() == response.json()
+        assert counter.count == 0
+
+        with TestingSessionLocal() as db:
+            movie = db.get(Movie, movies["notting"])
+            movie.description = "A bookseller falls in love with a deadly alien spaceship"
+            db.commit()
+        assert self.refresher.flush() == {MOVIES: 10}
+        titles = [movie["title"] for movie in client.get("/api/movies/similar", params={"title": "alien"}).json()]
+        assert titles == ["aliens", "runner", "notting"]
+        assert self.refresher.flush() == {}
+
+    def test_similar_series(self):
+        """
+        Function tests that similar series are rebuilt by the admin route and served by title.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        with TestingSessionLocal() as db:
+            genre, director = Genre("crime"), Director("Vince", "Gilligan", "USA")
+            db.add_all([genre, director])
+            db.commit()
+            series = [Series(title, "2008", director.id, genre.id)
+                      for title in ("Breaking Bad", "Better Call Saul", "Lost")]
+            for obj, description in zip(series, ("A chemistry teacher cooks drugs in Albuquerque",
+                                                 "A lawyer in Albuquerque defends drug dealers",
+                                                 "Survivors of a plane crash on an island")):
+                obj.description = description
+            db.add_all(series)
+            db.commit()
+        assert self.engine.rebuild(SERIES) == 6
+        response = client.get("/api/series/similar", params={"title": "Breaking Bad"})
+        assert response.status_code == 200, response.text
+        assert [obj["title"] for obj in response.json()] == ["Better Call Saul", "Lost"]
+        assert client.get("/api/series/similar", params={"title": "Dark"}).status_code == 404
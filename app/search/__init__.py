@@ -0,0 +1,3 @@
+from .trigram_index import TrigramIndex
+from .search_backend import SearchBackend, FullTextSearchBackend, TrigramSearchBackend, get_search_backend
+from .search_index import SEARCHABLE_FIELDS, search_ids, clear_search_indexes
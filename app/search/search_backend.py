@@ -0,0 +1,138 @@
+"""Search Backend module"""
+import re
+from threading import Lock
+from typing import Sequence
+
+from sqlalchemy.dialects.mysql import match
+
+from app.config import settings
+from app.search.trigram_index import TrigramIndex
+
+SEARCH_RESULTS_LIMIT = 100
+BOOLEAN_MODE_OPERATORS = re.compile(r"[+\-<>()~*\"@]+")
+
+
+def bind_key(db) -> tuple:
+    """
+    Function returns a key identifying the database a session is bound to,
+    the same for the sync and the async driver of one database.
+
+    Param db: Session.
+    Return: A tuple with backend name, host, port and database name.
+    """
+    url = db.get_bind().url
+    return url.get_backend_name(), url.host, url.port, url.database
+
+
+class SearchBackend:
+    """Base class for search backends. Backends return IDs of matching objects, best matches first."""
+
+    def search_ids(self, db, model, fields: Sequence[str], term: str, limit: int = SEARCH_RESULTS_LIMIT) -> list:
+        """
+        Function returns IDs of the objects whose fields match the term, best matches first.
+
+        Param db: Session.
+        Param model: Model class.
+        Param fields:Sequence[str]: Names of the searched columns.
+        Param term:str: Search term.
+        Param limit:int: Maximum number of results.
+        Return: A list of IDs.
+        """
+        raise NotImplementedError
+
+    def apply_changes(self, changes: list):
+        """
+        Function applies committed changes of searchable objects to the backend.
+
+        Param changes:list: Tuples of (bind key, model, fields, ID, text), text is None for deleted objects.
+        Return: None.
+        """
+
+    def clear(self):
+        """
+        Function drops all state kept by the backend.
+
+        Return: None.
+        """
+
+
+class FullTextSearchBackend(SearchBackend):
+    """Search backend using MySQL FULLTEXT indexes in boolean mode, every word is matched as a prefix."""
+
+    def search_ids(self, db, model, fields: Sequence[str], term: str, limit: int = SEARCH_RESULTS_LIMIT) -> list:
+        words = BOOLEAN_MODE_OPERATORS.sub(" ", term or "").split()
+        if not words:
+            return []
+        score = match(*[getattr(model, field) for field in fields], against=" ".join(f"{word}*" for word in words)) \
+            .in_boolean_mode()
+        rows = db.query(model.id).filter(score).order_by(score.desc()).limit(limit).all()
+        return [row.id for row in rows]
+
+
+class TrigramSearchBackend(SearchBackend):
+    """
+    Search backend using in-process trigram indexes, one per database, model and fields.
+    Index is built from the database on the first search and kept in sync with committed changes afterwards.
+    """
+
+    def __init__(self, min_similarity: float = 0.5):
+        self.min_similarity = min_similarity
+        self._lock = Lock()
+        self._indexes = {}
+
+    def get_index(self, db, model, fields: Sequence[str]) -> TrigramIndex:
+        """
+        Function returns the index for the given model and fields, building it on first use.
+
+        Param db: Session.
+        Param model: Model class.
+        Param fields:Sequence[str]: Names of the indexed columns.
+        Return: TrigramIndex.
+        """
+        key = (bind_key(db), model, tuple(fields))
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is None:
+                index = TrigramIndex(self.min_similarity)
+                rows = db.query(model.id, *[getattr(model, field) for field in fields]).all()
+                index.add_many((str(row[0]), " ".join(str(value) for value in row[1:] if value)) for row in rows)
+                self._indexes[key] = index
+            return index
+
+    def search_ids(self, db, model, fields: Sequence[str], term: str, limit: int = SEARCH_RESULTS_LIMIT) -> list:
+        return self.get_index(db, model, fields).search(term, limit)
+
+    def apply_changes(self, changes: list):
+        with self._lock:
+            for key, model, fields, doc_id, text in changes:
+                index = self._indexes.get((key, model, fields))
+                if index is None:
+                    continue
+                if text is None:
+                    index.remove(doc_id)
+                else:
+                    index.add(doc_id, text)
+
+    def clear(self):
+        with self._lock:
+            self._indexes.clear()
+
+
+fulltext_backend = FullTextSearchBackend()
+trigram_backend = TrigramSearchBackend(settings.SEARCH_MIN_SIMILARITY)
+SEARCH_BACKENDS = (fulltext_backend, trigram_backend)
+
+
+def get_search_backend(db) -> SearchBackend:
+    """
+    Function returns the search backend for the database of the session. With SEARCH_BACKEND set to auto,
+    MySQL databases use FULLTEXT indexes and all other databases the in-process trigram index.
+
+    Param db: Session.
+    Return: SearchBackend.
+    """
+    if settings.SEARCH_BACKEND == "fulltext":
+        return fulltext_backend
+    if settings.SEARCH_BACKEND == "trigram":
+        return trigram_backend
+    return fulltext_backend if db.get_bind().dialect.name == "mysql" else trigram_backend
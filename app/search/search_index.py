@@ -0,0 +1,84 @@
+"""Search Index module"""
+from typing import Sequence
+
+from sqlalchemy import DDL, event
+from sqlalchemy.orm import Session
+
+from app.actors.models import Actor
+from app.directors.models import Director
+from app.movies.models import Movie
+from app.search.search_backend import SEARCH_RESULTS_LIMIT, SEARCH_BACKENDS, bind_key, get_search_backend
+from app.series.models import Series, Episode
+
+SEARCHABLE_FIELDS = {
+    Movie: (("title",),),
+    Series: (("title",),),
+    Episode: (("name", "description"),),
+    Actor: (("first_name",), ("last_name",)),
+    Director: (("first_name",), ("last_name",)),
+}
+PENDING_CHANGES = "search_index_changes"
+
+
+def search_ids(db, model, fields: Sequence[str], term: str, limit: int = SEARCH_RESULTS_LIMIT) -> list:
+    """
+    Function returns IDs of the objects whose fields match the term, best matches first,
+    using the search backend configured for the database of the session.
+
+    Param db: Session.
+    Param model: Model class.
+    Param fields:Sequence[str]: Names of the searched columns, one of the SEARCHABLE_FIELDS of the model.
+    Param term:str: Search term.
+    Param limit:int: Maximum number of results.
+    Return: A list of IDs.
+    """
+    return get_search_backend(db).search_ids(db, model, tuple(fields), term, limit)
+
+
+def clear_search_indexes():
+    """
+    Function drops all in-process search indexes, they are rebuilt on the next search.
+
+    Return: None.
+    """
+    for backend in SEARCH_BACKENDS:
+        backend.clear()
+
+
+for _model, _field_groups in SEARCHABLE_FIELDS.items():
+    for _fields in _field_groups:
+        event.listen(_model.__table__, "after_create", DDL(
+            f"ALTER TABLE {_model.__tablename__} ADD FULLTEXT INDEX "
+            f"ft_{_model.__tablename__}_{'_'.join(_fields)} ({', '.join(_fields)})").execute_if(dialect="mysql"))
+
+
+@event.listens_for(Session, "after_flush")
+def _record_changes(session, _flush_context):
+    """Keeps searchable objects written in the flush, to be applied to search indexes after commit."""
+    changes = session.info.setdefault(PENDING_CHANGES, [])
+    key = None
+    for objects, deleted in ((session.new, False), (session.dirty, False), (session.deleted, True)):
+        for obj in objects:
+            field_groups = SEARCHABLE_FIELDS.get(type(obj))
+            if field_groups is None:
+                continue
+            key = key or bind_key(session)
+            for fields in field_groups:
+                text = None if deleted else " ".join(str(getattr(obj, field)) for field in fields
+                                                     if getattr(obj, field))
+                changes.append((key, type(obj), fields, str(obj.id), text))
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_changes(session):
+    """Applies changes of searchable objects to search indexes once they are committed."""
+    changes = session.info.pop(PENDING_CHANGES, None)
+    if changes:
+        for backend in SEARCH_BACKENDS:
+            backend.apply_changes(changes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session):
+    """Drops changes of searchable objects that were rolled back."""
+    session.info.pop(PENDING_CHANGES, None)
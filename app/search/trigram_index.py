@@ -0,0 +1,129 @@
+"""Trigram Index module"""
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from threading import RLock
+from typing import Iterable, Optional
+
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def normalize_words(text: Optional[str]) -> list:
+    """
+    Function lowercases the text, removes accents and splits it into words.
+
+    Param text:str: Text to split.
+    Return: A list of words.
+    """
+    if not text:
+        return []
+    text = unicodedata.normalize("NFKD", str(text)).encode("ascii", "ignore").decode().lower()
+    return WORD_PATTERN.findall(text)
+
+
+def word_trigrams(word: str, whole_word: bool = True) -> set:
+    """
+    Function returns the trigrams of a word, padded with two spaces in front so that prefixes weigh more.
+    Whole words are also padded at the end, query words are not, so a query matches any word it is a prefix of.
+
+    Param word:str: Normalized word.
+    Param whole_word:bool: Whether the word is complete.
+    Return: A set of trigrams.
+    """
+    padded = f"  {word} " if whole_word else f"  {word}"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """
+    In-process inverted index from trigrams to documents. A document matches a query when
+    at least min_similarity of the query trigrams occur in it, which tolerates typos and partial words.
+    """
+
+    def __init__(self, min_similarity: float = 0.5):
+        self.min_similarity = min_similarity
+        self._lock = RLock()
+        self._postings = defaultdict(set)
+        self._documents = {}
+
+    def __len__(self):
+        return len(self._documents)
+
+    def add(self, doc_id: str, text: Optional[str]):
+        """
+        Function adds a document to the index, replacing the previous version of it.
+
+        Param doc_id:str: ID of the document.
+        Param text:str: Searchable text of the document.
+        Return: None.
+        """
+        trigrams = set()
+        for word in normalize_words(text):
+            trigrams |= word_trigrams(word)
+        with self._lock:
+            self.remove(doc_id)
+            self._documents[doc_id] = (trigrams, len(text or ""))
+            for trigram in trigrams:
+                self._postings[trigram].add(doc_id)
+
+    def add_many(self, documents: Iterable):
+        """
+        Function adds (doc_id, text) pairs to the index.
+
+        Param documents:Iterable: Pairs of document ID and text.
+        Return: None.
+        """
+        for doc_id, text in documents:
+            self.add(doc_id, text)
+
+    def remove(self, doc_id: str):
+        """
+        Function removes a document from the index, if it is there.
+
+        Param doc_id:str: ID of the document.
+        Return: None.
+        """
+        with self._lock:
+            document = self._documents.pop(doc_id, None)
+            if document is None:
+                return
+            for trigram in document[0]:
+                postings = self._postings.get(trigram)
+                if postings is not None:
+                    postings.discard(doc_id)
+                    if not postings:
+                        del self._postings[trigram]
+
+    def search(self, term: str, limit: int = 100) -> list:
+        """
+        Function returns IDs of the documents matching the term, best matches first.
+        Documents are ranked by the share of query trigrams they contain, with a small bonus
+        for complete words, then by length of the text, so shorter, more exact matches come first.
+
+        Param term:str: Search term.
+        Param limit:int: Maximum number of results.
+        Return: A list of document IDs.
+        """
+        words = normalize_words(term)
+        query = set()
+        word_endings = set()
+        for word in words:
+            prefix = word_trigrams(word, whole_word=False)
+            query |= prefix
+            word_endings |= word_trigrams(word) - prefix
+        if not query:
+            return []
+        with self._lock:
+            matches = Counter()
+            for trigram in query:
+                matches.update(self._postings.get(trigram, ()))
+            ranked = []
+            for doc_id, count in matches.items():
+                similarity = count / len(query)
+                if similarity < self.min_similarity:
+                    continue
+                trigrams, length = self._documents[doc_id]
+                bonus = 0.1 * len(word_endings & trigrams) / len(word_endings)
+                ranked.append((-(similarity + bonus), length, doc_id))
+        ranked.sort()
+        return [doc_id for _, _, doc_id in ranked[:limit]]
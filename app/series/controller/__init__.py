@@ -1,2 +1,3 @@
 from .series_controller import SeriesController
 from .episode_controller import EpisodeController
+from .async_series_controller import AsyncSeriesController
@@ -0,0 +1,129 @@
+"""Async Series Controller module"""
+from typing import Optional
+
+from fastapi import HTTPException
+from starlette.responses import Response
+
+from app.base import AppException, sync_fallback
+from app.series.controller.series_controller import SeriesController
+from app.series.service import AsyncSeriesServices
+
+
+class AsyncSeriesController:
+    """Async controller for Series catalogue routes. Falls back to SeriesController when DB_ASYNC is disabled."""
+    @staticmethod
+    @sync_fallback(SeriesController.read_all_series)
+    async def read_all_series(page, cursor: Optional[str] = None):
+        """
+        Function returns a page of series in the database.
+
+        Param page: Specify the page of series to be returned
+        Param cursor:str: Cursor returned with the previous page, used instead of the page number.
+        Return: A list of series.
+        """
+        try:
+            series = await AsyncSeriesServices.read_all_series(page, cursor)
+            if not series:
+                return Response(content="End of query.", status_code=200)
+            return series
+        except AppException as exc:
+            raise HTTPException(status_code=exc.code, detail=exc.message) from exc
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+    @staticmethod
+    @sync_fallback(SeriesController.get_series_by_director_name)
+    async def get_series_by_director_name(director: str, page: int = 1):
+        """
+        Function is used to retrieve one page of series from a given director.
+
+        Param director:str: Filter the series by director name.
+        Param page:int: Page of the results.
+        Return: A list of series that match the director name.
+        """
+        try:
+            series = await AsyncSeriesServices.get_series_by_director_name(director, page)
+            if not series:
+                return Response(content=f"No Series from Director: {director}.", status_code=200)
+            return series
+        except AppException as exc:
+            raise HTTPException(status_code=exc.code, detail=exc.message) from exc
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+    @staticmethod
+    @sync_fallback(SeriesController.get_series_by_name)
+    async def get_series_by_name(series: str):
+        """
+        Function returns the series matching the given name.
+
+        Param series:str: Get the series by name.
+        Return: A list of series with the given name.
+        """
+        try:
+            result = await AsyncSeriesServices.get_series_by_name(series)
+            if not result:
+                return Response(content=f"No Series with name: {series}.", status_code=200)
+            return result
+        except AppException as exc:
+            raise HTTPException(status_code=exc.code, detail=exc.message) from exc
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+    @staticmethod
+    @sync_fallback(SeriesController.get_series_by_year)
+    async def get_series_by_year(year: int):
+        """
+        Function returns a list of series that were created in the given year.
+
+        Param year:int: Filter the series by a year.
+        Return: A list of series from a given year.
+        """
+        try:
+            series = await AsyncSeriesServices.get_series_by_year(year)
+            if not series:
+                return Response(content=f"No Series from year: {year}.", status_code=200)
+            return series
+        except AppException as exc:
+            raise HTTPException(status_code=exc.code, detail=exc.message) from exc
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+    @staticmethod
+    @sync_fallback(SeriesController.get_series_by_genre)
+    async def get_series_by_genre(genre: str, page: int = 1):
+        """
+        Function returns one page of series with the given genre.
+
+        Param genre:str: Filter the series by a genre.
+        Param page:int: Page of the results.
+        Return: A list of series that match the genre.
+        """
+        try:
+            series = await AsyncSeriesServices.get_series_by_genre(genre, page)
+            if not series:
+                return Response(content=f"No Series with genre: {genre}.", status_code=200)
+            return series
+        except AppException as exc:
+            raise HTTPException(status_code=exc.code, detail=exc.message) from exc
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+    @staticmethod
+    @sync_fallback(SeriesController.get_latest_features)
+    async def get_latest_features(date_limit: str):
+        """
+        Function returns a list of the latest series added to the database.
+
+        Param date_limit:str: Limit the number of series returned
+        Return: A list of the latest features.
+        """
+        try:
+            series = await AsyncSeriesServices.get_latest_features(date_limit)
+            if not series:
+                return Response(content="No series in latest list.", status_code=200)
+            return series
+        except AppException as exc:
+            raise HTTPException(status_code=exc.code, detail=exc.message) from exc
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
@@ -46,6 +46,21 @@ class EpisodeController:
         except Exception as exc:
             raise HTTPException(status_code=500, detail=str(exc)) from exc
 
+    @staticmethod
+    def search_episodes(term: str):
+        """
+        Function returns episodes whose name or description match the search term, best matches first.
+
+        Param term:str: Search term.
+        Return: A list of episodes.
+        """
+        try:
+            return EpisodeServices.search_episodes(term)
+        except AppException as exc:
+            raise HTTPException(status_code=exc.code, detail=exc.message) from exc
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
+
     @staticmethod
     def get_episode_by_id(episode_id: str):
         """
@@ -1,4 +1,6 @@
 """Series Controller module"""
+from typing import Optional
+
 from fastapi import HTTPException
 from starlette.responses import Response
 
@@ -37,17 +39,18 @@ class SeriesController:
             raise HTTPException(status_code=500, detail=str(exc)) from exc
 
     @staticmethod
-    def read_all_series(page):
+    def read_all_series(page, cursor: Optional[str] = None):
         """
         Function returns all series in the database.
         The function takes one argument, page, which is an integer that indicates what page of results to return.
         If no value is provided for this parameter, the default value of 1 will be used.
 
         Param page: Specify the page of series to be returned
+        Param cursor:str: Cursor returned with the previous page, used instead of the page number.
         Return: A list of all the series in the database.
         """
         try:
-            series = SeriesServices.read_all_series(page)
+            series = SeriesServices.read_all_series(page, cursor)
             if not series:
                 return Response(content="End of query.", status_code=200)
             return series
@@ -83,16 +86,17 @@ class SeriesController:
             raise HTTPException(status_code=500, detail=str(exc)) from exc
 
     @staticmethod
-    def get_series_by_director_name(director: str):
+    def get_series_by_director_name(director: str, page: int = 1):
         """
         Function is used to retrieve all series from a given director.
         It takes in the name of the director as an argument and returns a list of Series objects.
 
         Param director:str: Filter the series by director name.
+        Param page:int: Page of the results.
         Return: A list of series that match the director name.
         """
         try:
-            series = SeriesServices.get_series_by_director_name(director)
+            series = SeriesServices.get_series_by_director_name(director, page)
             if not series:
                 return Response(content=f"No Series from Director: {director}.", status_code=200)
             return series
@@ -194,16 +198,17 @@ class SeriesController:
             raise HTTPException(status_code=500, detail=str(exc)) from exc
 
     @staticmethod
-    def get_series_by_genre(genre: str):
+    def get_series_by_genre(genre: str, page: int = 1):
         """
         Function takes a genre as an argument and returns all series with that genre.
         If no series are found, it returns a message saying so.
 
         Param genre:str: Filter the series by a genre.
+        Param page:int: Page of the results.
         Return: A list of series that match the genre.
         """
         try:
-            series = SeriesServices.get_series_by_genre(genre)
+            series = SeriesServices.get_series_by_genre(genre, page)
             if not series:
                 return Response(content=f"No Series with genre: {genre}.", status_code=200)
             return series
@@ -1,23 +1,22 @@
 """Episode Model module"""
-from uuid import uuid4
-
-from sqlalchemy import Column, String, ForeignKey
+from sqlalchemy import Column, String, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
-from app.db import Base
+from app.db import Base, UUIDKey, new_id
 from app.utils import generate_fake_url
 
 
 class Episode(Base):
     """Base Episode model"""
     __tablename__ = "episodes"
-    id = Column(String(50), primary_key=True, default=uuid4)
+    __table_args__ = (Index("ix_episodes_series_id_name", "series_id", "name"),)
+    id = Column(UUIDKey(), primary_key=True, default=new_id)
     name = Column(String(50), nullable=False)
     description = Column(String(500), nullable=False)
     link = Column(String(100), nullable=False, default=generate_fake_url)
-    series_id = Column(String(50), ForeignKey("series.id"))
+    series_id = Column(UUIDKey(), ForeignKey("series.id"))
 
-    users = relationship('User', secondary="user_watch_episodes", back_populates='watched_episodes', lazy='subquery')
+    users = relationship('User', secondary="user_watch_episodes", back_populates='watched_episodes')
 
     def __init__(self, name: str, series_id: str):
         self.name = name
@@ -1,19 +1,19 @@
 """Series Model module"""
-from uuid import uuid4
 from datetime import date
 
-from sqlalchemy import Column, String, Date, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, String, Date, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 
-from app.db import Base
+from app.db import Base, UUIDKey, new_id
 
 
 class SeriesActor(Base):
     """Base Series-Actor model"""
     __tablename__ = "series_actors"
-    id = Column(String(50), primary_key=True, default=uuid4)
-    series_id = Column(String(50), ForeignKey('series.id'))
-    actor_id = Column(String(50), ForeignKey('actors.id'))
+    __table_args__ = (Index("ix_series_actors_series_id_actor_id", "series_id", "actor_id"),)
+    id = Column(UUIDKey(), primary_key=True, default=new_id)
+    series_id = Column(UUIDKey(), ForeignKey('series.id'))
+    actor_id = Column(UUIDKey(), ForeignKey('actors.id'), index=True)
 
     def __init__(self, series_id: str, actor_id: str):
         self.series_id = series_id
@@ -23,17 +23,18 @@ class SeriesActor(Base):
 class Series(Base):
     """Base Series model"""
     __tablename__ = "series"
-    __table_args__ = (UniqueConstraint("title", "director_id", name="same_director_different_title"),)
+    __table_args__ = (UniqueConstraint("title", "director_id", name="same_director_different_title"),
+                      Index("ix_series_date_added_id", "date_added", "id"))
 
-    id = Column(String(50), primary_key=True, default=uuid4)
+    id = Column(UUIDKey(), primary_key=True, default=new_id)
     title = Column(String(100), nullable=False)
     description = Column(String(500), nullable=False)
-    date_added = Column(Date(), default=date.today())
-    year_published = Column(String(5), nullable=False)
-    director_id = Column(String(50), ForeignKey("directors.id"))
-    genre_id = Column(String(50), ForeignKey("genres.id"))
+    date_added = Column(Date(), nullable=False, default=date.today())
+    year_published = Column(String(5), nullable=False, index=True)
+    director_id = Column(UUIDKey(), ForeignKey("directors.id"), index=True)
+    genre_id = Column(UUIDKey(), ForeignKey("genres.id"), index=True)
 
-    actors = relationship("Actor", secondary="series_actors", back_populates='series', lazy='subquery')
+    actors = relationship("Actor", secondary="series_actors", back_populates='series')
     episodes = relationship("Episode", cascade="all,delete", backref="series")
 
     def __init__(
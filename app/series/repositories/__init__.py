@@ -1,3 +1,4 @@
 from .series_repository import SeriesRepository
 from .episode_repository import EpisodeRepository
 from .series_actor_repository import SeriesActorRepository
+from .async_series_repository import AsyncSeriesRepository
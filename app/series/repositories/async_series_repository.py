@@ -0,0 +1,91 @@
+"""Async Series Repository module"""
+from app.base import AsyncBaseCRUDRepository
+from app.config import settings
+from app.directors.models import Director
+from app.genres.models import Genre
+from app.search import search_ids
+from app.series.models import Series
+
+PER_PAGE = settings.PER_PAGE
+
+
+class AsyncSeriesRepository(AsyncBaseCRUDRepository):
+    """Async repository for Series Model, covering the catalogue reads of SeriesRepository."""
+
+    async def read_series_by_director_name(self, last_name: str, page: int = 1):
+        """
+        Function returns one page of series from directors with the given last name.
+
+        Param last_name:str: Last name of the director.
+        Param page:int: Page of the results.
+        Return: A list of series objects.
+        """
+        try:
+            skip = (page - 1) * PER_PAGE
+            statement = self.base_select().join(Director, Series.director_id == Director.id) \
+                .filter(Director.last_name == last_name).order_by(Series.title).offset(skip).limit(PER_PAGE)
+            return await self.scalars(statement)
+        except Exception as exc:
+            await self.db.rollback()
+            raise exc
+
+    async def read_series_by_genre_name(self, name: str, page: int = 1):
+        """
+        Function returns one page of series with the given genre.
+
+        Param name:str: Name of the genre.
+        Param page:int: Page of the results.
+        Return: A list of series objects.
+        """
+        try:
+            skip = (page - 1) * PER_PAGE
+            statement = self.base_select().join(Genre, Series.genre_id == Genre.id) \
+                .filter(Genre.name == name).order_by(Series.title).offset(skip).limit(PER_PAGE)
+            return await self.scalars(statement)
+        except Exception as exc:
+            await self.db.rollback()
+            raise exc
+
+    async def read_series_by_title(self, title: str, search: bool = False):
+        """
+        Function accepts a title as an argument and returns the Series object with that title.
+        If no such series exists, it returns None.
+
+        Param title:str: Search for a series by title.
+        Param search:bool=False: Indicate whether the title is a search term or not.
+        Return: A list of all the series that match the title.
+        """
+        try:
+            if search:
+                return await self.read_by_ids(await self.db.run_sync(search_ids, Series, ("title",), title))
+            result = await self.db.execute(self.base_select().filter(Series.title == title))
+            return result.scalars().first()
+        except Exception as exc:
+            await self.db.rollback()
+            raise exc
+
+    async def read_series_by_year(self, year):
+        """
+        Function accepts a year as an argument and returns all the series published in that year.
+
+        Param year: Filter the series by a year published.
+        Return: A list of all the series published in a given year.
+        """
+        try:
+            return await self.scalars(self.base_select().filter(Series.year_published == year))
+        except Exception as exc:
+            await self.db.rollback()
+            raise exc
+
+    async def read_latest_releases(self, date_limit: str):
+        """
+        Function returns a list of all the series that were added to the database after the date limit.
+
+        Param date_limit:str: Filter the query to only return series that were added after the specified date.
+        Return: A list of series objects.
+        """
+        try:
+            return await self.scalars(self.base_select().filter(Series.date_added >= date_limit))
+        except Exception as exc:
+            await self.db.rollback()
+            raise exc
@@ -1,6 +1,8 @@
 """Episode Repository module"""
 from app.base import BaseCRUDRepository
-from app.series.models import Episode
+from app.base.base_repository import IN_CLAUSE_CHUNK_SIZE
+from app.search import search_ids
+from app.series.models import Episode, Series
 
 
 class EpisodeRepository(BaseCRUDRepository):
@@ -16,7 +18,7 @@ class EpisodeRepository(BaseCRUDRepository):
         return: A list of episodes that are associated with the series_id passed into the function.
         """
         try:
-            episodes = self.db.query(Episode).filter(Episode.series_id == series_id).order_by(Episode.name).all()
+            episodes = self.base_query().filter(Episode.series_id == series_id).order_by(Episode.name).all()
             return episodes
         except Exception as exc:
             self.db.rollback()
@@ -33,8 +35,45 @@ class EpisodeRepository(BaseCRUDRepository):
         Return: The episode object if a row is found in the database with the given name and series_id.
         """
         try:
-            episode = self.db.query(Episode).filter(Episode.name == name).filter(Episode.series_id == series_id).first()
+            episode = self.base_query().filter(Episode.name == name).filter(Episode.series_id == series_id).first()
             return episode
         except Exception as exc:
             self.db.rollback()
             raise exc
+
+    def read_by_episode_names_and_series_titles(self, pairs: list) -> dict:
+        """
+        Function returns episodes by their name and the title of their series, fetched with one
+        query per chunk of pairs. If several series share a title, the first episode found is returned.
+
+        Param pairs:list: Tuples of the series title and the episode name.
+        Return: A dictionary of episodes by (series title, episode name), pairs that do not exist are left out.
+        """
+        try:
+            pairs = list(dict.fromkeys(pairs))
+            episodes = {}
+            for start in range(0, len(pairs), IN_CLAUSE_CHUNK_SIZE):
+                chunk = pairs[start:start + IN_CLAUSE_CHUNK_SIZE]
+                rows = self.db.query(Series.title, Episode).join(Series, Episode.series_id == Series.id).\
+                    filter(Series.title.in_({title for title, _ in chunk}),
+                           Episode.name.in_({name for _, name in chunk})).all()
+                for title, episode in rows:
+                    episodes.setdefault((title, episode.name), episode)
+            return {pair: episodes[pair] for pair in pairs if pair in episodes}
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
+
+    def search_episodes(self, term: str):
+        """
+        Function returns episodes whose name or description match the search term,
+        best matches first. Partial words and small typos are matched as well.
+
+        Param term:str: Search term.
+        Return: A list of episodes.
+        """
+        try:
+            return self.read_by_ids(search_ids(self.db, Episode, ("name", "description"), term))
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
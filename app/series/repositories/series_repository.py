@@ -1,8 +1,13 @@
 """Series Repository module"""
+from typing import Optional
+
 from sqlalchemy import distinct
 
 from app.base import BaseCRUDRepository
 from app.config import settings
+from app.directors.models import Director
+from app.genres.models import Genre
+from app.search import search_ids
 from app.series.models import Series, Episode
 from app.users.models.user import UserWatchEpisode
 
@@ -20,7 +25,7 @@ class SeriesRepository(BaseCRUDRepository):
         Return: A list of series objects that match the genre_id passed to it.
         """
         try:
-            series = self.db.query(Series).filter(Series.genre_id == genre_id).all()
+            series = self.base_query().filter(Series.genre_id == genre_id).all()
             return series
         except Exception as exc:
             self.db.rollback()
@@ -36,7 +41,43 @@ class SeriesRepository(BaseCRUDRepository):
         Return: A list of series objects.
         """
         try:
-            series = self.db.query(Series).filter(Series.director_id == director_id).all()
+            series = self.base_query().filter(Series.director_id == director_id).all()
+            return series
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
+
+    def read_series_by_director_name(self, last_name: str, page: int = 1):
+        """
+        Function returns one page of series from directors with the given last name.
+        Director is joined by name, so only the requested page of series is loaded.
+
+        Param last_name:str: Last name of the director.
+        Param page:int: Page of the results.
+        Return: A list of series objects.
+        """
+        try:
+            skip = (page - 1) * PER_PAGE
+            series = self.base_query().join(Director, Series.director_id == Director.id) \
+                .filter(Director.last_name == last_name).order_by(Series.title).offset(skip).limit(PER_PAGE).all()
+            return series
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
+
+    def read_series_by_genre_name(self, name: str, page: int = 1):
+        """
+        Function returns one page of series with the given genre.
+        Genre is joined by name, so only the requested page of series is loaded.
+
+        Param name:str: Name of the genre.
+        Param page:int: Page of the results.
+        Return: A list of series objects.
+        """
+        try:
+            skip = (page - 1) * PER_PAGE
+            series = self.base_query().join(Genre, Series.genre_id == Genre.id) \
+                .filter(Genre.name == name).order_by(Series.title).offset(skip).limit(PER_PAGE).all()
             return series
         except Exception as exc:
             self.db.rollback()
@@ -53,9 +94,9 @@ class SeriesRepository(BaseCRUDRepository):
         """
         try:
             if search:
-                series = self.db.query(Series).filter(Series.title.ilike(f"%{title}%")).all()
+                series = self.read_by_ids(search_ids(self.db, Series, ("title",), title))
             else:
-                series = self.db.query(Series).filter(Series.title == title).first()
+                series = self.base_query().filter(Series.title == title).first()
             return series
         except Exception as exc:
             self.db.rollback()
@@ -69,7 +110,7 @@ class SeriesRepository(BaseCRUDRepository):
         Return: A list of all the series published in a given year.
         """
         try:
-            series = self.db.query(Series).filter(Series.year_published == year).all()
+            series = self.base_query().filter(Series.year_published == year).all()
             return series
         except Exception as exc:
             self.db.rollback()
@@ -84,7 +125,7 @@ class SeriesRepository(BaseCRUDRepository):
         Return: The series object that is associated with the episode_id.
         """
         try:
-            series = self.db.query(Series).join(Episode).filter(Episode.id == episode_id).first()
+            series = self.base_query().join(Episode).filter(Episode.id == episode_id).first()
             return series
         except Exception as exc:
             self.db.rollback()
@@ -100,7 +141,7 @@ class SeriesRepository(BaseCRUDRepository):
         Return: A list of series objects that have been added to the database since date-limit.
         """
         try:
-            series = self.db.query(Series).filter(Series.date_added >= date_limit).all()
+            series = self.base_query().filter(Series.date_added >= date_limit).all()
             return series
         except Exception as exc:
             self.db.rollback()
@@ -126,21 +167,16 @@ class SeriesRepository(BaseCRUDRepository):
             self.db.rollback()
             raise exc
 
-    def read_series_by_group_of_genres(self, page, genres):
+    def read_series_by_group_of_genres(self, page, genres, cursor: Optional[str] = None):
         """
         Function takes in a page number and a list of genre IDS. It then queries the database
-        for all series that have one of those genres, skipping PER_PAGE * (page—1)
-        results and returning PER_PAGE results. If there are no movies with any of the
-        genres passed in, it returns an empty list.
+        for all series that have one of those genres and returns one page of them.
+        When a cursor is given, the page after the cursor is returned.
 
         Param page: Determine, which page of the results should be returned
-        Param genres: Filter the movies by a genre
-        Return: A list of series that match the genres specified in the genres' parameter.
+        Param genres: Filter the series by a genre
+        Param cursor:str: Cursor returned with the previous page.
+        Return: A page of series that match the genres specified in the genres' parameter.
         """
-        try:
-            skip = (page - 1) * PER_PAGE
-            movies = self.db.query(Series).filter(Series.genre_id.in_(genres)).offset(skip).limit(PER_PAGE).all()
-            return movies
-        except Exception as exc:
-            self.db.rollback()
-            raise exc
+        query = self.base_query().filter(Series.genre_id.in_(genres))
+        return self.read_page(page=page, cursor=cursor, limit=PER_PAGE, query=query)
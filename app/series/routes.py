@@ -1,7 +1,12 @@
-from fastapi import APIRouter, Depends, status, HTTPException, Body
+from typing import Optional
+
+from fastapi import APIRouter, Depends, status, HTTPException, Body, Response
 from starlette.requests import Request
 
-from app.series.controller import SeriesController, EpisodeController
+from app.base import set_next_cursor
+from app.db import QueryBudget
+from app.recommendations.controller import RecommendationController
+from app.series.controller import SeriesController, EpisodeController, AsyncSeriesController
 from app.series.controller.series_actor_controller import SeriesActorController
 from app.series.schemas import *
 from app.users.controller import JWTBearer
@@ -33,16 +38,33 @@ def create_new_series(series: SeriesSchemaIn):
 @series_router.get("/",
                    response_model=list[SeriesWithActorsSchema]
                    )
-def get_all_series(page: int = 1):
+async def get_all_series(response: Response, page: int = 1, cursor: Optional[str] = None):
     """
     Function returns a list of all series in the database.
     It takes an optional parameter, page, which defaults to 1.
     The get_all_series function returns a list of all series in the database.
 
     Param page:int=1: Define the page number of the series that will be returned.
+    Param cursor:str: Cursor from the X-Next-Cursor header of the previous response, used instead of the page.
     Return: A list of series objects.
     """
-    return SeriesController.read_all_series(page)
+    series = await AsyncSeriesController.read_all_series(page, cursor)
+    return set_next_cursor(response, series)
+
+
+@series_router.get("/similar",
+                   response_model=list[SeriesSchema],
+                   summary="Search Series similar to a Series."
+                   )
+def get_similar_series(title: str):
+    """
+    Function returns the series most similar to a series by its description, genre, director and cast,
+    precomputed for every series and cached per title.
+
+    Param title:str: Title of the series.
+    Return: A list of series, most similar first.
+    """
+    return RecommendationController.get_similar_series(title)
 
 
 @series_router.get("/get-series/id",
@@ -124,6 +146,18 @@ def get_all_episodes_for_series(series_title: str):
     return episodes
 
 
+@episode_router.get("/search-episodes", response_model=list[EpisodeSchema])
+def search_episodes(term: str):
+    """
+    The search_episodes function returns episodes whose name or description match the search term,
+    best matches first. Partial words and small typos are matched as well.
+
+    Param term:str: Search term.
+    Return: A list of episodes.
+    """
+    return EpisodeController.search_episodes(term)
+
+
 @episode_router.get("/get-episode/id",
                     summary="Get episode by ID. Admin Route",
                     response_model=EpisodeSchema,
@@ -217,15 +251,15 @@ watch_episode = APIRouter(prefix="/api/watch_episode", tags=["Watch Episode"])
 def user_watch_episode(request: Request, episode_name: str = Body(embed=True), series_title: str = Body(embed=True)):
     """
     The user_watch_episode function is used to add a user's watch history to the database.
-    It takes in a request, episode name and series title as parameters. It then checks if the user_id cookie exists,
-    and if it does it add that information into the database.
+    It takes in a request, episode name and series title as parameters. It then takes the user_id from the token
+    principal and adds that information into the database.
 
-    Param request:Request: Get the user_id from the cookies.
+    Param request:Request: Get the user_id from the principal of the token.
     Param episode_name:str: Get the name of the episode that is being watched.
     Param series_title:str: Get the series title of the episode.
     Return: A response object.
     """
-    user_id = request.cookies.get("user_id")
+    user_id = request.state.principal.profile_id
     return UserWatchEpisodeController.user_watch_episode(user_id, episode_name, series_title)
 
 
@@ -245,7 +279,7 @@ def user_rate_episode(request: Request,
     and what rating they want to give it.
     It returns whether their rating was successful.
 
-    Param request:Request: Get the user_id from the cookie
+    Param request:Request: Get the user_id from the principal of the token.
     Param episode_name:str: Get the name of the episode that is being rated
     Param series_title:str: Get the series_id from the database and then pass it to user_rate_episode
     Param rating:int: Specify the rating of the episode
@@ -253,7 +287,7 @@ def user_rate_episode(request: Request,
     """
     if not 0 < rating <= 10:
         raise HTTPException(status_code=400, detail="Rating must be between 1 and 10.")
-    user_id = request.cookies.get("user_id")
+    user_id = request.state.principal.profile_id
     return UserWatchEpisodeController.user_rate_episode(user_id, episode_name, series_title, rating)
 
 
@@ -264,14 +298,14 @@ def user_rate_episode(request: Request,
 def get_my_series(request: Request):
     """
     Function returns a list of all the series that belong to the user.
-    The function takes in a request object as an argument and uses the cookies to get
+    The function takes in a request object as an argument and uses the token principal to get
     the user_id. The function then calls SeriesController's get_my_series method, which
     returns a list of all series belonging to that user.
 
-    Param request:Request: Get the user_id from the cookie
+    Param request:Request: Get the user_id from the principal of the token.
     Return: A list of all the series that have been created by the user.
     """
-    user_id = request.cookies.get("user_id")
+    user_id = request.state.principal.profile_id
     return SeriesController.get_my_series(user_id)
 
 
@@ -295,7 +329,7 @@ def get_series_data(title: str):
                    summary="Get Series by specific year. User Route.",
                    dependencies=[Depends(JWTBearer(["regular_user", "sub_user"]))]
                    )
-def get_series_by_year(year: int):
+async def get_series_by_year(year: int):
     """
     Function returns a list of series that were first aired in the provided year.
     If no series were first aired in the provided year, an empty list is returned.
@@ -305,13 +339,13 @@ def get_series_by_year(year: int):
     """
     if not 1900 < year < 2100:
         raise HTTPException(status_code=200, detail="Sorry, we have no series from provided year.")
-    return SeriesController.get_series_by_year(year)
+    return await AsyncSeriesController.get_series_by_year(year)
 
 
 @watch_episode.get("/search-series/name",
                    response_model=list[SeriesWithActorsSchema]
                    )
-def search_series_by_name(series: str):
+async def search_series_by_name(series: str):
     """
     Function searches for a series by name and returns the Series object.
     The search_series_by_name function accepts one argument, series,
@@ -321,34 +355,36 @@ def search_series_by_name(series: str):
     Param series:str: Specify the name of the series that is being searched for.
     Return: A list of series objects that match the search criteria.
     """
-    return SeriesController.get_series_by_name(series.strip())
+    return await AsyncSeriesController.get_series_by_name(series.strip())
 
 
 @watch_episode.get("/search-series/genre",
                    response_model=list[SeriesWithActorsSchema]
                    )
-def search_series_by_genre(genre: str):
+async def search_series_by_genre(genre: str, page: int = 1):
     """
     Function takes a string as an argument and returns all series that have the genre
     specified by the string.
 
     Param genre:str: Search for series by a genre
+    Param page:int=1: Indicate the page number of the series to be retrieved
     Return: A list of series that match the genre.
     """
-    return SeriesController.get_series_by_genre(genre.strip())
+    return await AsyncSeriesController.get_series_by_genre(genre.strip(), page)
 
 
 @watch_episode.get("/search-series/director", summary="Search Series by Director's Last Name.")
-def get_series_by_director_name(director: str):
+async def get_series_by_director_name(director: str, page: int = 1):
     """
     Function takes a director name as an argument and returns all the series that have
     that director. The function first strips any whitespace from the inputted string, then checks if it is empty.
     If it is empty, an error message will be returned to the user.
 
     Param director:str: Specify the name of the director.
+    Param page:int=1: Indicate the page number of the series to be retrieved
     Return: A list of series objects.
     """
-    return SeriesController.get_series_by_director_name(director.strip())
+    return await AsyncSeriesController.get_series_by_director_name(director.strip(), page)
 
 
 @watch_episode.get("/get-average-rating-for-series",
@@ -382,16 +418,20 @@ def get_average_series_rating_for_year(year: int):
     return UserWatchEpisodeController.get_average_series_rating_for_year(year)
 
 
-@watch_episode.get("/get-popular-series", description="Get most popular Series.")
-def get_most_popular_series():
+@watch_episode.get("/get-popular-series",
+                   description="Get most popular Series.",
+                   dependencies=[Depends(QueryBudget(2))]
+                   )
+def get_most_popular_series(window: str = "all"):
     """
-    The get_most_popular_series function returns a dictionary of the most popular series in the database.
-    The function sorts the series by number of views and returns a dictionary with each key being a
-    series name and its value being how many times it has been viewed.
+    The get_most_popular_series function returns a dictionary of the ten most popular series of a time window,
+    like 24h or 7d. The function sorts the series by their views, decayed with a half-life of the window,
+    and returns a dictionary with each key being a series name and its value being its score.
 
-    Return: A sorted dictionary of series, and their number of views.
+    Param window:str: Time window, all by default.
+    Return: A sorted dictionary of series, and their scores.
     """
-    series = UserWatchEpisodeController.get_most_popular_series()
+    series = UserWatchEpisodeController.get_most_popular_series(window)
     sorted_series = {k: {"Views": v} for k, v in sorted(series.items(), key=lambda item: item[1], reverse=True)}
     return sorted_series
 
@@ -422,7 +462,7 @@ def get_worst_rated_episodes():
 @watch_episode.get("/get-latest-features",
                    summary="Get latest features."
                    )
-def get_latest_features():
+async def get_latest_features():
     """
     Function returns a list of the latest features that have been added to the database.
     The function takes no arguments and returns a list of dictionaries,
@@ -431,7 +471,7 @@ def get_latest_features():
     Return: A series object containing the latest features.
     """
     date_limit = get_day_before_one_month()
-    return SeriesController.get_latest_features(date_limit)
+    return await AsyncSeriesController.get_latest_features(date_limit)
 
 
 @watch_episode.get("/show-series-never-downloaded",
@@ -452,16 +492,19 @@ def show_least_popular_series():
                    summary="Show Users recommendations. User Route.",
                    dependencies=[Depends(JWTBearer(["regular_user", "sub_user"]))]
                    )
-def get_users_series_recommendations(request: Request, page: int = 1):
+def get_users_series_recommendations(request: Request, response: Response, page: int = 1,
+                                     cursor: Optional[str] = None):
     """
     Function is used to get the recommendations for a specific user.
     It takes in a request and page number than parameters, and returns an array of
     dictionaries containing the series IDS, titles
     and images of all recommended series.
 
-    Param request:Request: Get the user_id from the cookies.
+    Param request:Request: Get the user_id from the principal of the token.
     Param page:int=1: Specify the page number to be returned.
+    Param cursor:str: Cursor from the X-Next-Cursor header of the previous response, used instead of the page.
     Return: A list of recommendations for the user.
     """
-    user_id = request.cookies.get("user_id")
-    return UserWatchEpisodeController.get_users_recommendations(user_id, page)
+    user_id = request.state.principal.profile_id
+    series = UserWatchEpisodeController.get_users_recommendations(user_id, page, cursor)
+    return set_next_cursor(response, series)
@@ -1,10 +1,12 @@
 """Episode schemas module"""
-from pydantic import BaseModel, UUID4
+from uuid import UUID
+
+from pydantic import BaseModel
 
 
 class EpisodeSchema(BaseModel):
     """Base Episode schema"""
-    id: UUID4
+    id: UUID
     name: str
     description: str
     link: str
@@ -1,6 +1,8 @@
 """Series Schemas module"""
 from datetime import date
-from pydantic import BaseModel, UUID4
+from uuid import UUID
+
+from pydantic import BaseModel
 
 from app.actors.schemas import ActorSchema
 from app.directors.schemas import DirectorSchema
@@ -9,7 +11,7 @@ from app.genres.schemas import GenreSchema
 
 class SeriesSchema(BaseModel):
     """Base Series Schema"""
-    id: UUID4
+    id: UUID
     title: str
     description: str
     date_added: date
@@ -46,7 +48,7 @@ class SeriesSchemaIn(BaseModel):
 
 class SeriesWithActorsSchema(BaseModel):
     """Base Series Schema with Actors"""
-    id: UUID4
+    id: UUID
     title: str
     description: str
     date_added: date
@@ -60,7 +62,7 @@ class SeriesWithActorsSchema(BaseModel):
 
 class SeriesWithDirectorAndGenreSchema(BaseModel):
     """Base Series Schema with Genres and Directors"""
-    id: UUID4
+    id: UUID
     title: str
     description: str
     date_added: date
@@ -75,7 +77,7 @@ class SeriesWithDirectorAndGenreSchema(BaseModel):
 
 class SeriesFullSchema(BaseModel):
     """Full Series Schema"""
-    id: UUID4
+    id: UUID
     title: str
     description: str
     date_added: date
@@ -1,3 +1,4 @@
 from .series_services import SeriesServices
 from .episode_services import EpisodeServices
 from .series_actor_service import SeriesActorService
+from .async_series_services import AsyncSeriesServices
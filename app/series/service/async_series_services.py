@@ -0,0 +1,126 @@
+"""Async Series Service module"""
+from typing import Optional
+
+from app.base import AsyncBaseCRUDRepository
+from app.config import settings
+from app.db import AsyncSessionLocal
+from app.directors.exceptions.director_exceptions import NonExistingDirectorException
+from app.directors.models import Director
+from app.genres.exceptions.genre_exceptions import NonExistingGenreException
+from app.genres.models import Genre
+from app.series.models import Series
+from app.series.repositories import AsyncSeriesRepository
+from app.series.service.series_services import SERIES_WITH_ACTORS
+
+PER_PAGE = settings.PER_PAGE
+
+
+class AsyncSeriesServices:
+    """Async service for Series catalogue routes"""
+    @staticmethod
+    async def read_all_series(page, cursor: Optional[str] = None):
+        """
+        Function returns a page of series from the database.
+
+        Param page: Determine, which page of results to return.
+        Param cursor:str: Cursor returned with the previous page, used instead of the page number.
+        Return: A page of series objects.
+        """
+        try:
+            async with AsyncSessionLocal() as db:
+                repository = AsyncSeriesRepository(db, Series, SERIES_WITH_ACTORS)
+                return await repository.read_page(page=page, cursor=cursor, limit=PER_PAGE)
+        except Exception as exc:
+            raise exc
+
+    @staticmethod
+    async def get_series_by_director_name(director: str, page: int = 1):
+        """
+        Function returns one page of series directed by the given director.
+        If no such director exists, it raises NonExistingDirectorException.
+
+        Param director:str: Last name of the director.
+        Param page:int: Page of the results.
+        Return: A list of series objects.
+        """
+        try:
+            async with AsyncSessionLocal() as db:
+                series_repo = AsyncSeriesRepository(db, Series)
+                series = await series_repo.read_series_by_director_name(director, page)
+                if not series:
+                    director_repo = AsyncBaseCRUDRepository(db, Director)
+                    if not await director_repo.exists(Director.last_name == director):
+                        raise NonExistingDirectorException(
+                            message=f"We do not have Director: {director} in our Database.")
+                return series
+        except Exception as exc:
+            raise exc
+
+    @staticmethod
+    async def get_series_by_year(year: int):
+        """
+        Function returns a list of series that were published in the given year.
+
+        Param year:int: Filter the series by a year.
+        Return: A list of series that were released in a specific year.
+        """
+        try:
+            async with AsyncSessionLocal() as db:
+                repository = AsyncSeriesRepository(db, Series)
+                return await repository.read_series_by_year(str(year))
+        except Exception as exc:
+            raise exc
+
+    @staticmethod
+    async def get_series_by_name(series: str, search: bool = True):
+        """
+        Function takes a series name as an argument and returns the series matching that name.
+
+        Param series:str: Search for a series by name.
+        Param search:bool=True: Indicate whether the function should search for a series by name.
+        Return: A list of series objects, or a series object when not searching.
+        """
+        try:
+            async with AsyncSessionLocal() as db:
+                repository = AsyncSeriesRepository(db, Series, SERIES_WITH_ACTORS)
+                return await repository.read_series_by_title(series, search=search)
+        except Exception as exc:
+            raise exc
+
+    @staticmethod
+    async def get_series_by_genre(genre, page: int = 1):
+        """
+        Function returns one page of series that belong to the given genre.
+        If no such genre exists, it raises a NonExistingGenreException.
+
+        Param genre: Search for the genre in our database.
+        Param page:int: Page of the results.
+        Return: A list of series that have the genre passed as a parameter.
+        """
+        try:
+            async with AsyncSessionLocal() as db:
+                series_repo = AsyncSeriesRepository(db, Series, SERIES_WITH_ACTORS)
+                series = await series_repo.read_series_by_genre_name(genre, page)
+                if not series:
+                    genre_repo = AsyncBaseCRUDRepository(db, Genre)
+                    if not await genre_repo.exists(Genre.name == genre):
+                        raise NonExistingGenreException(
+                            message=f"Genre with name: {genre} does not exist in our Database.")
+                return series
+        except Exception as exc:
+            raise exc
+
+    @staticmethod
+    async def get_latest_features(date_limit: str):
+        """
+        Function returns a list of the series added after the date limit.
+
+        Param date_limit:str: Limit the date range for which to return the data.
+        Return: A list of series objects.
+        """
+        try:
+            async with AsyncSessionLocal() as db:
+                repository = AsyncSeriesRepository(db, Series)
+                return await repository.read_latest_releases(date_limit)
+        except Exception as exc:
+            raise exc
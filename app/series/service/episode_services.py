@@ -1,11 +1,12 @@
 """Episode Service module"""
+from app.cache import cached, invalidate, EPISODE_RATINGS
 from app.config import settings
 from app.series.exceptions.series_exceptions import UnknownSeriesException, UnknownEpisodeException
 from app.series.models import Episode, Series
 from app.series.repositories import EpisodeRepository, SeriesRepository
 from app.db import SessionLocal
-from app.users.models.user import UserWatchEpisode
-from app.users.repositories import UserWatchEpisodeRepository
+from app.stats.models import EpisodeStats
+from app.stats.repositories import EpisodeStatsRepository
 
 PER_PAGE = settings.PER_PAGE
 
@@ -51,6 +52,21 @@ class EpisodeServices:
         except Exception as exc:
             raise exc
 
+    @staticmethod
+    def search_episodes(term: str):
+        """
+        Function returns episodes whose name or description match the search term, best matches first.
+
+        Param term:str: Search term.
+        Return: A list of episodes.
+        """
+        try:
+            with SessionLocal() as db:
+                repository = EpisodeRepository(db, Episode)
+                return repository.search_episodes(term)
+        except Exception as exc:
+            raise exc
+
     @staticmethod
     def get_episode_by_name_and_series(name: str, title: str):
         """
@@ -93,6 +109,7 @@ class EpisodeServices:
             raise exc
 
     @staticmethod
+    @cached(EPISODE_RATINGS)
     def get_best_rated_episode(best: bool = True):
         """
         Function returns the best rated episode from the database.
@@ -104,12 +121,14 @@ class EpisodeServices:
         """
         try:
             with SessionLocal() as db:
-                repository = UserWatchEpisodeRepository(db, UserWatchEpisode)
-                episode = repository.read_best_rated_episode(best=best)
+                repository = EpisodeStatsRepository(db, EpisodeStats)
+                ratings = repository.read_by_average_rating(best=best)
                 episode_repository = EpisodeRepository(db, Episode)
+                episode_objects = episode_repository.read_by_ids(episode_id for episode_id, _ in ratings)
+                episodes = {obj.id: obj for obj in episode_objects}
                 response = []
-                for episode_id, rating in episode:
-                    obj = episode_repository.read_by_id(episode_id)
+                for episode_id, rating in ratings:
+                    obj = episodes[episode_id]
                     response.append({obj.name: {"Rating": round(rating, 2), "Series": obj.series_id}})
                 return response
         except Exception as exc:
@@ -128,7 +147,9 @@ class EpisodeServices:
             with SessionLocal() as db:
                 repository = EpisodeRepository(db, Episode)
                 obj = repository.read_by_id(episode_id)
-                return repository.update(obj, attributes)
+                episode = repository.update(obj, attributes)
+                invalidate(EPISODE_RATINGS)
+                return episode
         except Exception as exc:
             raise exc
 
@@ -143,6 +164,9 @@ class EpisodeServices:
         try:
             with SessionLocal() as db:
                 repository = EpisodeRepository(db, Episode)
-                return repository.delete(episode_id)
+                EpisodeStatsRepository(db, EpisodeStats).delete_totals([episode_id])
+                response = repository.delete(episode_id)
+                invalidate(EPISODE_RATINGS)
+                return response
         except Exception as exc:
             raise exc
@@ -1,6 +1,11 @@
 """Series Service module"""
 from datetime import date
+from typing import Optional
 
+from sqlalchemy import select
+
+from app.base import LoadingProfile
+from app.cache import invalidate, SERIES_VIEWS, EPISODE_RATINGS
 from app.config import settings
 from app.directors.exceptions.director_exceptions import NonExistingDirectorException
 from app.directors.models import Director
@@ -8,13 +13,16 @@ from app.directors.repositories import DirectorRepository
 from app.genres.exceptions.genre_exceptions import NonExistingGenreException
 from app.genres.models import Genre
 from app.genres.repositories import GenreRepository
-from app.series.models import Series
+from app.series.models import Episode, Series
 from app.series.repositories import SeriesRepository
+from app.stats.models import EpisodeStats, SeriesStats
+from app.stats.repositories import EpisodeStatsRepository, SeriesStatsRepository
 from app.users.models.user import UserWatchEpisode
 from app.users.repositories import UserWatchEpisodeRepository
 from app.db import SessionLocal
 
 PER_PAGE = settings.PER_PAGE
+SERIES_WITH_ACTORS = LoadingProfile("actors")
 
 
 class SeriesServices:
@@ -45,18 +53,18 @@ class SeriesServices:
             raise exc
 
     @staticmethod
-    def read_all_series(page):
+    def read_all_series(page, cursor: Optional[str] = None):
         """
         Function returns all series in the database.
 
         Param page: Determine, which page of results to return.
-        Return: A list of series objects.
+        Param cursor:str: Cursor returned with the previous page, used instead of the page number.
+        Return: A page of series objects.
         """
         try:
             with SessionLocal() as db:
-                repository = SeriesRepository(db, Series)
-                skip = (page - 1) * PER_PAGE
-                return repository.read_many(skip=skip, limit=PER_PAGE)
+                repository = SeriesRepository(db, Series, SERIES_WITH_ACTORS)
+                return repository.read_page(page=page, cursor=cursor, limit=PER_PAGE)
         except Exception as exc:
             raise exc
 
@@ -76,22 +84,25 @@ class SeriesServices:
             raise exc
 
     @staticmethod
-    def get_series_by_director_name(director: str):
+    def get_series_by_director_name(director: str, page: int = 1):
         """
         Function takes a director name as an argument and returns all the series that
         the director has directed. If no such director exists, it raises NonExistingDirectorException.
 
         Param director:str: Get the director object from the database.
+        Param page:int: Page of the results.
         Return: A list of series objects.
         """
         try:
             with SessionLocal() as db:
-                director_repo = DirectorRepository(db, Director)
-                obj = director_repo.read_directors_by_last_name(director, search=False)
-                if not obj:
-                    raise NonExistingDirectorException(message=f"We do not have Director: {director} in our Database.")
                 series_repo = SeriesRepository(db, Series)
-                return series_repo.read_series_by_director_id(obj.id)
+                series = series_repo.read_series_by_director_name(director, page)
+                if not series:
+                    director_repo = DirectorRepository(db, Director)
+                    if not director_repo.read_directors_by_last_name(director, search=False):
+                        raise NonExistingDirectorException(
+                            message=f"We do not have Director: {director} in our Database.")
+                return series
         except Exception as exc:
             raise exc
 
@@ -162,29 +173,31 @@ class SeriesServices:
         """
         try:
             with SessionLocal() as db:
-                repo = SeriesRepository(db, Series)
+                repo = SeriesRepository(db, Series, SERIES_WITH_ACTORS)
                 series = repo.read_series_by_title(series, search=search)
                 return series
         except Exception as exc:
             raise exc
 
     @staticmethod
-    def get_series_by_genre(genre):
+    def get_series_by_genre(genre, page: int = 1):
         """
         Function takes a genre name as an argument and returns all the series that belong to that genre.
         If no such genre exists, it raises a NonExistingGenreException.
 
         Param genre: Search for the genre in our database.
+        Param page:int: Page of the results.
         Return: A list of series that have the genre passed as a parameter.
         """
         try:
             with SessionLocal() as db:
-                genre_repo = GenreRepository(db, Genre)
-                genre_obj = genre_repo.read_genres_by_name(genre, search=False)
-                if not genre_obj:
-                    raise NonExistingGenreException(message=f"Genre with name: {genre} does not exist in our Database.")
-                series_repo = SeriesRepository(db, Series)
-                series = series_repo.read_series_by_genre_id(genre_obj.id)
+                series_repo = SeriesRepository(db, Series, SERIES_WITH_ACTORS)
+                series = series_repo.read_series_by_genre_name(genre, page)
+                if not series:
+                    genre_repo = GenreRepository(db, Genre)
+                    if not genre_repo.read_genres_by_name(genre, search=False):
+                        raise NonExistingGenreException(
+                            message=f"Genre with name: {genre} does not exist in our Database.")
                 return series
         except Exception as exc:
             raise exc
@@ -238,6 +251,7 @@ class SeriesServices:
                 repo = SeriesRepository(db, Series)
                 obj = repo.read_by_id(series_id)
                 series = repo.update(obj, attributes)
+                invalidate(SERIES_VIEWS)
                 return series
         except Exception as exc:
             raise exc
@@ -253,6 +267,11 @@ class SeriesServices:
         try:
             with SessionLocal() as db:
                 repository = SeriesRepository(db, Series)
-                return repository.delete(series_id)
+                EpisodeStatsRepository(db, EpisodeStats).delete_totals(
+                    select(Episode.id).where(Episode.series_id == series_id))
+                SeriesStatsRepository(db, SeriesStats).delete_totals([series_id])
+                response = repository.delete(series_id)
+                invalidate(SERIES_VIEWS, EPISODE_RATINGS)
+                return response
         except Exception as exc:
             raise exc
@@ -0,0 +1,59 @@
+"""Test Series module"""
+from app.tests import TestClass, TestingSessionLocal, QueryCounter
+from app.series.models import Series, Episode
+from app.users.models import User
+from app.users.models.user import UserWatchEpisode
+from app.users.repositories import UserWatchEpisodeRepository
+
+
+class TestSeriesRatingAnalytics(TestClass):
+    """Test grouped rating aggregates for series."""
+
+    @staticmethod
+    def create_series(title: str, year: str, episode_ratings: list):
+        """
+        Function creates a series with one episode for every list of ratings, rated by different users.
+
+        Param title:str: Title of the series.
+        Param year:str: Year the series was published.
+        Param episode_ratings:list: List with a list of ratings for each episode.
+        Return: None.
+        """
+        with TestingSessionLocal() as db:
+            series = Series(title, year, None, None)
+            series.description = "Description"
+            db.add(series)
+            db.commit()
+            for number, ratings in enumerate(episode_ratings):
+                episode = Episode(f"{title} {number}", series.id)
+                episode.description = "Description"
+                db.add(episode)
+                db.commit()
+                for rating in ratings:
+                    user = User(f"{episode.id}-{rating}@gmail.com", "123", f"{episode.id}-{rating}")
+                    db.add(user)
+                    db.commit()
+                    db.add(UserWatchEpisode(user.id, episode.id, rating))
+                db.commit()
+
+    def test_read_average_rating_for_series_year(self):
+        """
+        Function tests that number of series and average rating of their episodes for a year
+        are read in a single query.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        self.create_series("Series One", "2005", [[10, 6], [4]])
+        self.create_series("Series Two", "2005", [[9]])
+        self.create_series("Series Three", "2005", [])
+        self.create_series("Series Four", "2010", [[1]])
+        with TestingSessionLocal() as db:
+            repository = UserWatchEpisodeRepository(db, UserWatchEpisode)
+            with QueryCounter() as counter:
+                result = repository.read_average_rating_for_series_year("2005")
+                empty = repository.read_average_rating_for_series_year("1800")
+        assert counter.count == 2
+        assert result.Series == 3
+        assert float(result._mapping["Average Rating"]) == 7.0
+        assert empty.Series == 0
@@ -0,0 +1,60 @@
+"""Stats Controller module"""
+from fastapi import HTTPException
+
+from app.base import AppException
+from app.stats.service import StatsServices
+
+
+class StatsController:
+    """Controller for Stats routes"""
+    @staticmethod
+    def rebuild_stats():
+        """
+        Function rebuilds all summary tables from watch records.
+
+        Return: A dictionary with the number of rows in every summary table.
+        """
+        try:
+            return StatsServices.rebuild_stats()
+        except AppException as exc:
+            raise HTTPException(status_code=exc.code, detail=exc.message) from exc
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+    @staticmethod
+    def rebuild_trending():
+        """
+        Function recomputes trending scores from watch records.
+
+        Return: A dictionary with the number of stored scores of movies and series.
+        """
+        try:
+            return StatsServices.rebuild_trending()
+        except AppException as exc:
+            raise HTTPException(status_code=exc.code, detail=exc.message) from exc
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+    @staticmethod
+    def get_pool_status():
+        """
+        Function returns the state of the connection pool and the time spent waiting on checkouts.
+
+        Return: A dictionary with the pool metrics.
+        """
+        try:
+            return StatsServices.get_pool_status()
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+    @staticmethod
+    def get_cache_status():
+        """
+        Function returns hit and miss counters of the response cache in this worker.
+
+        Return: A dictionary with the cache metrics.
+        """
+        try:
+            return StatsServices.get_cache_status()
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
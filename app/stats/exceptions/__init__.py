@@ -0,0 +1 @@
+from .stats_exceptions import *
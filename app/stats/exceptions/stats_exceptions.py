@@ -0,0 +1,8 @@
+"""Custom exceptions for Stats logic"""
+from app.base import AppException
+
+
+class UnknownTrendingWindowException(AppException):
+    """Exception raised when trending titles are read for a time window that is not configured."""
+    message = "Unknown trending window."
+    code = 400
@@ -0,0 +1,2 @@
+from .stats import MovieStats, EpisodeStats, SeriesStats
+from .trending_score import TrendingScore
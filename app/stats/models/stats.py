@@ -0,0 +1,52 @@
+"""MovieStats, EpisodeStats, SeriesStats Model module"""
+from sqlalchemy import Column, Integer, ForeignKey
+
+from app.db import Base, UUIDKey
+
+
+class MovieStats(Base):
+    """Base Model for MovieStats, running view and rating totals of a movie"""
+    __tablename__ = "movie_stats"
+
+    movie_id = Column(UUIDKey(), ForeignKey("movies.id", ondelete="CASCADE"), primary_key=True)
+    views = Column(Integer(), nullable=False, default=0, index=True)
+    rating_sum = Column(Integer(), nullable=False, default=0)
+    rating_count = Column(Integer(), nullable=False, default=0)
+
+    def __init__(self, movie_id: str, views: int = 0, rating_sum: int = 0, rating_count: int = 0):
+        self.movie_id = movie_id
+        self.views = views
+        self.rating_sum = rating_sum
+        self.rating_count = rating_count
+
+
+class EpisodeStats(Base):
+    """Base Model for EpisodeStats, running view and rating totals of an episode"""
+    __tablename__ = "episode_stats"
+
+    episode_id = Column(UUIDKey(), ForeignKey("episodes.id", ondelete="CASCADE"), primary_key=True)
+    views = Column(Integer(), nullable=False, default=0, index=True)
+    rating_sum = Column(Integer(), nullable=False, default=0)
+    rating_count = Column(Integer(), nullable=False, default=0)
+
+    def __init__(self, episode_id: str, views: int = 0, rating_sum: int = 0, rating_count: int = 0):
+        self.episode_id = episode_id
+        self.views = views
+        self.rating_sum = rating_sum
+        self.rating_count = rating_count
+
+
+class SeriesStats(Base):
+    """Base Model for SeriesStats, number of users who watched the series and totals of its episode ratings"""
+    __tablename__ = "series_stats"
+
+    series_id = Column(UUIDKey(), ForeignKey("series.id", ondelete="CASCADE"), primary_key=True)
+    views = Column(Integer(), nullable=False, default=0, index=True)
+    rating_sum = Column(Integer(), nullable=False, default=0)
+    rating_count = Column(Integer(), nullable=False, default=0)
+
+    def __init__(self, series_id: str, views: int = 0, rating_sum: int = 0, rating_count: int = 0):
+        self.series_id = series_id
+        self.views = views
+        self.rating_sum = rating_sum
+        self.rating_count = rating_count
@@ -0,0 +1,27 @@
+"""TrendingScore Model module"""
+from sqlalchemy import Column, String, Float, BigInteger
+
+from app.db import Base, UUIDKey
+
+
+class TrendingScore(Base):
+    """
+    Base Model for TrendingScore, the exponentially decayed views of a movie or series in a time window.
+    A score is the sum of views weighted by 2 ** ((time of the view - landmark) / half-life), so workers add
+    their views to the same row without reading it, and the score at any time is the stored score
+    multiplied by 2 ** ((landmark - time) / half-life). Scores of all-time windows are plain view counts.
+    """
+    __tablename__ = "trending_scores"
+
+    kind = Column(String(10), primary_key=True)
+    time_window = Column(String(10), primary_key=True)
+    landmark = Column(BigInteger(), primary_key=True, autoincrement=False)
+    item_id = Column(UUIDKey(), primary_key=True)
+    score = Column(Float(), nullable=False, default=0.0)
+
+    def __init__(self, kind: str, time_window: str, landmark: int, item_id: str, score: float = 0.0):
+        self.kind = kind
+        self.time_window = time_window
+        self.landmark = landmark
+        self.item_id = item_id
+        self.score = score
@@ -0,0 +1,13 @@
+"""
+Command for rebuilding movie, episode and series totals and trending scores from watch records.
+
+    python -m app.stats.rebuild
+"""
+from app.main import app  # noqa: F401, creates missing tables
+from app.stats.service import StatsServices
+
+if __name__ == "__main__":
+    for table, rows in StatsServices.rebuild_stats().items():
+        print(f"{table}: {rows} rows")
+    for kind, rows in StatsServices.rebuild_trending().items():
+        print(f"trending {kind}: {rows} scores")
@@ -0,0 +1,5 @@
+from .stats_repository import StatsRepository
+from .movie_stats_repository import MovieStatsRepository
+from .episode_stats_repository import EpisodeStatsRepository
+from .series_stats_repository import SeriesStatsRepository
+from .trending_score_repository import TrendingScoreRepository
@@ -0,0 +1,21 @@
+"""EpisodeStats Repository module"""
+from sqlalchemy import func, select
+
+from app.stats.repositories.stats_repository import StatsRepository
+from app.users.models.user import UserWatchEpisode
+
+
+class EpisodeStatsRepository(StatsRepository):
+    """Repository for EpisodeStats Model"""
+    key = "episode_id"
+
+    def rebuild(self) -> int:
+        """
+        Function rebuilds episode totals from the user_watch_episodes table.
+
+        Return: Number of episodes with totals.
+        """
+        aggregate = select(UserWatchEpisode.episode_id, func.count(),
+                           func.coalesce(func.sum(UserWatchEpisode.rating), 0), func.count(UserWatchEpisode.rating)).\
+            group_by(UserWatchEpisode.episode_id)
+        return self.replace_all(aggregate)
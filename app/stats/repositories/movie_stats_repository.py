@@ -0,0 +1,35 @@
+"""MovieStats Repository module"""
+from sqlalchemy import func, select
+
+from app.movies.models import Movie
+from app.stats.repositories.stats_repository import StatsRepository
+from app.users.models.user import UserWatchMovie
+
+
+class MovieStatsRepository(StatsRepository):
+    """Repository for MovieStats Model"""
+    key = "movie_id"
+
+    def read_average_rating_for_all_movies(self):
+        """
+        Function returns the average rating of every watched movie, together with the movie title.
+
+        Return: A list of tuples with the movie title and its average rating.
+        """
+        try:
+            return self.db.query(Movie.title.label("Movie Title"), self.average_rating.label("Average Rating")).\
+                join(Movie, self.model.movie_id == Movie.id).all()
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
+
+    def rebuild(self) -> int:
+        """
+        Function rebuilds movie totals from the user_watch_movies table.
+
+        Return: Number of movies with totals.
+        """
+        aggregate = select(UserWatchMovie.movie_id, func.count(),
+                           func.coalesce(func.sum(UserWatchMovie.rating), 0), func.count(UserWatchMovie.rating)).\
+            group_by(UserWatchMovie.movie_id)
+        return self.replace_all(aggregate)
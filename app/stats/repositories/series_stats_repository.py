@@ -0,0 +1,23 @@
+"""SeriesStats Repository module"""
+from sqlalchemy import func, select, distinct
+
+from app.series.models import Episode
+from app.stats.repositories.stats_repository import StatsRepository
+from app.users.models.user import UserWatchEpisode
+
+
+class SeriesStatsRepository(StatsRepository):
+    """Repository for SeriesStats Model. Views of a series are the number of users who watched any of its episodes."""
+    key = "series_id"
+
+    def rebuild(self) -> int:
+        """
+        Function rebuilds series totals from the user_watch_episodes table.
+
+        Return: Number of series with totals.
+        """
+        aggregate = select(Episode.series_id, func.count(distinct(UserWatchEpisode.user_id)),
+                           func.coalesce(func.sum(UserWatchEpisode.rating), 0), func.count(UserWatchEpisode.rating)).\
+            join(Episode, UserWatchEpisode.episode_id == Episode.id).\
+            group_by(Episode.series_id)
+        return self.replace_all(aggregate)
@@ -0,0 +1,140 @@
+"""Stats Repository module"""
+from sqlalchemy import func
+
+from app.base import BaseCRUDRepository
+
+
+class StatsRepository(BaseCRUDRepository):
+    """
+    Base Repository for summary tables with views, rating_sum and rating_count columns.
+    Methods that change totals do not commit, so totals are committed together with the watch record.
+    """
+    key = None
+
+    @property
+    def key_column(self):
+        """Primary key column of the summary table."""
+        return getattr(self.model, self.key)
+
+    @property
+    def average_rating(self):
+        """SQL expression for the average rating, rounded to two decimals."""
+        return func.round(self.model.rating_sum * 1.0 / self.model.rating_count, 2)
+
+    def add(self, key: str, views: int = 0, rating_sum: int = 0, rating_count: int = 0):
+        """
+        Function increments totals of a title, creating its row if it does not exist yet.
+        The row is created or incremented by a single upsert, so concurrent first views of the same title
+        do not conflict and concurrent updates are not lost. Changes are not committed.
+
+        Param key:str: ID of the title.
+        Param views:int: Number of views to add.
+        Param rating_sum:int: Value to add to the sum of ratings.
+        Param rating_count:int: Number of ratings to add.
+        Return: None.
+        """
+        self.upsert_many([{self.key: key, "views": views, "rating_sum": rating_sum, "rating_count": rating_count}],
+                         keys=(self.key,), increment=("views", "rating_sum", "rating_count"))
+
+    def add_rating(self, key: str, rating: int, old_rating: int = None, new_view: bool = False):
+        """
+        Function adds a rating to the totals of a title, replacing the previous rating of the same user.
+
+        Param key:str: ID of the title.
+        Param rating:int: New rating.
+        Param old_rating:int: Previous rating of the user, None if the user did not rate the title yet.
+        Param new_view:bool: Count the rating as a new view as well.
+        Return: None.
+        """
+        if old_rating is None:
+            self.add(key, views=int(new_view), rating_sum=rating, rating_count=1)
+        else:
+            self.add(key, views=int(new_view), rating_sum=rating - old_rating)
+
+    def add_many(self, totals: dict):
+        """
+        Function increments totals of many titles with a single multi-row upsert,
+        creating rows of titles that do not have totals yet. Changes are not committed.
+
+        Param totals:dict: Views, rating sum and rating count to add, by ID of the title.
+        Return: None.
+        """
+        rows = [{self.key: key, "views": views, "rating_sum": rating_sum, "rating_count": rating_count}
+                for key, (views, rating_sum, rating_count) in totals.items()
+                if views or rating_sum or rating_count]
+        self.upsert_many(rows, keys=(self.key,), increment=("views", "rating_sum", "rating_count"))
+
+    def delete_totals(self, keys):
+        """
+        Function deletes totals of titles, so the titles themselves can be deleted. Changes are not committed.
+
+        Param keys: IDs of the titles, or a select statement returning them.
+        Return: None.
+        """
+        try:
+            self.db.query(self.model).filter(self.key_column.in_(keys)).delete(synchronize_session=False)
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
+
+    def read_stats(self, key: str):
+        """
+        Function returns views and the average rating of a single title.
+
+        Param key:str: ID of the title.
+        Return: A row with views and average rating, or None if the title has no views.
+        """
+        try:
+            return self.db.query(self.model.views.label("Views"), self.average_rating.label("Average Rating")).\
+                filter(self.key_column == key).first()
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
+
+    def read_most_viewed(self, limit: int = 10):
+        """
+        Function returns the most viewed titles.
+
+        Param limit:int: Number of titles to return.
+        Return: A list of tuples with the ID of the title and number of views.
+        """
+        try:
+            return self.db.query(self.key_column, self.model.views).\
+                order_by(self.model.views.desc()).limit(limit).all()
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
+
+    def read_by_average_rating(self, best: bool = True):
+        """
+        Function returns the titles with the highest or the lowest average rating.
+
+        Param best:bool=True: Return the best rated titles if True, the worst rated otherwise.
+        Return: A list of tuples with the ID of the title and its average rating.
+        """
+        try:
+            rated = self.db.query(self.model).filter(self.model.rating_count > 0)
+            aggregate = func.max if best else func.min
+            limit = rated.with_entities(aggregate(self.average_rating)).scalar_subquery()
+            return rated.with_entities(self.key_column, self.average_rating).\
+                filter(self.average_rating == limit).all()
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
+
+    def replace_all(self, select) -> int:
+        """
+        Function deletes all rows and fills the table from a select statement that returns
+        key, views, rating_sum and rating_count columns. Changes are not committed.
+
+        Param select: Select statement that aggregates the source table.
+        Return: Number of rows in the table.
+        """
+        try:
+            self.db.query(self.model).delete(synchronize_session=False)
+            columns = [self.key, "views", "rating_sum", "rating_count"]
+            self.db.execute(self.model.__table__.insert().from_select(columns, select))
+            return self.db.query(func.count(self.key_column)).scalar()
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
@@ -0,0 +1,117 @@
+"""TrendingScore Repository module"""
+from sqlalchemy import func, select
+
+from app.base import BaseCRUDRepository
+from app.recommendations.models import MOVIES
+from app.series.models import Episode
+from app.users.models.user import UserWatchMovie, UserWatchEpisode
+
+
+class TrendingScoreRepository(BaseCRUDRepository):
+    """Repository for TrendingScore Model. Methods that change scores do not commit."""
+
+    def add_scores(self, scores: dict, chunk_size: int = 1000):
+        """
+        Function adds scores to the stored scores, creating rows that do not exist yet,
+        with multi-row upserts.
+
+        Param scores:dict: Scores to add by (kind, time window, landmark, title ID).
+        Param chunk_size:int: Number of rows upserted with one statement.
+        Return: None.
+        """
+        rows = [{"kind": kind, "time_window": time_window, "landmark": landmark, "item_id": item_id, "score": score}
+                for (kind, time_window, landmark, item_id), score in scores.items()]
+        for start in range(0, len(rows), chunk_size):
+            self.upsert_many(rows[start:start + chunk_size], keys=("kind", "time_window", "landmark", "item_id"),
+                             increment=("score",))
+
+    def read_scores(self, kind: str, time_window: str, since: int) -> list:
+        """
+        Function returns the stored scores of a time window, leaving out scores of landmarks before since.
+
+        Param kind:str: movies or series.
+        Param time_window:str: Name of the time window.
+        Param since:int: Oldest landmark to read.
+        Return: A list of (landmark, title ID, score) tuples.
+        """
+        try:
+            statement = select(self.model.landmark, self.model.item_id, self.model.score).\
+                where(self.model.kind == kind, self.model.time_window == time_window, self.model.landmark >= since)
+            return [tuple(row) for row in self.db.execute(statement)]
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
+
+    def delete_expired(self, kind: str, time_window: str, since: int):
+        """
+        Function deletes the scores of landmarks before since, whose weight has decayed to nothing.
+
+        Param kind:str: movies or series.
+        Param time_window:str: Name of the time window.
+        Param since:int: Oldest landmark to keep.
+        Return: None.
+        """
+        try:
+            self.db.query(self.model).\
+                filter(self.model.kind == kind, self.model.time_window == time_window, self.model.landmark < since).\
+                delete(synchronize_session=False)
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
+
+    def replace_scores(self, kind: str, scores: dict, chunk_size: int = 1000) -> int:
+        """
+        Function replaces all stored scores of movies or series.
+
+        Param kind:str: movies or series.
+        Param scores:dict: Scores by (kind, time window, landmark, title ID).
+        Param chunk_size:int: Number of rows inserted with one statement.
+        Return: Number of inserted rows.
+        """
+        try:
+            self.db.query(self.model).filter(self.model.kind == kind).delete(synchronize_session=False)
+            rows = [{"kind": kind, "time_window": time_window, "landmark": landmark, "item_id": item_id,
+                     "score": score} for (_, time_window, landmark, item_id), score in scores.items()]
+            for start in range(0, len(rows), chunk_size):
+                self.db.execute(self.model.__table__.insert(), rows[start:start + chunk_size])
+            return len(rows)
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
+
+    def has_scores(self, kind: str) -> bool:
+        """
+        Function checks whether scores of movies or series were ever stored.
+
+        Param kind:str: movies or series.
+        Return: True if there is at least one stored score.
+        """
+        try:
+            return self.db.query(self.model.item_id).filter(self.model.kind == kind).first() is not None
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
+
+    def read_views(self, kind: str) -> list:
+        """
+        Function returns the number of views of movies or series per day, from watch records.
+        A view of a movie is a user watching it, a view of a series is a user watching its first episode,
+        as counted by the summary tables.
+
+        Param kind:str: movies or series.
+        Return: A list of (title ID, date watched, views) tuples.
+        """
+        try:
+            if kind == MOVIES:
+                statement = select(UserWatchMovie.movie_id, UserWatchMovie.date_watched, func.count()).\
+                    group_by(UserWatchMovie.movie_id, UserWatchMovie.date_watched)
+            else:
+                first_watched = select(Episode.series_id, func.min(UserWatchEpisode.date_watched).label("day")).\
+                    join(Episode, UserWatchEpisode.episode_id == Episode.id).\
+                    group_by(UserWatchEpisode.user_id, Episode.series_id).subquery()
+                statement = select(first_watched.c.series_id, first_watched.c.day, func.count()).\
+                    group_by(first_watched.c.series_id, first_watched.c.day)
+            return [tuple(row) for row in self.db.execute(statement)]
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
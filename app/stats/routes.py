@@ -0,0 +1,62 @@
+"""Stats routes module"""
+from fastapi import APIRouter, Depends
+
+from app.stats.controller import StatsController
+from app.users.controller.user_auth_controller import JWTBearer
+
+stats_router = APIRouter(tags=["Stats"], prefix="/api/stats")
+
+
+@stats_router.post("/rebuild",
+                   summary="Rebuild view and rating totals from watch records. Admin route.",
+                   dependencies=[Depends(JWTBearer(["super_user"]))]
+                   )
+def rebuild_stats():
+    """
+    Function rebuilds movie, episode and series totals from scratch.
+
+    Return: A dictionary with the number of rows in every summary table.
+    """
+    return StatsController.rebuild_stats()
+
+
+@stats_router.post("/rebuild-trending",
+                   summary="Rebuild trending movies and series from watch records. Admin route.",
+                   dependencies=[Depends(JWTBearer(["super_user"]))]
+                   )
+def rebuild_trending():
+    """
+    Function recomputes decayed views of movies and series of every trending window from the dates
+    of watch records, and replaces the stored scores.
+
+    Return: A dictionary with the number of stored scores of movies and series.
+    """
+    return StatsController.rebuild_trending()
+
+
+@stats_router.get("/db-pool",
+                  summary="Show connection pool state and checkout wait times. Admin route.",
+                  dependencies=[Depends(JWTBearer(["super_user"]))]
+                  )
+def get_pool_status():
+    """
+    Function returns the state of the database connection pool, with the number
+    of checkouts and the time they spent waiting for a connection.
+
+    Return: A dictionary with the pool metrics.
+    """
+    return StatsController.get_pool_status()
+
+
+@stats_router.get("/cache",
+                  summary="Show response cache hits and misses. Admin route.",
+                  dependencies=[Depends(JWTBearer(["super_user"]))]
+                  )
+def get_cache_status():
+    """
+    Function returns hit and miss counters of the response cache, in total and per namespace.
+    Counters are kept per worker.
+
+    Return: A dictionary with the cache metrics.
+    """
+    return StatsController.get_cache_status()
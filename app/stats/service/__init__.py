@@ -0,0 +1,2 @@
+from .stats_services import StatsServices
+from .trending_engine import TrendingEngine, trending_engine, ALL_TIME
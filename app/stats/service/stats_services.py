@@ -0,0 +1,59 @@
+"""Stats Service module"""
+from app.cache import response_cache, NAMESPACES
+from app.db import SessionLocal, engine, pool_metrics
+from app.stats.models import MovieStats, EpisodeStats, SeriesStats
+from app.stats.repositories import MovieStatsRepository, EpisodeStatsRepository, SeriesStatsRepository
+from .trending_engine import trending_engine
+
+
+class StatsServices:
+    """Service for Stats routes"""
+    @staticmethod
+    def rebuild_stats():
+        """
+        Function rebuilds all summary tables from watch records, in a single transaction.
+
+        Return: A dictionary with the number of rows in every summary table.
+        """
+        try:
+            with SessionLocal() as db:
+                response = {
+                    "movie_stats": MovieStatsRepository(db, MovieStats).rebuild(),
+                    "episode_stats": EpisodeStatsRepository(db, EpisodeStats).rebuild(),
+                    "series_stats": SeriesStatsRepository(db, SeriesStats).rebuild(),
+                }
+                db.commit()
+                response_cache.invalidate(*NAMESPACES)
+                return response
+        except Exception as exc:
+            raise exc
+
+    @staticmethod
+    def rebuild_trending():
+        """
+        Function recomputes trending scores of movies and series from the dates of watch records.
+
+        Return: A dictionary with the number of stored scores of movies and series.
+        """
+        try:
+            return trending_engine.rebuild()
+        except Exception as exc:
+            raise exc
+
+    @staticmethod
+    def get_pool_status():
+        """
+        Function returns the state of the connection pool and the time spent waiting on checkouts.
+
+        Return: A dictionary with the pool metrics.
+        """
+        return pool_metrics.snapshot(engine.pool)
+
+    @staticmethod
+    def get_cache_status():
+        """
+        Function returns hit and miss counters of the response cache in this worker.
+
+        Return: A dictionary with the cache metrics.
+        """
+        return response_cache.snapshot()
@@ -0,0 +1,384 @@
+"""Trending Engine module"""
+import asyncio
+import heapq
+import logging
+import re
+import time
+from collections import defaultdict
+from datetime import date, datetime
+from threading import Lock, RLock
+from typing import Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from app.cache import invalidate, MOVIE_VIEWS, SERIES_VIEWS
+from app.config import settings
+from app.db import SessionLocal
+from app.recommendations.models import MOVIES, SERIES
+from app.stats.exceptions import UnknownTrendingWindowException
+from app.stats.models import TrendingScore
+from app.stats.repositories import TrendingScoreRepository
+
+ALL_TIME = "all"
+WINDOW = re.compile(r"^(\d+)([hd])$")
+UNITS = {"h": 3600, "d": 86400}
+# A landmark is kept for this many half-lives, so weights stay far from the float limit of 2 ** 1024.
+# Scores of the previous landmark are still read, a view of that period weighs at least 2 ** -512 now.
+PERIOD_HALF_LIVES = 256
+
+logger = logging.getLogger(__name__)
+
+
+def parse_window(name: str) -> Optional[float]:
+    """
+    Function returns the half-life of a time window: hours like 24h or days like 7d, or all for no decay.
+
+    Param name:str: Name of the time window.
+    Return: Half-life in seconds, None for all-time.
+    """
+    if name == ALL_TIME:
+        return None
+    match = WINDOW.match(name)
+    if not match or not int(match.group(1)):
+        raise ValueError(f"Invalid trending window: {name}")
+    return int(match.group(1)) * UNITS[match.group(2)]
+
+
+def day_timestamp(day: date) -> float:
+    """
+    Function returns the time of views recorded with a date only: the middle of the day.
+
+    Param day:date: Date watched.
+    Return: Unix timestamp.
+    """
+    return datetime(day.year, day.month, day.day, 12).timestamp()
+
+
+class DecayedTopK:
+    """
+    Exponentially decayed views of the titles of one kind in one time window, with the capacity titles
+    of the highest score. Scores are relative to a landmark, so a view only adds to the score of its title
+    and the order of the other titles does not change. A title enters the top titles only when its score grows,
+    so the top titles are kept exactly by comparing the changed title with the lowest top title.
+    """
+
+    def __init__(self, half_life: Optional[float], capacity: int, now: float):
+        self.half_life = half_life
+        self.capacity = capacity
+        self.landmark = self.landmark_of(now)
+        self.scores = defaultdict(float)
+        self.top = {}
+
+    def landmark_of(self, when: float) -> int:
+        """
+        Function returns the landmark of the period of a time.
+
+        Param when:float: Unix timestamp.
+        Return: Landmark as a Unix timestamp, 0 for all-time windows.
+        """
+        if self.half_life is None:
+            return 0
+        period = int(self.half_life * PERIOD_HALF_LIVES)
+        return int(when) // period * period
+
+    def factor(self, start: float, end: float) -> float:
+        """
+        Function returns the decay of a score from one time to another, in the window.
+
+        Param start:float: Unix timestamp.
+        Param end:float: Unix timestamp.
+        Return: Factor of the score.
+        """
+        return 1.0 if self.half_life is None else 2.0 ** ((start - end) / self.half_life)
+
+    def advance(self, now: float):
+        """
+        Function moves scores to the landmark of the current period, when a new period started.
+
+        Param now:float: Unix timestamp.
+        Return: None.
+        """
+        landmark = self.landmark_of(now)
+        if landmark > self.landmark:
+            factor = self.factor(self.landmark, landmark)
+            self.scores = defaultdict(float, {item_id: score * factor for item_id, score in self.scores.items()})
+            self.top = {item_id: score * factor for item_id, score in self.top.items()}
+            self.landmark = landmark
+
+    def add(self, item_id, weight: float):
+        """
+        Function adds a weighted view to the score of a title, and updates the top titles in O(capacity).
+
+        Param item_id: ID of the title.
+        Param weight:float: Weight of the view at the current landmark.
+        Return: None.
+        """
+        self.scores[item_id] += weight
+        score = self.scores[item_id]
+        if item_id in self.top or len(self.top) < self.capacity:
+            self.top[item_id] = score
+            return
+        lowest = min(self.top, key=self.top.get)
+        if score > self.top[lowest]:
+            del self.top[lowest]
+            self.top[item_id] = score
+
+    def replace(self, scores: dict):
+        """
+        Function replaces all scores and selects the top titles.
+
+        Param scores:dict: Scores at the current landmark by ID of the title.
+        Return: None.
+        """
+        self.scores = defaultdict(float, scores)
+        self.top = dict(heapq.nlargest(self.capacity, scores.items(), key=lambda pair: pair[1]))
+
+    def ranked(self, limit: int, now: float) -> list:
+        """
+        Function returns the titles with the highest scores, decayed to the given time.
+
+        Param limit:int: Number of titles, at most the capacity.
+        Param now:float: Unix timestamp.
+        Return: A list of (title ID, score) tuples, highest first, ties broken by ID.
+        """
+        factor = self.factor(self.landmark, now)
+        ranked = heapq.nsmallest(limit, self.top.items(), key=lambda pair: (-pair[1], str(pair[0])))
+        return [(item_id, score * factor) for item_id, score in ranked if score > 0]
+
+
+class TrendingEngine:
+    """
+    Trending movies and series of every configured time window, kept in memory and updated by the watch
+    services after commit. Every worker adds the views it records to the trending_scores table and reloads
+    the scores of all workers every sync_seconds, by a background task of the running event loop.
+    Scores are rebuilt from the dates of watch records when none were stored yet, or on demand.
+    Stored scores are loaded at startup, reads only serve the scores in memory and never query the database.
+    """
+
+    def __init__(self, session_factory=SessionLocal, windows: str = "24h,7d,all", capacity: int = 100,
+                 sync_seconds: float = 60.0, clock=time.time):
+        self.session_factory = session_factory
+        self.windows = {name.strip(): parse_window(name.strip()) for name in windows.split(",") if name.strip()}
+        self.capacity = capacity
+        self.sync_seconds = sync_seconds
+        self.clock = clock
+        self._lock = Lock()
+        # Restores and rebuilds replace stored scores, so they run one at a time.
+        self._storing = RLock()
+        self._stopping = None
+        self._task = None
+        self.clear()
+
+    def clear(self):
+        """
+        Function drops all scores kept in memory and views not stored yet.
+
+        Return: None.
+        """
+        now = self.clock()
+        with self._lock:
+            self.boards = {(kind, name): DecayedTopK(half_life, self.capacity, now)
+                           for kind in (MOVIES, SERIES) for name, half_life in self.windows.items()}
+            self._pending = defaultdict(float)
+
+    def record(self, kind: str, item_id, views: int = 1, when: Optional[float] = None):
+        """
+        Function adds views of a title to its scores in every time window.
+
+        Param kind:str: movies or series.
+        Param item_id: ID of the title.
+        Param views:int: Number of views.
+        Param when:float: Unix timestamp of the views, now if not given.
+        Return: None.
+        """
+        when = self.clock() if when is None else when
+        with self._lock:
+            for name in self.windows:
+                board = self.boards[(kind, name)]
+                board.advance(when)
+                weight = views * board.factor(when, board.landmark)
+                board.add(item_id, weight)
+                self._pending[(kind, name, board.landmark, item_id)] += weight
+
+    def top(self, kind: str, window: str, limit: int = 10) -> list:
+        """
+        Function returns the trending titles of a time window, from the scores in memory.
+
+        Param kind:str: movies or series.
+        Param window:str: Name of the time window.
+        Param limit:int: Number of titles.
+        Return: A list of (title ID, score) tuples, highest first.
+        """
+        if window not in self.windows:
+            raise UnknownTrendingWindowException
+        now = self.clock()
+        with self._lock:
+            board = self.boards[(kind, window)]
+            board.advance(now)
+            return board.ranked(limit, now)
+
+    def load(self, db) -> dict:
+        """
+        Function reads the stored scores of every time window, moved to the current landmark.
+
+        Param db: Database session.
+        Return: A dictionary of dictionaries of scores by ID of the title, by kind and time window.
+        """
+        repository = TrendingScoreRepository(db, TrendingScore)
+        now = self.clock()
+        stored = {}
+        for (kind, name), board in self.boards.items():
+            board.advance(now)
+            since = board.landmark_of(now - board.half_life * PERIOD_HALF_LIVES) if board.half_life else 0
+            repository.delete_expired(kind, name, since)
+            scores = defaultdict(float)
+            for landmark, item_id, score in repository.read_scores(kind, name, since):
+                scores[item_id] += score * board.factor(landmark, board.landmark)
+            stored[(kind, name)] = scores
+        return stored
+
+    def apply(self, stored: dict):
+        """
+        Function replaces scores in memory with stored scores and the views recorded since they were read.
+
+        Param stored:dict: Scores of load.
+        Return: None.
+        """
+        with self._lock:
+            for (kind, name), scores in stored.items():
+                board = self.boards[(kind, name)]
+                for (pending_kind, pending_name, landmark, item_id), score in self._pending.items():
+                    if (pending_kind, pending_name) == (kind, name):
+                        scores[item_id] += score * board.factor(landmark, board.landmark)
+                board.replace(scores)
+        invalidate(MOVIE_VIEWS, SERIES_VIEWS)
+
+    def sync(self) -> int:
+        """
+        Function stores the views recorded by this worker and reloads the scores of all workers.
+        Views of a failed sync are kept for the next one.
+
+        Return: Number of stored scores.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, defaultdict(float)
+        try:
+            with self.session_factory() as db:
+                TrendingScoreRepository(db, TrendingScore).add_scores(pending)
+                db.commit()
+                stored = self.load(db)
+                db.commit()
+        except Exception as exc:
+            with self._lock:
+                for key, score in pending.items():
+                    self._pending[key] += score
+            raise exc
+        self.apply(stored)
+        return len(pending)
+
+    def rebuild(self, kind: Optional[str] = None) -> dict:
+        """
+        Function recomputes the scores of movies, series or both from the dates of watch records,
+        and replaces the stored scores. Views are dated by day, so views of the last day are spread over it.
+
+        Param kind:str: movies or series, None for both.
+        Return: A dictionary with the number of stored scores of every kind.
+        """
+        with self._storing:
+            return self._rebuild(kind)
+
+    def _rebuild(self, kind: Optional[str]) -> dict:
+        now = self.clock()
+        rows = {}
+        with self.session_factory() as db:
+            repository = TrendingScoreRepository(db, TrendingScore)
+            for name in (MOVIES, SERIES):
+                if kind not in (None, name):
+                    continue
+                scores = defaultdict(float)
+                for item_id, day, views in repository.read_views(name):
+                    when = min(day_timestamp(day), now)
+                    for window in self.windows:
+                        board = self.boards[(name, window)]
+                        board.advance(now)
+                        scores[(name, window, board.landmark, item_id)] += views * board.factor(when, board.landmark)
+                with self._lock:
+                    for key in [key for key in self._pending if key[0] == name]:
+                        del self._pending[key]
+                rows[name] = repository.replace_scores(name, scores)
+            db.commit()
+            stored = self.load(db)
+            db.commit()
+        self.apply(stored)
+        return rows
+
+    def restore(self) -> dict:
+        """
+        Function rebuilds the scores of kinds that were never stored, and loads the stored scores.
+
+        Return: A dictionary with the number of stored scores of every rebuilt kind.
+        """
+        with self._storing:
+            with self.session_factory() as db:
+                repository = TrendingScoreRepository(db, TrendingScore)
+                missing = [kind for kind in (MOVIES, SERIES) if not repository.has_scores(kind)]
+            rebuilt = {}
+            for kind in missing:
+                rebuilt.update(self._rebuild(kind))
+            self.sync()
+            return rebuilt
+
+    async def run(self):
+        """
+        Function restores scores, then syncs them every sync_seconds until the engine is stopped.
+
+        Return: None.
+        """
+        sync = self.restore
+        while not self._stopping.is_set():
+            try:
+                await run_in_threadpool(sync)
+                sync = self.sync
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Failed syncing trending scores")
+            try:
+                await asyncio.wait_for(self._stopping.wait(), self.sync_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    async def preload(self):
+        """
+        Function restores scores once, at startup of a worker that does not sync them.
+        The worker starts even if they cannot be restored, and serves the views it records.
+
+        Return: None.
+        """
+        try:
+            await run_in_threadpool(self.restore)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Failed restoring trending scores")
+
+    def start(self):
+        """
+        Function starts the sync of scores as a task of the running event loop.
+
+        Return: None.
+        """
+        self._stopping = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self.run())
+
+    async def stop(self):
+        """
+        Function stops the sync after storing the views recorded since the last one.
+
+        Return: None.
+        """
+        if self._task is not None:
+            self._stopping.set()
+            await self._task
+            self._task = None
+            await run_in_threadpool(self.sync)
+
+
+trending_engine = TrendingEngine(windows=settings.TRENDING_WINDOWS, capacity=settings.TRENDING_CAPACITY,
+                                 sync_seconds=settings.TRENDING_SYNC_SECONDS)
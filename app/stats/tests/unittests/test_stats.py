@@ -0,0 +1,404 @@
+"""Test Stats module"""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.db import new_id
+from app.tests import MYSQL_URL_TEST, TestClass, TestingSessionLocal, QueryCounter, client
+from app.movies.models import Movie
+from app.movies.service import MovieServices
+from app.recommendations.models import MOVIES, SERIES
+from app.series.models import Series, Episode
+from app.series.service import EpisodeServices, SeriesServices
+from app.stats.exceptions import UnknownTrendingWindowException
+from app.stats.models import EpisodeStats, MovieStats, SeriesStats
+from app.stats.repositories import EpisodeStatsRepository, MovieStatsRepository, SeriesStatsRepository
+from app.stats.service import TrendingEngine
+from app.users.models import User
+from app.users.models.user import UserWatchMovie, UserWatchEpisode
+from app.users.service import sign_jwt, UserWatchMovieServices
+
+NOW = datetime(2026, 10, 18, 12).timestamp()
+HOUR = 3600
+
+
+class TestStatsRepo(TestClass):
+    """Test incremental and rebuilt summary tables."""
+
+    @staticmethod
+    def create_movie(db, title: str):
+        """
+        Function creates a movie.
+
+        Param db: Database session.
+        Param title:str: Title of the movie.
+        Return: ID of the movie.
+        """
+        movie = Movie(title, "Description", "1994", None, None)
+        db.add(movie)
+        db.commit()
+        return movie.id
+
+    @staticmethod
+    def create_user(db, username: str):
+        """
+        Function creates a user.
+
+        Param db: Database session.
+        Param username:str: Username of the user.
+        Return: ID of the user.
+        """
+        user = User(f"{username}@gmail.com", "123", username)
+        db.add(user)
+        db.commit()
+        return user.id
+
+    def test_add_views_and_ratings(self):
+        """
+        Function tests that views and ratings are added to totals, and that changing a rating
+        replaces the previous rating of the user.
+
+        Return: None.
+        """
+        with TestingSessionLocal() as db:
+            movie_id = self.create_movie(db, "Pulp Fiction")
+            repository = MovieStatsRepository(db, MovieStats)
+            repository.add(movie_id, views=1)
+            repository.add_rating(movie_id, 6, new_view=True)
+            repository.add_rating(movie_id, 10, old_rating=6)
+            repository.add_rating(movie_id, 8)
+            db.commit()
+            with QueryCounter() as counter:
+                stats = repository.read_stats(movie_id)
+        assert counter.count == 1
+        assert stats.Views == 2
+        assert float(stats._mapping["Average Rating"]) == 9.0
+
+    def test_add_is_a_single_upsert(self):
+        """
+        Function tests that totals are created and incremented by one statement, so concurrent first views
+        of a title cannot both insert its row.
+
+        Return: None.
+        """
+        with TestingSessionLocal() as db:
+            movie_id = self.create_movie(db, "Pulp Fiction")
+            repository = MovieStatsRepository(db, MovieStats)
+            with QueryCounter() as counter:
+                repository.add(movie_id, views=1)
+                repository.add(movie_id, views=1, rating_sum=7, rating_count=1)
+            db.commit()
+            stats = repository.read_stats(movie_id)
+        assert counter.count == 2
+        assert stats.Views == 2
+        assert float(stats._mapping["Average Rating"]) == 7.0
+
+    def test_uncommitted_totals_are_rolled_back(self):
+        """
+        Function tests that totals are not stored when the transaction they are part of is rolled back.
+
+        Return: None.
+        """
+        with TestingSessionLocal() as db:
+            movie_id = self.create_movie(db, "Pulp Fiction")
+            MovieStatsRepository(db, MovieStats).add(movie_id, views=1)
+            db.rollback()
+            assert MovieStatsRepository(db, MovieStats).read_stats(movie_id) is None
+
+    def test_read_best_and_worst_rated(self):
+        """
+        Function tests reading the best and the worst rated titles, ignoring titles without ratings.
+
+        Return: None.
+        """
+        with TestingSessionLocal() as db:
+            ids = [self.create_movie(db, f"Movie {i}") for i in range(3)]
+            repository = MovieStatsRepository(db, MovieStats)
+            repository.add_rating(ids[0], 9, new_view=True)
+            repository.add_rating(ids[1], 3, new_view=True)
+            repository.add(ids[2], views=5)
+            db.commit()
+            best = repository.read_by_average_rating(best=True)
+            worst = repository.read_by_average_rating(best=False)
+            most_viewed = repository.read_most_viewed(limit=1)
+        assert [(movie_id, float(rating)) for movie_id, rating in best] == [(ids[0], 9.0)]
+        assert [(movie_id, float(rating)) for movie_id, rating in worst] == [(ids[1], 3.0)]
+        assert most_viewed == [(ids[2], 5)]
+
+    def test_rebuild_movie_stats(self):
+        """
+        Function tests that movie totals are rebuilt from watch records.
+
+        Return: None.
+        """
+        with TestingSessionLocal() as db:
+            movie_id = self.create_movie(db, "Pulp Fiction")
+            users = [self.create_user(db, f"user{i}") for i in range(3)]
+            db.add_all([UserWatchMovie(users[0], movie_id, 10), UserWatchMovie(users[1], movie_id, 7),
+                        UserWatchMovie(users[2], movie_id)])
+            db.commit()
+            repository = MovieStatsRepository(db, MovieStats)
+            repository.add(movie_id, views=100)
+            assert repository.rebuild() == 1
+            db.commit()
+            stats = repository.read_stats(movie_id)
+        assert stats.Views == 3
+        assert float(stats._mapping["Average Rating"]) == 8.5
+
+    def test_rebuild_series_stats(self):
+        """
+        Function tests that series views are rebuilt as the number of users who watched any of its episodes.
+
+        Return: None.
+        """
+        with TestingSessionLocal() as db:
+            series = Series("Lost", "2004", None, None)
+            series.description = "Description"
+            db.add(series)
+            db.commit()
+            episodes = [Episode(f"Episode {i}", series.id) for i in range(2)]
+            for episode in episodes:
+                episode.description = "Description"
+            db.add_all(episodes)
+            db.commit()
+            users = [self.create_user(db, f"user{i}") for i in range(2)]
+            db.add_all([UserWatchEpisode(users[0], episodes[0].id, 4), UserWatchEpisode(users[0], episodes[1].id, 8),
+                        UserWatchEpisode(users[1], episodes[0].id)])
+            db.commit()
+            repository = SeriesStatsRepository(db, SeriesStats)
+            repository.rebuild()
+            db.commit()
+            stats = repository.read_stats(series.id)
+        assert stats.Views == 2
+        assert float(stats._mapping["Average Rating"]) == 6.0
+
+    def test_deleted_titles_take_their_totals(self, monkeypatch):
+        """
+        Function tests that watched titles can be deleted while foreign keys are enforced, and that their totals
+        are deleted with them, by the services as well as by the database.
+
+        Param monkeypatch: Pytest fixture for using a session that enforces foreign keys.
+        Return: None.
+        """
+        checked_engine = create_engine(MYSQL_URL_TEST)
+        if checked_engine.dialect.name == "sqlite":
+            event.listen(checked_engine, "connect",
+                         lambda connection, _: connection.execute("PRAGMA foreign_keys=ON"))
+        CheckedSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=checked_engine)
+        for module in ("app.movies.service.movie_services", "app.series.service.series_services",
+                       "app.series.service.episode_services"):
+            monkeypatch.setattr(f"{module}.SessionLocal", CheckedSessionLocal)
+        with CheckedSessionLocal() as db:
+            movies = [self.create_movie(db, title) for title in ("Pulp Fiction", "Jackie Brown")]
+            series = [Series(title, "2004", None, None) for title in ("Lost", "Fringe")]
+            for item in series:
+                item.description = "Description"
+            db.add_all(series)
+            db.commit()
+            episodes = [Episode(f"Episode {i}", item.id) for item in series for i in range(2)]
+            for episode in episodes:
+                episode.description = "Description"
+            db.add_all(episodes)
+            db.commit()
+            user_id = self.create_user(db, "user")
+            db.add_all([UserWatchMovie(user_id, movies[0], 8)] +
+                       [UserWatchEpisode(user_id, episode.id, 6) for episode in episodes[:3]])
+            MovieStatsRepository(db, MovieStats).add_many({movie_id: (1, 8, 1) for movie_id in movies})
+            EpisodeStatsRepository(db, EpisodeStats).add_many({episode.id: (1, 6, 1) for episode in episodes})
+            SeriesStatsRepository(db, SeriesStats).add_many({item.id: (1, 6, 1) for item in series})
+            db.commit()
+            episode_ids, series_ids = [episode.id for episode in episodes], [item.id for item in series]
+        assert MovieServices.delete_movie(movies[0])
+        assert EpisodeServices.delete_episode(episode_ids[2])
+        assert SeriesServices.delete_series(series_ids[0])
+        with checked_engine.begin() as connection:
+            connection.execute(Movie.__table__.delete())
+            connection.execute(Episode.__table__.delete())
+            connection.execute(Series.__table__.delete())
+        checked_engine.dispose()
+        with TestingSessionLocal() as db:
+            assert db.query(MovieStats).count() == db.query(EpisodeStats).count() == db.query(SeriesStats).count() == 0
+
+    def test_add_many(self):
+        """
+        Function tests that totals of many titles are added with a single upsert,
+        incrementing existing rows and creating missing ones.
+
+        Return: None.
+        """
+        with TestingSessionLocal() as db:
+            ids = [self.create_movie(db, f"Movie {i}") for i in range(3)]
+            repository = MovieStatsRepository(db, MovieStats)
+            repository.add(ids[0], views=2, rating_sum=8, rating_count=1)
+            db.commit()
+            with QueryCounter() as counter:
+                repository.add_many({ids[0]: (1, 2, 0), ids[1]: (1, 5, 1), ids[2]: (0, 0, 0)})
+            db.commit()
+            stats = {movie_id: (views, rating_sum, rating_count) for movie_id, views, rating_sum, rating_count in
+                     db.query(MovieStats.movie_id, MovieStats.views, MovieStats.rating_sum, MovieStats.rating_count)}
+        assert counter.count == 1
+        assert stats == {ids[0]: (3, 10, 1), ids[1]: (1, 5, 1)}
+
+
+class TestTrending(TestClass):
+    """Test decayed views of trending titles, their storage and their rebuild from watch records."""
+
+    @pytest.fixture(autouse=True)
+    def test_database(self, monkeypatch):
+        """
+        Function serves trending titles from the test database, at a fixed time.
+
+        Param monkeypatch: Replace the session factory of the service and the trending engine.
+        Return: None.
+        """
+        self.now = NOW
+        self.engine = self.create_engine()
+        monkeypatch.setattr("app.users.service.user_watch_movie_service.SessionLocal", TestingSessionLocal)
+        monkeypatch.setattr("app.users.service.user_watch_movie_service.trending_engine", self.engine)
+
+    def create_engine(self, capacity: int = 100) -> TrendingEngine:
+        """
+        Function creates a trending engine of the test database with the clock of the test.
+
+        Param capacity:int: Number of top titles kept in memory.
+        Return: TrendingEngine.
+        """
+        return TrendingEngine(TestingSessionLocal, windows="24h,7d,all", capacity=capacity, clock=lambda: self.now)
+
+    def test_recent_views_outweigh_older_views(self):
+        """
+        Function tests that views lose half of their weight every window, and that all-time scores
+        are the number of views.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        self.engine.restore()
+        self.engine.record(MOVIES, "old", views=3, when=NOW - 48 * HOUR)
+        self.engine.record(MOVIES, "new")
+        assert [movie_id for movie_id, _ in self.engine.top(MOVIES, "24h")] == ["new", "old"]
+        assert self.engine.top(MOVIES, "24h")[1][1] == pytest.approx(0.75)
+        assert self.engine.top(MOVIES, "all") == [("old", 3.0), ("new", 1.0)]
+        self.now += 24 * HOUR
+        assert self.engine.top(MOVIES, "24h") == [("new", pytest.approx(0.5)), ("old", pytest.approx(0.375))]
+        assert self.engine.top(SERIES, "7d") == []
+        with pytest.raises(UnknownTrendingWindowException):
+            self.engine.top(MOVIES, "1y")
+
+    def test_top_titles_are_bounded(self):
+        """
+        Function tests that only the titles with the highest scores are kept, and that a title
+        whose score grows replaces the lowest one.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        engine = self.create_engine(capacity=2)
+        engine.restore()
+        for movie_id, views in (("x", 5), ("y", 3), ("z", 1)):
+            engine.record(MOVIES, movie_id, views=views)
+        assert engine.top(MOVIES, "all") == [("x", 5.0), ("y", 3.0)]
+        engine.record(MOVIES, "z", views=5)
+        assert engine.top(MOVIES, "all") == [("z", 6.0), ("x", 5.0)]
+        assert engine.top(MOVIES, "all", limit=1) == [("z", 6.0)]
+
+    def test_reads_do_not_query_database(self):
+        """
+        Function tests that trending titles are read from memory, even before stored scores were restored.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        with QueryCounter() as counter:
+            assert self.engine.top(MOVIES, "all") == []
+            self.engine.record(MOVIES, "a")
+            assert self.engine.top(MOVIES, "all") == [("a", 1.0)]
+        assert counter.count == 0
+
+    def test_sync_merges_views_of_workers(self):
+        """
+        Function tests that every worker stores its views once, and reads the views of the other workers.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        first, second = self.create_engine(), self.create_engine()
+        first.restore()
+        second.restore()
+        movie_a, movie_b = new_id(), new_id()
+        first.record(MOVIES, movie_a, views=2)
+        second.record(MOVIES, movie_b)
+        assert first.sync() == 3
+        assert second.sync() == 3
+        first.sync()
+        assert first.top(MOVIES, "all") == second.top(MOVIES, "all") == [(movie_a, 2.0), (movie_b, 1.0)]
+        self.now += 24 * HOUR
+        third = self.create_engine()
+        third.restore()
+        assert third.top(MOVIES, "24h") == [(movie_a, pytest.approx(1.0)), (movie_b, pytest.approx(0.5))]
+
+    def test_rebuild_from_watch_records(self):
+        """
+        Function tests that scores are rebuilt from the dates of watch records when they are restored,
+        and that views of series are counted once per user.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        today = datetime.fromtimestamp(NOW).date()
+        with TestingSessionLocal() as db:
+            movies = [Movie(title, "Description", "1994", None, None) for title in ("Old", "New")]
+            series = Series("Lost", "2004", None, None)
+            series.description = "Description"
+            db.add_all([*movies, series])
+            db.commit()
+            episodes = [Episode(f"Episode {i}", series.id) for i in range(2)]
+            for episode in episodes:
+                episode.description = "Description"
+            users = [User(f"user{i}@gmail.com", "123", f"user{i}") for i in range(4)]
+            db.add_all([*episodes, *users])
+            db.commit()
+            db.add_all([UserWatchMovie(user.id, movies[0].id, date_watched=today - timedelta(days=30))
+                        for user in users])
+            db.add_all([UserWatchMovie(user.id, movies[1].id, date_watched=today) for user in users[:2]])
+            db.add_all([UserWatchEpisode(users[0].id, episodes[0].id, date_watched=today - timedelta(days=7)),
+                        UserWatchEpisode(users[0].id, episodes[1].id, date_watched=today)])
+            db.commit()
+            ids = {movie.title: movie.id for movie in movies}
+            series_id = series.id
+        assert self.engine.top(MOVIES, "all") == []
+        assert self.engine.restore() == {MOVIES: 6, SERIES: 3}
+        assert [movie_id for movie_id, _ in self.engine.top(MOVIES, "all")] == [ids["Old"], ids["New"]]
+        assert [movie_id for movie_id, _ in self.engine.top(MOVIES, "7d")] == [ids["New"], ids["Old"]]
+        assert self.engine.top(SERIES, "all") == [(series_id, 1.0)]
+        assert self.engine.top(SERIES, "7d") == [(series_id, pytest.approx(0.5))]
+        assert self.engine.rebuild(MOVIES) == {MOVIES: 6}
+
+    def test_top_ten_movies_by_window(self):
+        """
+        Function tests that watching a movie updates the trending movies of every window, and that
+        an unknown window is rejected.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        with TestingSessionLocal() as db:
+            movies = [Movie(title, "Description", "1994", None, None) for title in ("Old", "New")]
+            users = [User(f"user{i}@gmail.com", "123", f"user{i}") for i in range(3)]
+            db.add_all([*movies, *users])
+            db.commit()
+            db.add_all([UserWatchMovie(user.id, movies[0].id, date_watched="2026-09-01") for user in users])
+            db.commit()
+            user_ids, movie_id = [user.id for user in users], movies[1].id
+        self.engine.restore()
+        for user_id in user_ids[:2]:
+            UserWatchMovieServices.user_watch_movie(user_id, movie_id)
+        headers = {"Authorization": f"Bearer {sign_jwt(user_ids[0], 'regular_user')['access_token']}"}
+        response = client.get("/api/watch-movie/top-ten-movies", headers=headers)
+        assert response.json() == {"Old": {"Views": 3}, "New": {"Views": 2}}
+        response = client.get("/api/watch-movie/top-ten-movies", params={"window": "24h"}, headers=headers)
+        assert list(response.json()) == ["New", "Old"]
+        response = client.get("/api/watch-movie/top-ten-movies", params={"window": "1y"}, headers=headers)
+        assert response.status_code == 400
@@ -0,0 +1,194 @@
+"""Test Cache module"""
+import time
+from uuid import uuid4
+
+import pytest
+from starlette.responses import JSONResponse
+
+from app.cache import MemoryCacheBackend, ResponseCache
+from app.genres.models import Genre
+from app.genres.schemas import GenreSchema
+
+
+@pytest.fixture
+def anyio_backend():
+    """Run async tests on asyncio only."""
+    return "asyncio"
+
+
+class TestMemoryCacheBackend:
+    """Test expiry and eviction of the in-process cache backend."""
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """
+        Function tests that the least recently used entry is evicted when the cache is full.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        backend = MemoryCacheBackend(max_entries=2)
+        backend.set("a", "1", ttl=60)
+        backend.set("b", "2", ttl=60)
+        assert backend.get("a") == "1"
+        backend.set("c", "3", ttl=60)
+        assert backend.get("b") is None
+        assert backend.get("a") == "1"
+        assert len(backend) == 2
+
+    def test_expired_entries_are_not_returned(self, monkeypatch):
+        """
+        Function tests that entries are not returned once their TTL has passed.
+
+        Param self: Access the test class and its methods.
+        Param monkeypatch: Pytest fixture for changing the clock.
+        Return: None.
+        """
+        backend = MemoryCacheBackend()
+        backend.set("a", "1", ttl=10)
+        now = time.monotonic()
+        monkeypatch.setattr("app.cache.cache_backend.time.monotonic", lambda: now + 11)
+        assert backend.get("a") is None
+        assert len(backend) == 0
+
+    def test_unbounded_entries_are_only_dropped_when_expired(self, monkeypatch):
+        """
+        Function tests that a cache without max_entries keeps every live entry, and sweeps expired entries.
+
+        Param self: Access the test class and its methods.
+        Param monkeypatch: Pytest fixture for changing the clock.
+        Return: None.
+        """
+        backend = MemoryCacheBackend(max_entries=None)
+        for number in range(1500):
+            backend.set(str(number), "revoked", ttl=10 if number < 1000 else 60)
+        assert len(backend) == 1500
+        assert backend.get("0") == "revoked"
+        now = time.monotonic()
+        monkeypatch.setattr("app.cache.cache_backend.time.monotonic", lambda: now + 11)
+        for number in range(1500, 2500):
+            backend.set(str(number), "revoked", ttl=60)
+        assert len(backend) == 1500
+        assert backend.get("1000") == "revoked"
+
+
+class TestResponseCache:
+    """Test caching, invalidation and counters of the response cache."""
+
+    @staticmethod
+    def create_cache():
+        """
+        Function creates a response cache with an in-process backend and a counted function.
+
+        Return: A tuple of the cache, the cached function and the list of its calls.
+        """
+        cache = ResponseCache(MemoryCacheBackend())
+        calls = []
+
+        @cache.cached("movie-ratings")
+        def get_ratings(best: bool = True):
+            calls.append(best)
+            return [{"Movie": len(calls)}]
+        return cache, get_ratings, calls
+
+    def test_results_are_cached_per_arguments(self):
+        """
+        Function tests that a repeated call is served from the cache, and that
+        calls with different arguments are cached separately.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        cache, get_ratings, calls = self.create_cache()
+        assert get_ratings(True) == get_ratings(True) == [{"Movie": 1}]
+        assert get_ratings(False) == [{"Movie": 2}]
+        assert calls == [True, False]
+        snapshot = cache.snapshot()
+        assert (snapshot["hits"], snapshot["misses"]) == (1, 2)
+        assert snapshot["namespaces"]["movie-ratings"]["hits"] == 1
+
+    def test_invalidate_only_clears_namespace(self):
+        """
+        Function tests that invalidating a namespace recomputes its results and keeps other namespaces.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        cache, get_ratings, calls = self.create_cache()
+
+        @cache.cached("genres")
+        def get_genres():
+            calls.append("genres")
+            return ["Drama"]
+
+        get_ratings()
+        get_genres()
+        cache.invalidate("movie-ratings")
+        get_ratings()
+        get_genres()
+        assert calls == [True, "genres", True]
+        assert cache.snapshot()["namespaces"]["movie-ratings"]["invalidations"] == 1
+
+    def test_result_is_not_stored_after_concurrent_invalidation(self):
+        """
+        Function tests that a result computed while its namespace was invalidated is not cached,
+        so a write during a slow read does not leave stale data behind.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        cache = ResponseCache(MemoryCacheBackend())
+        calls = []
+
+        @cache.cached("movie-views")
+        def get_views():
+            calls.append(1)
+            if len(calls) == 1:
+                cache.invalidate("movie-views")
+            return {"Movie": len(calls)}
+
+        assert get_views() == {"Movie": 1}
+        assert get_views() == {"Movie": 2}
+        assert get_views() == {"Movie": 2}
+
+    def test_responses_and_orm_objects(self):
+        """
+        Function tests that responses are not cached and that ORM objects are stored through their schema.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        cache = ResponseCache(MemoryCacheBackend())
+        genre = Genre("Drama")
+        genre.id = str(uuid4())
+
+        @cache.cached("genres", schema=GenreSchema)
+        def get_genres():
+            return [genre]
+
+        @cache.cached("movie-ratings")
+        def get_empty():
+            return JSONResponse(content="No ratings.")
+
+        assert get_genres() == [{"id": genre.id, "name": "Drama"}]
+        assert get_genres() == [{"id": genre.id, "name": "Drama"}]
+        assert isinstance(get_empty(), JSONResponse)
+        assert len(cache.backend) == 1
+
+    @pytest.mark.anyio
+    async def test_async_functions_are_cached(self):
+        """
+        Function tests that coroutine functions are cached as well.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        cache = ResponseCache(MemoryCacheBackend())
+        calls = []
+
+        @cache.cached("directors")
+        async def get_directors():
+            calls.append(1)
+            return ["Quentin Tarantino"]
+
+        assert await get_directors() == await get_directors() == ["Quentin Tarantino"]
+        assert len(calls) == 1
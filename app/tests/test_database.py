@@ -0,0 +1,382 @@
+"""Test Database module"""
+import json
+import logging
+from uuid import UUID
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, inspect, select, text
+from sqlalchemy.exc import StatementError
+
+from app.config import settings
+from app.db import Base, QueryBudget, UUIDKey, pool_metrics, query_instrumentation_middleware, query_stats_scope, \
+    request_session_scope, uuid7
+from app.db.instrumentation import instrument, query_logger, redact
+from app.db.migrations import current_version, downgrade, load_migrations, schema_migrations, upgrade
+from app.db.migrations.operations import index_names, rebuild_tables, table_names
+from app.db.migrations.versions.v0002_query_indexes import INDEXES
+from app.db.pool import TimedQueuePool
+from app.db.request_session import RequestScopedSessionmaker, RequestSession
+from app.movies.models import Movie
+from app.movies.repositories import MovieRepository
+from app.tests import MYSQL_URL_TEST, TestClass, TestingSessionLocal, engine
+
+SessionLocal = RequestScopedSessionmaker(autocommit=False, autoflush=True, bind=engine, class_=RequestSession)
+
+
+class TestRequestSession:
+    """Test sharing of a single session within a request scope."""
+
+    def test_sessions_are_not_shared_outside_of_request(self):
+        """
+        Function tests that every call creates a new session when there is no request scope.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        with SessionLocal() as first, SessionLocal() as second:
+            assert first is not second
+
+    def test_session_is_shared_within_request(self):
+        """
+        Function tests that services within one request share a session, that closing it in a service
+        keeps its transaction open, and that the session is closed when the request ends.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        with request_session_scope() as scope:
+            with SessionLocal() as db:
+                db.execute(text("SELECT 1"))
+            with SessionLocal() as other:
+                assert other is db
+                assert other.in_transaction()
+        assert scope.closed
+        assert not db.in_transaction()
+        with SessionLocal() as db_after_request:
+            assert db_after_request is not db
+
+
+class TestPoolMetrics:
+    """Test recording of connection pool checkouts."""
+
+    def test_checkout_wait_is_recorded(self):
+        """
+        Function tests that every checkout from the pool is counted, and that pool state is reported.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        timed_engine = create_engine(MYSQL_URL_TEST, poolclass=TimedQueuePool, pool_size=1, max_overflow=0)
+        pool_metrics.reset()
+        for _ in range(3):
+            with timed_engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+        metrics = pool_metrics.snapshot(timed_engine.pool)
+        timed_engine.dispose()
+        assert metrics["checkouts"] == 3
+        assert metrics["wait_seconds_max"] >= metrics["wait_seconds_avg"] >= 0
+        assert metrics["size"] == 1
+        assert metrics["checked_out"] == 0
+
+
+class TestQueryInstrumentation:
+    """Test per-request statistics of statements, the slow query log and query budgets."""
+
+    instrumented_engine = create_engine(MYSQL_URL_TEST)
+    instrument(instrumented_engine)
+
+    def run_statements(self, number: int):
+        """Runs a number of statements on the instrumented engine."""
+        with self.instrumented_engine.connect() as connection:
+            for _ in range(number):
+                connection.execute(text("SELECT 1"))
+
+    def test_statements_are_recorded_per_scope(self):
+        """
+        Function tests that statements within a scope are counted and timed, and that statements outside
+        of any scope are not recorded.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        self.run_statements(1)
+        with query_stats_scope("GET /test") as stats:
+            self.run_statements(4)
+        self.run_statements(1)
+        assert stats.count == 4
+        assert len(stats.slowest) == 3
+        assert stats.seconds >= stats.slowest[0][0] >= stats.slowest[-1][0]
+        assert stats.server_timing().endswith('desc="4 queries"')
+
+    def test_slow_queries_are_logged_with_redacted_parameters(self, monkeypatch):
+        """
+        Function tests that slow statements are logged as JSON with parameter values replaced by their types,
+        and that sensitive values are redacted even when parameter values are logged.
+
+        Param self: Access the test class and its methods.
+        Param monkeypatch: Fixture for changing settings.
+        Return: None.
+        """
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        query_logger.addHandler(handler)
+        monkeypatch.setattr(settings, "DB_SLOW_QUERY_MS", 1e-9)
+        try:
+            with self.instrumented_engine.connect() as connection:
+                connection.execute(text("SELECT :email, :page"), {"email": "user@example.com", "page": 2})
+        finally:
+            query_logger.removeHandler(handler)
+        entry = json.loads(records[-1].getMessage())
+        parameters = entry["parameters"]
+        assert entry["event"] == "slow_query"
+        assert list(parameters.values() if isinstance(parameters, dict) else parameters) == ["<str>", "<int>"]
+        monkeypatch.setattr(settings, "DB_SLOW_QUERY_PARAMETERS", True)
+        assert redact({"email": "user@example.com", "page": 2}) == {"email": "<str>", "page": 2}
+        assert redact([{"page": 1}, {"page": 2}], executemany=True) == {"rows": 2}
+
+    def test_query_budget_of_route(self, monkeypatch):
+        """
+        Function tests that the Server-Timing header reports the statements of a request, and that a request
+        exceeding the query budget of its route fails only in strict mode.
+
+        Param self: Access the test class and its methods.
+        Param monkeypatch: Fixture for changing settings.
+        Return: None.
+        """
+        budget_app = FastAPI()
+        budget_app.middleware("http")(query_instrumentation_middleware)
+
+        @budget_app.get("/statements", dependencies=[Depends(QueryBudget(2))])
+        def statements(number: int):
+            self.run_statements(number)
+            return {"statements": number}
+
+        budget_client = TestClient(budget_app)
+        response = budget_client.get("/statements", params={"number": 2})
+        assert response.status_code == 200
+        assert response.headers["Server-Timing"].endswith('desc="2 queries"')
+        monkeypatch.setattr(settings, "DB_QUERY_BUDGET_STRICT", True)
+        response = budget_client.get("/statements", params={"number": 3})
+        assert response.status_code == 500
+        assert response.json()["queries"]["route"] == "GET /statements"
+        assert response.json()["queries"]["queries"] == 3
+        monkeypatch.setattr(settings, "DB_QUERY_BUDGET_STRICT", False)
+        assert budget_client.get("/statements", params={"number": 3}).status_code == 200
+
+
+class TestMigrations(TestClass):
+    """Test applying and reverting versioned schema migrations."""
+
+    @staticmethod
+    def teardown_method():
+        """Drop the tables and the migration history."""
+        TestClass.teardown_method()
+        schema_migrations.drop(engine, checkfirst=True)
+
+    def test_upgrade_applies_pending_migrations_once(self):
+        """
+        Function tests that upgrade applies every migration in order on an empty database,
+        and that running it again applies nothing.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        Base.metadata.drop_all(bind=engine)
+        migrations = load_migrations()
+        assert [migration.version for migration in migrations] == sorted(migration.version for migration in migrations)
+        versions = [migration.version for migration in migrations if migration.applies()]
+        assert versions[0] == 1
+        assert [migration.version for migration in upgrade(engine)] == versions
+        assert current_version(engine) == versions[-1]
+        assert upgrade(engine) == []
+
+    @pytest.mark.skipif(settings.DB_COMPACT_KEYS, reason="Compact keys cannot be reverted while they are enabled.")
+    def test_query_indexes_are_restored_after_downgrade(self):
+        """
+        Function tests that reverting the query indexes drops them and that upgrading creates them again,
+        as it does for databases created before the indexes were declared.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        upgrade(engine)
+        downgrade(engine, 1)
+        assert current_version(engine) == 1
+        with engine.connect() as connection:
+            assert "ix_users_verification_code" not in index_names(connection, "users")
+        assert [migration.version for migration in upgrade(engine, target=2)] == [2]
+        with engine.connect() as connection:
+            for table, name, _ in INDEXES:
+                assert name in index_names(connection, table)
+
+    @staticmethod
+    def describe_schema(connection, tables: list) -> dict:
+        """Returns the columns, keys, indexes and unique constraints of tables, as reflected from the database."""
+        inspector = inspect(connection)
+        return {table: {
+            "columns": {column["name"]: column["nullable"] for column in inspector.get_columns(table)},
+            "primary_key": set(inspector.get_pk_constraint(table)["constrained_columns"]),
+            "foreign_keys": {(tuple(key["constrained_columns"]), key["referred_table"],
+                              key["options"].get("ondelete")) for key in inspector.get_foreign_keys(table)},
+            "indexes": {index["name"] for index in inspector.get_indexes(table)
+                        if not index["name"].startswith("ft_")},
+            "unique": {constraint["name"] for constraint in inspector.get_unique_constraints(table)
+                       if constraint["name"]},
+        } for table in tables}
+
+    def test_migrated_schema_matches_models(self):
+        """
+        Function tests that upgrading an empty database creates the tables as the models declare them.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        Base.metadata.drop_all(bind=engine)
+        upgrade(engine)
+        tables = sorted(table.name for table in Base.metadata.sorted_tables)
+        with engine.connect() as connection:
+            assert sorted(set(table_names(connection)) - {schema_migrations.name}) == tables
+            migrated = self.describe_schema(connection, tables)
+        schema_migrations.drop(engine)
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        with engine.connect() as connection:
+            assert migrated == self.describe_schema(connection, tables)
+
+    def test_stats_foreign_keys_cascade_after_upgrade(self):
+        """
+        Function tests that the foreign keys of the stats tables are changed to cascade in place,
+        keeping the rows and indexes of the tables, and that reverting the change restores them.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        Base.metadata.drop_all(bind=engine)
+        upgrade(engine)
+        movie_id = str(uuid7())
+        with engine.begin() as connection:
+            connection.execute(text("INSERT INTO movies (id, title, description, date_added, year_published, link) "
+                                    "VALUES (:id, 'Heat', 'Description', '2026-10-18', '1995', 'link')"),
+                               {"id": UUIDKey().process_bind_param(movie_id, connection.dialect)})
+            connection.execute(text("INSERT INTO movie_stats (movie_id, views, rating_sum, rating_count) "
+                                    "SELECT id, 3, 0, 0 FROM movies"))
+        for version, ondelete in ((8, None), (None, "CASCADE")):
+            if version is None:
+                upgrade(engine)
+            else:
+                downgrade(engine, version)
+            with engine.connect() as connection:
+                for table in ("movie_stats", "episode_stats", "series_stats"):
+                    keys = inspect(connection).get_foreign_keys(table)
+                    assert [key["options"].get("ondelete") for key in keys] == [ondelete]
+                    assert f"ix_{table}_views" in index_names(connection, table)
+                assert connection.execute(text("SELECT views FROM movie_stats")).scalar() == 3
+
+    def test_missing_dates_added_are_filled_in(self):
+        """
+        Function tests that upgrading fills in movies without the date they were added and makes the date required,
+        so following cursors walks through all movies.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        Base.metadata.drop_all(bind=engine)
+        upgrade(engine, target=3)
+        with engine.begin() as connection:
+            for number, date_added in enumerate(("2022-05-01", None, "2021-03-01", None, None)):
+                connection.execute(text("INSERT INTO movies (id, title, description, date_added, year_published, "
+                                        "link) VALUES (:id, :title, 'Description', :date_added, '1995', 'link')"),
+                                   {"id": str(uuid7()), "title": f"Movie {number}", "date_added": date_added})
+        upgrade(engine)
+        with engine.connect() as connection:
+            assert not next(column for column in inspect(connection).get_columns("movies")
+                            if column["name"] == "date_added")["nullable"]
+        with TestingSessionLocal() as db:
+            assert [str(date_added) for date_added, in db.query(Movie.date_added).order_by(Movie.date_added)] == \
+                   ["2021-03-01"] * 4 + ["2022-05-01"]
+            movies, cursor = [], None
+            while True:
+                page = MovieRepository(db, Movie).read_page(cursor=cursor, limit=2)
+                movies += [movie.title for movie in page]
+                cursor = page.next_cursor
+                if cursor is None:
+                    break
+        assert sorted(movies) == [f"Movie {number}" for number in range(5)]
+
+    def test_model_indexes_are_created_by_migrations(self):
+        """
+        Function tests that every index declared on the models of the indexed tables is also created
+        by the query index migration, so existing databases get the same indexes as new ones.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        tables = {table for table, _, _ in INDEXES}
+        declared = {index.name for table in Base.metadata.sorted_tables if table.name in tables
+                    for index in table.indexes}
+        assert declared <= {name for _, name, _ in INDEXES}
+
+
+class TestCompactKeys:
+    """Test time-ordered UUIDs, binary key columns and conversion of string keys."""
+
+    @staticmethod
+    def teardown_method():
+        """Drop the test table."""
+        with engine.begin() as connection:
+            connection.execute(text("DROP TABLE IF EXISTS compact_keys_test"))
+
+    def test_uuid7_is_time_ordered(self):
+        """
+        Function tests that UUIDs created one after another are version 7 UUIDs in ascending order.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        ids = [uuid7() for _ in range(5000)]
+        assert all(uuid.version == 7 for uuid in ids)
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+
+    def test_string_keys_are_converted_to_binary(self):
+        """
+        Function tests that rebuilding a table with string keys stores them as 16 bytes,
+        and that they are read back and filtered on as canonical UUID strings.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        legacy = Table("compact_keys_test", MetaData(), Column("id", String(50), primary_key=True),
+                       Column("number", Integer()))
+        compact = Table("compact_keys_test", MetaData(), Column("id", UUIDKey(compact=True), primary_key=True),
+                        Column("number", Integer()))
+        ids = [str(uuid7()) for _ in range(7)]
+        with engine.begin() as connection:
+            legacy.create(connection)
+            connection.execute(legacy.insert(), [{"id": id_, "number": i} for i, id_ in enumerate(ids)])
+            assert rebuild_tables(connection, [compact], chunk_size=3) == {"compact_keys_test": 7}
+            assert connection.execute(text("SELECT id FROM compact_keys_test")).scalars().first() in \
+                   {UUID(id_).bytes for id_ in ids}
+            assert connection.execute(select(compact.c.id).order_by(compact.c.id)).scalars().all() == ids
+            assert connection.execute(select(compact.c.number).where(compact.c.id == ids[4])).scalar() == 4
+
+    def test_malformed_keys_are_not_stored(self):
+        """
+        Function tests that a value that is not a UUID matches no row of a binary key column,
+        and that it cannot be stored, so every stored key can be read back.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        compact = Table("compact_keys_test", MetaData(), Column("id", UUIDKey(compact=True), primary_key=True),
+                        Column("number", Integer()))
+        with engine.begin() as connection:
+            compact.create(connection)
+            connection.execute(compact.insert(), {"id": str(uuid7()), "number": 1})
+            assert connection.execute(select(compact.c.number).where(compact.c.id == "a")).all() == []
+            assert connection.execute(select(compact.c.number).where(compact.c.id.in_(["a", "b"]))).all() == []
+            with pytest.raises(StatementError):
+                connection.execute(compact.insert(), {"id": "a", "number": 2})
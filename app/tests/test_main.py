@@ -1,11 +1,16 @@
 """Test Class module"""
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
+from app.cache import response_cache
 from app.config import settings
 from app.db import Base
 from app.main import app
+from app.search import clear_search_indexes
+from app.stats.service import trending_engine
 
 MYSQL_URL_TEST = \
     f"{settings.DB_HOST}://{settings.DB_USER}:{settings.DB_PASSWORD}@{settings.DB_HOSTNAME}:" \
@@ -15,9 +20,48 @@ engine = create_engine(MYSQL_URL_TEST, echo=True)
 
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+ASYNC_MYSQL_URL_TEST = \
+    f"{settings.DB_ASYNC_HOST}://{settings.DB_USER}:{settings.DB_PASSWORD}@{settings.DB_HOSTNAME}:" \
+    f"{settings.DB_PORT}/{settings.DB_NAME_TEST}"
+
+# Every async test runs in its own event loop, so connections must not be pooled between tests.
+async_engine = create_async_engine(ASYNC_MYSQL_URL_TEST, echo=True, poolclass=NullPool)
+
+AsyncTestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=async_engine, class_=AsyncSession,
+                                        expire_on_commit=False)
+
+# Requests of the tests fail when a route runs more statements than its query budget.
+settings.DB_QUERY_BUDGET_STRICT = True
+
 client = TestClient(app)
 
 
+class QueryCounter:
+    """
+    Context manager that counts SQL statements executed on an engine.
+    Used to assert that a code path runs a fixed number of queries, regardless of the number of rows.
+    """
+
+    def __init__(self, bind=engine):
+        self.bind = bind
+        self.statements = []
+
+    @property
+    def count(self) -> int:
+        """Number of statements executed while the counter was active."""
+        return len(self.statements)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def __enter__(self):
+        event.listen(self.bind, "before_cursor_execute", self._before_cursor_execute)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        event.remove(self.bind, "before_cursor_execute", self._before_cursor_execute)
+
+
 class TestClass:
     """Class for running tests."""
 
@@ -32,3 +76,6 @@ class TestClass:
     def teardown_method():
         """Teardown any state that was previously setup with a setup method call."""
         Base.metadata.drop_all(bind=engine)
+        clear_search_indexes()
+        response_cache.clear()
+        trending_engine.clear()
@@ -0,0 +1,75 @@
+"""Test Metrics module"""
+import threading
+
+from app.metrics import MetricsRegistry
+from app.tests import TestClass, client
+
+
+class TestMetricsRegistry:
+    """Test metrics and their Prometheus text format."""
+
+    def test_histogram_buckets_are_cumulative(self):
+        """
+        Function tests that observations are counted in the first bucket they fit in, and that buckets,
+        sum and count are rendered cumulatively per label values.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value, "/a")
+        lines = registry.render().splitlines()
+        assert lines[:2] == ["# HELP latency_seconds Latency.", "# TYPE latency_seconds histogram"]
+        assert lines[2:] == ['latency_seconds_bucket{route="/a",le="0.1"} 2',
+                             'latency_seconds_bucket{route="/a",le="1.0"} 3',
+                             'latency_seconds_bucket{route="/a",le="+Inf"} 4',
+                             'latency_seconds_sum{route="/a"} 2.65',
+                             'latency_seconds_count{route="/a"} 4']
+
+    def test_updates_of_threads_are_added_up(self):
+        """
+        Function tests that counters updated concurrently from threads, each in its own shard,
+        add up to the exact total, and that label values are escaped.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        registry = MetricsRegistry()
+        counter = registry.counter("events_total", "Events.", ("kind",))
+
+        def count():
+            for _ in range(10000):
+                counter.inc('say "hi"')
+
+        threads = [threading.Thread(target=count) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert registry.render().splitlines()[-1] == r'events_total{kind="say \"hi\""} 80000.0'
+        assert registry.counter("events_total", "Events.") is counter
+
+
+class TestMetricsEndpoint(TestClass):
+    """Test the metrics of the application."""
+
+    def test_metrics_endpoint_reports_routes_by_router(self):
+        """
+        Function tests that the metrics endpoint reports requests by the router of their route, and the state
+        of the threadpool and the connection pool.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        client.get("/api/movies/")
+        client.get("/api/unknown-path")
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        requests = 'http_requests_total{router="movie_router",route="/api/movies/",method="GET",status="200"}'
+        assert requests in response.text
+        assert 'http_request_duration_seconds_count{router="app",route="unmatched",method="GET"}' in response.text
+        assert 'threadpool_threads{state="limit"}' in response.text
+        assert 'db_pool_connections{state="checked_out"}' in response.text
@@ -0,0 +1,88 @@
+"""Test Profiling module"""
+import json
+import marshal
+import threading
+import time
+
+from app.profiling import ProfileStore, RequestProfile
+from app.profiling.profiler import SamplingSession
+from app.tests import TestClass, client
+from app.users.service import sign_jwt
+
+
+def busy_wait(seconds: float):
+    """Function keeps the thread busy for the given time."""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class TestRequestProfiling(TestClass):
+    """Test profiling of admin requests and the store of profiles."""
+
+    admin = {"Authorization": f"Bearer {sign_jwt('admin', 'super_user')['access_token']}"}
+    user = {"Authorization": f"Bearer {sign_jwt('user', 'regular_user')['access_token']}"}
+
+    def test_admin_request_is_profiled(self):
+        """
+        Function tests that a request of an admin with the X-Profile header is profiled with cProfile,
+        that the profile of the endpoint is downloaded in the pstats format, and that the flag is ignored
+        in requests of other users.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        response = client.get("/api/stats/db-pool", headers={**self.admin, "X-Profile": "pstats"})
+        assert response.status_code == 200
+        download = client.get(response.headers["X-Profile-Url"], headers=self.admin)
+        assert download.status_code == 200
+        assert download.headers["content-disposition"].endswith('.pstats"')
+        functions = {function for _, _, function in marshal.loads(download.content)}
+        assert "get_pool_status" in functions
+        response = client.get("/api/movies/", params={"profile": "pstats"}, headers=self.user)
+        assert response.status_code == 200
+        assert "X-Profile-Id" not in response.headers
+        assert client.get("/api/profiles/unknown", headers=self.admin).status_code == 404
+
+    def test_sampling_profile_in_speedscope_format(self):
+        """
+        Function tests that the sampling profiler records stacks of the profiled thread only,
+        from the outermost frame, in the speedscope format.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        session = SamplingSession(interval=0.001)
+        other = threading.Thread(target=busy_wait, args=(0.05,))
+        other.start()
+        ident = session.start()
+        busy_wait(0.05)
+        session.stop(ident)
+        other.join()
+        profile = json.loads(session.artifact("GET /test"))
+        frames = profile["shared"]["frames"]
+        samples = profile["profiles"][0]["samples"]
+        assert profile["profiles"][0]["type"] == "sampled"
+        assert samples and len(samples) == len(profile["profiles"][0]["weights"])
+        assert "busy_wait" in {frames[stack[-1]]["name"] for stack in samples}
+        assert not any(frames[index]["name"] == "_bootstrap_inner" for stack in samples for index in stack)
+
+    def test_store_keeps_latest_and_slowest_profiles(self):
+        """
+        Function tests that the store keeps the latest profile and the slowest others when it is full,
+        and drops expired profiles.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        store = ProfileStore(capacity=2, max_age=60)
+
+        def profile(seconds: float) -> RequestProfile:
+            session = SamplingSession()
+            return store.add(RequestProfile(session, "GET /test", seconds, 200))
+
+        slow, fast, latest = profile(3.0), profile(1.0), profile(0.5)
+        assert [summary["id"] for summary in store.list()] == [slow.id, latest.id]
+        assert store.get(fast.id) is None
+        store.max_age = 0
+        assert store.list() == []
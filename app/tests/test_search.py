@@ -0,0 +1,104 @@
+"""Test Search module"""
+import pytest
+
+from app.config import settings
+from app.movies.models import Movie
+from app.movies.repositories import MovieRepository
+from app.search import TrigramIndex, TrigramSearchBackend, get_search_backend, search_ids
+from app.tests import TestClass, TestingSessionLocal
+
+
+class TestTrigramIndex:
+    """Test ranking and matching of the in-process trigram index."""
+
+    @staticmethod
+    def create_index():
+        """
+        Function creates an index with a few movie titles.
+
+        Return: TrigramIndex.
+        """
+        index = TrigramIndex()
+        index.add_many([("1", "The Godfather"), ("2", "The Godfather Part II"), ("3", "Goodfellas"),
+                        ("4", "Pulp Fiction"), ("5", "Amélie")])
+        return index
+
+    @pytest.mark.parametrize("term, expected", [("godfather", "1"), ("godf", "1"), ("godfahter", "1"),
+                                                ("PULP fict", "4"), ("amelie", "5")])
+    def test_search_matches_prefixes_and_typos(self, term, expected):
+        """
+        Function tests that whole words, prefixes, misspelled words and accented words are matched,
+        and that the best match comes first.
+
+        Param self: Access the test class and its methods.
+        Param term:str: Search term.
+        Param expected:str: ID of the best match.
+        Return: None.
+        """
+        assert self.create_index().search(term)[0] == expected
+
+    def test_search_ranks_shorter_matches_first(self):
+        """
+        Function tests that among equally similar documents, shorter ones come first,
+        and that unrelated documents are not returned.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        assert self.create_index().search("the godfather") == ["1", "2"]
+
+    def test_remove_and_replace_documents(self):
+        """
+        Function tests that removed documents are no longer found and that adding a document
+        with an existing ID replaces its text.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        index = self.create_index()
+        index.remove("3")
+        index.add("4", "Jackie Brown")
+        assert index.search("goodfellas") == []
+        assert index.search("pulp") == []
+        assert index.search("jackie") == ["4"]
+        assert len(index) == 4
+
+
+class TestSearchIndexSync(TestClass):
+    """Test that the trigram index follows committed changes of searchable objects."""
+
+    def test_index_follows_committed_changes(self, monkeypatch):
+        """
+        Function tests that created, renamed and deleted movies are reflected in search results
+        once they are committed, and that rolled back changes are not.
+
+        Param self: Access the test class and its methods.
+        Param monkeypatch: Pytest fixture for changing settings.
+        Return: None.
+        """
+        monkeypatch.setattr(settings, "SEARCH_BACKEND", "trigram")
+        with TestingSessionLocal() as db:
+            assert isinstance(get_search_backend(db), TrigramSearchBackend)
+            repository = MovieRepository(db, Movie)
+            db.add(Movie("Reservoir Dogs", "Description", "1992", None, None))
+            db.commit()
+            assert [movie.title for movie in repository.read_movie_by_title("reservoir", search=True)] == \
+                   ["Reservoir Dogs"]
+
+            db.add(Movie("Jackie Brown", "Description", "1997", None, None))
+            db.commit()
+            movie = repository.read_movie_by_title("jaki", search=True)[0]
+            assert movie.title == "Jackie Brown"
+
+            movie.title = "Kill Bill"
+            db.flush()
+            db.rollback()
+            assert search_ids(db, Movie, ("title",), "kill bill") == []
+
+            movie.title = "Kill Bill"
+            db.commit()
+            assert [movie.title for movie in repository.read_movie_by_title("kil", search=True)] == ["Kill Bill"]
+
+            db.delete(movie)
+            db.commit()
+            assert search_ids(db, Movie, ("title",), "kill") == []
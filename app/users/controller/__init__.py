@@ -3,3 +3,4 @@ from .subuser_controller import SubuserController
 from .admin_controller import AdminController
 from .user_auth_controller import JWTBearer
 from .user_watch_movie_controller import UserWatchMovieController
+from .user_watch_event_controller import UserWatchEventController
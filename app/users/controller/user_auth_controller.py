@@ -2,7 +2,8 @@
 from fastapi import Request, HTTPException
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
-from app.users.service import decode_jwt
+from app.users.service import decode_jwt, authenticate
+from app.users.exceptions import InvalidTokenException
 
 
 class JWTBearer(HTTPBearer):
@@ -16,7 +17,8 @@ class JWTBearer(HTTPBearer):
         The __call__ function is called when the class instance is called.
         It returns a coroutine, which can be awaited to get the result of the call.
         The __call__ function must accept one argument: request, which contains all information about
-        the HTTP request that triggered this function call.
+        the HTTP request that triggered this function call. The principal of the token is attached
+        to the request as request.state.principal.
 
         Param self: Access the attributes and methods of the class inside a method.
         Param request:Request: Get the authorization header from the request.
@@ -26,15 +28,31 @@ class JWTBearer(HTTPBearer):
         if credentials:
             if not credentials.scheme == "Bearer":
                 raise HTTPException(status_code=403, detail="Invalid authentication scheme.")
-            payload = self.verify_jwt(credentials.credentials)
-            if not payload.get("valid"):
+            principal = self.get_principal(credentials.credentials)
+            if principal is None:
                 raise HTTPException(status_code=403, detail="Invalid or expired token.")
-            if payload.get("role") not in self.role:
+            if not principal.is_active:
+                raise HTTPException(status_code=403, detail="Inactive user.")
+            if principal.role not in self.role:
                 raise HTTPException(status_code=403, detail="You have no permission to access this route.")
+            request.state.principal = principal
             return credentials.credentials
 
         raise HTTPException(status_code=403, detail="Invalid authorization code.")
 
+    @staticmethod
+    def get_principal(jwt_token: str):
+        """
+        Function resolves the principal of a JWT token, using the verified token cache.
+
+        Param jwt_token:str: Pass the jwt token to be verified
+        Return: Principal with user ID, profile ID, role and active flag, or None if the token is not valid.
+        """
+        try:
+            return authenticate(jwt_token)
+        except InvalidTokenException:
+            return None
+
     @staticmethod
     def verify_jwt(jwt_token: str) -> dict:
         """
@@ -12,7 +12,7 @@ from app.users.exceptions import UnknownProfileException, AdminLoginException
 class UserController:
     """Controller for User routes"""
     @staticmethod
-    def create_user(worker, email, password, username):
+    def create_user(email, password, username):
         """
         Function creates a new user in the database.
         It takes as input an email, password and username. It returns a response with
@@ -24,9 +24,9 @@ class UserController:
         Return: A response object.
         """
         try:
-            return UserServices.create_new_user(worker, email, password, username)
+            return UserServices.create_new_user(email, password, username)
         except AppException as exc:
-            raise HTTPException(status_code=exc.code, detail=exc.message) from exc
+            raise HTTPException(status_code=exc.code, detail=exc.message, headers=exc.headers) from exc
         except Exception as exc:
             raise HTTPException(status_code=500, detail=str(exc)) from exc
 
@@ -49,14 +49,15 @@ class UserController:
             raise HTTPException(status_code=500, detail=str(exc)) from exc
 
     @staticmethod
-    def get_all_users():
+    def get_all_users(schema=None):
         """
         The get_all_users function returns all users in the database.
 
+        Param schema: Response schema whose columns are selected, rows are returned instead of users if given.
         Return: A list of users.
         """
         try:
-            users = UserServices.get_all_users()
+            users = UserServices.get_all_users(schema)
             return users
         except AppException as exc:
             raise HTTPException(status_code=exc.code, detail=exc.message) from exc
@@ -133,23 +134,23 @@ class UserController:
             raise HTTPException(status_code=500, detail=str(exc)) from exc
 
     @staticmethod
-    def reset_password_complete(code: int, password_hashed: str):
+    def reset_password_complete(code: int, password: str):
         """
-        The reset_password_complete function takes in a code and password hashed,
+        The reset_password_complete function takes in a code and a new password,
         and returns the user object associated with that code. If no user is found,
         it raises an HTTPException with status_code 404. If there is an error in
         the database query or if the password does not match the hashed version of
         the new password, it raises an HTTPException with status_code 400.
 
         Param code:int: Identify the user who is trying to reset their password
-        Param password-hashed:str: Store the hashed password
+        Param password:str: New password, hashed by the service
         Return: The user object.
         """
         try:
-            user = UserServices.reset_password_complete(code, password_hashed)
+            user = UserServices.reset_password_complete(code, password)
             return user
         except AppException as exc:
-            raise HTTPException(status_code=exc.code, detail=exc.message) from exc
+            raise HTTPException(status_code=exc.code, detail=exc.message, headers=exc.headers) from exc
         except Exception as exc:
             raise HTTPException(status_code=500, detail=str(exc)) from exc
 
@@ -217,7 +218,7 @@ class UserController:
             if user_with_subs.subusers:
                 for sub in user_with_subs.subusers:
                     if sub.name == username:
-                        return sign_jwt(user.id, "sub_user"), sub.id
+                        return sign_jwt(user.id, "sub_user", sub.id), sub.id
             raise UnknownProfileException
         except AppException as exc:
             raise HTTPException(status_code=exc.code, detail=exc.message, headers=exc.headers) from exc
@@ -244,7 +245,7 @@ class UserController:
                 return sign_jwt(user.id, "super_user"), user.id
             raise AdminLoginException
         except AppException as exc:
-            raise HTTPException(status_code=exc.code, detail=exc.message) from exc
+            raise HTTPException(status_code=exc.code, detail=exc.message, headers=exc.headers) from exc
         except Exception as exc:
             raise HTTPException(status_code=500, detail=str(exc)) from exc
 
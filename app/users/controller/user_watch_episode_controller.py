@@ -1,4 +1,6 @@
 """UserWatchEpisode Controller module"""
+from typing import Optional
+
 from fastapi import HTTPException
 from starlette.responses import JSONResponse
 
@@ -59,16 +61,16 @@ class UserWatchEpisodeController:
             raise HTTPException(status_code=500, detail=str(exc)) from exc
 
     @staticmethod
-    def get_most_popular_series():
+    def get_most_popular_series(window: str):
         """
-        The get_most_popular_series function returns a list of series that have been watched the most.
-        The function takes no arguments and returns a list of dictionaries, where each dictionary contains
-        the name, number of views and average rating for each series.
+        The get_most_popular_series function returns a list of series that have been watched the most
+        in a time window.
 
+        Param window:str: Time window, like 24h, 7d or all.
         Return: A list of the most popular series.
         """
         try:
-            series = UserWatchEpisodeServices.get_most_popular_series()
+            series = UserWatchEpisodeServices.get_most_popular_series(window)
             if not series:
                 return JSONResponse(content="We have not generated series popularity list yet.", status_code=200)
             return series
@@ -78,7 +80,7 @@ class UserWatchEpisodeController:
             raise HTTPException(status_code=500, detail=str(exc)) from exc
 
     @staticmethod
-    def get_users_recommendations(user_id: str, page: int):
+    def get_users_recommendations(user_id: str, page: int, cursor: Optional[str] = None):
         """
         The get_users_recommendations function is used to get the recommendations for a specific user.
         It takes in two parameters, user_id and page. It returns a list of series objects
@@ -86,12 +88,13 @@ class UserWatchEpisodeController:
 
         Param user_id:str: Identify the user.
         Param page:int: Specify the page of the results.
+        Param cursor:str: Cursor returned with the previous page, used instead of the page number.
         Return: A list of series recommended for a specific user.
         """
         try:
-            series = UserWatchEpisodeServices.get_users_recommendations(user_id, page)
+            series = UserWatchEpisodeServices.get_users_recommendations(user_id, page, cursor)
             if not series:
-                return SeriesServices.read_all_series(page)
+                return SeriesServices.read_all_series(page, cursor)
             return series
         except AppException as exc:
             raise HTTPException(status_code=exc.code, detail=exc.message) from exc
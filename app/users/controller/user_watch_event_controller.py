@@ -0,0 +1,24 @@
+"""UserWatchEvent Controller module"""
+from fastapi import HTTPException
+
+from app.base import AppException
+from app.users.service import UserWatchEventServices
+
+
+class UserWatchEventController:
+    """Controller for batched watch and rating events"""
+    @staticmethod
+    def record_watch_events(user_id: str, events: list):
+        """
+        Function records a batch of watch and rating events of a user.
+
+        Param user_id:str: Identify the user.
+        Param events:list: Watch and rating events.
+        Return: Result of every event and the number of events by status.
+        """
+        try:
+            return UserWatchEventServices.record_watch_events(user_id, events)
+        except AppException as exc:
+            raise HTTPException(status_code=exc.code, detail=exc.message) from exc
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
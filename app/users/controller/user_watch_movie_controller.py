@@ -1,4 +1,6 @@
 """UserWatchMovie Controller module"""
+from typing import Optional
+
 from fastapi import HTTPException
 from starlette.responses import Response
 
@@ -66,15 +68,16 @@ class UserWatchMovieController:
             raise HTTPException(status_code=500, detail=str(exc)) from exc
 
     @staticmethod
-    def get_popular_movies():
+    def get_popular_movies(window: str):
         """
-        Function returns a list of movies that are popular based on the number of times they have been watched.
-        The function takes no arguments and returns a list of dictionaries, each dictionary representing one movie.
+        Function returns a list of movies that are popular based on the number of times they have been watched
+        in a time window.
 
+        Param window:str: Time window, like 24h, 7d or all.
         Return: A list of popular movies.
         """
         try:
-            movies = UserWatchMovieServices.get_popular_movies()
+            movies = UserWatchMovieServices.get_popular_movies(window)
             if not movies:
                 return Response(content="We have not yet generated movie popularity list.", status_code=200)
             return movies
@@ -103,7 +106,7 @@ class UserWatchMovieController:
             raise HTTPException(status_code=500, detail=str(exc)) from exc
 
     @staticmethod
-    def get_my_recommendations(user_id: str, page: int):
+    def get_my_recommendations(user_id: str, page: int, cursor: Optional[str] = None):
         """
         The get_my_recommendations function retrieves a list of movies that the user has not seen,
         but would like to see. It takes in a user_id and page number than parameters.
@@ -112,12 +115,13 @@ class UserWatchMovieController:
 
         Param user_id:str: Specify the user ID of the user that we want to get recommendations for
         Param page:int: Get the movies in a specific page
+        Param cursor:str: Cursor returned with the previous page, used instead of the page number.
         Return: A list of movies.
         """
         try:
-            movies = UserWatchMovieServices.get_my_recommendations(user_id, page)
+            movies = UserWatchMovieServices.get_my_recommendations(user_id, page, cursor)
             if not movies:
-                return MovieServices.get_all_movies(page)
+                return MovieServices.get_all_movies(page, cursor)
             return movies
         except AppException as exc:
             raise HTTPException(status_code=exc.code, detail=exc.message) from exc
@@ -44,6 +44,13 @@ class InvalidCredentialsException(AppException):
     code = 401
 
 
+class PasswordHashingBusyException(AppException):
+    """Exception raised when too many passwords are being hashed at the same time."""
+    message = "Too many requests are being processed at the moment. Please try again shortly."
+    code = 503
+    headers = {"Retry-After": "1"}
+
+
 class InvalidTokenException(AppException):
     """Exception raised on a wrong token authentication."""
     message = "Could not validate token."
@@ -1,23 +1,22 @@
 """Subuser Model module"""
-from uuid import uuid4
 from datetime import date
 
 from sqlalchemy import Column, String, Date, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import relationship
 
-from app.db import Base
+from app.db import Base, UUIDKey, new_id
 
 
 class Subuser(Base):
     """Base model for Subuser"""
     __tablename__ = "subusers"
     __table_args__ = (UniqueConstraint("user_id", "name", name="unique_subuser_name"),)
-    id = Column(String(50), primary_key=True, default=uuid4)
+    id = Column(UUIDKey(), primary_key=True, default=new_id)
     name = Column(String(100), nullable=False)
     date_subscribed = Column(Date(), default=date.today())
 
-    user_id = Column(String(50), ForeignKey("users.id"))
-    user = relationship("User", lazy='subquery')
+    user_id = Column(UUIDKey(), ForeignKey("users.id"))
+    user = relationship("User", lazy="joined")
 
     def __init__(self, name, user_id: str, date_subscribed=date.today()):
         self.name = name
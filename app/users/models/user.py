@@ -1,21 +1,26 @@
 """User Model module"""
-from uuid import uuid4
 from datetime import date
 
 from sqlalchemy.orm import relationship
-from sqlalchemy import Column, String, Boolean, Date, ForeignKey, Integer, UniqueConstraint
+from sqlalchemy import Column, String, Boolean, Date, ForeignKey, Integer, UniqueConstraint, Index
 
-from app.db import Base
+from app.db import Base, COMPACT_KEYS, UUIDKey, new_id
 
 
 class UserWatchMovie(Base):
-    """Base Model for UserWatchMovie"""
+    """Base Model for UserWatchMovie. In compact key mode the user and movie IDs are the primary key."""
     __tablename__ = "user_watch_movies"
-    __table_args__ = (UniqueConstraint("user_id", "movie_id", name="one_user_one_rating"),)
 
-    id = Column(String(50), primary_key=True, default=uuid4)
-    user_id = Column(String(50), ForeignKey("users.id"))
-    movie_id = Column(String(50), ForeignKey("movies.id"))
+    if COMPACT_KEYS:
+        __table_args__ = (Index("ix_user_watch_movies_movie_id_rating", "movie_id", "rating"),)
+        user_id = Column(UUIDKey(), ForeignKey("users.id"), primary_key=True)
+        movie_id = Column(UUIDKey(), ForeignKey("movies.id"), primary_key=True)
+    else:
+        __table_args__ = (UniqueConstraint("user_id", "movie_id", name="one_user_one_rating"),
+                          Index("ix_user_watch_movies_movie_id_rating", "movie_id", "rating"))
+        id = Column(UUIDKey(), primary_key=True, default=new_id)
+        user_id = Column(UUIDKey(), ForeignKey("users.id"))
+        movie_id = Column(UUIDKey(), ForeignKey("movies.id"))
     rating = Column(Integer(), nullable=True)
     date_watched = Column(Date(), default=date.today())
 
@@ -27,13 +32,19 @@ class UserWatchMovie(Base):
 
 
 class UserWatchEpisode(Base):
-    """Base Model for UserWatchEpisode"""
+    """Base Model for UserWatchEpisode. In compact key mode the user and episode IDs are the primary key."""
     __tablename__ = "user_watch_episodes"
-    __table_args__ = (UniqueConstraint("user_id", "episode_id", name="one_user_one_rate"),)
 
-    id = Column(String(50), primary_key=True, default=uuid4)
-    user_id = Column(String(50), ForeignKey("users.id"))
-    episode_id = Column(String(50), ForeignKey("episodes.id"))
+    if COMPACT_KEYS:
+        __table_args__ = (Index("ix_user_watch_episodes_episode_id_rating", "episode_id", "rating"),)
+        user_id = Column(UUIDKey(), ForeignKey("users.id"), primary_key=True)
+        episode_id = Column(UUIDKey(), ForeignKey("episodes.id"), primary_key=True)
+    else:
+        __table_args__ = (UniqueConstraint("user_id", "episode_id", name="one_user_one_rate"),
+                          Index("ix_user_watch_episodes_episode_id_rating", "episode_id", "rating"))
+        id = Column(UUIDKey(), primary_key=True, default=new_id)
+        user_id = Column(UUIDKey(), ForeignKey("users.id"))
+        episode_id = Column(UUIDKey(), ForeignKey("episodes.id"))
     rating = Column(Integer(), nullable=True)
     date_watched = Column(Date(), default=date.today())
 
@@ -47,17 +58,17 @@ class UserWatchEpisode(Base):
 class User(Base):
     """Base Model for User"""
     __tablename__ = "users"
-    id = Column(String(50), primary_key=True, default=uuid4)
+    id = Column(UUIDKey(), primary_key=True, default=new_id)
     email = Column(String(100), unique=True)
     password_hashed = Column(String(100))
-    username = Column(String(100))
+    username = Column(String(100), index=True)
     date_subscribed = Column(Date(), default=date.today())
     is_active = Column(Boolean)
     is_superuser = Column(Boolean, default=False)
-    verification_code = Column(Integer(), nullable=True)
+    verification_code = Column(Integer(), nullable=True, index=True)
 
-    watched_movies = relationship('Movie', secondary="user_watch_movies", back_populates='users', lazy='subquery')
-    watched_episodes = relationship('Episode', secondary="user_watch_episodes", back_populates='users', lazy='subquery')
+    watched_movies = relationship('Movie', secondary="user_watch_movies", back_populates='users')
+    watched_episodes = relationship('Episode', secondary="user_watch_episodes", back_populates='users')
 
     def __init__(self, email: str, password_hashed: str, username: str, date_subscribed: str = date.today(),
                  is_active: bool = True, is_superuser: bool = False, verification_code: int = None):
@@ -17,7 +17,7 @@ class AdminRepository(BaseCRUDRepository):
         Return: A list of admin objects.
         """
         try:
-            admins = self.db.query(Admin).filter(Admin.country == country).all()
+            admins = self.base_query().filter(Admin.country == country).all()
             return admins
         except Exception as exc:
             self.db.rollback()
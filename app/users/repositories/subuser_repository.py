@@ -36,7 +36,7 @@ class SubuserRepository(BaseCRUDRepository):
         Return: The subuser object that has the name passed in as a parameter.
         """
         try:
-            subuser = self.db.query(Subuser).filter(Subuser.name == name).filter(Subuser.user_id == user_id).first()
+            subuser = self.base_query().filter(Subuser.name == name).filter(Subuser.user_id == user_id).first()
             return subuser
         except Exception as exc:
             self.db.rollback()
@@ -51,7 +51,7 @@ class SubuserRepository(BaseCRUDRepository):
         Return: A list of subuser objects.
         """
         try:
-            subuser = self.db.query(Subuser).filter(Subuser.user_id == user_id).all()
+            subuser = self.base_query().filter(Subuser.user_id == user_id).all()
             return subuser
         except Exception as exc:
             self.db.rollback()
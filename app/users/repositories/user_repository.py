@@ -32,7 +32,7 @@ class UserRepository(BaseCRUDRepository):
         Return: A user object.
         """
         try:
-            return self.db.query(User).filter(User.email == email).first()
+            return self.base_query().filter(User.email == email).first()
         except Exception as exc:
             self.db.rollback()
             raise exc
@@ -47,7 +47,7 @@ class UserRepository(BaseCRUDRepository):
         Return: A list of users that match the search criteria.
         """
         try:
-            return self.db.query(User).filter(User.email.ilike(f"%{email}%")).all()
+            return self.base_query().filter(User.email.ilike(f"%{email}%")).all()
         except Exception as exc:
             self.db.rollback()
             raise exc
@@ -63,9 +63,9 @@ class UserRepository(BaseCRUDRepository):
         """
         try:
             if search:
-                return self.db.query(User).filter(User.username.ilike(f"%{username}%")).all()
+                return self.base_query().filter(User.username.ilike(f"%{username}%")).all()
             else:
-                return self.db.query(User).filter(User.username == username).first()
+                return self.base_query().filter(User.username == username).first()
         except Exception as exc:
             self.db.rollback()
             raise exc
@@ -79,7 +79,7 @@ class UserRepository(BaseCRUDRepository):
         Return: A user object if the verification code is valid.
         """
         try:
-            user = self.db.query(User).filter(User.verification_code == verification_code).first()
+            user = self.base_query().filter(User.verification_code == verification_code).first()
             if not user:
                 self.db.rollback()
                 raise InvalidVerificationCode
@@ -96,7 +96,7 @@ class UserRepository(BaseCRUDRepository):
         Return: A list of users that are active.
         """
         try:
-            users = self.db.query(User).filter(User.is_active == active).all()
+            users = self.base_query().filter(User.is_active == active).all()
             return users
         except Exception as exc:
             self.db.rollback()
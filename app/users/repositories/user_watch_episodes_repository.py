@@ -1,8 +1,8 @@
 """UserWatchEpisode Repository module"""
 from sqlalchemy import func
-from sqlalchemy.orm import aliased
 
 from app.base import BaseCRUDRepository
+from app.base.base_repository import IN_CLAUSE_CHUNK_SIZE
 from app.genres.models import Genre
 from app.series.models import Episode, Series
 from app.users.models.user import UserWatchEpisode
@@ -45,75 +45,80 @@ class UserWatchEpisodeRepository(BaseCRUDRepository):
             self.db.rollback()
             raise exc
 
-    def read_users_episodes_and_series(self, user_id: str):
+    def read_user_watched_series(self, user_id: str, series_id: str) -> bool:
         """
-        Function takes a user_id as an argument and returns a list of tuples.
-        Each tuple contains the episode ID, series ID, and title for each episode that the user has watched.
+        Function checks whether the user has watched any episode of the given series.
 
-        Param user_id:str: Filter the results by user.
-        Return: A list of tuples.
+        Param user_id:str: Identify the user.
+        Param series_id:str: Identify the series.
+        Return: True if the user watched at least one episode of the series.
         """
         try:
-            series = self.db.query(UserWatchEpisode, Episode.series_id, Series.title) \
+            watched = self.db.query(UserWatchEpisode.episode_id) \
                 .join(Episode, Episode.id == UserWatchEpisode.episode_id) \
-                .join(Series, Episode.series_id == Series.id) \
-                .filter(UserWatchEpisode.user_id == user_id).all()
-            return series
+                .filter(UserWatchEpisode.user_id == user_id, Episode.series_id == series_id).first()
+            return watched is not None
         except Exception as exc:
             self.db.rollback()
             raise exc
 
-    def read_episode_views(self):
+    def read_by_user_id_and_episode_ids(self, user_id: str, episode_ids: list) -> dict:
         """
-        Function returns a list of series, and the number of users who have watched each episode in that
-        series. The function first queries the UserWatchEpisode table for all user_id's and episode_id's,
-        then joins this query with
-        the Episode table to get the series_id associated with each user-episode pair. It then creates a
-        subquery from this join, which is used to create another subquery, which counts how many
-        times each unique (user, series) pair appears in the original
-        subquery. This second subquery is grouped by its series value so that we can count how many users
-        watched episodes from.
+        Function returns the watch records of a user for the given episodes.
 
-        Return: A query object.
+        Param user_id:str: Identify the user.
+        Param episode_ids:list: IDs of the episodes.
+        Return: A dictionary of UserWatchEpisode objects by episode ID, episodes the user did not watch are left out.
         """
         try:
-            subquery = self.db.query(UserWatchEpisode.user_id.label('user'),
-                                     UserWatchEpisode.episode_id.label('episode'), Episode.series_id.label('series')) \
-                .join(Episode, Episode.id == UserWatchEpisode.episode_id).subquery('sq')
-            sq = aliased(subquery)
-            subquery2 = self.db.query(sq.c.user, sq.c.series.label('series_two')).distinct().subquery('sq2')
-            sq2 = aliased(subquery2)
-            result = self.db.query(sq2.c.series_two, func.count(sq2.c.series_two)).group_by(sq2.c.series_two)
-            return result
+            episode_ids = list(dict.fromkeys(episode_ids))
+            watched = {}
+            for start in range(0, len(episode_ids), IN_CLAUSE_CHUNK_SIZE):
+                chunk = episode_ids[start:start + IN_CLAUSE_CHUNK_SIZE]
+                for obj in self.db.query(UserWatchEpisode).filter(UserWatchEpisode.user_id == user_id,
+                                                                  UserWatchEpisode.episode_id.in_(chunk)):
+                    watched[obj.episode_id] = obj
+            return watched
+        except Exception as exc:
+            self.db.rollback()
+            raise exc
+
+    def read_watched_series_ids(self, user_id: str, series_ids: list) -> set:
+        """
+        Function returns which of the given series the user has watched at least one episode of.
+
+        Param user_id:str: Identify the user.
+        Param series_ids:list: IDs of the series.
+        Return: A set of series IDs.
+        """
+        try:
+            series_ids = list(dict.fromkeys(series_ids))
+            watched = set()
+            for start in range(0, len(series_ids), IN_CLAUSE_CHUNK_SIZE):
+                chunk = series_ids[start:start + IN_CLAUSE_CHUNK_SIZE]
+                rows = self.db.query(Episode.series_id).distinct() \
+                    .join(UserWatchEpisode, Episode.id == UserWatchEpisode.episode_id) \
+                    .filter(UserWatchEpisode.user_id == user_id, Episode.series_id.in_(chunk)).all()
+                watched.update(series_id for series_id, in rows)
+            return watched
         except Exception as exc:
             self.db.rollback()
             raise exc
 
-    def read_best_rated_episode(self, best: bool = True):
+    def read_users_episodes_and_series(self, user_id: str):
         """
-        Function returns the episode with the highest rating.
-        The function takes one parameter, best, which is a boolean value that defaults to True.
-        If best is set to False then it will return the episode with the lowest rating.
+        Function takes a user_id as an argument and returns a list of tuples.
+        Each tuple contains the episode ID, series ID, and title for each episode that the user has watched.
 
-        Param best:bool=True: Determine whether the best or worst rated episode should be returned.
-        Return: The episode with the highest rating.
+        Param user_id:str: Filter the results by user.
+        Return: A list of tuples.
         """
         try:
-            if best:
-                subquery = self.db.query(UserWatchEpisode.episode_id.label("episode"),
-                                         func.avg(UserWatchEpisode.rating).label("rating")).group_by(
-                    UserWatchEpisode.episode_id.label("episode")).subquery()
-                max_rating = self.db.query(func.max(subquery.c.rating.label("rating")))
-                episode = self.db.query(subquery.c.episode.label("episode"), subquery.c.rating.label("rating")).filter(
-                    subquery.c.rating.label("rating") == max_rating)
-            else:
-                subquery = self.db.query(UserWatchEpisode.episode_id.label("episode"),
-                                         func.avg(UserWatchEpisode.rating).label("rating")).group_by(
-                    UserWatchEpisode.episode_id.label("episode")).subquery()
-                min_rating = self.db.query(func.min(subquery.c.rating.label("rating")))
-                episode = self.db.query(subquery.c.episode.label("episode"), subquery.c.rating.label("rating")).filter(
-                    subquery.c.rating.label("rating") == min_rating)
-            return episode
+            series = self.db.query(UserWatchEpisode, Episode.series_id, Series.title) \
+                .join(Episode, Episode.id == UserWatchEpisode.episode_id) \
+                .join(Series, Episode.series_id == Series.id) \
+                .filter(UserWatchEpisode.user_id == user_id).all()
+            return series
         except Exception as exc:
             self.db.rollback()
             raise exc
@@ -140,21 +145,24 @@ class UserWatchEpisodeRepository(BaseCRUDRepository):
             self.db.rollback()
             raise exc
 
-    def read_average_rating(self, episode_ids: list):
+    def read_average_rating_for_series_year(self, year: str):
         """
-        Function takes a list of episode IDS and returns the average rating for each
-        episode in the list. The function first queries UserWatchEpisode to get all ratings for episodes in the
-        list, then groups them by episode ID and finds their average. Finally, it returns that value.
+        Function returns the number of series published in the given year, together with
+        the average of average ratings of their episodes, in a single query.
 
-        Param episode IDs:list: Pass in a list of episode IDs to the function.
-        Return: The average rating of the episodes in episode_ids.
+        Param year:str: Year the series were published.
+        Return: A row with the number of series and the average rating.
         """
         try:
-            averages = self.db.query(UserWatchEpisode.rating.label("Rating")).\
-                filter(UserWatchEpisode.episode_id.in_(episode_ids)).\
+            averages = self.db.query(UserWatchEpisode.episode_id.label("episode_id"),
+                                     func.avg(UserWatchEpisode.rating).label("average")).\
                 group_by(UserWatchEpisode.episode_id).\
-                subquery('averages')
-            result = self.db.query(func.round(func.avg(averages.c.Rating), 2).label("Average Rating")).first()
+                subquery("episode_averages")
+            result = self.db.query(func.count(func.distinct(Series.id)).label("Series"),
+                                   func.round(func.avg(averages.c.average), 2).label("Average Rating")).\
+                outerjoin(Episode, Episode.series_id == Series.id).\
+                outerjoin(averages, averages.c.episode_id == Episode.id).\
+                filter(Series.year_published == year).first()
             return result
         except Exception as exc:
             self.db.rollback()
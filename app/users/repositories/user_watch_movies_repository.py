@@ -1,10 +1,10 @@
 """UserWatchMovie Repository module"""
-from sqlalchemy.sql.functions import count, func
+from sqlalchemy.sql.functions import func
 
 from app.base import BaseCRUDRepository
+from app.base.base_repository import IN_CLAUSE_CHUNK_SIZE
 from app.config import settings
 from app.genres.models import Genre
-from app.movies.exceptions import NoRatingsException
 from app.movies.models import Movie
 from app.users.models.user import UserWatchMovie
 
@@ -33,58 +33,37 @@ class UserWatchMovieRepository(BaseCRUDRepository):
             self.db.rollback()
             raise exc
 
-    def read_movies_from_user(self, user_id: str):
+    def read_by_user_id_and_movie_ids(self, user_id: str, movie_ids: list) -> dict:
         """
-        Function takes a user_id as an argument and returns all the movies that the user has watched.
+        Function returns the watch records of a user for the given movies.
 
-        Param user_id:str: Filter the user-watch-movie table by user_id
-        Return: A list of user-watch-movie objects.
+        Param user_id:str: Identify the user.
+        Param movie_ids:list: IDs of the movies.
+        Return: A dictionary of UserWatchMovie objects by movie ID, movies the user did not watch are left out.
         """
         try:
-            user_watch_movies = self.db.query(UserWatchMovie).filter(UserWatchMovie.user_id == user_id).all()
-            return user_watch_movies
+            movie_ids = list(dict.fromkeys(movie_ids))
+            watched = {}
+            for start in range(0, len(movie_ids), IN_CLAUSE_CHUNK_SIZE):
+                chunk = movie_ids[start:start + IN_CLAUSE_CHUNK_SIZE]
+                for obj in self.db.query(UserWatchMovie).filter(UserWatchMovie.user_id == user_id,
+                                                                UserWatchMovie.movie_id.in_(chunk)):
+                    watched[obj.movie_id] = obj
+            return watched
         except Exception as exc:
             self.db.rollback()
             raise exc
 
-    def read_movie_downloads(self):
-        """
-        Function returns a list of tuples containing the movie_id and number of times it has been downloaded.
-
-        Return: A list of tuples.
-        """
-        try:
-            movie_downloads = self.db.query(UserWatchMovie.movie_id, count()).group_by(UserWatchMovie.movie_id)
-            return movie_downloads
-        except Exception as exc:
-            self.db.rollback()
-            raise exc
-
-    def read_movies_by_rating(self, best=True):
+    def read_movies_from_user(self, user_id: str):
         """
-        Function takes a boolean value (best) and returns the movies with the highest or lowest ratings.
-        The function first queries for all movie IDs and their average rating, then groups them by movie ID.
-        It then finds either the highest or lowest rated movies depending on the best parameter passed in.
+        Function takes a user_id as an argument and returns all the movies that the user has watched.
 
-        Param best=True: Specify whether the best or worst movies should be returned.
-        Return: A list of tuples with the movie_id and rating.
+        Param user_id:str: Filter the user-watch-movie table by user_id
+        Return: A list of user-watch-movie objects.
         """
         try:
-            if best:
-                subquery = self.db.query(UserWatchMovie.movie_id.label("movie"),
-                                         func.avg(UserWatchMovie.rating).label("rating")).group_by(
-                    UserWatchMovie.movie_id.label("movie")).subquery()
-                max_rating = self.db.query(func.max(subquery.c.rating.label("rating")))
-                movie = self.db.query(subquery.c.movie.label("movie"), subquery.c.rating.label("rating")).filter(
-                    subquery.c.rating.label("rating") == max_rating)
-            else:
-                subquery = self.db.query(UserWatchMovie.movie_id.label("movie"),
-                                         func.avg(UserWatchMovie.rating).label("rating")).group_by(
-                    UserWatchMovie.movie_id.label("movie")).subquery()
-                min_rating = self.db.query(func.min(subquery.c.rating.label("rating")))
-                movie = self.db.query(subquery.c.movie.label("movie"), subquery.c.rating.label("rating")).filter(
-                    subquery.c.rating.label("rating") == min_rating)
-            return movie
+            user_watch_movies = self.db.query(UserWatchMovie).filter(UserWatchMovie.user_id == user_id).all()
+            return user_watch_movies
         except Exception as exc:
             self.db.rollback()
             raise exc
@@ -106,57 +85,73 @@ class UserWatchMovieRepository(BaseCRUDRepository):
             self.db.rollback()
             raise exc
 
-    def read_average_rating(self, movie_id):
+    def read_average_rating_for_movies(self, movie_ids: list):
         """
-        Function takes in a movie_id and returns the average rating of that movie.
-        If no ratings are found for the given movie, it raises an exception.
+        Function accepts a list of movie IDs and returns the average rating for each movie.
+        The function first queries the database to get all movies with their respective titles,
+        then joins UserWatchMovie table to Movie table on ID. It then groups by Movie ID and finds the
+        average rating for each movie, returning it as a list of tuples.
 
-        Param movie_id: Filter the ratings for a particular movie.
-        Return: The average rating of a movie.
+        Param movie_ids:list: Pass in a list of movie IDs.
+        Return: The average rating for each movie in the list of movie IDs.
         """
         try:
-            average = self.db.query(func.round(func.avg(UserWatchMovie.rating), 2).label("Average Rating")).\
-                filter(UserWatchMovie.movie_id == movie_id).\
-                group_by(UserWatchMovie.movie_id).first()
-            if not average:
-                raise NoRatingsException
+            average = self.db.query(Movie.title.label("Movie Title"), func.round(func.avg(UserWatchMovie.rating), 2).
+                                    label("Average Rating")).join(Movie, UserWatchMovie.movie_id == Movie.id).\
+                filter(Movie.id.in_(movie_ids)).\
+                group_by(UserWatchMovie.movie_id).all()
             return average
         except Exception as exc:
             self.db.rollback()
             raise exc
 
-    def read_average_rating_for_all_movies(self):
+    def _read_movie_averages(self):
+        """
+        Function builds a subquery with the average rating of every rated movie and the year it was published.
+
+        Return: A subquery with movie_id, year_published and average columns.
         """
-        Function takes in no parameters. It queries the database for all movies and
-        their average ratings, then returns a list of tuples containing the movie title and their average rating.
+        return self.db.query(UserWatchMovie.movie_id.label("movie_id"),
+                             Movie.year_published.label("year_published"),
+                             func.round(func.avg(UserWatchMovie.rating), 2).label("average")).\
+            join(Movie, UserWatchMovie.movie_id == Movie.id).\
+            group_by(UserWatchMovie.movie_id, Movie.year_published).\
+            subquery("movie_averages")
 
-        Return: The average rating for each movie in the database.
+    def read_average_rating_per_year(self):
+        """
+        Function returns the average movie rating for every year in a single grouped query.
+        Average for a year is the average of average ratings of movies published in that year.
+        Years without rated movies are left out.
+
+        Return: A list of tuples containing the year and its average rating.
         """
         try:
-            average = self.db.query(Movie.title.label("Movie Title"), func.round(func.avg(UserWatchMovie.rating), 2).
-                                    label("Average Rating")).join(Movie, UserWatchMovie.movie_id == Movie.id).\
-                group_by(UserWatchMovie.movie_id).all()
-            return average
+            averages = self._read_movie_averages()
+            result = self.db.query(averages.c.year_published.label("Year"),
+                                   func.round(func.avg(averages.c.average), 2).label("Average Rating")).\
+                group_by(averages.c.year_published).\
+                having(func.avg(averages.c.average).isnot(None)).all()
+            return result
         except Exception as exc:
             self.db.rollback()
             raise exc
 
-    def read_average_rating_for_movies(self, movie_ids: list):
+    def read_average_rating_for_year(self, year: str):
         """
-        Function accepts a list of movie IDs and returns the average rating for each movie.
-        The function first queries the database to get all movies with their respective titles,
-        then joins UserWatchMovie table to Movie table on ID. It then groups by Movie ID and finds the
-        average rating for each movie, returning it as a list of tuples.
+        Function returns the number of movies published in the given year, together with
+        the average of their average ratings, in a single query.
 
-        Param movie_ids:list: Pass in a list of movie IDs.
-        Return: The average rating for each movie in the list of movie IDs.
+        Param year:str: Year the movies were published.
+        Return: A row with the number of movies and the average rating.
         """
         try:
-            average = self.db.query(Movie.title.label("Movie Title"), func.round(func.avg(UserWatchMovie.rating), 2).
-                                    label("Average Rating")).join(Movie, UserWatchMovie.movie_id == Movie.id).\
-                filter(Movie.id.in_(movie_ids)).\
-                group_by(UserWatchMovie.movie_id).all()
-            return average
+            averages = self._read_movie_averages()
+            result = self.db.query(func.count(Movie.id).label("Movies"),
+                                   func.round(func.avg(averages.c.average), 2).label("Average Rating")).\
+                outerjoin(averages, averages.c.movie_id == Movie.id).\
+                filter(Movie.year_published == year).first()
+            return result
         except Exception as exc:
             self.db.rollback()
             raise exc
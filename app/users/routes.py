@@ -1,15 +1,16 @@
 """User routes module"""
-import hashlib
-
 from email_validator import validate_email, EmailNotValidError
-from fastapi import APIRouter, status, Depends, HTTPException, Body, Query, BackgroundTasks
+from fastapi import APIRouter, status, Depends, HTTPException, Body, Query
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
-from app.users.controller import UserController, SubuserController, AdminController
+from app.base import fast_json_response
+from app.db import QueryBudget
+from app.users.controller import UserController, SubuserController, AdminController, UserWatchEventController
 from app.users.controller.user_auth_controller import JWTBearer
 
 from app.users.schemas import *
+from app.users.schemas.user_watch_event_schema import WatchEventsSchemaIn, WatchEventsResultSchema
 
 user_router = APIRouter(prefix="/api/users", tags=["Users"])
 
@@ -18,11 +19,11 @@ user_router = APIRouter(prefix="/api/users", tags=["Users"])
                   summary="User Registration",
                   status_code=status.HTTP_201_CREATED
                   )
-def register_user(user: UserSchemaIn, worker: BackgroundTasks):
+def register_user(user: UserSchemaIn):
     """
     Function creates a new user in the database.
     It takes as input a UserSchemaIn object, which is validated and converted to an equivalent UserSchemaOut object.
-    The password is hashed using SHA256 before being stored in the database.
+    The password is hashed with the configured key derivation function before being stored in the database.
 
     Param user:UserSchemaIn: Tell the function that it will be receiving a user object.
     Return: A dictionary with the user's ID and token.
@@ -32,7 +33,7 @@ def register_user(user: UserSchemaIn, worker: BackgroundTasks):
         valid_email = valid.email
     except EmailNotValidError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    return UserController.create_user(worker, valid_email, user.password, user.username)
+    return UserController.create_user(valid_email, user.password, user.username)
 
 
 @user_router.patch("/user-verification",
@@ -58,7 +59,7 @@ def verify_user(verification_code: int = Body(embed=True)):
 def login_user(login: UserLoginSchema, response: JSONResponse):
     """
     Function takes in a username, email, password and response object.
-    It hashes the password using sha256 and then uses the UserController to login user.
+    It uses the UserController to login user, the password is checked against its stored hash.
     The function returns a token for the user.
 
     Param username:str: Check if the username is already taken.
@@ -67,8 +68,7 @@ def login_user(login: UserLoginSchema, response: JSONResponse):
     Param response:Response: Set the cookie for the user.
     Return: The token and user_id of the logged-in user.
     """
-    password_hashed = hashlib.sha256(login.password.encode()).hexdigest()
-    token, user_id = UserController.login_user(login.email, password_hashed, login.username)
+    token, user_id = UserController.login_user(login.email, login.password, login.username)
     response.set_cookie(key="user_id", value=user_id)
     response.set_cookie(key="user_email", value=login.email)
     return token
@@ -120,8 +120,8 @@ def reset_password_complete(request: Request, reset: ChangePasswordSchema):
     """
     The reset_password_complete function is used to reset the password of a user.
     It takes as input the code generated by send_reset_password, and two strings:
-    the old password and the new one. It checks if both passwords match, hashes them using SHA256,
-    and then calls UserController's reset password method to change it.
+    the old password and the new one. It checks if both passwords match,
+    and then calls UserController's reset password method to hash and store it.
 
     Param request:Request: Get the user's cookie.
     Param code:int: Identify the user.
@@ -133,8 +133,7 @@ def reset_password_complete(request: Request, reset: ChangePasswordSchema):
         raise HTTPException(status_code=403, detail="Verification code expired. Ask for another one.")
     if reset.new_password != reset.repeat_password:
         raise HTTPException(status_code=400, detail="Passwords must match. Try again")
-    password_hashed = hashlib.sha256(reset.new_password.encode()).hexdigest()
-    UserController.reset_password_complete(reset.code, password_hashed)
+    UserController.reset_password_complete(reset.code, reset.new_password)
     response = JSONResponse(content="Reset password finished successfully. You can login now.", status_code=200)
     response.delete_cookie(key="code")
     return response
@@ -145,8 +144,8 @@ def reset_password_complete(request: Request, reset: ChangePasswordSchema):
                   )
 def login_admin(login: AdminLoginSchema, response: JSONResponse):
     """
-    Function takes in an email and a password, hashes the password using SHA256,
-    and then checks if the email and hashed password match. If they do it returns a token for that user
+    Function takes in an email and a password,
+    and then checks if the password matches the stored hash. If they do it returns a token for that user
     and their user_id. It also sets a cookie on the response with their user_id.
 
     Param email:str: Store the email of the user that is trying to log in.
@@ -154,8 +153,7 @@ def login_admin(login: AdminLoginSchema, response: JSONResponse):
     Param response:Response: Set the cookie.
     Return: A token and a user_id.
     """
-    password_hashed = hashlib.sha256(login.password.encode()).hexdigest()
-    token, user_id = UserController.login_admin(login.email, password_hashed)
+    token, user_id = UserController.login_admin(login.email, login.password)
     response.set_cookie(key="user_id", value=user_id)
     return token
 
@@ -163,15 +161,16 @@ def login_admin(login: AdminLoginSchema, response: JSONResponse):
 @user_router.get("/get-all-users",
                  response_model=list[UserSchemaOut],
                  summary="Get all users. Admin route.",
-                 dependencies=[Depends(JWTBearer(["super_user"]))]
+                 dependencies=[Depends(JWTBearer(["super_user"])), Depends(QueryBudget(2))]
                  )
 def get_all_users():
     """
-    Function returns a list of all users in the database.
+    Function returns a list of all users in the database,
+    selected as rows of the columns of the schema and serialized with orjson.
 
     Return: A list of all the users in the database.
     """
-    return UserController.get_all_users()
+    return fast_json_response(UserController.get_all_users(schema=UserSchemaOut))
 
 
 @user_router.get("/get-all-active-users",
@@ -266,10 +265,10 @@ def get_my_subusers(request: Request):
     associated with this user. Each object has three keys: ID, name and email. The value for the key 'user'
     is an object that represents this user's information; it also has three keys: ID, name and email.
 
-    Param request:Request: Get the user_id from the cookie.
+    Param request:Request: Get the user_id from the principal of the token.
     Return: A list of all subusers for a given user.
     """
-    user_id = request.cookies.get("user_id")
+    user_id = request.state.principal.profile_id
     return UserController.get_user_with_all_subusers(user_id)
 
 
@@ -283,11 +282,11 @@ def update_my_name(request: Request, username: str = Body(embed=True)):
     """
     The update_my_name function updates the username of a user.
 
-    Param request:Request: Get the user_id from the cookie.
+    Param request:Request: Get the user_id from the principal of the token.
     Param username:str: Store the new username that is entered by the user.
     Return: A user object.
     """
-    user_id = request.cookies.get("user_id")
+    user_id = request.state.principal.profile_id
     return UserController.update_username(user_id, username)
 
 
@@ -303,11 +302,11 @@ def change_my_email(request: Request, email: str = Body(embed=True)):
     It takes in the request and the new email as parameters.
     It returns a response with the status code of 200 if successful, or 400 if not.
 
-    Param request:Request: Get the user_id from the cookies.
+    Param request:Request: Get the user_id from the principal of the token.
     Param email:str: Change the email of a user.
     Return: None.
     """
-    user_id = request.cookies.get("user_id")
+    user_id = request.state.principal.profile_id
     return UserController.change_email(user_id, email)
 
 
@@ -372,11 +371,11 @@ def register_subuser(request: Request, name: str = Body(embed=True)):
     """
     Function creates a new subuser with the given name.
 
-    Param request:Request: Get the user_id from the cookie
+    Param request:Request: Get the user_id from the principal of the token.
     Param name:str: Set the name of the subuser
     Return: A dictionary with the sub-user's information.
     """
-    user_id = request.cookies.get("user_id")
+    user_id = request.state.principal.profile_id
     return SubuserController.create_subuser(user_id, name)
 
 
@@ -419,11 +418,11 @@ def update_subusers_name(request: Request, name: str = Body(embed=True)):
     """
     The update_subusers_name function updates the name of a subuser.
 
-    Param request:Request: Get the user_id from the cookies.
+    Param request:Request: Get the user_id from the principal of the token.
     Param name:str: Update the name of the subuser.
     Return: A response object.
     """
-    subuser_id = request.cookies.get("user_id")
+    subuser_id = request.state.principal.profile_id
     return SubuserController.update_subusers_name(subuser_id, name)
 
 
@@ -435,11 +434,11 @@ def delete_subuser(request: Request, subuser_name: str = Body(embed=True)):
     """
     Function deletes a subuser from the database.
 
-    Param request:Request: Get the user_id from the cookie
+    Param request:Request: Get the user_id from the principal of the token.
     Param subuser_name:str: Specify, which subuser to delete
     Return: A response object.
     """
-    user_id = request.cookies.get("user_id")
+    user_id = request.state.principal.profile_id
     return SubuserController.delete_subuser(user_id, subuser_name)
 
 
@@ -509,3 +508,25 @@ def remove_admin_credentials(admin_id: str = Body(embed=True)):
     Return: The admin_id of the admin that is being removed from the system.
     """
     return AdminController.derogate_admin(admin_id)
+
+
+watch_events_router = APIRouter(prefix="/api/watch-events", tags=["Watch Events"])
+
+
+@watch_events_router.post("/",
+                          response_model=WatchEventsResultSchema,
+                          summary="Record a batch of watch and rating events. User Route.",
+                          dependencies=[Depends(JWTBearer(["regular_user", "sub_user"]))]
+                          )
+def record_watch_events(request: Request, batch: WatchEventsSchemaIn):
+    """
+    Function records a batch of watch and rating events of the user in a single transaction.
+    Every event refers to a movie or an episode, and rates it if a rating is given.
+    The result of every event is returned in the order the events were sent.
+
+    Param request:Request: Get the user_id from the principal of the token.
+    Param batch:WatchEventsSchemaIn: Events to record.
+    Return: Result of every event and the number of events by status.
+    """
+    user_id = request.state.principal.profile_id
+    return UserWatchEventController.record_watch_events(user_id, batch.events)
@@ -1,10 +1,12 @@
 """Admin Schema module"""
-from pydantic import BaseModel, UUID4
+from uuid import UUID
+
+from pydantic import BaseModel
 
 
 class AdminSchema(BaseModel):
     """Base schema for Admin"""
-    id: UUID4
+    id: UUID
     first_name: str
     last_name: str
     address: str
@@ -1,11 +1,13 @@
 """Subuser schemas module"""
 from datetime import date
-from pydantic import BaseModel, UUID4
+from uuid import UUID
+
+from pydantic import BaseModel
 
 
 class SubuserSchema(BaseModel):
     """Base schema for Subuser"""
-    id: UUID4
+    id: UUID
     name: str
     date_subscribed: date
 
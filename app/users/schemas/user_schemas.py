@@ -1,14 +1,16 @@
 """User Schemas module"""
 from datetime import date
 from typing import Optional
-from pydantic import BaseModel, UUID4, EmailStr
+from uuid import UUID
+
+from pydantic import BaseModel, EmailStr
 
 from .subuser_schemas import SubuserSchema
 
 
 class UserSchema(BaseModel):
     """Base schema for User"""
-    id: UUID4
+    id: UUID
     email: str
     password_hashed: str
     username: str
@@ -42,7 +44,7 @@ class UserSchemaIn(BaseModel):
 
 class UserSchemaOut(BaseModel):
     """Base User schema for output"""
-    id: UUID4
+    id: UUID
     email: str
     username: str
     date_subscribed: date
@@ -56,7 +58,7 @@ class UserSchemaOut(BaseModel):
 
 class UserWithSubusersSchema(BaseModel):
     """User schema with subusers"""
-    id: UUID4
+    id: UUID
     email: str
     username: str
     date_subscribed: date
@@ -1,11 +1,13 @@
 """UserWatchEpisode schemas module"""
 from datetime import date
-from pydantic import BaseModel, UUID4, Field
+from uuid import UUID
+
+from pydantic import BaseModel, Field
 
 
 class UserWatchEpisodeSchema(BaseModel):
     """Base schema for UserWatchEpisode model."""
-    id: UUID4
+    id: UUID = None
     user_id: str
     episode_id: str
     rating: int = None
@@ -0,0 +1,51 @@
+"""UserWatchEvent schemas module"""
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, conlist
+
+from app.config import settings
+
+
+class WatchEventSchemaIn(BaseModel):
+    """
+    Schema of a single watch or rating event. A movie is given by its title or ID, an episode by its ID or
+    by its name and the title of its series. Events with a rating rate the title, others only watch it.
+    Events are validated one by one, so an invalid event does not reject the whole batch.
+    """
+    movie_title: Optional[str]
+    movie_id: Optional[str]
+    series_title: Optional[str]
+    episode_name: Optional[str]
+    episode_id: Optional[str]
+    rating: Optional[int]
+
+
+class WatchEventsSchemaIn(BaseModel):
+    """Schema of a batch of watch and rating events."""
+    events: conlist(WatchEventSchemaIn, min_items=1, max_items=settings.WATCH_EVENTS_MAX_BATCH)
+
+    class Config:
+        """Configuration Class"""
+        schema_extra = {
+            "example": {
+                "events": [
+                    {"movie_title": "Pulp Fiction"},
+                    {"movie_title": "Pulp Fiction", "rating": 9},
+                    {"series_title": "Twin Peaks", "episode_name": "Pilot", "rating": 8}
+                ]
+            }
+        }
+
+
+class WatchEventResultSchema(BaseModel):
+    """Outcome of a single event: created, updated, unchanged, not_found or invalid."""
+    index: int
+    status: str
+    detail: Optional[str]
+    link: Optional[str]
+
+
+class WatchEventsResultSchema(BaseModel):
+    """Outcome of a batch of events, in the order they were sent, with the number of events by status."""
+    results: List[WatchEventResultSchema]
+    summary: Dict[str, int]
@@ -1,11 +1,13 @@
 """UserWatchMovie schemas module"""
 from datetime import date
-from pydantic import BaseModel, UUID4, Field
+from uuid import UUID
+
+from pydantic import BaseModel, Field
 
 
 class UserWatchMovieSchema(BaseModel):
     """Base schema for UserWatchMovie model."""
-    id: UUID4
+    id: UUID = None
     user_id: str
     movie_id: str
     rating: int = None
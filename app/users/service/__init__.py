@@ -1,7 +1,11 @@
 from .user_services import UserServices
 from .subuser_services import SubuserServices
 from .admin_services import AdminServices
-from .user_auth_service import decode_jwt, sign_jwt
+from .user_auth_service import decode_jwt, sign_jwt, authenticate, revoke_tokens, Principal, DEACTIVATED, \
+    ADMIN_DEROGATED, PASSWORD_RESET
 from .user_watch_movie_service import UserWatchMovieServices
 from .user_watch_episode_service import UserWatchEpisodeServices
 from .mail_service import EmailServices
+from .password_hasher import PasswordHasher, Sha256Hasher, ScryptHasher, Argon2Hasher, HashingPool, \
+    password_hasher, hash_password, verify_password
+from .user_watch_event_service import UserWatchEventServices
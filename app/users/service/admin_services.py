@@ -4,6 +4,7 @@ from app.users.exceptions import NonExistingUserIdException, AdminAlreadyCreated
 from app.users.repositories import AdminRepository
 from app.users.models import Admin
 from app.users.service import UserServices
+from app.users.service.user_auth_service import revoke_tokens, ADMIN_DEROGATED
 
 
 class AdminServices:
@@ -48,6 +49,7 @@ class AdminServices:
                     raise NonExistingAdminIdException
                 obj = UserServices.update_admin_status(admin.user_id, superuser=False)
                 admin_repository.delete(admin_id)
+                revoke_tokens(admin.user_id, ADMIN_DEROGATED)
                 return obj
         except Exception as exc:
             raise exc
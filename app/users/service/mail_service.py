@@ -1,10 +1,8 @@
 """Mail Service module"""
-import asyncio
-
-from fastapi_mail import ConnectionConfig, MessageSchema, MessageType, FastMail
 from pydantic import EmailStr
 
-from app.config import settings
+from app.mail.models import OutboxMessage
+from app.mail.repositories import OutboxRepository
 
 
 RESET_PASSWORD_TEMPLATE = """<h4>You requested password reset on Netflix.</h4>
@@ -16,56 +14,31 @@ USER_VERIFICATION_TEMPLATE = """<h4>Welcome to Netflix,</h4><p>One more step is
 
 class EmailServices:
     """Service for mail operations"""
-    conf = ConnectionConfig(
-        MAIL_USERNAME=settings.MAIL_USERNAME,
-        MAIL_PASSWORD=settings.MAIL_PASSWORD,
-        MAIL_PORT=settings.MAIL_PORT,
-        MAIL_SERVER=settings.MAIL_SERVER,
-        MAIL_FROM=settings.MAIL_FROM,
-        MAIL_STARTTLS=True,
-        MAIL_SSL_TLS=False
-    )
 
     @staticmethod
-    def send_code_for_verification(email: EmailStr, code: int):
+    def queue_code_for_verification(db, email: EmailStr, code: int):
         """
-        Function sends a verification code to the user's email address.
-        The function takes in an email and a code as parameters, and uses them to create an HTML message
-        that contains the code. The function then sends this message via FastMail.
+        Function adds a message with the verification code to the outbox.
+        The message is committed together with the new user, and sent by the mail dispatcher.
 
+        Param db: Session in which the user is created.
         Param email:EmailStr: Store the email address of the user
         Param code:int: Send the verification code to the user.
-        Return: The message that was sent to the user.
+        Return: The outbox message.
         """
         html = USER_VERIFICATION_TEMPLATE + f"<strong>{str(code)}</strong>"
-        message = MessageSchema(
-            subject="Finish your registration on Netflix.",
-            recipients=[email],
-            body=html,
-            subtype=MessageType.html,
-        )
-        fm = FastMail(EmailServices.conf)
-        asyncio.run(fm.send_message(message))
-        return
+        return OutboxRepository(db, OutboxMessage).enqueue(email, "Finish your registration on Netflix.", html)
 
     @staticmethod
-    def send_code_for_password_reset(email: EmailStr, code: int):
+    def queue_code_for_password_reset(db, email: EmailStr, code: int):
         """
-        The send_code_for_password_reset function sends a code to the user's email address.
-        The function takes in an email and a code as parameters, and uses them to send the user
-        an HTML message containing their password reset code.
+        Function adds a message with the password reset code to the outbox.
+        The message is committed together with the new code, and sent by the mail dispatcher.
 
+        Param db: Session in which the code is stored.
         Param email:EmailStr: Specify the email address of the user who is requesting a password reset
         Param code:int: Send the code to the user.
-        Return: A future object.
+        Return: The outbox message.
         """
         html = RESET_PASSWORD_TEMPLATE + f"<strong>{str(code)}</strong>"
-        message = MessageSchema(
-            subject="Reset Password.",
-            recipients=[email],
-            body=html,
-            subtype=MessageType.html,
-        )
-        fm = FastMail(EmailServices.conf)
-        asyncio.run(fm.send_message(message))
-        return
+        return OutboxRepository(db, OutboxMessage).enqueue(email, "Reset Password.", html)
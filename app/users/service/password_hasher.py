@@ -0,0 +1,275 @@
+"""Password Hasher module"""
+import base64
+import hashlib
+import hmac
+import os
+from concurrent.futures import ProcessPoolExecutor
+from threading import BoundedSemaphore, Lock
+from typing import Optional, Tuple
+
+from app.config import settings
+from app.users.exceptions import PasswordHashingBusyException
+
+
+def _encode(data: bytes) -> str:
+    return base64.b64encode(data).decode().rstrip("=")
+
+
+def _decode(data: str) -> bytes:
+    return base64.b64decode(data + "=" * (-len(data) % 4))
+
+
+class PasswordHasher:
+    """
+    Base Class for key derivation functions. Hashes are stored with their algorithm and parameters,
+    so hashes created with older parameters or algorithms can still be verified and then upgraded.
+    """
+    algorithm = None
+    cpu_bound = True
+
+    def identifies(self, encoded: str) -> bool:
+        """
+        Function checks whether the stored hash was created by this hasher.
+
+        Param encoded:str: Stored password hash.
+        Return: bool
+        """
+        raise NotImplementedError
+
+    def hash(self, password: str) -> str:
+        """
+        Function hashes the password with a new random salt.
+
+        Param password:str: Plain text password.
+        Return: Stored form of the hash.
+        """
+        raise NotImplementedError
+
+    def verify(self, password: str, encoded: str) -> bool:
+        """
+        Function checks the password against a stored hash in constant time.
+
+        Param password:str: Plain text password.
+        Param encoded:str: Stored password hash.
+        Return: bool
+        """
+        raise NotImplementedError
+
+    def needs_rehash(self, encoded: str) -> bool:
+        """
+        Function checks whether the stored hash was created with other parameters than the current ones.
+
+        Param encoded:str: Stored password hash.
+        Return: bool
+        """
+        raise NotImplementedError
+
+
+class Sha256Hasher(PasswordHasher):
+    """Unsalted SHA-256 hashes stored before key derivation functions were used. Only used for verification."""
+    algorithm = "sha256"
+    cpu_bound = False
+
+    def identifies(self, encoded: str) -> bool:
+        return len(encoded) == 64 and all(char in "0123456789abcdef" for char in encoded)
+
+    def hash(self, password: str) -> str:
+        return hashlib.sha256(password.encode()).hexdigest()
+
+    def verify(self, password: str, encoded: str) -> bool:
+        return hmac.compare_digest(self.hash(password), encoded)
+
+    def needs_rehash(self, encoded: str) -> bool:
+        return True
+
+
+class ScryptHasher(PasswordHasher):
+    """Scrypt from the standard library, stored as scrypt$n$r$p$salt$key."""
+    algorithm = "scrypt"
+
+    def __init__(self, n: int = 2 ** 14, r: int = 8, p: int = 1, salt_bytes: int = 16, key_bytes: int = 32):
+        self.n = n
+        self.r = r
+        self.p = p
+        self.salt_bytes = salt_bytes
+        self.key_bytes = key_bytes
+
+    def _derive(self, password: str, salt: bytes, n: int, r: int, p: int, key_bytes: int) -> bytes:
+        return hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p, dklen=key_bytes,
+                              maxmem=256 * n * r * p + 1024 * 1024)
+
+    def identifies(self, encoded: str) -> bool:
+        return encoded.startswith("scrypt$")
+
+    def hash(self, password: str) -> str:
+        salt = os.urandom(self.salt_bytes)
+        key = self._derive(password, salt, self.n, self.r, self.p, self.key_bytes)
+        return f"scrypt${self.n}${self.r}${self.p}${_encode(salt)}${_encode(key)}"
+
+    def verify(self, password: str, encoded: str) -> bool:
+        try:
+            _, n, r, p, salt, key = encoded.split("$")
+            key = _decode(key)
+            derived = self._derive(password, _decode(salt), int(n), int(r), int(p), len(key))
+        except ValueError:
+            return False
+        return hmac.compare_digest(derived, key)
+
+    def needs_rehash(self, encoded: str) -> bool:
+        return encoded.split("$")[1:4] != [str(self.n), str(self.r), str(self.p)]
+
+
+class Argon2Hasher(PasswordHasher):
+    """Argon2id from the argon2-cffi package, which is only imported when this hasher is configured."""
+    algorithm = "argon2"
+
+    def __init__(self, time_cost: int = 3, memory_cost: int = 65536, parallelism: int = 4):
+        self.time_cost = time_cost
+        self.memory_cost = memory_cost
+        self.parallelism = parallelism
+
+    def _hasher(self):
+        import argon2  # pylint: disable=import-outside-toplevel
+        return argon2.PasswordHasher(time_cost=self.time_cost, memory_cost=self.memory_cost,
+                                     parallelism=self.parallelism)
+
+    def identifies(self, encoded: str) -> bool:
+        return encoded.startswith("$argon2")
+
+    def hash(self, password: str) -> str:
+        return self._hasher().hash(password)
+
+    def verify(self, password: str, encoded: str) -> bool:
+        import argon2  # pylint: disable=import-outside-toplevel
+        try:
+            return self._hasher().verify(encoded, password)
+        except (argon2.exceptions.VerificationError, argon2.exceptions.InvalidHash):
+            return False
+
+    def needs_rehash(self, encoded: str) -> bool:
+        return self._hasher().check_needs_rehash(encoded)
+
+
+HASHERS = {"scrypt": ScryptHasher, "argon2": Argon2Hasher}
+
+
+def _call(hasher: PasswordHasher, method: str, *args):
+    return getattr(hasher, method)(*args)
+
+
+class HashingPool:
+    """
+    Runs the key derivation function in a pool of worker processes, so hashing does not hold the GIL
+    of the API worker. At most max_pending passwords are hashed or waiting at a time, further
+    requests are refused instead of queueing up behind them. With no workers hashing runs in the caller,
+    and max_pending of 0 disables the limit.
+    """
+
+    def __init__(self, hasher: PasswordHasher, legacy: tuple = (Sha256Hasher(),), workers: int = 2,
+                 max_pending: int = 64):
+        self.hasher = hasher
+        self.hashers = (hasher,) + tuple(legacy)
+        self.workers = workers
+        self.max_pending = max_pending
+        self._pending = BoundedSemaphore(max_pending) if max_pending else None
+        self._lock = Lock()
+        self._executor = None
+        self._dummy_hash = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """Process pool, started on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            return self._executor
+
+    def _run(self, hasher: PasswordHasher, method: str, *args):
+        if not hasher.cpu_bound:
+            return _call(hasher, method, *args)
+        if self._pending is not None and not self._pending.acquire(blocking=False):
+            raise PasswordHashingBusyException
+        try:
+            if not self.workers:
+                return _call(hasher, method, *args)
+            return self.executor.submit(_call, hasher, method, *args).result()
+        finally:
+            if self._pending is not None:
+                self._pending.release()
+
+    def identify(self, encoded: str) -> Optional[PasswordHasher]:
+        """
+        Function returns the hasher that created the stored hash.
+
+        Param encoded:str: Stored password hash.
+        Return: PasswordHasher or None.
+        """
+        for hasher in self.hashers:
+            if encoded and hasher.identifies(encoded):
+                return hasher
+        return None
+
+    def hash(self, password: str) -> str:
+        """
+        Function hashes the password with the configured hasher.
+
+        Param password:str: Plain text password.
+        Return: Stored form of the hash.
+        """
+        return self._run(self.hasher, "hash", password)
+
+    def verify(self, password: str, encoded: str) -> Tuple[bool, Optional[str]]:
+        """
+        Function checks the password against a stored hash. Hashes created by a legacy hasher
+        or with outdated parameters are rehashed with the configured hasher after a successful check.
+
+        Param password:str: Plain text password.
+        Param encoded:str: Stored password hash.
+        Return: A tuple of the result and the new hash to store, if the stored one should be replaced.
+        """
+        hasher = self.identify(encoded)
+        if hasher is None or not self._run(hasher, "verify", password, encoded):
+            return False, None
+        if hasher is self.hasher and not hasher.needs_rehash(encoded):
+            return True, None
+        return True, self.hash(password)
+
+    def verify_dummy(self, password: str):
+        """
+        Function checks the password against a hash of a random password, so logins with
+        unknown emails take as long as logins with wrong passwords.
+
+        Param password:str: Plain text password.
+        Return: None.
+        """
+        if self._dummy_hash is None:
+            self._dummy_hash = self.hash(_encode(os.urandom(16)))
+        self._run(self.hasher, "verify", password, self._dummy_hash)
+
+    def shutdown(self):
+        """
+        Function stops the worker processes.
+
+        Return: None.
+        """
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+
+def create_password_hasher() -> PasswordHasher:
+    """
+    Function creates the password hasher selected in the settings.
+
+    Return: PasswordHasher.
+    """
+    if settings.PASSWORD_HASHER == "scrypt":
+        return ScryptHasher(settings.SCRYPT_N, settings.SCRYPT_R, settings.SCRYPT_P)
+    return HASHERS[settings.PASSWORD_HASHER]()
+
+
+password_hasher = HashingPool(create_password_hasher(), workers=settings.PASSWORD_HASH_WORKERS,
+                              max_pending=settings.PASSWORD_HASH_MAX_PENDING)
+hash_password = password_hasher.hash
+verify_password = password_hasher.verify
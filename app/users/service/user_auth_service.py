@@ -1,27 +1,39 @@
 """User Authentication module"""
+import hashlib
+import json
 import time
-from typing import Dict
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Optional
 import jwt
 
+from app.cache import CacheBackend, MemoryCacheBackend, RedisCacheBackend
 from app.config import settings
 from app.users.exceptions import InvalidTokenException
 
 USER_SECRET = settings.USER_SECRET
 JWT_ALGORITHM = settings.ALGORYTHM
 TOKEN_DURATION_SECONDS = settings.TOKEN_DURATION_SECONDS
+DEACTIVATED = "deactivated"
+ADMIN_DEROGATED = "admin derogated"
+PASSWORD_RESET = "password reset"
 
 
-def sign_jwt(user_id: str, role: str) -> Dict[str, str]:
+def sign_jwt(user_id: str, role: str, profile_id: str = None) -> Dict[str, str]:
     """
     Creates and returns user's access token.
     Param user_id: user's ID
     Param role: permission
+    Param profile_id: ID of the subuser profile, defaults to the user's ID
     Return: token, dictionary.
     """
+    issued = time.time()
     payload = {
         "user_id": user_id,
+        "profile_id": profile_id or user_id,
         "role": role,
-        "expires": time.time() + TOKEN_DURATION_SECONDS
+        "issued": issued,
+        "expires": issued + TOKEN_DURATION_SECONDS
     }
     token = jwt.encode(payload, USER_SECRET, algorithm=JWT_ALGORITHM)
 
@@ -40,3 +52,187 @@ def decode_jwt(token: str) -> dict:
         return decoded_token if decoded_token["expires"] >= time.time() else None
     except (jwt.PyJWTError, jwt.InvalidTokenError) as exc:
         raise InvalidTokenException from exc
+
+
+class Principal:
+    """Authenticated caller of a request, resolved once from the bearer token."""
+
+    __slots__ = ("user_id", "profile_id", "role", "is_active", "issued", "expires")
+
+    def __init__(self, user_id: str, profile_id: str, role: str, issued: float, expires: float,
+                 is_active: bool = True):
+        self.user_id = user_id
+        self.profile_id = profile_id
+        self.role = role
+        self.issued = issued
+        self.expires = expires
+        self.is_active = is_active
+
+    @classmethod
+    def from_payload(cls, payload: dict):
+        """
+        Function creates a principal from a verified token payload.
+        Tokens issued before the profile_id and issued claims existed fall back to the user ID and token duration.
+
+        Param payload:dict: Decoded token.
+        Return: Principal.
+        """
+        expires = payload["expires"]
+        return cls(payload["user_id"], payload.get("profile_id", payload["user_id"]), payload["role"],
+                   payload.get("issued", expires - TOKEN_DURATION_SECONDS), expires)
+
+    def deactivated(self):
+        """
+        Function returns a copy of the principal marked as inactive.
+
+        Return: Principal.
+        """
+        return Principal(self.user_id, self.profile_id, self.role, self.issued, self.expires, is_active=False)
+
+
+class VerifiedTokenCache:
+    """
+    Bounded cache of verified tokens, keyed by the SHA-256 digest of the token so raw tokens are not kept.
+    Entries expire together with the token, and the least recently used entry is evicted when full.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._lock = Lock()
+        self._entries = OrderedDict()
+
+    def get(self, digest: bytes) -> Optional[Principal]:
+        """
+        Function returns the principal of a verified token, if it is cached and not expired.
+
+        Param digest:bytes: Digest of the token.
+        Return: Principal or None.
+        """
+        with self._lock:
+            principal = self._entries.get(digest)
+            if principal is None:
+                return None
+            if principal.expires < time.time():
+                del self._entries[digest]
+                return None
+            self._entries.move_to_end(digest)
+            return principal
+
+    def put(self, digest: bytes, principal: Principal):
+        """
+        Function caches the principal of a verified token.
+
+        Param digest:bytes: Digest of the token.
+        Param principal:Principal: Principal resolved from the token.
+        Return: None.
+        """
+        with self._lock:
+            self._entries[digest] = principal
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """
+        Function drops all cached tokens.
+
+        Return: None.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class TokenRevocations:
+    """
+    Revoked tokens, recorded per user: every token issued to the user before the revocation is rejected.
+    Revocations are kept as long as a token can live, in Redis when the shared cache backend is configured.
+    """
+
+    def __init__(self, backend: CacheBackend):
+        self.backend = backend
+
+    def revoke(self, user_id: str, reason: str):
+        """
+        Function revokes all tokens issued to the user until now.
+
+        Param user_id:str: ID of the user.
+        Param reason:str: Reason of the revocation.
+        Return: None.
+        """
+        revocation = json.dumps({"revoked": time.time(), "reason": reason})
+        self.backend.set(str(user_id), revocation, TOKEN_DURATION_SECONDS)
+
+    def check(self, principal: Principal) -> Optional[Principal]:
+        """
+        Function checks the principal against revocations of its user. Tokens of deactivated users resolve to
+        an inactive principal, all other revoked tokens are rejected.
+
+        Param principal:Principal: Principal resolved from the token.
+        Return: The principal, or None if its token was revoked.
+        """
+        revocation = self.backend.get(str(principal.user_id))
+        if revocation is None:
+            return principal
+        revocation = json.loads(revocation)
+        if principal.issued > revocation["revoked"]:
+            return principal
+        return principal.deactivated() if revocation["reason"] == DEACTIVATED else None
+
+    def clear(self):
+        """
+        Function drops all revocations.
+
+        Return: None.
+        """
+        self.backend.clear()
+
+
+def create_revocation_backend() -> CacheBackend:
+    """
+    Function creates the backend for token revocations, shared when the Redis cache backend is configured.
+    An evicted revocation would accept revoked tokens again, so revocations in memory are not bounded
+    and are only dropped when no token issued before them can be valid anymore.
+
+    Return: CacheBackend.
+    """
+    if settings.CACHE_BACKEND == "redis":
+        return RedisCacheBackend(settings.CACHE_URL, key_prefix="revoked-tokens:")
+    return MemoryCacheBackend(max_entries=None)
+
+
+verified_tokens = VerifiedTokenCache(settings.TOKEN_CACHE_SIZE)
+token_revocations = TokenRevocations(create_revocation_backend())
+
+
+def authenticate(token: str) -> Optional[Principal]:
+    """
+    Function resolves the principal of a bearer token. Signatures are verified once per token,
+    later requests with the same token are served from the verified token cache.
+    Revocations are checked on every call.
+
+    Param token:str: Bearer token.
+    Return: Principal, or None if the token is expired or revoked.
+    """
+    digest = hashlib.sha256(token.encode()).digest()
+    principal = verified_tokens.get(digest)
+    if principal is None:
+        payload = decode_jwt(token)
+        if not payload:
+            return None
+        principal = Principal.from_payload(payload)
+        verified_tokens.put(digest, principal)
+    return token_revocations.check(principal)
+
+
+def revoke_tokens(user_id: str, reason: str):
+    """
+    Function revokes all tokens issued to the user, called when the user is deactivated,
+    loses admin rights or resets the password.
+
+    Param user_id:str: ID of the user.
+    Param reason:str: Reason of the revocation.
+    Return: None.
+    """
+    token_revocations.revoke(user_id, reason)
@@ -1,25 +1,26 @@
 """User Service module"""
-import hashlib
-
-from fastapi import BackgroundTasks
 from starlette.responses import JSONResponse
 
+from app.base import projection
 from app.users.repositories import UserRepository, SubuserRepository
 from app.db.database import SessionLocal
 from app.users.models import User, Subuser
 from app.users.exceptions import *
 from .mail_service import EmailServices
+from .password_hasher import password_hasher, hash_password, verify_password
+from .user_auth_service import revoke_tokens, DEACTIVATED, PASSWORD_RESET
 from app.utils import generate_random_int, validate_password
 
 
 class UserServices:
     """Service for User routes."""
     @staticmethod
-    def create_new_user(worker: BackgroundTasks, email: str, password: str, username: str):
+    def create_new_user(email: str, password: str, username: str):
         """
         The create_new_user function creates a new user in the database.
         It takes as input an email, password, username and verification code.
-        The function returns the newly created user.
+        The verification email is added to the outbox in the same transaction, so the function
+        returns as soon as the user is committed and the mail dispatcher sends the email.
 
         Param email:str: Store the email of the user.
         Param password:str: Hash the password.
@@ -30,12 +31,12 @@ class UserServices:
             code = generate_random_int()
             if not validate_password(password):
                 raise InvalidPasswordForm
-            password = hashlib.sha256(password.encode()).hexdigest()
+            password = hash_password(password)
             with SessionLocal() as db:
                 repository = UserRepository(db, User)
                 fields = {"email": email, "password_hashed": password, "username": username, "verification_code": code}
-                obj = repository.create(fields)
-            worker.add_task(EmailServices.send_code_for_verification, obj.email, code)
+                EmailServices.queue_code_for_verification(db, email, code)
+                repository.create(fields)
             return JSONResponse(
                 content="Finish your registration. Instructions are sent to your email.",
                 status_code=200
@@ -64,15 +65,18 @@ class UserServices:
             raise exc
 
     @staticmethod
-    def get_all_users():
+    def get_all_users(schema=None):
         """
         The get_all_users function returns all users in the database.
 
+        Param schema: Response schema whose columns are selected, rows are returned instead of users if given.
         Return: All the users in the database.
         """
         try:
             with SessionLocal() as db:
                 repository = UserRepository(db, User)
+                if schema is not None:
+                    return repository.read_rows(projection(User, schema))
                 return repository.read_all()
         except Exception as exc:
             raise exc
@@ -167,6 +171,7 @@ class UserServices:
         """
         Function is used to authenticate a user by checking the email and password
         provided. If the credentials are valid, then it returns an object of type User.
+        Passwords stored as legacy SHA-256 hashes or with outdated parameters are rehashed on success.
 
 
         Param email:str: Pass the email address of the user logging in
@@ -177,8 +182,14 @@ class UserServices:
             with SessionLocal() as db:
                 repository = UserRepository(db, User)
                 user = repository.read_user_by_email(email)
-                if not user or user.password_hashed != password:
+                if not user:
+                    password_hasher.verify_dummy(password)
                     raise InvalidCredentialsException
+                valid, new_hash = verify_password(password, user.password_hashed)
+                if not valid:
+                    raise InvalidCredentialsException
+                if new_hash:
+                    user = repository.update(user, {"password_hashed": new_hash})
                 if user.verification_code is not None:
                     raise UnverifiedAccountException
                 if not user.is_active:
@@ -242,7 +253,10 @@ class UserServices:
                 repository = UserRepository(db, User)
                 user = UserServices.get_user_by_id(user_id)
                 updates = {"is_active": activity}
-                return repository.update(user, updates)
+                user = repository.update(user, updates)
+                if not activity:
+                    revoke_tokens(user.id, DEACTIVATED)
+                return user
         except Exception as exc:
             raise exc
 
@@ -292,13 +306,13 @@ class UserServices:
             raise exc
 
     @staticmethod
-    def reset_password_complete(code: int, password_hashed: str):
+    def reset_password_complete(code: int, password: str):
         """
-        The reset_password_complete function takes in a code and password hashed,
+        The reset_password_complete function takes in a code and a new password,
         and updates the user's password to be the hashed version of the new password.
 
         Param code:int: Identify the user.
-        Param password hashed:str: Store the hashed password, and the code:int parameter is used to store
+        Param password:str: New password, and the code:int parameter is used to store
         the verification code.
         Return: A dictionary with the key &quot;success&quot; and value true.
         """
@@ -306,8 +320,10 @@ class UserServices:
             with SessionLocal() as db:
                 repository = UserRepository(db, User)
                 user = repository.read_user_by_code(code)
-                updates = {"password_hashed": password_hashed, "verification_code": None}
-                return repository.update(user, updates)
+                updates = {"password_hashed": hash_password(password), "verification_code": None}
+                user = repository.update(user, updates)
+                revoke_tokens(user.id, PASSWORD_RESET)
+                return user
         except Exception as exc:
             raise exc
 
@@ -326,8 +342,8 @@ class UserServices:
                 if not user:
                     raise UserEmailDoesNotExistsException(message=f"Email: {email} does not exist in our Database.")
                 code = generate_random_int()
+                EmailServices.queue_code_for_password_reset(db, user.email, code)
                 obj = repository.update(user, {"verification_code": code})
-                EmailServices.send_code_for_password_reset(user.email, code)
                 return obj
         except Exception as exc:
             raise exc
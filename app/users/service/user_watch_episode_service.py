@@ -1,10 +1,18 @@
 """UserWatchEpisode Service module"""
+from typing import Optional
+
 from starlette.responses import JSONResponse
 
+from app.cache import cached, invalidate, SERIES_VIEWS, EPISODE_RATINGS
 from app.db import SessionLocal
+from app.recommendations.models import SERIES
+from app.recommendations.service import RecommendationServices, recommendation_updater
 from app.series.exceptions.series_exceptions import UnknownSeriesException
 from app.series.models import Episode, Series
 from app.series.repositories import EpisodeRepository, SeriesRepository
+from app.stats.models import EpisodeStats, SeriesStats
+from app.stats.repositories import EpisodeStatsRepository, SeriesStatsRepository
+from app.stats.service import trending_engine, ALL_TIME
 from app.users.models.user import UserWatchEpisode
 from app.users.repositories import UserWatchEpisodeRepository
 
@@ -20,7 +28,8 @@ class UserWatchEpisodeServices:
         if they have it will return a message saying that they have already watched
         it and where to find it again. If not,
         it will create a new entry in the UserWatchEpisode table with their ID and the ID
-        of the specific episode they are watching.
+        of the specific episode they are watching. Views of the episode and its series are counted
+        in the same transaction.
 
         Param user_id:str: Identify the user.
         Param episode_id:str: Get the episode object from the database.
@@ -34,8 +43,15 @@ class UserWatchEpisodeServices:
                 episode = episode_repo.read_by_id(episode_id)
                 if watched_episode:
                     return {"message": "Watch episode again.", "link": episode.link}
+                new_viewer = not repository.read_user_watched_series(user_id, episode.series_id)
+                EpisodeStatsRepository(db, EpisodeStats).add(episode_id, views=1)
+                SeriesStatsRepository(db, SeriesStats).add(episode.series_id, views=int(new_viewer))
                 fields = {"user_id": user_id, "episode_id": episode_id}
                 repository.create(fields)
+                invalidate(SERIES_VIEWS)
+                recommendation_updater.record(SERIES, [episode.series_id])
+                if new_viewer:
+                    trending_engine.record(SERIES, episode.series_id)
                 return {"message": "Watch this episode now.", "link": episode.link}
         except Exception as exc:
             raise exc
@@ -44,6 +60,7 @@ class UserWatchEpisodeServices:
     def rate_episode(user_id: str, episode_id: str, rating: int):
         """
         Function allows a user to rate an episode.
+        Rating totals of the episode and its series are updated in the same transaction.
 
         Param user_id:str: Identify the user.
         Param episode_id:str: Get the episode object from the database.
@@ -53,55 +70,79 @@ class UserWatchEpisodeServices:
         try:
             with SessionLocal() as db:
                 repository = UserWatchEpisodeRepository(db, UserWatchEpisode)
+                episode_stats_repository = EpisodeStatsRepository(db, EpisodeStats)
+                series_stats_repository = SeriesStatsRepository(db, SeriesStats)
+                episode = EpisodeRepository(db, Episode).read_by_id(episode_id)
                 watched_episode = repository.read_user_watch_episode_by_user_id_and_episode_id(user_id, episode_id)
                 if watched_episode:
+                    episode_stats_repository.add_rating(episode_id, rating, old_rating=watched_episode.rating)
+                    series_stats_repository.add_rating(episode.series_id, rating, old_rating=watched_episode.rating)
                     obj = repository.update(watched_episode, {"rating": rating})
+                    invalidate(EPISODE_RATINGS)
+                    recommendation_updater.record(SERIES, [episode.series_id])
                     return obj
+                new_viewer = not repository.read_user_watched_series(user_id, episode.series_id)
+                episode_stats_repository.add_rating(episode_id, rating, new_view=True)
+                series_stats_repository.add_rating(episode.series_id, rating, new_view=new_viewer)
                 fields = {"user_id": user_id, "episode_id": episode_id, "rating": rating}
-                return repository.create(fields)
+                obj = repository.create(fields)
+                invalidate(EPISODE_RATINGS, SERIES_VIEWS)
+                recommendation_updater.record(SERIES, [episode.series_id])
+                if new_viewer:
+                    trending_engine.record(SERIES, episode.series_id)
+                return obj
         except Exception as exc:
             raise exc
 
     @staticmethod
-    def get_most_popular_series():
+    @cached(SERIES_VIEWS)
+    def get_most_popular_series(window: str = ALL_TIME):
         """
-        Function returns a dictionary of the most popular series by number of views.
-        The function takes no arguments and returns a dictionary with the title as key and number of views as value.
+        Function returns a dictionary of the 10 trending series of a time window.
+        Views of a series are users starting it, decayed with a half-life of the window,
+        and all-time scores are the number of views.
 
-        Return: A dictionary of series and views.
+        Param window:str: Time window, like 24h, 7d or all.
+        Return: A dictionary of series titles mapped to their scores.
         """
         try:
+            ranked = trending_engine.top(SERIES, window, limit=10)
             with SessionLocal() as db:
-                repo = UserWatchEpisodeRepository(db, UserWatchEpisode)
-                episodes = repo.read_episode_views()
                 series_repo = SeriesRepository(db, Series)
+                series_objects = series_repo.read_by_ids(series_id for series_id, _ in ranked)
+                titles = {obj.id: obj.title for obj in series_objects}
                 response = {}
-                for series_id, views in episodes:
-                    series = series_repo.read_by_id(series_id)
-                    response.update({series.title: views})
+                for series_id, score in ranked:
+                    if series_id in titles:
+                        response.update({titles[series_id]: round(score, 2)})
                 return response
         except Exception as exc:
             raise exc
 
     @staticmethod
-    def get_users_recommendations(user_id: str, page: int):
+    def get_users_recommendations(user_id: str, page: int, cursor: Optional[str] = None):
         """
-        Function returns a list of series that are recommended for the user based on their
+        Function returns a list of series that are recommended for the user, ranked by their similarity
+        to the series the user watched and rated. Users without recommendations yet get series based on their
         affinities. The function takes in a user_id and page number as the parameters, and uses
         them to query the database for the users affinities. It then uses those affinities to
         find all series with those genres, and returns them in order of popularity.
 
         Param user_id:str: Identify the user that we want to recommend series for.
         Param page:int: Paginate the results.
-        Return: A list of series that are recommended to the user.
+        Param cursor:str: Cursor returned with the previous page, used instead of the page number.
+        Return: A page of series that are recommended to the user.
         """
         try:
+            recommended = RecommendationServices.get_recommendations(SERIES, user_id, page, cursor)
+            if recommended is not None:
+                return recommended
             with SessionLocal() as db:
                 user_watch_episode_repo = UserWatchEpisodeRepository(db, UserWatchEpisode)
                 users_affinities = user_watch_episode_repo.read_users_affinities(user_id)
                 series_repo = SeriesRepository(db, Series)
                 genres = [affinity.Genre_ID for affinity in users_affinities]
-                return series_repo.read_series_by_group_of_genres(page, genres)
+                return series_repo.read_series_by_group_of_genres(page, genres, cursor)
         except Exception as exc:
             raise exc
 
@@ -117,15 +158,11 @@ class UserWatchEpisodeServices:
         """
         try:
             with SessionLocal() as db:
-                series_repository = SeriesRepository(db, Series)
-                series = series_repository.read_series_by_year(str(year))
-                if not series:
+                user_watch_episode_repo = UserWatchEpisodeRepository(db, UserWatchEpisode)
+                result = user_watch_episode_repo.read_average_rating_for_series_year(str(year))
+                if not result.Series:
                     return JSONResponse(content=f"No Series from this year: {year}", status_code=200)
-                episode_ids = [episode.id for obj in series for episode in obj.episodes]
-                user_watch_episode_repo = UserWatchEpisodeRepository(db, Episode)
-                average = user_watch_episode_repo.read_average_rating(episode_ids)
-                response = {"Year": year}
-                response.update(average)
+                response = {"Year": year, "Average Rating": result._mapping["Average Rating"]}
                 return response
         except Exception as exc:
             raise exc
@@ -146,11 +183,9 @@ class UserWatchEpisodeServices:
                 series = series_repository.read_series_by_title(title, search=False)
                 if not series:
                     raise UnknownSeriesException
-                episode_ids = [episode.id for episode in series.episodes]
-                user_watch_episode_repo = UserWatchEpisodeRepository(db, Episode)
-                average = user_watch_episode_repo.read_average_rating(episode_ids)
-                response = {"Series": series.title}
-                response.update(average)
+                stats = SeriesStatsRepository(db, SeriesStats).read_stats(series.id)
+                average = stats._mapping["Average Rating"] if stats else None
+                response = {"Series": series.title, "Average Rating": average}
                 return response
         except Exception as exc:
             raise exc
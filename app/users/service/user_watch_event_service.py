@@ -0,0 +1,223 @@
+"""UserWatchEvent Service module"""
+from collections import Counter
+from datetime import date
+
+from app.cache import invalidate, MOVIE_VIEWS, MOVIE_RATINGS, SERIES_VIEWS, EPISODE_RATINGS
+from app.db import SessionLocal
+from app.movies.exceptions import NonExistingMovieTitleException
+from app.movies.models import Movie
+from app.movies.repositories import MovieRepository
+from app.recommendations.models import MOVIES, SERIES
+from app.recommendations.service import recommendation_updater
+from app.series.exceptions.series_exceptions import UnknownEpisodeException
+from app.series.models import Episode
+from app.series.repositories import EpisodeRepository
+from app.stats.models import MovieStats, EpisodeStats, SeriesStats
+from app.stats.repositories import MovieStatsRepository, EpisodeStatsRepository, SeriesStatsRepository
+from app.stats.service import trending_engine
+from app.users.models.user import UserWatchMovie, UserWatchEpisode
+from app.users.repositories import UserWatchMovieRepository, UserWatchEpisodeRepository
+
+CREATED = "created"
+UPDATED = "updated"
+UNCHANGED = "unchanged"
+NOT_FOUND = "not_found"
+INVALID = "invalid"
+
+
+class WatchedTitles:
+    """
+    Watch records of one user for titles of a single kind, changed by the events of a batch in the order
+    they were sent. Changed records and the change of title totals are written once, after all events are applied.
+    """
+
+    def __init__(self, existing: dict):
+        self.existing = {key: obj.rating for key, obj in existing.items()}
+        self.ratings = dict(self.existing)
+
+    def apply(self, key: str, rating: int = None) -> str:
+        """
+        Function applies a watch event, or a rating event if the rating is given, to the record of a title.
+
+        Param key:str: ID of the title.
+        Param rating:int: New rating of the title, None for a watch event.
+        Return: created, updated or unchanged.
+        """
+        if key not in self.ratings:
+            status = CREATED
+        elif rating is not None and rating != self.ratings[key]:
+            status = UPDATED
+        else:
+            return UNCHANGED
+        self.ratings[key] = rating if rating is not None else self.ratings.get(key)
+        return status
+
+    def changed(self) -> dict:
+        """
+        Function returns the final rating of records that were created or rated by the events.
+
+        Return: A dictionary of ratings by ID of the title.
+        """
+        return {key: rating for key, rating in self.ratings.items()
+                if key not in self.existing or rating != self.existing[key]}
+
+    def totals(self, key: str) -> tuple:
+        """
+        Function returns the change of views, rating sum and rating count of a title caused by the events.
+
+        Param key:str: ID of the title.
+        Return: Tuple of views, rating sum and rating count.
+        """
+        new_view = key not in self.existing
+        old_rating = self.existing.get(key)
+        rating = self.ratings[key]
+        return (int(new_view), (rating or 0) - (old_rating or 0),
+                int(rating is not None) - int(old_rating is not None))
+
+
+def add_totals(totals: dict, key: str, change: tuple):
+    """
+    Function adds a change of views, rating sum and rating count to the totals of a title.
+
+    Param totals:dict: Totals by ID of the title.
+    Param key:str: ID of the title.
+    Param change:tuple: Views, rating sum and rating count to add.
+    Return: None.
+    """
+    current = totals.get(key, (0, 0, 0))
+    totals[key] = tuple(value + delta for value, delta in zip(current, change))
+
+
+def event_target(event) -> tuple:
+    """
+    Function validates an event and returns the title it refers to.
+
+    Param event:WatchEventSchemaIn: Watch or rating event.
+    Return: Tuple of the kind, movie or episode, and the ID or name of the title. The kind is None if invalid,
+    with the reason in place of the title.
+    """
+    movie = event.movie_id or event.movie_title
+    episode = event.episode_id or event.episode_name
+    if bool(movie) == bool(episode or event.series_title):
+        return None, "Event must refer to one movie or one episode."
+    if event.rating is not None and not 0 < event.rating <= 10:
+        return None, "Rating must be between 1 and 10."
+    if event.movie_id:
+        return "movie", ("id", event.movie_id)
+    if event.movie_title:
+        return "movie", ("title", event.movie_title.strip())
+    if event.episode_id:
+        return "episode", ("id", event.episode_id)
+    if not event.episode_name or not event.series_title:
+        return None, "Episode must be given by its ID, or by its name and the title of its series."
+    return "episode", ("name", (event.series_title.strip(), event.episode_name.strip()))
+
+
+class UserWatchEventServices:
+    """Service for batched watch and rating events."""
+    @staticmethod
+    def record_watch_events(user_id: str, events: list) -> dict:
+        """
+        Function records a batch of watch and rating events of a user in a single transaction.
+        Titles are resolved with one query per kind of reference, and existing watch records with one query
+        per kind of title. Events are applied in the order they were sent, so a title watched and then rated
+        in the same batch ends up rated once. Watch records are written with one multi-row upsert per table,
+        and views and rating totals of movies, episodes and series with one multi-row upsert per summary table.
+        Events that are invalid or refer to unknown titles are reported and do not stop the batch.
+
+        Param user_id:str: Identify the user.
+        Param events:list: WatchEventSchemaIn objects.
+        Return: A dictionary with the result of every event and the number of events by status.
+        """
+        try:
+            targets = [event_target(event) for event in events]
+            references = {}
+            for kind, target in targets:
+                if kind:
+                    references.setdefault((kind, target[0]), []).append(target[1])
+            with SessionLocal() as db:
+                movie_repository = MovieRepository(db, Movie)
+                episode_repository = EpisodeRepository(db, Episode)
+                resolved = {
+                    ("movie", "id"): {obj.id: obj for obj in
+                                      movie_repository.read_by_ids(references.get(("movie", "id"), []))},
+                    ("movie", "title"): movie_repository.read_by_titles(references.get(("movie", "title"), [])),
+                    ("episode", "id"): {obj.id: obj for obj in
+                                        episode_repository.read_by_ids(references.get(("episode", "id"), []))},
+                    ("episode", "name"): episode_repository.read_by_episode_names_and_series_titles(
+                        references.get(("episode", "name"), []))}
+                movies = {obj.id: obj for obj in [*resolved[("movie", "id")].values(),
+                                                  *resolved[("movie", "title")].values()]}
+                episodes = {obj.id: obj for obj in [*resolved[("episode", "id")].values(),
+                                                    *resolved[("episode", "name")].values()]}
+
+                watch_movie_repository = UserWatchMovieRepository(db, UserWatchMovie)
+                watch_episode_repository = UserWatchEpisodeRepository(db, UserWatchEpisode)
+                watched_movies = WatchedTitles(
+                    watch_movie_repository.read_by_user_id_and_movie_ids(user_id, list(movies)))
+                watched_episodes = WatchedTitles(
+                    watch_episode_repository.read_by_user_id_and_episode_ids(user_id, list(episodes)))
+                watched_series = watch_episode_repository.read_watched_series_ids(
+                    user_id, {episode.series_id for episode in episodes.values()})
+
+                results = []
+                for index, ((kind, target), event) in enumerate(zip(targets, events)):
+                    if kind is None:
+                        results.append({"index": index, "status": INVALID, "detail": target})
+                        continue
+                    obj = resolved[(kind, target[0])].get(target[1])
+                    if obj is None:
+                        detail = NonExistingMovieTitleException.message if kind == "movie" \
+                            else UnknownEpisodeException.message
+                        results.append({"index": index, "status": NOT_FOUND, "detail": detail})
+                        continue
+                    watched = watched_movies if kind == "movie" else watched_episodes
+                    results.append({"index": index, "status": watched.apply(obj.id, event.rating), "link": obj.link})
+
+                today = date.today()
+                movie_totals, episode_totals, series_totals = {}, {}, {}
+                changed_movies = watched_movies.changed()
+                for movie_id in changed_movies:
+                    add_totals(movie_totals, movie_id, watched_movies.totals(movie_id))
+                changed_episodes = watched_episodes.changed()
+                for episode_id in changed_episodes:
+                    change = watched_episodes.totals(episode_id)
+                    add_totals(episode_totals, episode_id, change)
+                    series_id = episodes[episode_id].series_id
+                    new_viewer = bool(change[0]) and series_id not in watched_series
+                    watched_series.add(series_id)
+                    add_totals(series_totals, series_id, (int(new_viewer), *change[1:]))
+
+                watch_movie_repository.upsert_many(
+                    [{"user_id": user_id, "movie_id": movie_id, "rating": rating, "date_watched": today}
+                     for movie_id, rating in changed_movies.items()],
+                    keys=("user_id", "movie_id"), replace=("rating",))
+                watch_episode_repository.upsert_many(
+                    [{"user_id": user_id, "episode_id": episode_id, "rating": rating, "date_watched": today}
+                     for episode_id, rating in changed_episodes.items()],
+                    keys=("user_id", "episode_id"), replace=("rating",))
+                MovieStatsRepository(db, MovieStats).add_many(movie_totals)
+                EpisodeStatsRepository(db, EpisodeStats).add_many(episode_totals)
+                SeriesStatsRepository(db, SeriesStats).add_many(series_totals)
+                db.commit()
+
+            namespaces = set()
+            if any(views for views, _, _ in movie_totals.values()):
+                namespaces.add(MOVIE_VIEWS)
+            if any(count or rating_sum for _, rating_sum, count in movie_totals.values()):
+                namespaces.add(MOVIE_RATINGS)
+            if any(views for views, _, _ in series_totals.values()):
+                namespaces.add(SERIES_VIEWS)
+            if any(count or rating_sum for _, rating_sum, count in episode_totals.values()):
+                namespaces.add(EPISODE_RATINGS)
+            if namespaces:
+                invalidate(*namespaces)
+            recommendation_updater.record(MOVIES, changed_movies)
+            recommendation_updater.record(SERIES, series_totals)
+            for kind, totals in ((MOVIES, movie_totals), (SERIES, series_totals)):
+                for item_id, (views, _, _) in totals.items():
+                    if views:
+                        trending_engine.record(kind, item_id, views)
+            return {"results": results, "summary": dict(Counter(result["status"] for result in results))}
+        except Exception as exc:
+            raise exc
@@ -1,9 +1,18 @@
 """UserWatchMovie Service module"""
+from typing import Optional
+
 from starlette.responses import JSONResponse
 
+from app.cache import cached, invalidate, MOVIE_RATINGS, MOVIE_VIEWS
 from app.db import SessionLocal
 from app.movies.models import Movie
+from app.movies.exceptions import NoRatingsException
 from app.movies.repositories import MovieRepository
+from app.recommendations.models import MOVIES
+from app.recommendations.service import RecommendationServices, recommendation_updater
+from app.stats.models import MovieStats
+from app.stats.repositories import MovieStatsRepository
+from app.stats.service import trending_engine, ALL_TIME
 from app.users.models.user import UserWatchMovie
 from app.users.repositories import UserWatchMovieRepository
 
@@ -17,7 +26,8 @@ class UserWatchMovieServices:
         It takes in two parameters, the user_id and the movie_id.
         The function then checks if there is an existing record of
         this particular combination of user ID and movie ID.
-        If it does not exist, it creates one with the given information.
+        If it does not exist, it creates one with the given information, and counts a new view of the movie
+        in the same transaction.
 
         Param user_id:str: Identify the user.
         Param movie_id:str: Get the movie object from the database.
@@ -31,8 +41,12 @@ class UserWatchMovieServices:
                 watched_movie = repository.read_user_watch_movie_by_user_id_and_movie_id(user_id, movie_id)
                 if watched_movie:
                     return {"message": "Watch movie again.", "link": movie.link}
+                MovieStatsRepository(db, MovieStats).add(movie_id, views=1)
                 fields = {"user_id": user_id, "movie_id": movie_id}
                 repository.create(fields)
+                invalidate(MOVIE_VIEWS)
+                recommendation_updater.record(MOVIES, [movie_id])
+                trending_engine.record(MOVIES, movie_id)
                 return {"message": "Watch this movie now.", "link": movie.link}
         except Exception as exc:
             raise exc
@@ -44,6 +58,7 @@ class UserWatchMovieServices:
         It takes in the user_id, movie_id and rating as parameters.
         The function then checks if the user has already rated that particular movie.
         If they have not, it creates a new entry in the UserWatchMovie table with their rating for that specific film.
+        Rating totals of the movie are updated in the same transaction.
 
         Param user_id:str: Identify the user.
         Param movie_id:str: Specify the movie that is being rated.
@@ -53,12 +68,21 @@ class UserWatchMovieServices:
         try:
             with SessionLocal() as db:
                 repository = UserWatchMovieRepository(db, UserWatchMovie)
+                stats_repository = MovieStatsRepository(db, MovieStats)
                 watched_movie = repository.read_user_watch_movie_by_user_id_and_movie_id(user_id, movie_id)
                 if watched_movie:
+                    stats_repository.add_rating(movie_id, rating, old_rating=watched_movie.rating)
                     obj = repository.update(watched_movie, {"rating": rating})
+                    invalidate(MOVIE_RATINGS)
+                    recommendation_updater.record(MOVIES, [movie_id])
                     return obj
+                stats_repository.add_rating(movie_id, rating, new_view=True)
                 fields = {"user_id": user_id, "movie_id": movie_id, "rating": rating}
-                return repository.create(fields)
+                obj = repository.create(fields)
+                invalidate(MOVIE_RATINGS, MOVIE_VIEWS)
+                recommendation_updater.record(MOVIES, [movie_id])
+                trending_engine.record(MOVIES, movie_id)
+                return obj
         except Exception as exc:
             raise exc
 
@@ -79,33 +103,37 @@ class UserWatchMovieServices:
                     return JSONResponse(content="You have not watched any Movie yet.", status_code=200)
                 movie_ids = [obj.movie_id for obj in objects]
                 movie_repo = MovieRepository(db, Movie)
-                movie_objects = [movie_repo.read_by_id(movie_id) for movie_id in movie_ids]
-                return movie_objects
+                return movie_repo.read_by_ids(movie_ids)
         except Exception as exc:
             raise exc
 
     @staticmethod
-    def get_popular_movies():
+    @cached(MOVIE_VIEWS)
+    def get_popular_movies(window: str = ALL_TIME):
         """
-        The get_popular_movies function returns the top 10 most popular movies in the database.
-        The function takes no arguments and returns a dictionary of movie titles mapped to their number of views.
+        The get_popular_movies function returns the top 10 trending movies of a time window.
+        Views are decayed with a half-life of the window, so recent views count more, and all-time
+        scores are the number of views.
 
-        Return: The top 10 most popular movies.
+        Param window:str: Time window, like 24h, 7d or all.
+        Return: A dictionary of movie titles mapped to their scores.
         """
         try:
+            movies = trending_engine.top(MOVIES, window, limit=10)
             with SessionLocal() as db:
-                repository = UserWatchMovieRepository(db, UserWatchMovie)
-                movies = repository.read_movie_downloads()
                 movie_repo = MovieRepository(db, Movie)
+                movie_objects = movie_repo.read_by_ids(movie_id for movie_id, _ in movies)
+                titles = {movie.id: movie.title for movie in movie_objects}
                 response = {}
-                for movie_id, views in movies[:10]:
-                    movie = movie_repo.read_by_id(movie_id)
-                    response.update({movie.title: views})
+                for movie_id, score in movies:
+                    if movie_id in titles:
+                        response.update({titles[movie_id]: round(score, 2)})
                 return response
         except Exception as exc:
             raise exc
 
     @staticmethod
+    @cached(MOVIE_RATINGS)
     def get_best_rated_movie(best: bool = True):
         """
         Function returns the best rated movie by users.
@@ -118,21 +146,23 @@ class UserWatchMovieServices:
         try:
             with SessionLocal() as db:
                 movie_repo = MovieRepository(db, Movie)
-                user_watch_repo = UserWatchMovieRepository(db, UserWatchMovie)
-                movie = user_watch_repo.read_movies_by_rating(best)
+                stats_repository = MovieStatsRepository(db, MovieStats)
+                ratings = stats_repository.read_by_average_rating(best)
+                movie_objects = movie_repo.read_by_ids(movie_id for movie_id, _ in ratings)
+                titles = {movie.id: movie.title for movie in movie_objects}
                 response = []
-                for movie_id, rating in movie:
-                    movie = movie_repo.read_by_id(movie_id)
-                    response.append({movie.title: rating})
+                for movie_id, rating in ratings:
+                    response.append({titles[movie_id]: rating})
                 return response
         except Exception as exc:
             raise exc
 
     @staticmethod
-    def get_my_recommendations(user_id, page):
+    def get_my_recommendations(user_id, page, cursor: Optional[str] = None):
         """
-        Function returns a list of movies that are recommended to the user based on their
-        affinities. The function takes in two parameters, user_id and page. The page
+        Function returns a list of movies that are recommended to the user, ranked by their similarity
+        to the movies the user watched and rated. Users without recommendations yet get movies of the genres
+        they watched, based on their affinities. The function takes in two parameters, user_id and page. The page
         parameter is used to paginate the results
         and return only 10 movies at a time. It also takes into account if
         there are no more pages left by checking if there
@@ -140,15 +170,19 @@ class UserWatchMovieServices:
 
         Param user_id: Get the user's affinity for each genre.
         Param page: Paginate the results.
-        Return: A list of movies that are recommended to the user.
+        Param cursor:str: Cursor returned with the previous page, used instead of the page number.
+        Return: A page of movies that are recommended to the user.
         """
         try:
+            recommended = RecommendationServices.get_recommendations(MOVIES, user_id, page, cursor)
+            if recommended is not None:
+                return recommended
             with SessionLocal() as db:
                 user_watch_movie_repo = UserWatchMovieRepository(db, UserWatchMovie)
                 users_affinities = user_watch_movie_repo.read_users_affinities(user_id)
                 movies_repo = MovieRepository(db, Movie)
                 genres = [affinity.Genre_ID for affinity in users_affinities]
-                return movies_repo.read_movies_by_group_of_genres(page, genres)
+                return movies_repo.read_movies_by_group_of_genres(page, genres, cursor)
         except Exception as exc:
             raise exc
 
@@ -166,15 +200,16 @@ class UserWatchMovieServices:
             with SessionLocal() as db:
                 movie_repository = MovieRepository(db, Movie)
                 movie = movie_repository.read_movie_by_title(name, search=False)
-                user_watch_movie_repository = UserWatchMovieRepository(db, Movie)
-                average = user_watch_movie_repository.read_average_rating(movie.id)
-                response = {"Movie": movie.title}
-                response.update(average)
+                stats = MovieStatsRepository(db, MovieStats).read_stats(movie.id)
+                if not stats:
+                    raise NoRatingsException
+                response = {"Movie": movie.title, "Average Rating": stats._mapping["Average Rating"]}
                 return response
         except Exception as exc:
             raise exc
 
     @staticmethod
+    @cached(MOVIE_RATINGS)
     def get_average_ratings():
         """
         Function returns the average rating for all movies in the database.
@@ -183,8 +218,8 @@ class UserWatchMovieServices:
         """
         try:
             with SessionLocal() as db:
-                user_watch_movie_repository = UserWatchMovieRepository(db, Movie)
-                response = user_watch_movie_repository.read_average_rating_for_all_movies()
+                stats_repository = MovieStatsRepository(db, MovieStats)
+                response = stats_repository.read_average_rating_for_all_movies()
                 return response
         except Exception as exc:
             raise exc
@@ -200,8 +235,8 @@ class UserWatchMovieServices:
         """
         try:
             with SessionLocal() as db:
-                user_watch_movie_repository = UserWatchMovieRepository(db, Movie)
-                ratings = user_watch_movie_repository.read_average_rating_for_all_movies()
+                stats_repository = MovieStatsRepository(db, MovieStats)
+                ratings = stats_repository.read_average_rating_for_all_movies()
                 response = [movie for movie in ratings if movie["Average Rating"] and movie["Average Rating"] > rating]
                 return response
         except Exception as exc:
@@ -219,20 +254,17 @@ class UserWatchMovieServices:
         """
         try:
             with SessionLocal() as db:
-                movie_repository = MovieRepository(db, Movie)
-                movies = movie_repository.read_movies_by_year(str(year))
-                if not movies:
+                user_watch_movie_repository = UserWatchMovieRepository(db, UserWatchMovie)
+                result = user_watch_movie_repository.read_average_rating_for_year(str(year))
+                if not result.Movies:
                     return JSONResponse(content=f"No Movies from this year: {year}", status_code=200)
-                movie_ids = [movie.id for movie in movies]
-                user_watch_movie_repository = UserWatchMovieRepository(db, Movie)
-                ratings = user_watch_movie_repository.read_average_rating_for_movies(movie_ids)
-                all_ratings = [rating["Average Rating"] for rating in ratings]
-                response = {f"Average rating for year: {year}": round(sum(all_ratings) / len(all_ratings), 2)}
+                response = {f"Average rating for year: {year}": result._mapping["Average Rating"]}
                 return response
         except Exception as exc:
             raise exc
 
     @staticmethod
+    @cached(MOVIE_RATINGS)
     def get_most_successful_movie_year():
         """
         Function returns the year with the highest average rating.
@@ -242,19 +274,9 @@ class UserWatchMovieServices:
         """
         try:
             with SessionLocal() as db:
-                movie_repository = MovieRepository(db, Movie)
-                query = movie_repository.read_movie_years()
-                years = [obj.year_published for obj in query]
-                user_watch_movie_repository = UserWatchMovieRepository(db, Movie)
-                response = {}
-                for year in years:
-                    movies = movie_repository.read_movies_by_year(year)
-                    ids = [movie.id for movie in movies]
-                    ratings = user_watch_movie_repository.read_average_rating_for_movies(movie_ids=ids)
-                    all_ratings = [rating["Average Rating"] for rating in ratings if rating["Average Rating"]]
-                    avg_rating = round(sum(all_ratings) / len(all_ratings), 2) if all_ratings else None
-                    if avg_rating:
-                        response.update({year: avg_rating})
+                user_watch_movie_repository = UserWatchMovieRepository(db, UserWatchMovie)
+                averages = user_watch_movie_repository.read_average_rating_per_year()
+                response = {year: float(average) for year, average in averages}
                 return response
         except Exception as exc:
             raise exc
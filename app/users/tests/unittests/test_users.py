@@ -1,11 +1,31 @@
 """Test users module"""
+import hashlib
+import threading
+import time
+from uuid import uuid4
+
+import jwt
 import pytest
+from fastapi import HTTPException
 from sqlalchemy.exc import IntegrityError
+from starlette.requests import Request
 
 from app.base import AppException
-from app.tests import TestClass, TestingSessionLocal
+from app.movies.models import Movie
+from app.series.models import Series, Episode
+from app.stats.models import MovieStats, SeriesStats
+from app.tests import TestClass, TestingSessionLocal, QueryCounter
+from app.users.controller.user_auth_controller import JWTBearer
+from app.users.controller.user_controller import UserController
 from app.users.repositories import UserRepository, SubuserRepository
 from app.users.models import User, Subuser
+from app.users.models.user import UserWatchMovie, UserWatchEpisode
+from app.users.schemas.user_watch_event_schema import WatchEventSchemaIn
+from app.users.exceptions import PasswordHashingBusyException
+from app.users.service import sign_jwt, authenticate, revoke_tokens, DEACTIVATED, PASSWORD_RESET, HashingPool, \
+    ScryptHasher
+from app.users.service.user_auth_service import USER_SECRET, JWT_ALGORITHM
+from app.users.service.user_watch_event_service import UserWatchEventServices
 
 
 class TestUserRepo(TestClass):
@@ -144,6 +164,39 @@ class TestUserRepo(TestClass):
         assert users[0].username == user.username
         assert users[0].password_hashed == user.password_hashed
 
+    def test_get_users_by_ids(self):
+        """
+        Function tests the read_by_ids function of the base repository by creating three users,
+        and then reading them back by their IDs in a single query.
+        The test asserts that the order of given IDs is kept and that unknown IDs are skipped.
+
+        Return: A list of users with the requested IDs.
+        """
+        self.create_users_for_methods()
+        with TestingSessionLocal() as db:
+            user_repository = UserRepository(db, User)
+            ids = [user.id for user in user_repository.read_all()][::-1]
+            with QueryCounter() as counter:
+                users = user_repository.read_by_ids(ids + ["unknown-id"])
+        assert [user.id for user in users] == ids
+        assert counter.count == 1
+
+    def test_get_users_by_ids_in_chunks(self):
+        """
+        Function tests that the read_by_ids function splits a long list of IDs into chunks,
+        running one query per chunk.
+
+        Return: A list of users with the requested IDs.
+        """
+        self.create_users_for_methods()
+        with TestingSessionLocal() as db:
+            user_repository = UserRepository(db, User)
+            ids = [user.id for user in user_repository.read_all()]
+            with QueryCounter() as counter:
+                users = user_repository.read_by_ids(ids, chunk_size=2)
+        assert [user.id for user in users] == ids
+        assert counter.count == 2
+
     def test_get_user_by_email(self):
         """
         Function tests the get_user_by_email function in user.py by creating a superuser,
@@ -395,3 +448,296 @@ class TestUserRepo(TestClass):
             subusers = subuser_repository.read_subusers_by_user_id(self.subuser.user_id)
         assert any([subuser.name == self.subuser.name for subuser in subusers])
         assert any([subuser.user_id == self.subuser.user_id for subuser in subusers])
+
+
+@pytest.fixture
+def anyio_backend():
+    """Run async tests on asyncio only."""
+    return "asyncio"
+
+
+class TestWatchEvents(TestClass):
+    """Test batched watch and rating events."""
+
+    @pytest.fixture(autouse=True)
+    def test_database(self, monkeypatch):
+        """
+        Function records events in the test database.
+
+        Param monkeypatch: Replace the session factory of the service.
+        Return: None.
+        """
+        monkeypatch.setattr("app.users.service.user_watch_event_service.SessionLocal", TestingSessionLocal)
+
+    @staticmethod
+    def create_catalogue(db, movies: int = 3) -> tuple:
+        """
+        Function creates a user, movies and a series with two episodes.
+
+        Param db: Database session.
+        Param movies:int: Number of movies.
+        Return: Tuple of the user ID, movie IDs, series ID and episode IDs.
+        """
+        user = User("viewer@gmail.com", "123", "viewer")
+        series = Series("Lost", "2004", None, None)
+        series.description = "Description"
+        db.add_all([user, series, *[Movie(f"Movie {i}", "Description", "1994", None, None) for i in range(movies)]])
+        db.commit()
+        episodes = [Episode(f"Episode {i}", series.id) for i in range(2)]
+        for episode in episodes:
+            episode.description = "Description"
+        db.add_all(episodes)
+        db.commit()
+        movie_ids = [movie.id for movie in db.query(Movie).order_by(Movie.title)]
+        return user.id, movie_ids, series.id, [episode.id for episode in episodes]
+
+    def test_events_are_applied_in_order(self):
+        """
+        Function tests that events of a batch are applied in order, with a status for every event,
+        and that watch records and totals match the result of sending the events one by one.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        with TestingSessionLocal() as db:
+            user_id, movie_ids, series_id, episode_ids = self.create_catalogue(db)
+            db.add(UserWatchMovie(user_id, movie_ids[2], 4))
+            db.add(MovieStats(movie_ids[2], 1, 4, 1))
+            db.commit()
+        events = [WatchEventSchemaIn(**event) for event in [
+            {"movie_title": "Movie 0"},
+            {"movie_title": " Movie 0 ", "rating": 7},
+            {"movie_id": movie_ids[1], "rating": 9},
+            {"movie_id": movie_ids[2], "rating": 6},
+            {"movie_id": movie_ids[2]},
+            {"series_title": "Lost", "episode_name": "Episode 0", "rating": 8},
+            {"episode_id": episode_ids[1]},
+            {"movie_title": "Unknown"},
+            {"movie_title": "Movie 0", "episode_id": episode_ids[0]},
+            {"movie_title": "Movie 1", "rating": 11},
+            {"episode_name": "Episode 0"}]]
+        report = UserWatchEventServices.record_watch_events(user_id, events)
+        assert [result["status"] for result in report["results"]] == \
+               ["created", "updated", "created", "updated", "unchanged", "created", "created",
+                "not_found", "invalid", "invalid", "invalid"]
+        assert report["summary"] == {"created": 4, "updated": 2, "unchanged": 1, "not_found": 1, "invalid": 3}
+        with TestingSessionLocal() as db:
+            ratings = {row.movie_id: row.rating for row in db.query(UserWatchMovie)}
+            movie_stats = {row.movie_id: (row.views, row.rating_sum, row.rating_count) for row in db.query(MovieStats)}
+            series_stats = db.query(SeriesStats).one()
+            assert db.query(UserWatchEpisode).count() == 2
+        assert ratings == {movie_ids[0]: 7, movie_ids[1]: 9, movie_ids[2]: 6}
+        assert movie_stats == {movie_ids[0]: (1, 7, 1), movie_ids[1]: (1, 9, 1), movie_ids[2]: (1, 6, 1)}
+        assert (series_stats.series_id, series_stats.views, series_stats.rating_sum) == (series_id, 1, 8)
+
+    def test_number_of_queries_does_not_depend_on_batch_size(self):
+        """
+        Function tests that a batch is recorded with the same number of statements for any number of events.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        with TestingSessionLocal() as db:
+            user_id, movie_ids, _, episode_ids = self.create_catalogue(db, movies=40)
+            other_user = User("other@gmail.com", "123", "other")
+            db.add(other_user)
+            db.commit()
+            batches = {user_id: [WatchEventSchemaIn(movie_id=movie_ids[0], rating=5),
+                                 WatchEventSchemaIn(movie_title="Movie 1"),
+                                 WatchEventSchemaIn(episode_id=episode_ids[0])],
+                       other_user.id: [WatchEventSchemaIn(movie_id=movie_id, rating=5) for movie_id in movie_ids] +
+                                      [WatchEventSchemaIn(movie_title=f"Movie {i}") for i in range(40)] +
+                                      [WatchEventSchemaIn(episode_id=episode_id) for episode_id in episode_ids]}
+        counts = []
+        for user, events in batches.items():
+            with QueryCounter() as counter:
+                UserWatchEventServices.record_watch_events(user, events)
+            counts.append(len([statement for statement in counter.statements
+                               if not statement.startswith(("BEGIN", "COMMIT", "ROLLBACK"))]))
+        assert counts[0] == counts[1]
+        with TestingSessionLocal() as db:
+            assert db.query(UserWatchMovie).count() == 42
+            assert db.query(MovieStats.views).filter(MovieStats.movie_id == movie_ids[0]).scalar() == 2
+
+
+class TestAuthentication:
+    """Test verification of tokens, the principal attached to requests and token revocation."""
+
+    @staticmethod
+    def create_request(token: str) -> Request:
+        """
+        Function creates a request with the token in the authorization header.
+
+        Param token:str: Bearer token.
+        Return: Request.
+        """
+        headers = [(b"authorization", f"Bearer {token}".encode())]
+        return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+    def test_signature_is_verified_once_per_token(self, monkeypatch):
+        """
+        Function tests that a token is decoded only on its first use and that the principal
+        carries the user ID, the profile ID and the role.
+
+        Param self: Access the test class and its methods.
+        Param monkeypatch: Pytest fixture for counting decode calls.
+        Return: None.
+        """
+        user_id, subuser_id = str(uuid4()), str(uuid4())
+        token = sign_jwt(user_id, "sub_user", subuser_id)["access_token"]
+        calls = []
+        decode = jwt.decode
+        monkeypatch.setattr(jwt, "decode", lambda *args, **kwargs: calls.append(1) or decode(*args, **kwargs))
+        first, second = authenticate(token), authenticate(token)
+        assert len(calls) == 1
+        assert first is second
+        assert (first.user_id, first.profile_id, first.role, first.is_active) == (user_id, subuser_id, "sub_user", True)
+
+    def test_expired_token_is_rejected(self):
+        """
+        Function tests that an expired token does not resolve to a principal.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        payload = {"user_id": str(uuid4()), "role": "regular_user", "expires": time.time() - 1}
+        assert authenticate(jwt.encode(payload, USER_SECRET, algorithm=JWT_ALGORITHM)) is None
+
+    def test_revoked_tokens(self):
+        """
+        Function tests that tokens issued before a password reset are rejected, that tokens of
+        deactivated users resolve to an inactive principal, and that new tokens are accepted.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        user_id = str(uuid4())
+        token = sign_jwt(user_id, "regular_user")["access_token"]
+        assert authenticate(token).is_active
+        revoke_tokens(user_id, DEACTIVATED)
+        assert not authenticate(token).is_active
+        revoke_tokens(user_id, PASSWORD_RESET)
+        assert authenticate(token) is None
+        assert authenticate(sign_jwt(user_id, "regular_user")["access_token"]).is_active
+
+    @pytest.mark.anyio
+    async def test_principal_is_attached_to_request(self):
+        """
+        Function tests that JWTBearer attaches the principal to the request and rejects
+        inactive users and roles without permission.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        user_id = str(uuid4())
+        token = sign_jwt(user_id, "regular_user")["access_token"]
+        request = self.create_request(token)
+        assert await JWTBearer(["regular_user"])(request) == token
+        assert request.state.principal.profile_id == user_id
+        with pytest.raises(HTTPException) as exc_info:
+            await JWTBearer(["super_user"])(self.create_request(token))
+        assert exc_info.value.detail == "You have no permission to access this route."
+        revoke_tokens(user_id, DEACTIVATED)
+        with pytest.raises(HTTPException) as exc_info:
+            await JWTBearer(["regular_user"])(self.create_request(token))
+        assert exc_info.value.detail == "Inactive user."
+
+
+class TestPasswordHashing:
+    """Test password hashing, rehashing of legacy hashes and the limit of pending hashes."""
+
+    def test_scrypt_hashes_are_salted_and_versioned(self):
+        """
+        Function tests that the same password gets different hashes, that hashes verify only the right password,
+        and that hashes created with other parameters need a rehash.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        hasher = ScryptHasher(n=2 ** 10)
+        first, second = hasher.hash("Password123"), hasher.hash("Password123")
+        assert first != second
+        assert hasher.verify("Password123", first) and hasher.verify("Password123", second)
+        assert not hasher.verify("Password124", first)
+        assert not hasher.needs_rehash(first)
+        assert ScryptHasher(n=2 ** 11).needs_rehash(first)
+        assert len(first) <= 100
+
+    def test_legacy_hash_is_rehashed_after_login(self):
+        """
+        Function tests that legacy SHA-256 hashes are accepted once and replaced with a scrypt hash,
+        and that wrong passwords and unknown hash formats are rejected.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        pool = HashingPool(ScryptHasher(n=2 ** 10), workers=0)
+        legacy = hashlib.sha256(b"Password123").hexdigest()
+        assert pool.verify("Password124", legacy) == (False, None)
+        valid, new_hash = pool.verify("Password123", legacy)
+        assert valid and new_hash.startswith("scrypt$1024$")
+        assert pool.verify("Password123", new_hash) == (True, None)
+        assert pool.verify("Password123", "plain-text") == (False, None)
+
+    def test_hashing_runs_in_worker_processes(self):
+        """
+        Function tests that hashes created in the process pool verify in the caller and the other way around.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        pool = HashingPool(ScryptHasher(n=2 ** 10), workers=1)
+        try:
+            encoded = pool.hash("Password123")
+            assert ScryptHasher(n=2 ** 10).verify("Password123", encoded)
+            assert pool.verify("Password123", ScryptHasher(n=2 ** 10).hash("Password123")) == (True, None)
+        finally:
+            pool.shutdown()
+
+    def test_pending_hashes_are_limited(self):
+        """
+        Function tests that hashing is refused with code 503 while max_pending hashes are in progress.
+
+        Param self: Access the test class and its methods.
+        Return: None.
+        """
+        started, release = threading.Event(), threading.Event()
+
+        class SlowHasher(ScryptHasher):
+            """Hasher waiting for the test before hashing."""
+            def hash(self, password: str) -> str:
+                started.set()
+                release.wait(5)
+                return super().hash(password)
+
+        pool = HashingPool(SlowHasher(n=2 ** 10), workers=0, max_pending=1)
+        worker = threading.Thread(target=pool.hash, args=("Password123",))
+        worker.start()
+        started.wait(5)
+        with pytest.raises(PasswordHashingBusyException) as exc_info:
+            pool.hash("Password123")
+        release.set()
+        worker.join()
+        assert exc_info.value.code == 503
+        assert pool.hash("Password123").startswith("scrypt$")
+
+    def test_busy_hashing_is_retried_after(self, monkeypatch):
+        """
+        Function tests that registration and password reset return 503 with the Retry-After header
+        while passwords cannot be hashed.
+
+        Param self: Access the test class and its methods.
+        Param monkeypatch: Replace the user services that hash passwords.
+        Return: None.
+        """
+        def busy(*args):
+            raise PasswordHashingBusyException
+
+        monkeypatch.setattr("app.users.controller.user_controller.UserServices.create_new_user", busy)
+        monkeypatch.setattr("app.users.controller.user_controller.UserServices.reset_password_complete", busy)
+        for call in (lambda: UserController.create_user("busy@gmail.com", "Password123", "busy"),
+                     lambda: UserController.reset_password_complete(1234, "Password123")):
+            with pytest.raises(HTTPException) as exc_info:
+                call()
+            assert exc_info.value.status_code == 503
+            assert exc_info.value.headers == {"Retry-After": "1"}
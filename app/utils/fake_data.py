@@ -0,0 +1,76 @@
+"""Fake Data module"""
+import random
+from datetime import date, timedelta
+from typing import Optional
+
+import faker
+
+EXTENSION = "mp4"
+
+
+class FakeData:
+    """
+    Fast generator of fake values for links and bulk inserts. Faker takes hundreds of microseconds per value,
+    so pools of realistic values are drawn from Faker once, and values are combined from the pools with a seeded
+    random generator. A value costs about a microsecond, and the same seed generates the same values.
+    """
+
+    def __init__(self, seed: Optional[int] = None, pool_size: int = 1000):
+        self.random = random.Random(seed)
+        fake = faker.Faker()
+        fake.seed_instance(seed)
+        self.first_names = [fake.first_name() for _ in range(pool_size)]
+        self.last_names = [fake.last_name() for _ in range(pool_size)]
+        self.countries = [fake.country()[:50] for _ in range(pool_size // 4 or 1)]
+        self.domains = [fake.domain_name() for _ in range(pool_size)]
+        self.words = fake.words(pool_size)
+
+    def first_name(self) -> str:
+        """Function returns a fake first name."""
+        return self.random.choice(self.first_names)
+
+    def last_name(self) -> str:
+        """Function returns a fake last name."""
+        return self.random.choice(self.last_names)
+
+    def country(self) -> str:
+        """Function returns a fake country name."""
+        return self.random.choice(self.countries)
+
+    def words_text(self, number: int) -> str:
+        """
+        Function returns a text of random words.
+
+        Param number:int: Number of words.
+        Return: Words separated by spaces.
+        """
+        return " ".join(self.random.choices(self.words, k=number))
+
+    def sentence(self, min_words: int = 6, max_words: int = 20) -> str:
+        """
+        Function returns a fake sentence, like a description of a title.
+
+        Param min_words:int: Minimal number of words.
+        Param max_words:int: Maximal number of words.
+        Return: Sentence.
+        """
+        return self.words_text(self.random.randint(min_words, max_words)).capitalize() + "."
+
+    def url(self) -> str:
+        """
+        Function returns a fake link to a video file, like https://www.example.com/word/word.mp4.
+
+        Return: URL, shorter than 100 characters.
+        """
+        first, second = self.random.choices(self.words, k=2)
+        return f"https://www.{self.random.choice(self.domains)}/{first}/{second}.{EXTENSION}"[:100]
+
+    def date_between(self, start: date, end: date) -> date:
+        """
+        Function returns a random date between two dates, both included.
+
+        Param start:date: First date.
+        Param end:date: Last date.
+        Return: Date.
+        """
+        return start + timedelta(days=self.random.randint(0, (end - start).days))
@@ -1,8 +1,10 @@
 """Utility functions"""
-import faker
 from datetime import datetime
+from functools import lru_cache
 from dateutil.relativedelta import relativedelta
 
+from .fake_data import FakeData
+
 
 def generate_random_int(n: int = 6) -> int:
     """
@@ -15,15 +17,19 @@ def generate_random_int(n: int = 6) -> int:
     return int(''.join(nums))
 
 
+@lru_cache(maxsize=None)
+def _fake_data() -> FakeData:
+    """Shared generator of fake values, created on first use."""
+    return FakeData()
+
+
 def generate_fake_url() -> str:
     """
-    Function that generates fake url using faker library
+    Function that generates fake url from pools of values drawn from the faker library once,
+    calling faker for every url dominates bulk inserts.
     Return: Fake url, string.
     """
-    fk = faker.Faker()
-    fake_url = fk.url()[:-1]
-    fake_file_path = fk.file_path(extension="mp4")
-    return fake_url + fake_file_path
+    return _fake_data().url()
 
 
 def get_day_before_one_month() -> str: